@@ -0,0 +1,34 @@
+"""Time decoding entries into models in each of the client's decode modes.
+
+Each decoded entry has a few of its attributes read, so that lazily decoded
+modes pay for the attributes a typical consumer uses. Run with
+`python -m benchmark.bench_decode`; full statham validation of the default
+100k entries takes a few minutes.
+"""
+import argparse
+import time
+
+import toshling
+from toshling.models import return_types
+
+from .server import make_entry
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=100000)
+    parser.add_argument('--modes', nargs='+', default=['statham', 'compiled', 'trusted'])
+    args = parser.parse_args()
+
+    plain = [make_entry(i) for i in range(args.rows)]
+    for mode in args.modes:
+        client = toshling.Client('key', decode=mode)
+        start = time.perf_counter()
+        for entry in client.decode(plain, return_types.Entry):
+            entry.amount, entry.date, entry.currency.code
+        elapsed = time.perf_counter() - start
+        print(f'{mode:10} {elapsed:8.2f} s {elapsed / args.rows * 1e6:9.1f} us/entry')
+
+
+if __name__ == '__main__':
+    main()
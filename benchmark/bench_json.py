@@ -0,0 +1,44 @@
+"""Micro-benchmarks of encoding an entry model, and parsing a page of entries,
+with `StathamJSONEncoder` and each available JSON backend.
+
+Run with `python -m benchmark.bench_json`.
+"""
+import argparse
+import json
+import timeit
+
+from toshling._client import StathamJSONEncoder
+from toshling._json import OrjsonJSON, StdlibJSON, orjson
+from toshling.models import return_types
+
+from .server import make_entry
+
+
+def report(name, seconds, number):
+    print(f'{name:24} {seconds / number * 1e6:9.2f} us')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--number', type=int, default=2000)
+    parser.add_argument('--per-page', type=int, default=200)
+    args = parser.parse_args()
+
+    backends = [StdlibJSON] + ([OrjsonJSON] if orjson is not None else [])
+
+    entry = return_types.Entry(make_entry(1))
+    print('Encode one entry')
+    report('StathamJSONEncoder', timeit.timeit(lambda: json.dumps(entry, cls=StathamJSONEncoder),
+                                               number=args.number), args.number)
+    for backend in backends:
+        report(backend.name, timeit.timeit(lambda: backend.dumps(entry), number=args.number), args.number)
+
+    page = json.dumps([make_entry(i) for i in range(args.per_page)]).encode()
+    number = max(args.number // 10, 1)
+    print(f'Parse a page of {args.per_page} entries ({len(page)} bytes)')
+    for backend in backends:
+        report(backend.name, timeit.timeit(lambda: backend.loads(page), number=number), number)
+
+
+if __name__ == '__main__':
+    main()
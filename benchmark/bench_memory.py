@@ -0,0 +1,45 @@
+"""Measure the memory retained per decoded entry in each of the client's
+decode modes, with tracemalloc.
+
+The entries are parsed from JSON within the measurement, and only the models
+are kept, so strings and nested data shared with the parsed JSON count
+towards them. Run with `python -m benchmark.bench_memory`.
+"""
+import argparse
+import gc
+import json
+import tracemalloc
+
+import toshling
+from toshling.models import return_types
+
+from .server import make_entry
+
+
+def retained(client, body, rows):
+    gc.collect()
+    tracemalloc.start()
+    try:
+        models = client.decode(json.loads(body), return_types.Entry)
+        gc.collect()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert len(models) == rows
+    return current / rows, peak / rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=20000)
+    parser.add_argument('--modes', nargs='+', default=['compiled', 'trusted', 'compact'])
+    args = parser.parse_args()
+
+    body = json.dumps([make_entry(i) for i in range(args.rows)])
+    for mode in args.modes:
+        current, peak = retained(toshling.Client('key', decode=mode), body, args.rows)
+        print(f'{mode:10} {current:8.0f} B/entry retained {peak:8.0f} B/entry peak')
+
+
+if __name__ == '__main__':
+    main()
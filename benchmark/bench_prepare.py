@@ -0,0 +1,41 @@
+"""Time preparing requests (remapping keyword arguments, validating them and
+building the URL and body), which every call pays on top of the network,
+with and without argument validation.
+
+Run with `python -m benchmark.bench_prepare`.
+"""
+import argparse
+import time
+
+import toshling
+from toshling.models import argument_types
+
+
+def calls():
+    entry = {'id': '1', 'amount': -8.31, 'currency': {'code': 'AUD'}, 'date': '2020-01-01', 'desc': 'Lunch',
+             'account': '1', 'category': '2', 'tags': ['1', '2'], 'modified': '2020-01-01 00:00:00.000'}
+    return [
+        ('entries.get', '/entries/{id}', 'GET', argument_types.EntriesGetArgument, {'id': '1'}),
+        ('entries.list', '/entries', 'GET', argument_types.EntriesListArgument,
+         {'from_': '2020-01-01', 'to': '2020-01-31', 'page': 0, 'per_page': 200}),
+        ('entries.update', '/entries/{id}', 'PUT', argument_types.EntriesUpdateArgument, entry),
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--number', type=int, default=100000)
+    args = parser.parse_args()
+
+    for validate in (True, False):
+        client = toshling.Client('key', validate=validate)
+        for name, href, method, argument_type, kwargs in calls():
+            start = time.perf_counter()
+            for _ in range(args.number):
+                client.prepare(href, method, argument_type, **kwargs)
+            elapsed = time.perf_counter() - start
+            print(f'{name:16} validate={validate!s:5} {elapsed / args.number * 1e6:7.2f} us/call')
+
+
+if __name__ == '__main__':
+    main()
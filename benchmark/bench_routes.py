@@ -0,0 +1,167 @@
+"""Time every route of the API against the local `FakeToshl`, with no network.
+
+Routes are found by calling each method of the generated endpoints of
+`toshling.Client`. For each, this reports calls per second through
+`Client.request`, with representative arguments (validated and encoded as
+usual), the rows returned per call, the cost of decoding each row, and the
+peak memory allocated by a call.
+
+Run with `python -m benchmark.bench_routes`, optionally with `--match entries`
+to time only the routes whose href contains `entries`.
+"""
+import argparse
+import time
+import tracemalloc
+from collections import namedtuple
+
+from statham.schema.constants import NotPassed
+from statham.schema.elements import Array, Boolean, Integer, Number, String
+from statham.schema.elements.meta import ObjectMeta
+
+import toshling
+from toshling._decode import keywords
+from toshling._endpoints import Endpoint
+
+from .server import FakeToshl, make_account, make_budget, make_category, make_entry, make_tag, make_user
+
+
+Route = namedtuple('Route', ['name', 'method', 'href', 'argument_type', 'return_type'])
+
+# Methods adding nothing to the routes, as they call those of other methods.
+DERIVED = frozenset(['iter', 'iter_pages', 'iter_sharded', 'bulk_create', 'update_many', 'delete_many'])
+
+# The objects of the fake server sent as the arguments creating or updating
+# them, by collection.
+FIXTURES = {'accounts': make_account, 'budgets': make_budget, 'categories': make_category, 'entries': make_entry,
+            'tags': make_tag, 'me': lambda i: make_user()}
+
+# Required arguments of listed ranges, such as those of sums.
+RANGE = {'from_': '2015-01-01', 'to': '2015-12-31', 'currency': 'AUD'}
+
+
+class _Recorder:
+    # Stands in for a client, recording the request an endpoint method makes.
+    def request(self, href, method, argument_type=None, return_type=None, **kwargs):
+        self.route = (method, href, argument_type, return_type)
+
+
+def _endpoints(owner, path):
+    # Namespaces of clients are only constructed when first accessed.
+    for name in dir(owner):
+        value = getattr(owner, name)
+        if isinstance(value, Endpoint):
+            yield f'{path}.{name}' if path else name, value
+            yield from _endpoints(value, f'{path}.{name}' if path else name)
+
+
+def routes():
+    """Return a `Route` for each method of the endpoints of `toshling.Client`,
+    e.g. `Route('entries.sums.list', 'GET', '/entries/sums', ...)`."""
+    recorder = _Recorder()
+    found = []
+    for path, endpoint in _endpoints(toshling.Client('key'), ''):
+        for name, function in vars(type(endpoint)).items():
+            if name.startswith('_') or name in DERIVED or not callable(function):
+                continue
+            function(type(endpoint)(recorder))
+            found.append(Route(f'{path}.{name}', *recorder.route))
+    return found
+
+
+def _example(element, id_):
+    # A valid value of `element`, referring to objects by `id_`.
+    for keyword in ('default', 'enum'):
+        value = getattr(element, keyword, NotPassed())
+        if not isinstance(value, NotPassed):
+            return value if keyword == 'default' else value[0]
+    if isinstance(element, ObjectMeta):
+        return {p.source: _example(p.element, id_) for p in element.properties.values() if p.required}
+    if isinstance(element, Array):
+        return [_example(element.items, id_)]
+    if isinstance(element, Boolean):
+        return False
+    if isinstance(element, Integer):
+        return 0 if isinstance(element.minimum, NotPassed) else element.minimum
+    if isinstance(element, Number):
+        return 1.5
+    if isinstance(element, String) and element.format == 'date':
+        return RANGE['from_']
+    return id_
+
+
+def arguments(route, id_='1'):
+    """Return representative keyword arguments of `route`: the whole object
+    of the fake server for creates and updates, and a valid value of each
+    other required argument."""
+    argument_type = route.argument_type
+    names = {source: name for name, source in keywords(argument_type).items()}
+    kwargs = {}
+    make = FIXTURES.get(route.name.split('.')[0])
+    if make is not None and route.name.rpartition('.')[2] in ('create', 'update'):
+        kwargs.update((names[k], v) for k, v in make(int(id_)).items() if k in names)
+    for name, property_ in argument_type.properties.items():
+        if property_.required and name not in kwargs:
+            kwargs[name] = RANGE.get(name) or _example(property_.element, id_)
+    if '{id}' in route.href:
+        kwargs.setdefault('id', id_)
+    return kwargs
+
+
+def call(client, route, id_='1', raw=False):
+    # A few arguments don't include the id in their href (such as that of
+    # `accounts.move`), so can't be called with them.
+    if route.argument_type is None or '{id}' in route.href and 'id' not in route.argument_type.properties:
+        return client.request(route.href, route.method, return_type=route.return_type, raw=raw, id=id_)
+    return client.request(route.href, route.method, route.argument_type, route.return_type, raw=raw,
+                          **arguments(route, id_))
+
+
+def rows(result):
+    if result is None:
+        return 0
+    return len(result) if isinstance(result, (list, dict)) else 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--calls', type=int, default=200)
+    parser.add_argument('--entries', type=int, default=1000)
+    parser.add_argument('--match', default='')
+    parser.add_argument('--decode', default='compiled')
+    args = parser.parse_args()
+
+    print(f'{"route":34} {"method":6} {"calls/s":>9} {"rows":>5} {"us/row":>8} {"peak KiB":>9}')
+    with FakeToshl(entries=args.entries) as server:
+        client = toshling.Client('key', api_endpoint_base=server.base_url, decode=args.decode)
+        # Reads come first, as writes change what later routes return, and
+        # each object is only deleted once.
+        order = ['GET', 'POST', 'PUT', 'DELETE']
+        for route in sorted(routes(), key=lambda r: order.index(r.method)):
+            if args.match not in route.href:
+                continue
+            calls = args.calls if route.method == 'GET' else 1
+
+            start = time.perf_counter()
+            for _ in range(calls):
+                result = call(client, route)
+            per_second = calls / (time.perf_counter() - start)
+
+            decode = ''
+            if route.return_type and rows(result):
+                plain = call(client, route, raw=True)
+                start = time.perf_counter()
+                for _ in range(10):
+                    client.decode(plain, route.return_type)
+                decode = f'{(time.perf_counter() - start) / 10 / rows(result) * 1e6:8.1f}'
+
+            tracemalloc.start()
+            call(client, route, '2')
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+            print(f'{route.name:34} {route.method:6} {per_second:9.1f} {rows(result):5} {decode:>8} '
+                  f'{peak / 1024:9.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,48 @@
+"""Compare calls per second with a fresh connection per call against the
+pooled, keep-alive session owned by `toshling.Client`.
+
+Run with `python -m benchmark.bench_session`.
+"""
+import argparse
+import time
+
+import requests
+
+import toshling
+
+from .server import FakeToshl
+
+
+# No return type is passed to `Client.request`, so that model construction
+# doesn't drown out the cost of the transport.
+
+def per_call_requests(base_url, calls):
+    # This is what `Client.request` used to do: a module level
+    # `requests.request`, and so a new connection, for every call.
+    for _ in range(calls):
+        requests.request('GET', base_url + '/accounts', auth=('key', ''))
+
+
+def pooled_client(base_url, calls):
+    with toshling.Client('key', api_endpoint_base=base_url) as client:
+        for _ in range(calls):
+            client.request('/accounts', 'GET')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--calls', type=int, default=500)
+    args = parser.parse_args()
+
+    for name, run in (('per-call requests.request', per_call_requests),
+                      ('pooled Client.session', pooled_client)):
+        with FakeToshl() as server:
+            start = time.perf_counter()
+            run(server.base_url, args.calls)
+            elapsed = time.perf_counter() - start
+            print(f'{name:28} {args.calls / elapsed:9.1f} calls/s '
+                  f'over {server.connections} connection(s)')
+
+
+if __name__ == '__main__':
+    main()
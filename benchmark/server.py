@@ -0,0 +1,441 @@
+"""A local stand-in for the Toshl API, used by the benchmarks and tests.
+
+The server speaks HTTP/1.1 with keep-alive so that connection reuse by the
+client is observable, and counts both the requests it serves and the TCP
+connections it accepts.
+"""
+import datetime
+import hashlib
+import json
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+
+MODIFIED = '2020-01-01 00:00:00.000'
+
+
+def make_account(i):
+    return {
+        'id': str(i),
+        'name': f'Account {i}',
+        'balance': 1000.0 + i,
+        'initial_balance': 0,
+        'currency': {'code': 'AUD', 'rate': 1, 'fixed': False},
+        'status': 'active',
+        'order': i % 256,
+        'modified': MODIFIED,
+        'type': 'custom'
+    }
+
+
+def make_entry(i):
+    day = datetime.date(2015, 1, 1) + datetime.timedelta(days=i // 5)
+    return {
+        'id': str(i),
+        'amount': -round(1 + (i * 7.31) % 250, 2),
+        'currency': {'code': 'AUD', 'rate': 1, 'fixed': False},
+        'date': day.isoformat(),
+        'desc': f'Entry number {i}',
+        'account': str(i % 3),
+        'category': str(i % 12),
+        'tags': [str(i % 7), str(i % 11)],
+        'created': '2020-01-01 00:00:00',
+        'modified': MODIFIED,
+        'completed': i % 2 == 0,
+        'deleted': False
+    }
+
+
+CURRENCIES = {
+    'AUD': {'name': 'Australian Dollar', 'symbol': '$', 'precision': 2, 'type': 'fiat', 'modified': MODIFIED},
+    'EUR': {'name': 'Euro', 'symbol': '€', 'precision': 2, 'type': 'fiat', 'modified': MODIFIED},
+    'USD': {'name': 'US Dollar', 'symbol': '$', 'precision': 2, 'type': 'fiat', 'modified': MODIFIED},
+    'BTC': {'name': 'Bitcoin', 'symbol': '₿', 'precision': 8, 'type': 'crypto', 'modified': MODIFIED},
+}
+
+
+def make_budget(i):
+    return {
+        'id': str(i),
+        'name': f'Budget {i}',
+        'amount': 100.0 * (i + 1),
+        'limit': 100.0 * (i + 1),
+        'planned': 0,
+        'currency': {'code': 'AUD', 'rate': 1, 'fixed': False},
+        'from': '2020-01-01',
+        'to': '2020-01-31',
+        'categories': [str(i % 12)],
+        'tags': [],
+        'accounts': [],
+        'rollover': False,
+        'type': 'regular',
+        'status': 'active',
+        'order': i % 256,
+        'recurrence': {'frequency': 'monthly', 'interval': 1, 'start': '2020-01-01', 'iteration': 0},
+        'modified': MODIFIED
+    }
+
+
+def make_category(i):
+    return {
+        'id': str(i),
+        'name': f'Category {i}',
+        'type': 'expense' if i % 4 else 'income',
+        'counts': {'entries': 10 * i, 'budgets': i % 2, 'tags': 3, 'tags_used_with_category': 2},
+        'deleted': False,
+        'modified': MODIFIED
+    }
+
+
+def make_tag(i):
+    return {
+        'id': str(i),
+        'name': f'Tag {i}',
+        'type': 'expense',
+        'category': str(i % 12),
+        'counts': {'entries': 5 * i, 'budgets': 0},
+        'meta_tag': False,
+        'deleted': False,
+        'modified': MODIFIED
+    }
+
+
+def make_location(i):
+    return {
+        'id': str(i),
+        'name': f'Venue {i}',
+        'address': f'{i} Example Street',
+        'city': 'Melbourne',
+        'latitude': -37.81 + i / 1000,
+        'longitude': 144.96 + i / 1000,
+        'visits': i,
+        'expenses': {'count': i, 'sum': 12.5 * i},
+        'modified': MODIFIED
+    }
+
+
+def make_export(i):
+    return {'id': str(i), 'formats': ['csv'], 'resources': ['entry'], 'status': 'generated',
+            'created': '2020-01-01T00:00:00Z', 'modified': MODIFIED}
+
+
+def make_image(i):
+    return {'id': str(i), 'filename': f'receipt-{i}.jpg', 'path': f'/images/{i}/receipt-{i}.jpg',
+            'status': 'uploaded', 'type': 'image/jpeg', 'deleted': False}
+
+
+def make_notification(i):
+    return {'id': str(i), 'type': 'budget', 'text': f'Budget {i} is almost spent', 'action': 'open',
+            'date': '2020-01-02T03:04:05Z', 'deleted': False, 'modified': MODIFIED}
+
+
+def make_user():
+    return {
+        'id': '42',
+        'email': 'user@example.com',
+        'first_name': 'Example',
+        'last_name': 'User',
+        'joined': '2015-01-01T00:00:00Z',
+        'modified': MODIFIED,
+        'currency': {'main': 'AUD', 'update': 'historical'},
+        'start_day': 1,
+        'country': 'AU',
+        'timezone': 'Australia/Melbourne',
+        'locale': 'en_AU',
+        'language': 'en',
+        'notifications': 1,
+        'otp_enabled': False,
+        'limits': {'accounts': True, 'budgets': True, 'images': True, 'import': True},
+        'flags': [],
+        'social': ['toshl'],
+        'steps': ['income', 'expense']
+    }
+
+
+def sums(entries, key):
+    # Totals of `entries` by `key` (which returns the keys of an entry), in
+    # the shape of the sums endpoints.
+    totals = {}
+    for entry in entries:
+        for k in key(entry):
+            total = totals.setdefault(k, {'expenses': {'count': 0, 'sum': 0.0},
+                                          'incomes': {'count': 0, 'sum': 0.0}})
+            kind = 'expenses' if entry['amount'] < 0 else 'incomes'
+            total[kind]['count'] += 1
+            total[kind]['sum'] = round(total[kind]['sum'] + abs(entry['amount']), 2)
+    return sorted(totals.items())
+
+
+def in_range(entries, query):
+    # `from` and `to` are inclusive ISO dates, so they compare as strings.
+    start, end = query.get('from', ''), query.get('to', '9999')
+    return [e for e in entries if start <= e['date'] <= end]
+
+
+def modified_at(item):
+    # `modified` timestamps are in UTC, without a zone.
+    return datetime.datetime.strptime(item['modified'], '%Y-%m-%d %H:%M:%S.%f').replace(tzinfo=datetime.timezone.utc)
+
+
+def changed(items, query):
+    # Deleted items are only listed on request, and `since` (an RFC 3339
+    # date-time, raising ValueError otherwise) limits the list to items
+    # modified after it.
+    since = query.get('since')
+    if since is not None:
+        since = datetime.datetime.strptime(since, '%Y-%m-%dT%H:%M:%S.%f%z')
+    include_deleted = query.get('include_deleted') in ('true', 'True', '1')
+    return [i for i in items
+            if (since is None or ('modified' in i and modified_at(i) > since))
+            and (include_deleted or not i.get('deleted'))]
+
+
+def paginate(items, query):
+    page = int(query.get('page', 0))
+    per_page = int(query.get('per_page', 200))
+    return items[page * per_page:(page + 1) * per_page]
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    # Buffer the headers and body into a single write, otherwise Nagle's
+    # algorithm and delayed ACKs dominate the timings of kept-alive
+    # connections.
+    wbufsize = 1 << 16
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def log_message(self, format, *args):
+        pass
+
+    def _handle(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length) if length else b''
+        url = urlsplit(self.path)
+        query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+
+        with self.server.lock:
+            self.server.requests += 1
+            self.server.in_flight += 1
+            self.server.max_in_flight = max(self.server.max_in_flight, self.server.in_flight)
+
+        try:
+            if self.server.latency:
+                time.sleep(self.server.latency)
+            status, headers, payload = self.server.app(self.command, url.path, query, body, self.headers)
+        finally:
+            with self.server.lock:
+                self.server.in_flight -= 1
+        self.send_response(status)
+        for k, v in headers.items():
+            self.send_header(k, v)
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    do_GET = do_POST = do_PUT = do_DELETE = _handle
+
+
+class FakeToshl:
+    """Serve canned Toshl-like responses from a background thread.
+
+    Every route of the API is answered: collections (accounts, budgets,
+    categories, tags, entries and so on) can be listed, paginated, created,
+    fetched, updated and deleted, sums are computed from the entries, and
+    actions such as merges are accepted without content. The counts of each
+    kind of object served are arguments.
+
+    Use as a context manager; `base_url` can be passed straight to
+    `toshling.Client` as the `api_endpoint_base`. `latency` is a delay in
+    seconds added to every response, to stand in for a distant server.
+    """
+    def __init__(self, accounts=20, entries=0, latency=0, host='127.0.0.1', port=0, budgets=5, categories=12,
+                 tags=11, locations=10, exports=3, images=3, notifications=4):
+        self.accounts = [make_account(i) for i in range(accounts)]
+        self.entries = [make_entry(i) for i in range(entries)]
+        self.user = make_user()
+        self.currencies = dict(CURRENCIES)
+        # Lists of the objects of each collection, by path.
+        self.collections = {
+            'accounts': self.accounts,
+            'budgets': [make_budget(i) for i in range(budgets)],
+            'categories': [make_category(i) for i in range(categories)],
+            'tags': [make_tag(i) for i in range(tags)],
+            'entries': self.entries,
+            'entries/locations': [make_location(i) for i in range(locations)],
+            'exports': [make_export(i) for i in range(exports)],
+            'images': [make_image(i) for i in range(images)],
+            'me/notifications': [make_notification(i) for i in range(notifications)],
+        }
+        self.httpd = ThreadingHTTPServer((host, port), _Handler)
+        self.httpd.daemon_threads = True
+        self.httpd.lock = threading.Lock()
+        self.httpd.connections = 0
+        self.httpd.requests = 0
+        self.httpd.in_flight = 0
+        self.httpd.max_in_flight = 0
+        self.httpd.latency = latency
+        self.httpd.app = self.dispatch
+        self.faults = deque()
+        self.last_modified = 'Wed, 01 Jan 2020 00:00:00 GMT'
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.httpd.server_address[:2]
+        return f'http://{host}:{port}'
+
+    @property
+    def connections(self):
+        return self.httpd.connections
+
+    @property
+    def requests(self):
+        return self.httpd.requests
+
+    @property
+    def max_in_flight(self):
+        return self.httpd.max_in_flight
+
+    def fail(self, status, times=1, headers=None):
+        """Answer the next `times` requests with an error `status`."""
+        for _ in range(times):
+            self.faults.append((status, headers or {}))
+
+    def dispatch(self, method, path, query, body, headers):
+        try:
+            status, fault_headers = self.faults.popleft()
+        except IndexError:
+            pass
+        else:
+            return self.json({'error_id': 'error.fault'}, status=status, headers=fault_headers)
+
+        status, response_headers, payload = self.handle(method, path, query, body, headers)
+
+        # Successful GETs carry validators, and conditional requests matching
+        # them are answered with 304 Not Modified.
+        if method == 'GET' and status == 200:
+            etag = '"{}"'.format(hashlib.sha1(payload).hexdigest()[:16])
+            response_headers.update({'ETag': etag, 'Last-Modified': self.last_modified})
+            if headers.get('If-None-Match') == etag or (
+                    'If-None-Match' not in headers and headers.get('If-Modified-Since') == self.last_modified):
+                return 304, response_headers, b''
+
+        return status, response_headers, payload
+
+    def handle(self, method, path, query, body, headers):
+        """Return a `(status, headers, body)` tuple for a single request."""
+        if method == 'GET':
+            if path == '/currencies':
+                # Currencies are listed as a dict by code, not a list.
+                return self.json(self.currencies)
+            if path == '/me':
+                return self.json(self.user)
+            if path in ('/entries/sums', '/categories/sums', '/tags/sums'):
+                return self.json(paginate(self.sums(path, query), query))
+            if path in ('/me/settings', '/me/devices', '/entries/manage', '/entries/repeats'):
+                return self.json([] if path != '/me/settings' else {'locale': self.user['locale']})
+        if method == 'PUT' and path == '/me':
+            self.user.update(json.loads(body or b'{}'))
+            return self.json(self.user)
+
+        # Collections and their objects, e.g. `/me/notifications/{id}`.
+        name, _, id_ = path.strip('/').rpartition('/')
+        if path.strip('/') in self.collections:
+            name, id_ = path.strip('/'), ''
+        if name in self.collections:
+            with self.httpd.lock:
+                return self.collection(method, name, self.collections[name], id_, query, body)
+
+        # Anything else is an action, such as a merge or a move, answered
+        # without content.
+        if method == 'POST' or (method == 'DELETE' and path.startswith('/entries/split/')):
+            return 204, {}, b''
+        if method == 'GET' and path.startswith('/budgets/') and path.endswith('/history'):
+            return self.json([])
+        return self.not_found()
+
+    def collection(self, method, name, items, id_, query, body):
+        # List, create, get, update or delete objects of a collection.
+        if not id_:
+            if method == 'GET':
+                listed = in_range(items, query) if name == 'entries' else items
+                try:
+                    listed = changed(listed, query)
+                except ValueError:
+                    return self.json({'error_id': 'error.validation', 'field': 'since'}, status=400)
+                return self.json(paginate(listed, query))
+            if method == 'POST':
+                item = {**json.loads(body or b'{}'), 'id': str(len(items))}
+                items.append(item)
+                return 201, {'Location': f'/{name}/{item["id"]}'}, b''
+            return self.not_found()
+
+        if method == 'POST':
+            # An action on the collection, e.g. `/tags/merge`.
+            return 204, {}, b''
+        index = self.find(items, id_)
+        if index is None:
+            return self.not_found()
+        if method == 'DELETE':
+            items[index] = {**items[index], 'deleted': True}
+            return 204, {}, b''
+        if method == 'PUT':
+            items[index].update(json.loads(body or b'{}'))
+        return self.json(items[index])
+
+    @staticmethod
+    def find(items, id_):
+        # The index of the object (not deleted) with id `id_`, or None.
+        for i, item in enumerate(items):
+            if item['id'] == id_ and not item.get('deleted'):
+                return i
+        return None
+
+    def sums(self, path, query):
+        entries = [e for e in in_range(self.entries, query) if not e.get('deleted')]
+        if path == '/entries/sums':
+            return [{'day': day, **total, 'modified': MODIFIED}
+                    for day, total in sums(entries, lambda e: [e['date']])]
+        if path == '/categories/sums':
+            names = {c['id']: c for c in self.collections['categories']}
+            return [{'category': category, 'category_name': names.get(category, {}).get('name', ''),
+                     'category_type': names.get(category, {}).get('type', 'expense'), **total, 'modified': MODIFIED}
+                    for category, total in sums(entries, lambda e: [e['category']])]
+        categories = {}
+        for entry in entries:
+            for tag in entry.get('tags') or ():
+                categories.setdefault(tag, set()).add(entry['category'])
+        return [{'tag': tag, 'expenses': {**total['expenses'], 'categories': sorted(categories[tag])},
+                 'incomes': total['incomes'], 'modified': MODIFIED}
+                for tag, total in sums(entries, lambda e: e.get('tags') or ())]
+
+    def not_found(self):
+        return self.json({'error_id': 'error.object.not_found'}, status=404)
+
+    @staticmethod
+    def json(obj, status=200, headers=None):
+        return status, {'Content-Type': 'application/json', **(headers or {})}, json.dumps(obj).encode()
+
+    def start(self):
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
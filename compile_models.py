@@ -0,0 +1,331 @@
+"""Compile the statham models into specialised decoders.
+
+For every model in `toshling/models/return_types.py` and `argument_types.py`
+a `decode_<Model>` function is written to `compiled_return_types.py` and
+`compiled_argument_types.py`, which validates decoded JSON with the checks of
+the model inlined as straight-line code (types, ranges, enums, lengths and
+precompiled patterns) and constructs the model directly, instead of walking
+statham's validators for every value. The arguments of the endpoint methods
+also get a table of the source key of each keyword argument.
+
+Anything without a specialised check (such as composition or `const`) is
+delegated to the statham element, and any failed check raises `Invalid`, in
+which case `toshling._decode` hands the value to statham, so that results and
+errors are always those of statham.
+
+The return models are also compiled into compact variants, written to
+`compact_types.py`, which keep their properties in `__slots__` and only build
+nested models when they are first read.
+
+Run by `generate.py`, or on its own to recompile the existing models.
+"""
+import importlib
+from pathlib import Path
+
+from statham.schema.constants import NotPassed
+from statham.schema.elements import Array, Boolean, Element, Integer, Number, String
+from statham.schema.elements.meta import ObjectMeta
+
+
+HEADER = '''"""Specialised decoders for the models in `{module}`.
+
+Generated by `compile_models.py`, do not edit.
+"""
+import re
+
+from .._decode import MISSING, Invalid, additional, anything, is_format, new
+from . import {module} as models
+'''
+
+COMPACT_HEADER = '''"""Compact variants of the models in `{module}`.
+
+Generated by `compile_models.py`, do not edit.
+"""
+from .._decode import MISSING, CompactObject, new, unknown
+from . import {module} as models
+'''
+
+SCALARS = {String: 'str', Integer: 'int', Boolean: 'bool'}
+RANGES = (('minimum', '<'), ('maximum', '>'), ('exclusiveMinimum', '<='), ('exclusiveMaximum', '>='))
+# Keywords which are always delegated to statham.
+DELEGATED = ('const', 'multipleOf', 'contains')
+
+
+def frozen(values):
+    # A frozenset expression, written in a stable order.
+    return f'frozenset({sorted(set(values), key=repr)!r})'
+
+
+def passed(element, keyword):
+    return not isinstance(getattr(element, keyword, NotPassed()), NotPassed)
+
+
+def untyped(element):
+    # Whether `element` is an `Element()` accepting anything.
+    return type(element) is Element and element == Element(description=element.description)
+
+
+class ModelCompiler:
+    """Compile the `Object` models of `module` to Python source."""
+    def __init__(self, module):
+        self.module = module
+        self.name = module.__name__.rsplit('.', 1)[-1]
+        self.models = [m for m in vars(module).values()
+                       if isinstance(m, ObjectMeta) and m.__module__ == module.__name__]
+        self.constants = {}
+
+    def constant(self, kind, expression):
+        # Module level constants, shared between identical expressions.
+        if expression not in self.constants:
+            self.constants[expression] = f'_{kind}_{len(self.constants)}'
+        return self.constants[expression]
+
+    def source(self):
+        functions = [self.function(model) for model in self.models]
+        lines = [HEADER.format(module=self.name)]
+        lines.extend(f'{name} = {expression}' for expression, name in self.constants.items())
+        for function in functions:
+            lines.extend(['', ''] + function)
+        lines.extend(['', '', 'DECODERS = {'])
+        lines.extend(f'    models.{m.__name__}: decode_{m.__name__},' for m in self.models)
+        lines.append('}')
+        arguments = [m for m in self.models if m.__name__.endswith('Argument')]
+        if arguments:
+            lines.extend(['', '# The source key of each keyword argument of the endpoint methods.', 'KEYWORDS = {'])
+            lines.extend(f'    models.{m.__name__}: {{{", ".join(f"{k!r}: {p.source!r}" for k, p in m.properties.items())}}},'
+                         for m in arguments)
+            lines.append('}')
+        return '\n'.join(lines) + '\n'
+
+    def function(self, model):
+        path = f'models.{model.__name__}'
+        properties = model.properties
+        sources = self.constant('SOURCES', frozen(p.source for p in properties.values()))
+        required = set(getattr(model, 'required', None) or []) - {p.source for p in properties.values()}
+
+        lines = [f'def decode_{model.__name__}(value):',
+                 '    if type(value) is not dict:',
+                 '        raise Invalid']
+        if required:
+            lines += [f'    if not value.keys() >= {self.constant("REQUIRED", frozen(required))}:',
+                      '        raise Invalid']
+        if properties:
+            lines.append('    get = value.get')
+
+        for name, prop in properties.items():
+            target = f'_{name}'
+            lines += [f'    value_ = get({prop.source!r}, MISSING)',
+                      '    if value_ is MISSING:']
+            lines += ['        ' + line for line in self.missing(path, name, prop, target)]
+            lines.append('    else:')
+            property_ = f'{path}.properties[{name!r}]'
+            lines += ['        ' + line for line in self.element(prop.element, property_, 'value_', target)]
+
+        attributes = ', '.join(f'{name!r}: _{name}' for name in properties)
+        # Attributes are set one by one, as statham does, which keeps them in
+        # the compact storage CPython gives instances when `__dict__` isn't
+        # accessed directly.
+        lines += [f'    properties = {{{attributes}}}',
+                  f'    model = new({path})',
+                  '    model._dict = properties']
+        lines += [f'    model.{name} = _{name}' for name in properties]
+        lines.append(f'    if not {sources}.issuperset(value):')
+        if model.__properties__.additional:
+            names = self.constant('NAMES', frozen(properties))
+            lines.append(f'        additional(properties, value, {sources}, {names})')
+        else:
+            lines.append('        raise Invalid')
+        lines.append('    return model')
+        return lines
+
+    def missing(self, path, name, prop, target):
+        if prop.required:
+            return ['raise Invalid']
+        return [f'{target} = {self.default(path, name, prop)}']
+
+    @staticmethod
+    def default(path, name, prop):
+        # An expression for the value of a property missing from the data.
+        if prop.source != name:
+            # statham looks renamed properties up by name, so never applies
+            # their defaults.
+            return 'MISSING'
+        default = prop.element(NotPassed())
+        if isinstance(default, NotPassed):
+            return 'MISSING'
+        if default is None or type(default) in (bool, int, float, str):
+            return repr(default)
+        return f'{path}.properties[{name!r}].element(MISSING)'
+
+    def element(self, element, property_, value, target):
+        """Lines checking `value` against the `element` of a property (found
+        at `property_`), and assigning the constructed value to `target`."""
+        if isinstance(element, ObjectMeta):
+            if element in self.models and isinstance(element.default, NotPassed):
+                return [f'{target} = decode_{element.__name__}({value})']
+        elif isinstance(element, Array):
+            lines = self.array(element, value, target)
+            if lines:
+                return lines
+        else:
+            conditions = self.conditions(element, value)
+            if conditions:
+                construct = f'float({value})' if type(element) is Number else value
+                return [f'if {" or ".join(conditions)}:', '    raise Invalid', f'{target} = {construct}']
+
+        delegate = self.constant('PROPERTY', property_)
+        return [f'{target} = {delegate}({value})']
+
+    def conditions(self, element, value):
+        """The conditions under which `value` fails a scalar `element`, or
+        None if it needs statham."""
+        if type(element) not in (String, Integer, Number, Boolean) or any(passed(element, k) for k in DELEGATED):
+            return None
+
+        if type(element) is Number:
+            conditions = [f'type({value}) is not float and type({value}) is not int']
+        else:
+            conditions = [f'type({value}) is not {SCALARS[type(element)]}']
+
+        if passed(element, 'enum'):
+            if type(element) is not String:
+                # Enums mixing booleans and numbers are compared specially.
+                return None
+            conditions.append(f'{value} not in {self.constant("ENUM", frozen(element.enum))}')
+        for keyword, operator in RANGES:
+            if passed(element, keyword):
+                conditions.append(f'{value} {operator} {getattr(element, keyword)!r}')
+        if passed(element, 'minLength'):
+            conditions.append(f'len({value}) < {element.minLength!r}')
+        if passed(element, 'maxLength'):
+            conditions.append(f'len({value}) > {element.maxLength!r}')
+        if passed(element, 'pattern'):
+            pattern = self.constant('PATTERN', f're.compile({element.pattern!r})')
+            conditions.append(f'not {pattern}.search({value})')
+        if passed(element, 'format'):
+            conditions.append(f'not is_format({element.format!r}, {value})')
+        return conditions
+
+    def array(self, element, value, target):
+        if (any(passed(element, k) for k in DELEGATED) or element.uniqueItems or passed(element, 'enum')
+                or isinstance(element.items, (list, NotPassed))):
+            return None
+
+        conditions = [f'type({value}) is not list']
+        if passed(element, 'minItems'):
+            conditions.append(f'len({value}) < {element.minItems!r}')
+        if passed(element, 'maxItems'):
+            conditions.append(f'len({value}) > {element.maxItems!r}')
+        lines = [f'if {" or ".join(conditions)}:', '    raise Invalid']
+
+        items = element.items
+        if isinstance(items, ObjectMeta) and items in self.models and isinstance(items.default, NotPassed):
+            return lines + [f'{target} = [decode_{items.__name__}(item) for item in {value}]']
+
+        if untyped(items):
+            return lines + [f'{target} = [anything(item) for item in {value}]']
+
+        item_conditions = self.conditions(items, 'item')
+        if not item_conditions:
+            return None
+        construct = f'[float(item) for item in {value}]' if type(items) is Number else f'list({value})'
+        return lines + [f'for item in {value}:',
+                        f'    if {" or ".join(item_conditions)}:',
+                        '        raise Invalid',
+                        f'{target} = {construct}']
+
+
+class CompactCompiler(ModelCompiler):
+    """Compile the `Object` models of `module` to compact subclasses, which
+    are built from decoded JSON without validating it."""
+    def source(self):
+        classes = [self.compact_class(model) for model in self.models]
+        functions = [self.function(model) for model in self.models]
+        lines = [COMPACT_HEADER.format(module=self.name)]
+        lines.extend(f'{name} = {expression}' for expression, name in self.constants.items())
+        for definition in classes + functions:
+            lines.extend(['', ''] + definition)
+        lines.extend(['', '', 'DECODERS = {'])
+        lines.extend(f'    models.{m.__name__}: decode_{m.__name__},' for m in self.models)
+        lines.append('}')
+        return '\n'.join(lines) + '\n'
+
+    def nested(self, element):
+        # The compact model of a nested model (or list of them), if any.
+        if isinstance(element, Array):
+            element = element.items
+        if isinstance(element, ObjectMeta) and element in self.models:
+            return element.__name__
+        return None
+
+    def compact_class(self, model):
+        properties = model.properties
+        slots = [f'_{name}' if self.nested(p.element) else name for name, p in properties.items()]
+        lines = [f'class {model.__name__}(CompactObject, models.{model.__name__}):',
+                 f'    __slots__ = {tuple(slots + ["_additional"])!r}',
+                 f'    validated_type = models.{model.__name__}']
+
+        for name, prop in properties.items():
+            nested = self.nested(prop.element)
+            if not nested:
+                continue
+            if isinstance(prop.element, Array):
+                build = (f'[decode_{nested}(item) if type(item) is dict else item for item in value]',
+                         'type(value) is list and any(type(item) is dict for item in value)')
+            else:
+                build = f'decode_{nested}(value)', 'type(value) is dict'
+            lines += ['',
+                      '    @property',
+                      f'    def {name}(self):',
+                      f'        value = self._{name}',
+                      f'        if {build[1]}:',
+                      f'            value = self._{name} = {build[0]}',
+                      '        return value',
+                      '',
+                      f'    @{name}.setter',
+                      f'    def {name}(self, value):',
+                      f'        self._{name} = value']
+        return lines
+
+    def function(self, model):
+        path = f'models.{model.__name__}'
+        properties = model.properties
+        sources = self.constant('SOURCES', frozen(p.source for p in properties.values()))
+
+        lines = [f'def decode_{model.__name__}(value):',
+                 f'    model = new({model.__name__})']
+        if properties:
+            lines.append('    get = value.get')
+        for name, prop in properties.items():
+            slot = f'_{name}' if self.nested(prop.element) else name
+            get = f'get({prop.source!r}, {self.default(path, name, prop)})'
+            if type(prop.element) is Number:
+                lines += [f'    value_ = {get}',
+                          f'    model.{slot} = float(value_) if type(value_) is int else value_']
+            else:
+                lines.append(f'    model.{slot} = {get}')
+        lines += [f'    model._additional = None if {sources}.issuperset(value) else unknown(value, {sources})',
+                  '    return model']
+        return lines
+
+
+def compile_models(module, path):
+    """Write the compiled decoders of the models in `module` to `path`."""
+    Path(path).write_text(ModelCompiler(module).source())
+
+
+def compile_compact_models(module, path):
+    """Write compact variants of the models in `module` to `path`."""
+    Path(path).write_text(CompactCompiler(module).source())
+
+
+def main():
+    for name in ('return_types', 'argument_types'):
+        module = importlib.import_module(f'toshling.models.{name}')
+        compile_models(module, f'toshling/models/compiled_{name}.py')
+    compile_compact_models(importlib.import_module('toshling.models.return_types'),
+                           'toshling/models/compact_types.py')
+
+
+if __name__ == '__main__':
+    main()
@@ -11,6 +11,8 @@ from jinja2 import Template
 from json_ref_dict import RefDict, materialize
 from statham.titles import title_labeller
 
+from compile_models import compile_compact_models, compile_models
+
 API_SCHEMA = "https://api2.toshl.com/schema/"
 SCHEMAS = [
     "user",
@@ -255,6 +257,12 @@ arguments = (api_method['argument'] for api_method in filtered_api_methods.value
 arg_types_path = Path('toshling/models/argument_types.py')
 arg_types_path.write_text(statham.serializers.python.serialize_python(*arguments))
 
+# Compile specialised decoders for the return and argument models.
+import toshling.models.argument_types
+compile_models(toshling.models.return_types, 'toshling/models/compiled_return_types.py')
+compile_models(toshling.models.argument_types, 'toshling/models/compiled_argument_types.py')
+compile_compact_models(toshling.models.return_types, 'toshling/models/compact_types.py')
+
 # Automatically generate Python code for the endpoints.
 classes: List[Dict[str, List[Dict[str, Any]]]] = []
 subclasses = []
@@ -277,10 +285,24 @@ for crumbs, api_method in filtered_api_methods_reversed:
 
     method = {'name': crumbs[-1]}
     method.update(api_method)
+
+    # List methods taking `page` and `per_page` also get paginating iterators.
+    argument = api_method['argument']
+    method['paginated'] = (crumbs[-1] == 'list' and argument is not None
+                           and {'page', 'per_page'} <= set(argument.properties))
+    # Those of dated items between `from` and `to` can also be fetched in
+    # date windows in parallel.
+    return_ = api_method['return']
+    method['sharded'] = (method['paginated'] and {'from_', 'to'} <= set(argument.properties)
+                         and return_ is not None and bool({'date', 'day'} & set(return_.properties)))
     classes[-1]['methods'].append(method)
 
 
 end_tmp = Path('_endpoints.py.tmpl')
 template = Template(end_tmp.read_text())
 end_out = Path('toshling/_endpoints.py')
-end_out.write_text(template.render(classes=classes))
+end_out.write_text(template.render(classes=classes, asynchronous=False))
+
+# The same endpoints, with coroutine methods, for the AsyncClient.
+async_end_out = Path('toshling/_async_endpoints.py')
+async_end_out.write_text(template.render(classes=classes, asynchronous=True))
@@ -0,0 +1,55 @@
+import asyncio
+import unittest
+import toshling
+from toshling._async_client import httpx
+from benchmark.server import FakeToshl
+
+
+@unittest.skipIf(httpx is None, 'httpx is not installed')
+class TestAsyncClient(unittest.TestCase):
+    def setUp(self):
+        self.server = FakeToshl(accounts=25, latency=0.05).start()
+
+    def tearDown(self):
+        self.server.stop()
+
+    def run_with_client(self, coroutine_function):
+        async def run():
+            async with toshling.AsyncClient('key', api_endpoint_base=self.server.base_url) as client:
+                return await coroutine_function(client)
+        return asyncio.run(run())
+
+    def test_namespaces(self):
+        client = toshling.AsyncClient('key')
+        self.assertTrue(asyncio.iscoroutinefunction(client.entries.sums.list))
+        self.assertTrue(asyncio.iscoroutinefunction(client.me.notifications.get))
+
+    def test_get(self):
+        account = self.run_with_client(lambda client: client.accounts.get(id='7'))
+        self.assertIsInstance(account, toshling.models.return_types.Account)
+        self.assertEqual(account.id, '7')
+
+    def test_concurrent(self):
+        async def get_all(client):
+            return await asyncio.gather(*(client.accounts.get(id=str(i)) for i in range(20)))
+
+        accounts = self.run_with_client(get_all)
+        self.assertEqual([a.id for a in accounts], [str(i) for i in range(20)])
+        self.assertGreater(self.server.max_in_flight, 1)
+
+    def test_iter(self):
+        async def collect(client):
+            return [a.id async for a in client.accounts.iter(per_page=10)]
+
+        self.assertEqual(self.run_with_client(collect), [str(i) for i in range(25)])
+
+    def test_iter_prefetch(self):
+        async def collect(client):
+            return [len(p) async for p in client.accounts.iter_pages(per_page=10, prefetch=3)]
+
+        self.assertEqual(self.run_with_client(collect), [10, 10, 5])
+        self.assertEqual(self.server.max_in_flight, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,198 @@
+import asyncio
+import time
+import unittest
+import requests
+import toshling
+from statham.schema.exceptions import ValidationError
+from toshling._async_client import httpx
+from toshling.models import return_types
+from benchmark.server import FakeToshl, make_entry
+
+
+def row(i):
+    return {'amount': -1.5 - i, 'currency': {'code': 'AUD'}, 'date': '2020-01-01', 'account': '1',
+            'category': '2', 'desc': f'Imported {i}'}
+
+
+class TestBulkCreate(unittest.TestCase):
+    def setUp(self):
+        self.server = FakeToshl(latency=0.02).start()
+        self.client = toshling.Client('key', api_endpoint_base=self.server.base_url,
+                                      retry=toshling.RetryPolicy(backoff_factor=0))
+
+    def tearDown(self):
+        self.client.close()
+        self.server.stop()
+
+    def test_create(self):
+        rows = [row(i) for i in range(40)]
+        rows[3]['amount'] = 'lots'
+        del rows[7]['date']
+        rows[9]['unknown'] = True
+
+        report = self.client.entries.bulk_create(iter(rows), concurrency=8)
+        self.assertEqual([r.index for r in report], list(range(40)))
+        self.assertEqual([r.index for r in report.failed], [3, 7, 9])
+        self.assertIsInstance(report.failed[0].error, ValidationError)
+        self.assertIsInstance(report.failed[2].error, KeyError)
+        self.assertEqual(len(report.succeeded), 37)
+        self.assertTrue(report.succeeded[0].result.startswith('/entries/'))
+
+        # Only valid rows were sent, concurrently.
+        self.assertEqual(self.server.requests, 37)
+        self.assertEqual(sorted(e['desc'] for e in self.server.entries),
+                         sorted(r['desc'] for i, r in enumerate(rows) if i not in (3, 7, 9)))
+        self.assertGreater(self.server.max_in_flight, 1)
+        self.assertLessEqual(self.server.max_in_flight, 8)
+
+    def test_concurrency(self):
+        start = time.perf_counter()
+        self.client.entries.bulk_create([row(i) for i in range(40)], concurrency=1)
+        serial = time.perf_counter() - start
+        start = time.perf_counter()
+        self.client.entries.bulk_create([row(i) for i in range(40)], concurrency=8)
+        self.assertLess(time.perf_counter() - start, serial / 2)
+
+    def test_server_errors(self):
+        self.server.fail(422)
+        report = self.client.entries.bulk_create([row(i) for i in range(3)], concurrency=1)
+        self.assertEqual([r.ok for r in report], [False, True, True])
+        self.assertIsInstance(report.failed[0].error, requests.HTTPError)
+
+    def test_unexpected_errors(self):
+        # Even an unexpected error only fails its own row.
+        load = self.client._bulk_result
+        calls = []
+
+        def fail_first(*args):
+            calls.append(args)
+            if len(calls) == 1:
+                raise RuntimeError('Unexpected')
+            return load(*args)
+
+        self.client._bulk_result = fail_first
+        report = self.client.entries.bulk_create([row(i) for i in range(3)], concurrency=1)
+        self.assertEqual([r.ok for r in report], [False, True, True])
+        self.assertIsInstance(report.failed[0].error, RuntimeError)
+
+    def test_rate_limited(self):
+        # A rejected create is retried once the limit resets.
+        self.server.fail(429, headers={'Retry-After': '0.3'})
+        start = time.perf_counter()
+        report = self.client.entries.bulk_create([row(i) for i in range(4)], concurrency=1)
+        self.assertEqual(len(report.succeeded), 4)
+        self.assertGreaterEqual(time.perf_counter() - start, 0.3)
+        self.assertEqual(self.client.retry.stats.statuses, {429: 1})
+
+    def test_rate_limit_exhausted(self):
+        # Requests wait for an exhausted rate limit to reset, without being
+        # rejected first.
+        self.client._note_rate_limit({'X-RateLimit-Remaining': '0', 'X-RateLimit-Reset': '0.3'})
+        start = time.perf_counter()
+        report = self.client.entries.bulk_create([row(i) for i in range(4)])
+        self.assertEqual(len(report.succeeded), 4)
+        self.assertGreaterEqual(time.perf_counter() - start, 0.3)
+        self.assertEqual(self.server.requests, 4)
+
+    def test_rate_limit_reset_capped(self):
+        # A distant reset only pauses requests for up to `backoff_max`.
+        self.client.retry.backoff_max = 0.3
+        self.client._note_rate_limit({'X-RateLimit-Remaining': '0', 'X-RateLimit-Reset': '86400'})
+        self.assertLessEqual(self.client._paused(), 0.3)
+        self.client.retry = None
+        self.client._note_rate_limit({'X-RateLimit-Remaining': '0', 'X-RateLimit-Reset': '86400'})
+        self.assertLessEqual(self.client._paused(), toshling.RetryPolicy().backoff_max)
+
+    def test_dry_run(self):
+        rows = [row(i) for i in range(5)]
+        rows[1]['amount'] = None
+        report = self.client.entries.bulk_create(rows, dry_run=True)
+        self.assertTrue(report.dry_run)
+        self.assertEqual([r.ok for r in report], [True, False, True, True, True])
+        self.assertEqual(self.server.requests, 0)
+
+    def test_dry_run_unvalidated(self):
+        # Dry runs validate rows even when the client doesn't.
+        client = toshling.Client('key', api_endpoint_base=self.server.base_url, validate=False)
+        report = client.entries.bulk_create([{'amount': 'lots'}, row(1)], dry_run=True)
+        self.assertEqual([r.ok for r in report], [False, True])
+        self.assertIsInstance(report.failed[0].error, ValidationError)
+
+
+class TestBulkUpdateDelete(unittest.TestCase):
+    def setUp(self):
+        self.server = FakeToshl(entries=30).start()
+        self.client = toshling.Client('key', api_endpoint_base=self.server.base_url)
+
+    def tearDown(self):
+        self.client.close()
+        self.server.stop()
+
+    def rows(self, ids):
+        fields = ('id', 'amount', 'currency', 'date', 'desc', 'account', 'tags')
+        return [{**{k: make_entry(i)[k] for k in fields}, 'category': 'recategorized', 'modified': 'now'}
+                for i in ids]
+
+    def test_update(self):
+        rows = self.rows(range(10))
+        rows[4]['id'] = 'missing'
+        report = self.client.entries.update_many(rows, concurrency=4)
+        self.assertEqual([r.index for r in report.failed], [4])
+        self.assertIsInstance(report.failed[0].error, requests.HTTPError)
+        self.assertIsInstance(report.succeeded[0].result, return_types.Entry)
+        self.assertEqual(report.succeeded[0].result.category, 'recategorized')
+        self.assertEqual([e['category'] for e in self.server.entries[:4]], ['recategorized'] * 4)
+
+    def test_delete(self):
+        report = self.client.entries.delete_many(['1', '2', {'id': '3'}, {}])
+        self.assertEqual([r.ok for r in report], [True, True, True, False])
+        self.assertIsInstance(report.failed[0].error, ValidationError)
+        entries = self.client.entries.list(from_='2015-01-01', to='2015-12-31')
+        self.assertEqual(len(entries), 27)
+
+    def test_dry_run(self):
+        rows = self.rows(range(3))
+        del rows[1]['modified']
+        report = self.client.entries.update_many(rows, dry_run=True)
+        self.assertEqual([r.ok for r in report], [True, False, True])
+        self.assertEqual(self.server.requests, 0)
+        self.assertEqual(self.server.entries[0], make_entry(0))
+
+
+@unittest.skipIf(httpx is None, 'httpx is not installed')
+class TestAsyncBulkCreate(unittest.TestCase):
+    def test_create(self):
+        async def run(server):
+            async with toshling.AsyncClient('key', api_endpoint_base=server.base_url) as client:
+                rows = [row(i) for i in range(20)]
+                rows[5]['amount'] = 'lots'
+                return await client.entries.bulk_create(rows, concurrency=4)
+
+        with FakeToshl(latency=0.02) as server:
+            report = asyncio.run(run(server))
+            self.assertEqual([r.index for r in report.failed], [5])
+            self.assertEqual(len(report.succeeded), 19)
+            self.assertEqual(len(server.entries), 19)
+            self.assertLessEqual(server.max_in_flight, 4)
+
+    def test_unexpected_errors(self):
+        async def run(server):
+            async with toshling.AsyncClient('key', api_endpoint_base=server.base_url) as client:
+                load = client._bulk_result
+
+                def fail_second(*args):
+                    if b'Imported 1' in args[-1].request.content:
+                        raise RuntimeError('Unexpected')
+                    return load(*args)
+
+                client._bulk_result = fail_second
+                return await client.entries.bulk_create([row(i) for i in range(3)])
+
+        with FakeToshl() as server:
+            report = asyncio.run(run(server))
+        self.assertEqual([r.ok for r in report], [True, False, True])
+        self.assertIsInstance(report.failed[0].error, RuntimeError)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,181 @@
+import asyncio
+import threading
+import unittest
+import requests
+import toshling
+from toshling._async_client import httpx
+from benchmark.server import FakeToshl
+
+
+class TestHTTPCache(unittest.TestCase):
+    def setUp(self):
+        self.server = FakeToshl().start()
+        self.cache = toshling.HTTPCache(maxsize=2)
+        self.client = toshling.Client('key', api_endpoint_base=self.server.base_url, http_cache=self.cache)
+
+    def tearDown(self):
+        self.client.close()
+        self.server.stop()
+
+    def test_not_modified(self):
+        accounts = self.client.accounts.list()
+        self.assertIs(self.client.accounts.list(), accounts)
+        self.assertEqual(self.server.requests, 2)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+    def test_modified(self):
+        accounts = self.client.accounts.list()
+        self.server.accounts[0]['name'] = 'Renamed'
+        changed = self.client.accounts.list()
+        self.assertIsNot(changed, accounts)
+        self.assertEqual(changed[0].name, 'Renamed')
+        self.assertEqual((self.cache.hits, self.cache.misses), (0, 2))
+
+    def test_params(self):
+        self.client.accounts.list(per_page=10)
+        self.client.accounts.list(per_page=20)
+        self.assertEqual((self.cache.hits, self.cache.misses), (0, 2))
+        self.client.accounts.list(per_page=10)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 2))
+
+    def test_last_modified(self):
+        key = self.cache.key('url', None)
+        self.cache.store(key, {'Last-Modified': 'then'}, ['result'])
+        self.assertEqual(self.cache.conditional_headers(self.cache.get(key)), {'If-Modified-Since': 'then'})
+
+    def test_eviction(self):
+        for i in range(3):
+            self.client.accounts.get(id=str(i))
+        self.client.accounts.get(id='0')
+        self.assertEqual((self.cache.hits, self.cache.misses), (0, 4))
+
+    def test_disabled(self):
+        client = toshling.Client('key', api_endpoint_base=self.server.base_url)
+        self.assertIsNot(client.accounts.list(), client.accounts.list())
+
+
+class TestResponseCache(unittest.TestCase):
+    def setUp(self):
+        self.now = 0
+        self.server = FakeToshl().start()
+        self.cache = toshling.ResponseCache(ttl=10, ttls={'/accounts/{id}': 100}, clock=lambda: self.now)
+        self.client = toshling.Client('key', api_endpoint_base=self.server.base_url, response_cache=self.cache)
+
+    def tearDown(self):
+        self.client.close()
+        self.server.stop()
+
+    def test_hit(self):
+        account = self.client.accounts.get(id='1')
+        self.assertIs(self.client.accounts.get(id='1'), account)
+        self.assertIsNot(self.client.accounts.get(id='2'), account)
+        self.assertEqual(self.server.requests, 2)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 2))
+
+    def test_ttl(self):
+        self.client.accounts.list()
+        self.client.accounts.get(id='1')
+        self.now = 50
+        self.client.accounts.list()
+        self.client.accounts.get(id='1')
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 3))
+
+    def test_invalidation(self):
+        self.client.accounts.list()
+        self.client.accounts.get(id='1')
+        # Unrelated resources are untouched.
+        self.cache.store(('/tags', ()), ['tag'])
+        self.client.accounts.update(id='1', name='Renamed', currency={'code': 'AUD', 'fixed': False}, modified='now')
+        self.assertEqual(self.cache.size, 1)
+        self.assertEqual(self.client.accounts.get(id='1').name, 'Renamed')
+        self.assertEqual(self.cache.invalidations, 2)
+
+    def test_entries_invalidate_accounts(self):
+        self.client.accounts.list()
+        self.cache.invalidate('/entries/{id}')
+        self.assertEqual(self.cache.size, 0)
+
+    def test_lru(self):
+        cache = toshling.ResponseCache(maxsize=2, maxbytes=100)
+        cache.store(('a', ()), 'a', 10)
+        cache.store(('b', ()), 'b', 10)
+        cache.get(('a', ()))
+        cache.store(('c', ()), 'c', 10)
+        self.assertRaises(KeyError, cache.get, ('b', ()))
+        cache.store(('d', ()), 'd', 85)
+        self.assertEqual((cache.size, cache.bytes), (2, 95))
+        self.assertEqual(cache.evictions, 2)
+        cache.store(('e', ()), 'e', 101)
+        self.assertRaises(KeyError, cache.get, ('e', ()))
+
+
+class TestSingleFlight(unittest.TestCase):
+    def setUp(self):
+        self.server = FakeToshl(latency=0.2).start()
+        self.coalesce = toshling.SingleFlight()
+        self.client = toshling.Client('key', api_endpoint_base=self.server.base_url, coalesce=self.coalesce)
+
+    def tearDown(self):
+        self.client.close()
+        self.server.stop()
+
+    def concurrently(self, function, count=8):
+        barrier = threading.Barrier(count)
+        results = [None] * count
+
+        def run(i):
+            barrier.wait()
+            try:
+                results[i] = function(i)
+            except requests.HTTPError as e:
+                results[i] = e
+
+        threads = [threading.Thread(target=run, args=(i,)) for i in range(count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results
+
+    def test_shared(self):
+        results = self.concurrently(lambda i: self.client.accounts.list())
+        self.assertEqual(self.server.requests, 1)
+        self.assertTrue(all(r is results[0] for r in results))
+        self.assertEqual((self.coalesce.calls, self.coalesce.shared), (1, 7))
+
+        # Nothing is kept once the call completes.
+        self.client.accounts.list()
+        self.assertEqual(self.server.requests, 2)
+
+    def test_params(self):
+        results = self.concurrently(lambda i: self.client.accounts.list(per_page=10 + i % 2), 4)
+        self.assertEqual([len(r) for r in results], [10, 11, 10, 11])
+        self.assertEqual(self.server.requests, 2)
+
+    def test_errors_shared(self):
+        self.server.fail(404)
+        results = self.concurrently(lambda i: self.client.accounts.get(id='1'), 4)
+        self.assertTrue(all(isinstance(r, requests.HTTPError) for r in results))
+        self.assertEqual(self.server.requests, 1)
+
+    def test_writes_not_coalesced(self):
+        self.concurrently(lambda i: self.client.accounts.update(id='1', name='Renamed', modified='now',
+                                                                currency={'code': 'AUD', 'fixed': False}), 3)
+        self.assertEqual(self.server.requests, 3)
+
+    @unittest.skipIf(httpx is None, 'httpx is not installed')
+    def test_async(self):
+        async def run():
+            async with toshling.AsyncClient('key', api_endpoint_base=self.server.base_url,
+                                            coalesce=True) as client:
+                return await asyncio.gather(*(client.accounts.list() for _ in range(5)),
+                                            client.accounts.list(per_page=10))
+
+        results = asyncio.run(run())
+        self.assertEqual(self.server.requests, 2)
+        self.assertIs(results[4], results[0])
+        self.assertEqual(len(results[5]), 10)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+import asyncio
+import gzip
+import os
+import tempfile
+import time
+import unittest
+import toshling
+from toshling._async_client import httpx
+from toshling.cassette import SCRUBBED, Cassette, CassetteMiss
+from toshling.models import return_types
+from benchmark.server import FakeToshl
+
+
+OFFLINE = 'http://127.0.0.1:9'
+
+
+class TestCassette(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'toshl.jsonl.gz')
+        self.kwargs = {'from_': '2015-01-01', 'to': '2015-12-31', 'per_page': 10}
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def record(self, latency=0):
+        cassette = Cassette()
+        with FakeToshl(entries=25, latency=latency) as server:
+            with toshling.Client('secret-key', api_endpoint_base=server.base_url,
+                                 transport=cassette.recorder()) as client:
+                entries = [e for page in client.entries.iter_pages(**self.kwargs) for e in page]
+                currencies = client.currencies.list()
+                client.entries.create(amount=-5, currency={'code': 'AUD'}, date='2020-01-01',
+                                      account='1', category='2')
+        cassette.save(self.path)
+        return entries, currencies
+
+    def test_replay(self):
+        entries, currencies = self.record()
+        with gzip.open(self.path, 'rt') as f:
+            self.assertNotIn('secret-key', f.read())
+
+        cassette = Cassette.load(self.path)
+        self.assertEqual(len(cassette), 5)
+        with toshling.Client('other-key', api_endpoint_base=OFFLINE, transport=cassette.player()) as client:
+            self.assertEqual([e for page in client.entries.iter_pages(**self.kwargs) for e in page], entries)
+            self.assertEqual(client.currencies.list(), currencies)
+            self.assertIsInstance(client.currencies.list()['AUD'], return_types.CurrencyElement)
+            # Streamed responses are replayed too.
+            self.assertEqual(list(client.entries.iter(stream=True, **self.kwargs)), entries)
+            self.assertRaises(CassetteMiss, client.entries.get, id='1')
+
+    def test_latency(self):
+        self.record(latency=0.05)
+        cassette = Cassette.load(self.path)
+        with toshling.Client('key', api_endpoint_base=OFFLINE, transport=cassette.player()) as client:
+            start = time.perf_counter()
+            client.entries.list(page=0, **self.kwargs)
+            self.assertLess(time.perf_counter() - start, 0.05)
+        with toshling.Client('key', api_endpoint_base=OFFLINE, transport=cassette.player(latency=True)) as client:
+            start = time.perf_counter()
+            client.entries.list(page=0, **self.kwargs)
+            self.assertGreaterEqual(time.perf_counter() - start, 0.05)
+
+    def test_scrub(self):
+        cassette = Cassette()
+        cassette.record('GET', 'https://api2.toshl.com/me?b=2&a=1', None, 200,
+                        {'Content-Type': 'application/json', 'Content-Encoding': 'gzip', 'X-Key': 'k-123'},
+                        b'{"key": "k-123"}', 0.01, api_key='k-123')
+        interaction = cassette.interactions[0]
+        self.assertEqual(interaction['url'], '/me?a=1&b=2')
+        self.assertEqual(interaction['headers'], {'content-type': 'application/json', 'x-key': SCRUBBED})
+        self.assertEqual(interaction['content'], f'{{"key": "{SCRUBBED}"}}')
+
+    def test_order(self):
+        # Repeated requests are answered in the order they were recorded, then
+        # again from the first.
+        cassette = Cassette()
+        for i in range(2):
+            cassette.record('GET', '/me', None, 200, {}, str(i).encode(), 0)
+        self.assertEqual([cassette.play('GET', '/me', None)['content'] for _ in range(3)], ['0', '1', '0'])
+        cassette.rewind()
+        self.assertEqual(cassette.play('GET', '/me', None)['content'], '0')
+
+
+@unittest.skipIf(httpx is None, 'httpx is not installed')
+class TestAsyncCassette(unittest.TestCase):
+    def test_replay(self):
+        kwargs = {'from_': '2015-01-01', 'to': '2015-12-31'}
+
+        async def run(base_url, transport):
+            async with toshling.AsyncClient('secret-key', api_endpoint_base=base_url, transport=transport) as client:
+                return await client.entries.list(**kwargs), await client.currencies.list()
+
+        cassette = Cassette()
+        with FakeToshl(entries=15) as server:
+            recorded = asyncio.run(run(server.base_url, cassette.async_recorder()))
+        self.assertEqual(len(cassette), 2)
+        self.assertEqual(asyncio.run(run(OFFLINE, cassette.async_player())), recorded)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+import json
+import unittest
+from statham.schema.exceptions import ValidationError
+import toshling
+from toshling._client import _href_builder
+from toshling.models import argument_types, compiled_argument_types
+from benchmark.server import FakeToshl
+
+
+class TestSession(unittest.TestCase):
+    def setUp(self):
+        self.server = FakeToshl().start()
+        self.client = toshling.Client('key', api_endpoint_base=self.server.base_url)
+
+    def tearDown(self):
+        self.client.close()
+        self.server.stop()
+
+    def test_connection_reuse(self):
+        for _ in range(5):
+            self.client.accounts.list()
+        self.assertEqual(self.server.requests, 5)
+        self.assertEqual(self.server.connections, 1)
+
+    def test_pool_size(self):
+        client = toshling.Client('key', pool_connections=2, pool_maxsize=4, pool_block=True)
+        adapter = client.session.get_adapter('https://api2.toshl.com')
+        self.assertEqual(adapter._pool_connections, 2)
+        self.assertEqual(adapter._pool_maxsize, 4)
+        self.assertTrue(adapter._pool_block)
+        client.close()
+
+    def test_context_manager(self):
+        with toshling.Client('key', api_endpoint_base=self.server.base_url) as client:
+            account = client.accounts.get(id='3')
+            self.assertIsInstance(account, toshling.models.return_types.Account)
+            self.assertEqual(account.name, 'Account 3')
+        self.assertFalse(client.session.adapters['http://'].poolmanager.pools)
+
+
+class TestPrepare(unittest.TestCase):
+    def setUp(self):
+        self.client = toshling.Client('key')
+        self.kwargs = {'amount': -5, 'currency': {'code': 'AUD'}, 'date': '2020-01-01', 'account': '1',
+                       'category': '2'}
+
+    def test_prepare(self):
+        url, params, body = self.client.prepare('/entries', 'GET', argument_types.EntriesListArgument,
+                                                from_='2020-01-01', to='2020-01-31')
+        self.assertEqual(url, 'https://api2.toshl.com/entries')
+        self.assertEqual(params, {'from': '2020-01-01', 'to': '2020-01-31'})
+        self.assertIsNone(body)
+
+        url, _, body = self.client.prepare('/entries/{id}', 'PUT', argument_types.EntriesUpdateArgument,
+                                           id='7', modified='now', **self.kwargs)
+        self.assertEqual(url, 'https://api2.toshl.com/entries/7')
+        # Validated arguments are sent with their defaults.
+        self.assertIs(json.loads(body)['completed'], False)
+
+        self.assertRaises(KeyError, self.client.prepare, '/entries', 'GET', argument_types.EntriesListArgument,
+                          from_='2020-01-01', to='2020-01-31', nope=1)
+        self.assertRaises(ValidationError, self.client.prepare, '/entries', 'GET',
+                          argument_types.EntriesListArgument, from_='2020-01-01')
+
+    def test_unvalidated(self):
+        client = toshling.Client('key', validate=False)
+        _, params, _ = client.prepare('/entries', 'GET', argument_types.EntriesListArgument, from_='2020-01-01')
+        self.assertEqual(params, {'from': '2020-01-01'})
+        _, _, body = client.prepare('/entries', 'POST', argument_types.EntriesCreateArgument, **self.kwargs)
+        self.assertEqual(json.loads(body), self.kwargs)
+
+    def test_validate_changed(self):
+        # The client validates as `validate` is when a request is prepared,
+        # not as it was when the argument type was first used.
+        arguments = ('/entries', 'GET', argument_types.EntriesListArgument)
+        self.client.prepare(*arguments, from_='2020-01-01', to='2020-01-31')
+        self.client.validate = False
+        self.assertEqual(self.client.prepare(*arguments, from_='2020-01-01')[1], {'from': '2020-01-01'})
+        self.client.validate = True
+        self.assertRaises(ValidationError, self.client.prepare, *arguments, from_='2020-01-01')
+
+    def test_keywords(self):
+        for model, keywords in compiled_argument_types.KEYWORDS.items():
+            self.assertEqual(keywords, {k: p.source for k, p in model.properties.items()})
+        self.assertEqual(compiled_argument_types.KEYWORDS[argument_types.EntriesListArgument]['from_'], 'from')
+
+    def test_href(self):
+        for href, kwargs in [('/entries', {'id': '1'}), ('/entries/{id}', {'id': '1'}),
+                             ('/budgets/{id}/history', {'id': 2}), ('/a/{b}/{c}', {'b': 1, 'c': 2})]:
+            self.assertEqual(_href_builder(href)(kwargs), href.format(**kwargs))
+        self.assertRaises(KeyError, _href_builder('/entries/{id}'), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+import collections
+import datetime
+import unittest
+import toshling
+from toshling.columns import EntryTable, np, to_columns
+from benchmark.server import FakeToshl, make_entry
+
+
+@unittest.skipIf(np is None, 'numpy is not installed')
+class TestEntryTable(unittest.TestCase):
+    def setUp(self):
+        self.entries = [make_entry(i) for i in range(500)]
+        self.table = EntryTable.from_pages([self.entries[:200], self.entries[200:], []])
+
+    def test_columns(self):
+        table = self.table
+        self.assertEqual(len(table), 500)
+        self.assertEqual(table.amount.dtype, np.float64)
+        self.assertEqual(table.date.dtype, np.dtype('datetime64[D]'))
+        self.assertEqual(table.date[7], np.datetime64(self.entries[7]['date']))
+        self.assertEqual(table.id.tolist(), [e['id'] for e in self.entries])
+        self.assertEqual(table.amount.tolist(), [e['amount'] for e in self.entries])
+        self.assertEqual(table.currency.tolist(), ['AUD'] * 500)
+        self.assertEqual(table.completed.tolist(), [e['completed'] for e in self.entries])
+        for i in (0, 13, 499):
+            self.assertEqual(table.tags(i), self.entries[i]['tags'])
+
+    def test_empty(self):
+        table = EntryTable.from_pages([])
+        self.assertEqual(len(table), 0)
+        self.assertEqual(table.sum_by('category'), {})
+
+    def test_sum_by(self):
+        expected = collections.defaultdict(float)
+        for e in self.entries:
+            month = datetime.date.fromisoformat(e['date']).replace(day=1)
+            for tag in e['tags']:
+                if e['completed']:
+                    expected[(e['category'], tag, month)] += e['amount']
+        result = self.table.sum_by('category', 'tag', period='M', where=self.table.completed)
+        self.assertEqual(result.keys(), expected.keys())
+        for key, total in expected.items():
+            self.assertAlmostEqual(result[key], total)
+
+        self.assertAlmostEqual(self.table.sum_by()[()], sum(e['amount'] for e in self.entries))
+
+    def test_sum_by_many_keys(self):
+        # The keys could combine to billions of groups, but only those seen
+        # are counted.
+        result = self.table.sum_by('id', 'amount', 'category', 'tag', period='D')
+        expected = collections.defaultdict(float)
+        for e in self.entries:
+            for tag in e['tags']:
+                expected[(e['id'], e['amount'], e['category'], tag, datetime.date.fromisoformat(e['date']))] += e['amount']
+        self.assertEqual(result.keys(), expected.keys())
+        for key, total in expected.items():
+            self.assertAlmostEqual(result[key], total)
+
+
+@unittest.skipIf(np is None, 'numpy is not installed')
+class TestToColumns(unittest.TestCase):
+    def test_fetch(self):
+        with FakeToshl(entries=45) as server:
+            client = toshling.Client('key', api_endpoint_base=server.base_url)
+            table = to_columns(client, from_='2015-01-01', to='2015-12-31', per_page=10)
+            self.assertEqual(server.requests, 5)
+            raw = client.entries.list(from_='2015-01-01', to='2015-12-31', raw=True)
+        self.assertEqual(table.id.tolist(), [str(i) for i in range(45)])
+        self.assertIsInstance(raw[0], dict)
+        self.assertEqual(raw[0], make_entry(0))
+
+
+if __name__ == '__main__':
+    unittest.main()
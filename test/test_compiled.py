@@ -0,0 +1,89 @@
+import unittest
+from pathlib import Path
+from statham.schema.constants import NotPassed
+from statham.schema.exceptions import ValidationError
+import toshling
+from toshling._decode import compiled
+from toshling.models import argument_types, compiled_argument_types, compiled_return_types, return_types
+from benchmark.server import make_account, make_entry
+from compile_models import ModelCompiler
+
+
+class TestCompiledDecoders(unittest.TestCase):
+    def setUp(self):
+        self.entry = make_entry(3)
+        self.entry['location'] = {'latitude': 1.5, 'longitude': 2}
+        self.entry['images'] = [{'id': 'i1', 'type': 'image/png'}]
+        self.entry['unknown'] = {'nested': [{'a': 1}]}
+
+    def assertMatches(self, model, value):
+        try:
+            expected = model(value)
+        except ValidationError as e:
+            with self.assertRaises(ValidationError) as raised:
+                compiled(model)(value)
+            self.assertEqual(str(raised.exception), str(e))
+        else:
+            # Valid values shouldn't need statham.
+            decoders = {**compiled_return_types.DECODERS, **compiled_argument_types.DECODERS}
+            actual = decoders[model](value)
+            self.assertIs(type(actual), model)
+            self.assertEqual(actual, expected)
+            self.assertEqual(vars(actual).keys(), vars(expected).keys())
+            self.assertEqual({k: type(v) for k, v in vars(actual).items()},
+                             {k: type(v) for k, v in vars(expected).items()})
+
+    def test_generated_source_is_current(self):
+        for module in (return_types, argument_types):
+            path = Path(module.__file__).with_name(f'compiled_{module.__name__.rsplit(".", 1)[-1]}.py')
+            self.assertEqual(path.read_text(), ModelCompiler(module).source())
+
+    def test_valid(self):
+        self.assertMatches(return_types.Entry, self.entry)
+        self.assertMatches(return_types.Account, make_account(2))
+        self.assertMatches(return_types.Currency, {'code': 'AUD', 'rate': 1})
+        self.assertMatches(return_types.EntryRepeat, {'frequency': 'daily', 'interval': 2, 'start': '2020-01-01'})
+        self.assertMatches(argument_types.EntriesListArgument, {'from': '2020-01-01', 'to': '2020-02-01'})
+        self.assertMatches(argument_types.EntriesUpdateArgument,
+                           {'id': '1', 'amount': -1, 'currency': {'code': 'AUD'}, 'date': '2020-01-01', 'account': '1',
+                            'category': '2', 'modified': 'now', 'tags': ['1', {'a': 1}]})
+        # Models of the same name in both modules are kept apart.
+        self.assertIs(type(compiled(argument_types.Export)({})), argument_types.Export)
+        self.assertIs(type(compiled(return_types.Export)({})), return_types.Export)
+
+    def test_defaults(self):
+        del self.entry['completed']
+        entry = compiled(return_types.Entry)(self.entry)
+        self.assertIs(entry.completed, False)
+        self.assertIsInstance(entry.repeat, NotPassed)
+        self.assertEqual(compiled(return_types.Currency)({}).fixed, 'false')
+        self.assertMatches(return_types.Currency, {})
+
+    def test_invalid(self):
+        cases = [
+            ('amount', 'not a number'),
+            ('amount', True),
+            ('amount', 1e16),
+            ('date', '2020-13-01'),
+            ('created', None),
+            ('desc', 'x' * 4000),
+            ('tags', ['1', 2]),
+            ('tags', 'not a list'),
+            ('currency', {'code': 'aud'}),
+            ('images', [{'id': 'i'}] * 5),
+            ('repeat', {'frequency': 'daily'}),
+            ('repeat', {'frequency': 'hourly', 'interval': 1, 'start': '2020-01-01'}),
+        ]
+        for key, value in cases:
+            with self.subTest(key=key, value=value):
+                self.assertMatches(return_types.Entry, {**self.entry, key: value})
+        self.assertMatches(return_types.Entry, None)
+        self.assertMatches(argument_types.EntriesListArgument, {'from': '2020-01-01', 'to': '2020-02-01', 'per_page': 5})
+
+    def test_client(self):
+        statham = toshling.Client('key', decode='statham').decode([self.entry], return_types.Entry)
+        self.assertEqual(toshling.Client('key').decode([self.entry], return_types.Entry), statham)
+
+
+if __name__ == '__main__':
+    unittest.main()
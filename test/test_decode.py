@@ -0,0 +1,101 @@
+import json
+import unittest
+from statham.schema.constants import NotPassed
+from statham.schema.exceptions import ValidationError
+import toshling
+from toshling.models import compact_types, return_types
+from benchmark.server import FakeToshl, make_entry
+
+
+class TestTrustedDecode(unittest.TestCase):
+    def setUp(self):
+        self.plain = make_entry(3)
+        self.plain['location'] = {'latitude': 1.5, 'longitude': 2.5}
+        self.plain['images'] = [{'id': 'i1'}]
+        self.client = toshling.Client('key', decode='trusted')
+
+    def test_attributes(self):
+        entry = self.client.decode(self.plain, return_types.Entry)
+        self.assertIsInstance(entry, return_types.Entry)
+        self.assertEqual(entry.amount, self.plain['amount'])
+        self.assertIsInstance(entry.location, return_types.EntryLocation)
+        self.assertEqual(entry.location.latitude, 1.5)
+        self.assertIsInstance(entry.images[0], return_types.EntryImage)
+        self.assertEqual(entry.currency.code, 'AUD')
+        self.assertIsInstance(entry.repeat, NotPassed)
+        self.assertRaises(AttributeError, getattr, entry, 'nonsense')
+
+    def test_defaults(self):
+        del self.plain['completed']
+        self.assertIs(self.client.decode(self.plain, return_types.Entry).completed, False)
+
+    def test_matches_statham(self):
+        trusted = self.client.decode([self.plain], return_types.Entry)
+        validated = toshling.Client('key').decode([self.plain], return_types.Entry)
+        self.assertEqual(trusted, validated)
+        encode = lambda model: json.loads(json.dumps(model, cls=toshling._client.StathamJSONEncoder))
+        self.assertEqual(encode(trusted[0]), encode(validated[0]))
+
+    def test_validate(self):
+        self.plain['desc'] = 'x' * 4000
+        entry = self.client.decode(self.plain, return_types.Entry)
+        self.assertEqual(len(entry.desc), 4000)
+        self.assertRaises(ValidationError, entry.validate)
+
+    def test_sample(self):
+        self.plain['amount'] = 'not a number'
+        self.client.decode([self.plain] * 10, return_types.Entry)
+        client = toshling.Client('key', decode='trusted', validate_sample=1.0)
+        self.assertRaises(ValidationError, client.decode, [self.plain], return_types.Entry)
+
+    def test_unknown_mode(self):
+        self.assertRaises(ValueError, toshling.Client, 'key', decode='nonsense')
+
+    def test_request(self):
+        with FakeToshl(entries=20) as server:
+            client = toshling.Client('key', api_endpoint_base=server.base_url, decode='trusted')
+            entries = client.entries.list(from_='2015-01-01', to='2015-12-31')
+        self.assertEqual([e.id for e in entries], [str(i) for i in range(20)])
+
+
+class TestCompactDecode(unittest.TestCase):
+    def setUp(self):
+        self.plain = make_entry(3)
+        self.plain['location'] = {'latitude': 1.5, 'longitude': 2}
+        self.plain['images'] = [{'id': 'i1'}]
+        self.plain['unknown'] = 'kept'
+        self.client = toshling.Client('key', decode='compact')
+
+    def test_attributes(self):
+        entry, = self.client.decode([self.plain], return_types.Entry)
+        self.assertIsInstance(entry, return_types.Entry)
+        self.assertFalse(hasattr(entry, '__dict__') and vars(entry))
+        self.assertEqual(entry.amount, self.plain['amount'])
+        self.assertIsInstance(entry.location, compact_types.EntryLocation)
+        self.assertEqual(entry.location.longitude, 2.0)
+        self.assertIsInstance(entry.images[0], compact_types.EntryImage)
+        self.assertIsInstance(entry.repeat, NotPassed)
+        self.assertEqual(entry['unknown'], 'kept')
+        entry.currency = None
+        self.assertIsNone(entry.currency)
+
+    def test_matches_statham(self):
+        compact = self.client.decode([self.plain], return_types.Entry)
+        validated = toshling.Client('key', decode='statham').decode([self.plain], return_types.Entry)
+        self.assertEqual(compact, validated)
+        self.assertEqual(repr(compact), repr(validated))
+        encode = lambda model: json.loads(json.dumps(model, cls=toshling._client.StathamJSONEncoder))
+        self.assertEqual(encode(compact[0]), encode(validated[0]))
+        self.assertEqual(compact[0].validate(), validated[0])
+
+    def test_validate(self):
+        self.plain['currency']['code'] = 'lowercase'
+        entry, = self.client.decode([self.plain], return_types.Entry)
+        self.assertEqual(entry.currency.code, 'lowercase')
+        self.assertRaises(ValidationError, entry.validate)
+        client = toshling.Client('key', decode='compact', validate_sample=1.0)
+        self.assertRaises(ValidationError, client.decode, [self.plain], return_types.Entry)
+
+
+if __name__ == '__main__':
+    unittest.main()
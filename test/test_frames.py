@@ -0,0 +1,92 @@
+import unittest
+import toshling
+from toshling.frames import FrameBuilder, iter_dataframes, pd, to_dataframe
+from toshling.models import return_types
+from benchmark.server import FakeToshl, make_entry
+
+
+@unittest.skipIf(pd is None, 'pandas is not installed')
+class TestFrameBuilder(unittest.TestCase):
+    def test_days(self):
+        builder = FrameBuilder(return_types.Day)
+        builder.add([
+            {'day': '2020-01-01', 'expenses': {'count': 2, 'sum': 12.5}, 'incomes': {'count': 0, 'sum': 0}},
+            {'day': '2020-01-02', 'expenses': {'count': 1, 'sum': 3}},
+        ])
+        frame = builder.build()
+        self.assertEqual(list(frame.columns),
+                         ['day', 'expenses_count', 'expenses_sum', 'incomes_count', 'incomes_sum', 'modified'])
+        self.assertEqual(frame['day'].dtype, 'datetime64[ns]')
+        self.assertEqual(frame['day'][1], pd.Timestamp('2020-01-02'))
+        self.assertEqual(frame['expenses_sum'].tolist(), [12.5, 3.0])
+        self.assertEqual(frame['incomes_count'].dtype, 'Int64')
+        self.assertTrue(pd.isna(frame['incomes_count'][1]))
+        self.assertEqual(len(builder), 0)
+
+    def test_sums(self):
+        builder = FrameBuilder(return_types.CategorySum, columns=['category', 'category_type', 'expenses_sum'])
+        builder.add([{'category': '1', 'category_type': 'expense', 'expenses': {'count': 1, 'sum': 5}}] * 3)
+        frame = builder.build()
+        self.assertEqual(list(frame.columns), ['category', 'category_type', 'expenses_sum'])
+        self.assertIsInstance(frame['category'].dtype, pd.CategoricalDtype)
+        self.assertEqual(list(frame['category_type'].cat.categories), ['expense'])
+
+        builder = FrameBuilder(return_types.TagSum)
+        builder.add([{'tag': '7', 'incomes': {'categories': ['1', '2'], 'count': 2, 'sum': 10}}])
+        frame = builder.build()
+        self.assertEqual(frame['incomes_categories'][0], ['1', '2'])
+        self.assertEqual(frame['tag'].tolist(), ['7'])
+
+    def test_date_times(self):
+        builder = FrameBuilder(return_types.Notification, columns=['id', 'date'])
+        builder.add([{'id': '1', 'date': '2020-01-02T03:04:05Z'}, {'id': '2', 'date': '2020-01-02T05:04:05+02:00'},
+                     {'id': '3', 'date': '2020-01-02T03:04:05'}, {'id': '4'}])
+        frame = builder.build()
+        self.assertEqual(frame['date'].dtype, 'datetime64[ns]')
+        self.assertEqual(frame['date'][:3].tolist(), [pd.Timestamp('2020-01-02 03:04:05')] * 3)
+        self.assertTrue(pd.isna(frame['date'][3]))
+
+    def test_unknown_column(self):
+        self.assertRaises(ValueError, FrameBuilder, return_types.Day, columns=['day', 'nope'])
+
+
+@unittest.skipIf(pd is None, 'pandas is not installed')
+class TestToDataFrame(unittest.TestCase):
+    def setUp(self):
+        self.server = FakeToshl(entries=45).start()
+        self.client = toshling.Client('key', api_endpoint_base=self.server.base_url)
+        self.kwargs = {'from_': '2015-01-01', 'to': '2015-12-31', 'per_page': 10}
+
+    def tearDown(self):
+        self.client.close()
+        self.server.stop()
+
+    def test_entries(self):
+        frame = to_dataframe(self.client.entries, chunk_size=20, **self.kwargs)
+        expected = [make_entry(i) for i in range(45)]
+        self.assertEqual(len(frame), 45)
+        self.assertEqual(frame['id'].tolist(), [e['id'] for e in expected])
+        self.assertEqual(frame['amount'].tolist(), [e['amount'] for e in expected])
+        self.assertEqual(frame['tags'][44], expected[44]['tags'])
+        # Categories of every chunk are combined.
+        self.assertIsInstance(frame['category'].dtype, pd.CategoricalDtype)
+        self.assertEqual(set(frame['category'].cat.categories), {e['category'] for e in expected})
+        self.assertEqual(frame['currency_code'].tolist(), ['AUD'] * 45)
+        self.assertEqual(frame['date'][44], pd.Timestamp(expected[44]['date']))
+
+    def test_notifications(self):
+        frame = to_dataframe(self.client.me.notifications, return_type=return_types.Notification)
+        self.assertEqual(frame['date'][0], pd.Timestamp('2020-01-02 03:04:05'))
+
+    def test_chunks(self):
+        frames = list(iter_dataframes(self.client.entries, columns=['id', 'amount'], chunk_size=20, **self.kwargs))
+        self.assertEqual([len(f) for f in frames], [20, 20, 5])
+
+    def test_empty(self):
+        frame = to_dataframe(self.client.entries, from_='2030-01-01', to='2030-12-31')
+        self.assertEqual(len(frame), 0)
+        self.assertIn('amount', frame.columns)
+
+
+if __name__ == '__main__':
+    unittest.main()
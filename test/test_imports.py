@@ -0,0 +1,71 @@
+import subprocess
+import sys
+import unittest
+import toshling
+from toshling import models
+from toshling._endpoints import Entries
+
+
+# Modules `import toshling` shouldn't import, as they take a while and aren't
+# needed until a request is made (or an `AsyncClient` used).
+LAZY = ['toshling.models.argument_types', 'toshling.models.return_types', 'toshling._async_client', 'httpx',
+        'asyncio']
+
+
+def import_times(code):
+    # The self and cumulative microseconds taken to import each module
+    # imported by `code`, as reported by `python -X importtime`.
+    process = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], capture_output=True, text=True,
+                             check=True)
+    times = {}
+    for line in process.stderr.splitlines():
+        if line.startswith('import time:') and '|' in line and 'self [us]' not in line:
+            own, cumulative, name = line[len('import time:'):].split('|')
+            times[name.strip()] = int(own), int(cumulative)
+    return times, process.stdout
+
+
+class TestImports(unittest.TestCase):
+    def test_import_time(self):
+        times, _ = import_times('import toshling')
+        self.assertIn('toshling._client', times)
+        for name in LAZY:
+            self.assertNotIn(name, times)
+        # Toshling's own modules import quickly, leaving the time to its
+        # dependencies.
+        own = sum(t for name, (t, _) in times.items() if name.startswith('toshling'))
+        self.assertLess(own, 100000)
+
+    def test_models_loaded_on_request(self):
+        code = '\n'.join([
+            'import sys, toshling',
+            'loaded = lambda: all(m in sys.modules for m in ("toshling.models.argument_types",',
+            '                                                 "toshling.models.return_types"))',
+            'client = toshling.Client("key", api_endpoint_base="http://127.0.0.1:9", retry=False)',
+            'client.entries.sums',
+            'print(loaded())',
+            'try:',
+            '    client.entries.get(id="1")',
+            'except Exception:',
+            '    pass',
+            'print(loaded())',
+        ])
+        _, output = import_times(code)
+        self.assertEqual(output.split(), ['False', 'True'])
+
+    def test_namespaces(self):
+        client = toshling.Client('key')
+        self.assertNotIn('entries', vars(client))
+        self.assertIsInstance(client.entries, Entries)
+        self.assertIs(client.entries, client.entries)
+        self.assertIs(client.entries.client, client)
+
+    def test_attributes(self):
+        self.assertIs(models.return_types.Entry, sys.modules['toshling.models.return_types'].Entry)
+        self.assertIs(toshling.AsyncClient, sys.modules['toshling._async_client'].AsyncClient)
+        self.assertRaises(AttributeError, getattr, toshling, 'Nope')
+        self.assertRaises(AttributeError, getattr, models, 'nope')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+import json
+import unittest
+from statham.schema.constants import NotPassed
+import toshling
+from toshling._client import StathamJSONEncoder
+from toshling._json import OrjsonJSON, StdlibJSON, orjson, resolve_backend, to_plain
+from toshling.models import argument_types, return_types
+from benchmark.server import FakeToshl, make_entry
+
+
+class CountingJSON(StdlibJSON):
+    loaded = 0
+
+    @classmethod
+    def loads(cls, data):
+        cls.loaded += 1
+        return super().loads(data)
+
+
+class TestToPlain(unittest.TestCase):
+    def test_matches_encoder(self):
+        plain = make_entry(1)
+        plain['location'] = {'latitude': 1.5, 'longitude': 2.5}
+        plain['unknown'] = {'a': [1]}
+        entry = return_types.Entry(plain)
+        self.assertEqual(to_plain(entry), json.loads(json.dumps(entry, cls=StathamJSONEncoder)))
+        self.assertEqual(to_plain([entry])[0]['location'], {'latitude': 1.5, 'longitude': 2.5})
+
+    def test_sources(self):
+        argument = argument_types.EntriesListArgument({'from': '2020-01-01', 'to': '2020-01-31'})
+        plain = to_plain(argument)
+        self.assertEqual(plain['from'], '2020-01-01')
+        self.assertNotIn('from_', plain)
+        self.assertNotIn(NotPassed(), plain.values())
+
+    def test_dicts(self):
+        # Arguments sent unvalidated are dicts, which may hold models.
+        currency = argument_types.EntriesCreateArgument.properties['currency'].element({'code': 'AUD'})
+        plain = {'code': 'AUD', 'fixed': 'false'}
+        self.assertEqual(to_plain({'amount': -1, 'currency': currency, 'tags': [currency]}),
+                         {'amount': -1, 'currency': plain, 'tags': [plain]})
+        _, _, body = toshling.Client('key', validate=False).prepare(
+            '/entries', 'POST', argument_types.EntriesCreateArgument, amount=-1, currency=currency)
+        self.assertEqual(json.loads(body), {'amount': -1, 'currency': plain})
+
+
+class TestBackends(unittest.TestCase):
+    def test_resolve(self):
+        self.assertIs(resolve_backend(), OrjsonJSON if orjson is not None else StdlibJSON)
+        self.assertIs(resolve_backend('stdlib'), StdlibJSON)
+        self.assertIs(resolve_backend(CountingJSON), CountingJSON)
+
+    def test_roundtrip(self):
+        entry = return_types.Entry(make_entry(2))
+        for backend in [StdlibJSON] + ([OrjsonJSON] if orjson is not None else []):
+            with self.subTest(backend=backend.name):
+                data = backend.dumps(entry)
+                self.assertIsInstance(data, bytes)
+                self.assertEqual(return_types.Entry(backend.loads(data)), entry)
+
+    def test_client(self):
+        with FakeToshl() as server:
+            client = toshling.Client('key', api_endpoint_base=server.base_url, json_backend=CountingJSON)
+            client.accounts.list()
+            account = client.accounts.update(id='1', name='Renamed', currency={'code': 'AUD', 'fixed': False},
+                                             modified='now')
+        self.assertEqual(CountingJSON.loaded, 2)
+        self.assertEqual(account.name, 'Renamed')
+        self.assertEqual(account.currency.code, 'AUD')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,138 @@
+import asyncio
+import gzip
+import json
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import toshling
+from toshling._async_client import httpx
+from toshling.metrics import Histogram, Metrics, prometheus_text
+from benchmark.server import FakeToshl
+
+
+class TestHistogram(unittest.TestCase):
+    def test_buckets(self):
+        histogram = Histogram([1, 10])
+        for value in (0.5, 1, 5, 50):
+            histogram.observe(value)
+        self.assertEqual(histogram.snapshot(),
+                         {'count': 4, 'sum': 56.5, 'buckets': [(1, 2), (10, 3), (float('inf'), 4)]})
+
+
+class TestClientMetrics(unittest.TestCase):
+    def setUp(self):
+        self.server = FakeToshl(entries=30).start()
+        self.metrics = Metrics()
+        self.client = toshling.Client('key', api_endpoint_base=self.server.base_url, metrics=self.metrics,
+                                      retry=toshling.RetryPolicy(backoff_factor=0))
+
+    def tearDown(self):
+        self.client.close()
+        self.server.stop()
+
+    def test_request(self):
+        self.server.fail(503)
+        self.client.entries.list(from_='2015-01-01', to='2015-12-31')
+        self.client.entries.list(from_='2015-01-01', to='2015-12-31', raw=True)
+
+        metrics = self.metrics.snapshot()['GET /entries']
+        self.assertEqual(metrics['statuses'], {503: 1, 200: 2})
+        self.assertEqual(metrics['request_seconds']['count'], 3)
+        self.assertEqual(metrics['validate_seconds']['count'], 2)
+        self.assertEqual(metrics['parse_seconds']['count'], 2)
+        # Raw results aren't decoded.
+        self.assertEqual(metrics['decode_seconds']['count'], 1)
+        self.assertGreater(metrics['response_bytes']['sum'], 30 * 200)
+        self.assertEqual(metrics['request_bytes']['count'], 0)
+
+    def test_write(self):
+        self.client.accounts.update(id='1', name='Renamed', modified='now', currency={'code': 'AUD', 'fixed': False})
+        metrics = self.metrics.snapshot()['PUT /accounts/{id}']
+        self.assertEqual(metrics['statuses'], {200: 1})
+        self.assertEqual(metrics['request_bytes']['count'], 1)
+        self.assertEqual(metrics['decode_seconds']['count'], 1)
+
+    def test_prometheus(self):
+        self.server.fail(404)
+        with self.assertRaises(Exception):
+            self.client.accounts.get(id='1')
+        self.client.accounts.get(id='1')
+        text = self.metrics.export()
+        self.assertEqual(text, prometheus_text(self.metrics.snapshot()))
+        lines = text.splitlines()
+        self.assertIn('# TYPE toshling_responses_total counter', lines)
+        self.assertIn('toshling_responses_total{method="GET",endpoint="/accounts/{id}",status="404"} 1', lines)
+        self.assertIn('toshling_responses_total{method="GET",endpoint="/accounts/{id}",status="200"} 1', lines)
+        self.assertIn('# TYPE toshling_request_seconds histogram', lines)
+        self.assertIn('toshling_request_seconds_bucket{method="GET",endpoint="/accounts/{id}",le="+Inf"} 2', lines)
+        self.assertIn('toshling_request_seconds_count{method="GET",endpoint="/accounts/{id}"} 2', lines)
+
+    def test_disabled(self):
+        client = toshling.Client('key', api_endpoint_base=self.server.base_url)
+        self.assertIsNone(client.metrics)
+        client.accounts.list()
+
+    @unittest.skipIf(httpx is None, 'httpx is not installed')
+    def test_async(self):
+        async def run():
+            async with toshling.AsyncClient('key', api_endpoint_base=self.server.base_url, metrics=True) as client:
+                await client.accounts.list()
+                return client.metrics.snapshot()
+
+        metrics = asyncio.run(run())['GET /accounts']
+        self.assertEqual(metrics['statuses'], {200: 1})
+        self.assertEqual(metrics['decode_seconds']['count'], 1)
+
+
+class _SlowBody(BaseHTTPRequestHandler):
+    # Sends gzipped accounts a while after the headers.
+    body = gzip.compress(json.dumps([{'id': str(i), 'name': 'Account'} for i in range(200)]).encode())
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Length', str(len(self.body)))
+        self.end_headers()
+        self.wfile.flush()
+        time.sleep(0.2)
+        self.wfile.write(self.body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestTransferMetrics(unittest.TestCase):
+    # Waiting for a response is timed until its headers, and its size is
+    # that of the body as sent.
+    def setUp(self):
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), _SlowBody)
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+        self.base_url = f'http://127.0.0.1:{self.httpd.server_address[1]}'
+
+    def tearDown(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def assertTransfer(self, metrics):
+        self.assertLess(metrics['request_seconds']['sum'], 0.2)
+        self.assertEqual(metrics['response_bytes']['sum'], len(_SlowBody.body))
+
+    def test_sync(self):
+        with toshling.Client('key', api_endpoint_base=self.base_url, metrics=True) as client:
+            self.assertEqual(len(client.request('/accounts', 'GET', raw=True)), 200)
+        self.assertTransfer(client.metrics.snapshot()['GET /accounts'])
+
+    @unittest.skipIf(httpx is None, 'httpx is not installed')
+    def test_async(self):
+        async def run():
+            async with toshling.AsyncClient('key', api_endpoint_base=self.base_url, metrics=True) as client:
+                self.assertEqual(len(await client.request('/accounts', 'GET', raw=True)), 200)
+                return client.metrics.snapshot()
+
+        self.assertTransfer(asyncio.run(run())['GET /accounts'])
+
+
+if __name__ == '__main__':
+    unittest.main()
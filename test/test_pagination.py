@@ -0,0 +1,77 @@
+import time
+import unittest
+import toshling
+from benchmark.server import FakeToshl
+
+
+class TestPagination(unittest.TestCase):
+    def setUp(self):
+        self.server = FakeToshl(accounts=25, entries=612).start()
+        self.client = toshling.Client('key', api_endpoint_base=self.server.base_url)
+
+    def tearDown(self):
+        self.client.close()
+        self.server.stop()
+
+    def test_iter(self):
+        entries = list(self.client.entries.iter(from_='2000-01-01', to='2100-01-01'))
+        self.assertEqual([e.id for e in entries], [str(i) for i in range(612)])
+        self.assertIsInstance(entries[0], toshling.models.return_types.Entry)
+        # Default page size is the schema maximum of 500.
+        self.assertEqual(self.server.requests, 2)
+
+    def test_iter_pages(self):
+        pages = list(self.client.accounts.iter_pages(per_page=10))
+        self.assertEqual([len(p) for p in pages], [10, 10, 5])
+        self.assertEqual(self.server.requests, 3)
+
+    def test_exact_multiple(self):
+        pages = list(self.client.accounts.iter_pages(per_page=25))
+        self.assertEqual([len(p) for p in pages], [25])
+        self.assertEqual(self.server.requests, 2)
+
+    def test_start_page(self):
+        accounts = list(self.client.accounts.iter(per_page=10, page=2))
+        self.assertEqual([a.id for a in accounts], [str(i) for i in range(20, 25)])
+
+    def test_per_page_maximum(self):
+        list(self.client.accounts.iter_pages(per_page=1000))
+        self.assertEqual(self.server.requests, 1)
+
+    def test_lazy(self):
+        accounts = self.client.accounts.iter(per_page=10)
+        self.assertEqual(self.server.requests, 0)
+        next(accounts)
+        self.assertEqual(self.server.requests, 1)
+
+
+class TestPrefetch(unittest.TestCase):
+    def setUp(self):
+        self.server = FakeToshl(accounts=95, latency=0.05).start()
+        self.client = toshling.Client('key', api_endpoint_base=self.server.base_url)
+
+    def tearDown(self):
+        self.client.close()
+        self.server.stop()
+
+    def test_in_order(self):
+        accounts = list(self.client.accounts.iter(per_page=10, prefetch=4))
+        self.assertEqual([a.id for a in accounts], [str(i) for i in range(95)])
+
+    def test_concurrency(self):
+        pages = list(self.client.accounts.iter_pages(per_page=10, prefetch=4))
+        self.assertEqual(len(pages), 10)
+        self.assertEqual(self.server.max_in_flight, 4)
+        # Requests past the short last page are bounded by the prefetch depth.
+        self.assertLessEqual(self.server.requests, 10 + 3)
+
+    def test_backpressure(self):
+        pages = self.client.accounts.iter_pages(per_page=10, prefetch=3)
+        next(pages)
+        time.sleep(0.3)
+        self.assertEqual(self.server.requests, 4)
+        pages.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+import unittest
+import requests
+import toshling
+from benchmark.server import FakeToshl
+
+
+class TestRetryPolicy(unittest.TestCase):
+    def test_backoff(self):
+        policy = toshling.RetryPolicy(total=5, backoff_factor=1, backoff_max=5, jitter=False)
+        self.assertEqual([policy.delay('GET', a, 503) for a in range(6)], [1, 2, 4, 5, 5, None])
+
+    def test_jitter(self):
+        policy = toshling.RetryPolicy(backoff_factor=1)
+        for _ in range(20):
+            self.assertTrue(0 <= policy.delay('GET', 2, 503) <= 4)
+
+    def test_statuses(self):
+        policy = toshling.RetryPolicy()
+        self.assertIsNone(policy.delay('GET', 0, 404))
+        self.assertIsNotNone(policy.delay('GET', 0, None))
+
+    def test_idempotency(self):
+        policy = toshling.RetryPolicy()
+        self.assertIsNone(policy.delay('POST', 0, 503))
+        self.assertIsNotNone(policy.delay('POST', 0, 503, idempotent=True))
+        self.assertIsNone(policy.delay('GET', 0, 503, idempotent=False))
+        # Rejected requests weren't processed, so can be retried.
+        self.assertIsNotNone(policy.delay('POST', 0, 429))
+        self.assertIsNone(toshling.RetryPolicy(retry_rejected=False).delay('POST', 0, 429))
+
+    def test_retry_after(self):
+        policy = toshling.RetryPolicy()
+        self.assertEqual(policy.delay('GET', 0, 429, {'Retry-After': '7'}), 7)
+        self.assertAlmostEqual(policy.delay('GET', 0, 429, {'Retry-After': 'Thu, 01 Jan 1970 00:00:00 GMT'}), 0)
+        self.assertEqual(policy.delay('GET', 0, 429, {'X-RateLimit-Remaining': '0', 'X-RateLimit-Reset': '12'}), 12)
+        # Requested delays are capped.
+        self.assertEqual(policy.delay('GET', 0, 429, {'Retry-After': '86400'}), 60)
+
+
+class TestRetry(unittest.TestCase):
+    def setUp(self):
+        self.server = FakeToshl().start()
+        self.policy = toshling.RetryPolicy(backoff_factor=0)
+        self.client = toshling.Client('key', api_endpoint_base=self.server.base_url, retry=self.policy)
+
+    def tearDown(self):
+        self.client.close()
+        self.server.stop()
+
+    def test_recovers(self):
+        self.server.fail(503, times=2)
+        self.server.fail(429, headers={'Retry-After': '0'})
+        self.assertEqual(len(self.client.accounts.list()), 20)
+        self.assertEqual(self.server.requests, 4)
+        self.assertEqual(self.policy.stats.snapshot(),
+                         {'retries': 3, 'wait_time': 0, 'statuses': {503: 2, 429: 1}, 'exhausted': 0})
+
+    def test_exhausted(self):
+        self.server.fail(503, times=10)
+        with self.assertRaises(requests.HTTPError):
+            self.client.accounts.list()
+        self.assertEqual(self.server.requests, 4)
+        self.assertEqual(self.policy.stats.exhausted, 1)
+
+    def test_not_retried(self):
+        self.server.fail(503)
+        with self.assertRaises(requests.HTTPError):
+            self.client.request('/accounts', 'POST')
+        self.server.fail(404)
+        with self.assertRaises(requests.HTTPError):
+            self.client.accounts.list()
+        self.assertEqual(self.server.requests, 2)
+
+    def test_not_exhausted(self):
+        # A failure which isn't retried after a retry isn't the policy running
+        # out of attempts.
+        self.server.fail(503)
+        self.server.fail(404)
+        with self.assertRaises(requests.HTTPError):
+            self.client.accounts.list()
+        self.assertEqual(self.server.requests, 2)
+        self.assertEqual(self.policy.stats.snapshot()['exhausted'], 0)
+
+    def test_timeouts(self):
+        # Timeouts are retried like connection errors, as by `AsyncClient`.
+        self.server.httpd.latency = 0.2
+        with self.assertRaises(requests.Timeout):
+            self.client._send('/accounts', 'GET', self.server.base_url + '/accounts', timeout=0.05)
+        self.assertEqual(self.policy.stats.retries, 3)
+        self.assertEqual(self.policy.stats.exhausted, 1)
+
+    def test_disabled(self):
+        client = toshling.Client('key', api_endpoint_base=self.server.base_url, retry=False)
+        self.server.fail(503)
+        with self.assertRaises(requests.HTTPError):
+            client.accounts.list()
+
+
+if __name__ == '__main__':
+    unittest.main()
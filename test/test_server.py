@@ -0,0 +1,63 @@
+import unittest
+import toshling
+from toshling.models import return_types
+from benchmark.bench_routes import arguments, call, routes
+from benchmark.server import FakeToshl, make_entry
+
+
+class TestFakeToshl(unittest.TestCase):
+    def setUp(self):
+        self.server = FakeToshl(entries=125).start()
+        self.client = toshling.Client('key', api_endpoint_base=self.server.base_url)
+
+    def tearDown(self):
+        self.client.close()
+        self.server.stop()
+
+    def test_every_route(self):
+        found = routes()
+        self.assertGreater(len(found), 60)
+        self.assertIn(('entries.sums.list', 'GET', '/entries/sums'), [r[:3] for r in found])
+
+        order = ['GET', 'POST', 'PUT', 'DELETE']
+        for route in sorted(found, key=lambda r: order.index(r.method)):
+            with self.subTest(route.name):
+                result = call(self.client, route)
+                if route.return_type and route.method in ('GET', 'PUT') and result:
+                    if isinstance(result, dict):
+                        result = list(result.values())
+                    values = result if isinstance(result, list) else [result]
+                    self.assertIsInstance(values[0], route.return_type)
+
+    def test_arguments(self):
+        found = {route.name: route for route in routes()}
+        update = arguments(found['entries.update'], '3')
+        self.assertEqual((update['id'], update['tags']), ('3', make_entry(3)['tags']))
+        self.assertEqual(arguments(found['entries.sums.list']), {'from_': '2015-01-01', 'to': '2015-12-31',
+                                                                 'currency': 'AUD'})
+        self.assertEqual(arguments(found['tags.merge']), {'tags': ['1']})
+
+    def test_currencies(self):
+        currencies = self.client.currencies.list()
+        self.assertIsInstance(currencies, dict)
+        self.assertIsInstance(currencies['AUD'], return_types.CurrencyElement)
+
+    def test_export(self):
+        export = self.client.exports.get(id='1')
+        self.assertIsInstance(export, return_types.Export)
+        self.assertEqual(export._dict['formats'], ['csv'])
+
+    def test_sums_pagination(self):
+        kwargs = {'from_': '2015-01-01', 'to': '2015-12-31', 'currency': 'AUD', 'per_page': 10}
+        pages = list(self.client.entries.sums.iter_pages(**kwargs))
+        self.assertEqual([len(p) for p in pages], [10, 10, 5])
+        # Each day has five entries.
+        self.assertEqual(sum(d.expenses.count + d.incomes.count for p in pages for d in p), 125)
+
+    def test_create(self):
+        self.client.tags.create(name='New', type='expense', category='1')
+        self.assertEqual(self.server.collections['tags'][-1]['name'], 'New')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,141 @@
+import asyncio
+import threading
+import unittest
+from datetime import date
+import toshling
+from toshling._async_client import httpx
+from toshling._shard import Shards, halves, windows
+from toshling.models import return_types
+from benchmark.server import FakeToshl
+
+
+class TestWindows(unittest.TestCase):
+    def test_months(self):
+        self.assertEqual(windows(date(2019, 12, 15), date(2020, 2, 10)), [
+            (date(2019, 12, 15), date(2019, 12, 31)),
+            (date(2020, 1, 1), date(2020, 1, 31)),
+            (date(2020, 2, 1), date(2020, 2, 10)),
+        ])
+
+    def test_days(self):
+        self.assertEqual(windows(date(2020, 1, 1), date(2020, 1, 5), 2), [
+            (date(2020, 1, 1), date(2020, 1, 2)),
+            (date(2020, 1, 3), date(2020, 1, 4)),
+            (date(2020, 1, 5), date(2020, 1, 5)),
+        ])
+        self.assertEqual(windows(date(2020, 1, 1), date(2019, 1, 1)), [])
+        self.assertRaises(ValueError, windows, date(2020, 1, 1), date(2020, 1, 5), 'week')
+
+    def test_halves(self):
+        self.assertEqual(halves((date(2020, 1, 1), date(2020, 1, 31))),
+                         [(date(2020, 1, 1), date(2020, 1, 16)), (date(2020, 1, 17), date(2020, 1, 31))])
+        self.assertEqual(halves((date(2020, 1, 1), date(2020, 1, 2))),
+                         [(date(2020, 1, 1), date(2020, 1, 1)), (date(2020, 1, 2), date(2020, 1, 2))])
+
+
+class TestShards(unittest.TestCase):
+    def test_duplicates(self):
+        # Items repeated within a window are released once, in date order.
+        shards = Shards(return_types.Day, {'from_': '2020-01-01', 'to': '2020-02-29', 'per_page': 10, 'raw': True})
+        january, february = shards.take(2)
+        shards.finish(february, [{'day': '2020-02-01'}])
+        self.assertEqual(shards.ready(), [])
+        shards.finish(january, [{'day': '2020-01-02'}, {'day': '2020-01-01'}, {'day': '2020-01-02'}])
+        self.assertEqual(shards.ready(), [{'day': '2020-01-01'}, {'day': '2020-01-02'}, {'day': '2020-02-01'}])
+
+
+class TestSharded(unittest.TestCase):
+    def setUp(self):
+        # Five entries a day from the start of 2015, through April.
+        self.server = FakeToshl(entries=600, latency=0.01)
+        self.server.start()
+        self.client = toshling.Client('key', api_endpoint_base=self.server.base_url)
+        self.kwargs = {'from_': '2015-01-01', 'to': '2015-06-30'}
+
+    def tearDown(self):
+        self.client.close()
+        self.server.stop()
+
+    def test_entries(self):
+        serial = list(self.client.entries.iter(**self.kwargs))
+        self.assertEqual(len(serial), 600)
+        self.assertEqual(list(self.client.entries.iter_sharded(**self.kwargs)), serial)
+        self.assertEqual(list(self.client.entries.iter_sharded(window='year', **self.kwargs)), serial)
+
+    def test_split(self):
+        # Ten entries a page fills the first page of every window of more
+        # than a day, so they're split down to days, each paged through.
+        requested = []
+        request = self.client.request
+
+        def record(*args, **kwargs):
+            requested.append((kwargs['from_'], kwargs['to'], kwargs['page']))
+            return request(*args, **kwargs)
+
+        self.client.request = record
+        entries = list(self.client.entries.iter_sharded(per_page=10, window=4, **self.kwargs))
+        self.assertEqual([e.id for e in entries], [str(i) for i in range(600)])
+        self.assertIn(('2015-01-01', '2015-01-04', 0), requested)
+        self.assertIn(('2015-01-01', '2015-01-02', 0), requested)
+        self.assertIn(('2015-01-01', '2015-01-01', 0), requested)
+        self.assertNotIn(('2015-01-01', '2015-01-02', 1), requested)
+
+    def test_workers(self):
+        running, most = 0, 0
+        lock = threading.Lock()
+        request = self.client.request
+
+        def count(*args, **kwargs):
+            nonlocal running, most
+            with lock:
+                running += 1
+                most = max(most, running)
+            try:
+                return request(*args, **kwargs)
+            finally:
+                with lock:
+                    running -= 1
+
+        self.client.request = count
+        self.assertEqual(len(list(self.client.entries.iter_sharded(workers=3, **self.kwargs))), 600)
+        self.assertGreater(most, 1)
+        self.assertLessEqual(most, 3)
+
+    def test_sums(self):
+        kwargs = {'currency': 'AUD', 'per_page': 10, **self.kwargs}
+        serial = list(self.client.entries.sums.iter(**kwargs))
+        self.assertEqual(len(serial), 120)
+        self.assertEqual(list(self.client.entries.sums.iter_sharded(**kwargs)), serial)
+        self.assertRaises(ValueError, list, self.client.entries.sums.iter_sharded(range='week', **kwargs))
+
+    def test_raw(self):
+        serial = list(self.client.entries.iter(raw=True, **self.kwargs))
+        self.assertIsInstance(serial[0], dict)
+        self.assertEqual(list(self.client.entries.iter_sharded(raw=True, window=7, **self.kwargs)), serial)
+        kwargs = {'currency': 'AUD', 'per_page': 10, 'raw': True, **self.kwargs}
+        self.assertEqual(list(self.client.entries.sums.iter_sharded(**kwargs)),
+                         list(self.client.entries.sums.iter(**kwargs)))
+
+    def test_arguments(self):
+        self.assertRaises(ValueError, list, self.client.entries.iter_sharded(from_='2015-01-01'))
+
+
+@unittest.skipIf(httpx is None, 'httpx is not installed')
+class TestAsyncSharded(unittest.TestCase):
+    def test_entries(self):
+        kwargs = {'from_': '2015-01-01', 'to': '2015-06-30', 'per_page': 10}
+
+        async def run(base_url):
+            async with toshling.AsyncClient('key', api_endpoint_base=base_url) as client:
+                serial = [e async for e in client.entries.iter(**kwargs)]
+                sharded = [e async for e in client.entries.iter_sharded(window=7, **kwargs)]
+                return serial, sharded
+
+        with FakeToshl(entries=600) as server:
+            serial, sharded = asyncio.run(run(server.base_url))
+        self.assertEqual(len(serial), 600)
+        self.assertEqual(sharded, serial)
+
+
+if __name__ == '__main__':
+    unittest.main()
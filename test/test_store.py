@@ -0,0 +1,80 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+import toshling
+from toshling.models import return_types
+from toshling.store import SQLiteStore
+from toshling.sync import SyncEngine
+from benchmark.server import FakeToshl, make_account, make_entry
+
+
+class TestSQLiteStore(unittest.TestCase):
+    def setUp(self):
+        self.store = SQLiteStore()
+        self.entries = [return_types.Entry(make_entry(i)) for i in range(50)]
+        self.store.upsert('entries', self.entries)
+
+    def tearDown(self):
+        self.store.close()
+
+    def test_roundtrip(self):
+        self.assertEqual(self.store.get('entries', '7'), self.entries[7])
+        self.assertIsNone(self.store.get('entries', 'missing'))
+        self.store.upsert('accounts', [return_types.Account(make_account(1))])
+        self.assertEqual(self.store.accounts(), [return_types.Account(make_account(1))])
+
+    def test_filters(self):
+        entries = self.store.entries(from_='2015-01-03', to='2015-01-04', account='1')
+        self.assertEqual([e.id for e in entries], ['10', '13', '16', '19'])
+        self.assertEqual(len(self.store.entries(category='3')), 4)
+        self.assertEqual([e.id for e in self.store.entries(tag='5', to='2015-01-06')], ['5', '12', '16', '19', '26', '27'])
+
+    def test_upsert_replaces_tags(self):
+        changed = make_entry(5)
+        changed['tags'] = ['new']
+        self.store.upsert('entries', [return_types.Entry(changed)])
+        self.assertEqual(self.store.get('entries', '5').tags, ['new'])
+        self.assertEqual([e.id for e in self.store.entries(tag='new')], ['5'])
+        self.assertEqual(len(self.store.all('entries')), 50)
+
+    def test_delete(self):
+        self.store.delete('entries', ['1', '2'])
+        self.assertEqual(len(self.store.all('entries')), 48)
+        self.assertEqual(self.store.connection.execute('SELECT COUNT(*) FROM entry_tags WHERE entry = ?', ('1',)).fetchone(), (0,))
+
+    def test_indexes(self):
+        plan = self.store.connection.execute('EXPLAIN QUERY PLAN SELECT data FROM entries WHERE date >= ?', ('2015',)).fetchall()
+        self.assertIn('entries_date', str(plan))
+
+    def test_sync(self):
+        with FakeToshl(accounts=5) as server, toshling.Client('key', api_endpoint_base=server.base_url) as client:
+            SyncEngine(client, self.store).sync('accounts')
+        self.assertEqual(len(self.store.accounts()), 5)
+        self.assertEqual(self.store.get_mark('accounts'), '2020-01-01 00:00:00.000')
+
+    def test_marks_per_filters(self):
+        self.store.set_mark('entries', '2020-01-01 00:00:00.000', 'from_=2015-01-01&to=2015-01-31')
+        self.assertIsNone(self.store.get_mark('entries', 'from_=2015-02-01&to=2015-02-28'))
+        self.assertIsNone(self.store.get_mark('entries'))
+        self.assertEqual(self.store.get_mark('entries', 'from_=2015-01-01&to=2015-01-31'), '2020-01-01 00:00:00.000')
+
+    def test_old_marks(self):
+        # Marks kept by resource alone are dropped, so the next sync is full.
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'toshl.db')
+            with sqlite3.connect(path) as connection:
+                connection.execute('CREATE TABLE marks (resource TEXT PRIMARY KEY, mark TEXT)')
+                connection.execute("INSERT INTO marks VALUES ('entries', '2020-01-01 00:00:00.000')")
+            connection.close()
+            store = SQLiteStore(path)
+            self.assertIsNone(store.get_mark('entries'))
+            store.set_mark('entries', '2021-01-01 00:00:00.000')
+            store.close()
+            store = SQLiteStore(path)
+            self.assertEqual(store.get_mark('entries'), '2021-01-01 00:00:00.000')
+            store.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+import asyncio
+import json
+import unittest
+import toshling
+from toshling._async_client import httpx
+from toshling._stream import ArrayParser
+from toshling.models import return_types
+from benchmark.server import FakeToshl
+
+
+class TestArrayParser(unittest.TestCase):
+    def parse(self, data, size):
+        parser = ArrayParser()
+        items = []
+        for start in range(0, len(data), size):
+            items.extend(parser.feed(data[start:start + size]))
+        return items + parser.close()
+
+    def test_chunk_boundaries(self):
+        items = [{'id': '1', 'desc': 'café ☕', 'tags': ['a', 'b']}, 12345, -1.5e3, 'x,]', None, [], {}]
+        data = json.dumps(items, ensure_ascii=False, indent=1).encode()
+        for size in range(1, 40):
+            with self.subTest(size=size):
+                self.assertEqual(self.parse(data, size), items)
+
+    def test_empty(self):
+        self.assertEqual(self.parse(b' [ ] ', 1), [])
+
+    def test_invalid(self):
+        self.assertRaises(ValueError, self.parse, b'{"a": 1}', 4)
+        self.assertRaises(ValueError, self.parse, b'[1, 2', 4)
+        self.assertRaises(ValueError, self.parse, b'[1 2]', 4)
+        self.assertRaises(ValueError, self.parse, b'[1] 2', 4)
+
+
+class TestStream(unittest.TestCase):
+    def setUp(self):
+        self.server = FakeToshl(entries=45).start()
+        self.client = toshling.Client('key', api_endpoint_base=self.server.base_url)
+        self.client.stream_chunk_size = 100
+
+    def tearDown(self):
+        self.client.close()
+        self.server.stop()
+
+    def test_stream(self):
+        kwargs = {'from_': '2015-01-01', 'to': '2015-12-31'}
+        streamed = self.client.stream('/entries', 'GET', toshling.models.argument_types.EntriesListArgument,
+                                      return_types.Entry, **kwargs)
+        self.assertEqual(list(streamed), self.client.entries.list(**kwargs))
+
+    def test_iter(self):
+        entries = self.client.entries.iter(from_='2015-01-01', to='2015-12-31', per_page=10, stream=True)
+        self.assertEqual([e.id for e in entries], [str(i) for i in range(45)])
+        self.assertEqual(self.server.requests, 5)
+
+    def test_prefetch(self):
+        entries = self.client.entries.iter(from_='2015-01-01', to='2015-12-31', stream=True, prefetch=2)
+        self.assertRaises(ValueError, list, entries)
+
+
+@unittest.skipIf(httpx is None, 'httpx is not installed')
+class TestAsyncStream(unittest.TestCase):
+    def test_iter(self):
+        async def run(server):
+            async with toshling.AsyncClient('key', api_endpoint_base=server.base_url) as client:
+                client.stream_chunk_size = 100
+                return [e.id async for e in client.entries.iter(from_='2015-01-01', to='2015-12-31', per_page=10,
+                                                                stream=True)]
+
+        with FakeToshl(entries=45) as server:
+            self.assertEqual(asyncio.run(run(server)), [str(i) for i in range(45)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+import unittest
+import toshling
+from toshling.sync import MemoryStore, SyncEngine, filters, rfc3339
+from benchmark.server import FakeToshl
+
+
+class TestSync(unittest.TestCase):
+    def setUp(self):
+        self.server = FakeToshl(accounts=30, entries=120).start()
+        self.client = toshling.Client('key', api_endpoint_base=self.server.base_url)
+        self.engine = SyncEngine(self.client)
+        self.range = {'from_': '2015-01-01', 'to': '2015-12-31'}
+
+    def tearDown(self):
+        self.client.close()
+        self.server.stop()
+
+    def test_full_then_delta(self):
+        result = self.engine.sync('entries', **self.range)
+        self.assertEqual(result, ('entries', 120, 0, '2020-01-01 00:00:00.000'))
+        self.assertEqual(len(self.engine.store.all('entries')), 120)
+
+        self.server.entries[3].update(desc='Changed', modified='2021-01-01 00:00:00.000')
+        self.server.entries[4].update(deleted=True, modified='2021-01-02 00:00:00.000')
+        requests = self.server.requests
+        result = self.engine.sync('entries', **self.range)
+
+        self.assertEqual(result, ('entries', 1, 1, '2021-01-02 00:00:00.000'))
+        self.assertEqual(self.server.requests, requests + 1)
+        entries = {e.id: e for e in self.engine.store.all('entries')}
+        self.assertEqual(len(entries), 119)
+        self.assertEqual(entries['3'].desc, 'Changed')
+        self.assertNotIn('4', entries)
+
+    def test_unchanged(self):
+        self.engine.sync('accounts')
+        result = self.engine.sync('accounts')
+        self.assertEqual(result.upserted, 0)
+        self.assertEqual(len(self.engine.store.all('accounts')), 30)
+
+    def test_marks_per_resource(self):
+        store = MemoryStore()
+        SyncEngine(self.client, store).sync('accounts')
+        self.assertEqual(store.marks, {('accounts', ''): '2020-01-01 00:00:00.000'})
+
+    def test_marks_per_filters(self):
+        # Five entries a day, so fifty in each range. Syncing the second
+        # doesn't reuse the mark of the first, and so skip them.
+        first = self.engine.sync('entries', from_='2015-01-01', to='2015-01-10')
+        second = self.engine.sync('entries', from_='2015-01-11', to='2015-01-20')
+        self.assertEqual((first.upserted, second.upserted), (50, 50))
+        self.assertEqual(len(self.engine.store.all('entries')), 100)
+        self.assertEqual(self.engine.sync('entries', to='2015-01-10', from_='2015-01-01').upserted, 0)
+
+    def test_filters(self):
+        self.assertEqual(filters({'to': '2015-12-31', 'from_': '2015-01-01', 'per_page': 500}),
+                         'from_=2015-01-01&to=2015-12-31')
+        self.assertEqual(filters({}), '')
+
+    def test_marks_compared_as_times(self):
+        # An hour ahead of UTC, this mark is before the entry's modification,
+        # though it sorts after it as a string.
+        self.engine.store.set_mark('entries', '2021-01-01T00:30:00.000+01:00', filters(self.range))
+        self.server.entries[3].update(modified='2021-01-01 00:45:00.000')
+        result = self.engine.sync('entries', **self.range)
+        self.assertEqual(result, ('entries', 1, 0, '2021-01-01 00:45:00.000'))
+
+    def test_rfc3339(self):
+        self.assertEqual(rfc3339('2020-01-02 03:04:05.600'), '2020-01-02T03:04:05.600Z')
+        self.assertEqual(rfc3339('2021-01-01T00:30:00+01:00'), '2020-12-31T23:30:00.000Z')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1 +1,13 @@
-from ._client import Client
\ No newline at end of file
+from ._client import Client
+from ._bulk import BulkReport, BulkResult
+from ._cache import HTTPCache, ResponseCache, SingleFlight
+from ._retry import RetryPolicy
+
+
+def __getattr__(name):
+    # `AsyncClient` is imported when first used, as it needs httpx.
+    if name == 'AsyncClient':
+        from ._async_client import AsyncClient
+        globals()[name] = AsyncClient
+        return AsyncClient
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -0,0 +1,313 @@
+import asyncio
+import time
+from collections import deque
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None
+
+from . import _async_endpoints as async_endpoints
+from ._bulk import BulkReport, BulkResult
+from ._cache import HTTPCache
+from ._client import BaseClient
+from ._shard import Shards
+from ._stream import ArrayParser
+
+
+class AsyncClient(BaseClient):
+    """A `Client` for use with asyncio, whose endpoint methods are coroutines
+    and whose `iter()`/`iter_pages()` are asynchronous generators.
+
+    Requires `httpx`, which is installed with the `async` extra.
+    """
+    endpoints = async_endpoints
+
+    def __init__(self, api_key, api_endpoint_base='https://api2.toshl.com',
+                 max_connections=100, max_keepalive_connections=20, retry=True, http_cache=None,
+                 response_cache=None, decode='compiled', validate_sample=0.0, json_backend=None, coalesce=False,
+                 metrics=None, transport=None, validate=True):
+        if httpx is None:
+            raise ImportError("AsyncClient requires httpx, install toshling[async]")
+        super().__init__(api_key, api_endpoint_base, retry, http_cache, response_cache, decode, validate_sample,
+                         json_backend, coalesce, metrics, validate)
+
+        # `transport` is an `httpx` transport to send requests with instead of
+        # a pooled one (such as a `toshling.cassette.Cassette` recorder or
+        # player).
+        self.session = httpx.AsyncClient(auth=(api_key, ''), transport=transport,
+                                         limits=httpx.Limits(max_connections=max_connections,
+                                                             max_keepalive_connections=max_keepalive_connections))
+
+    async def aclose(self):
+        await self.session.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    async def request(self, href, method, argument_type=None, return_type=None, idempotent=None, raw=False,
+                      **kwargs):
+        if self.coalesce is not None and method == 'GET':
+            return await self.coalesce.acall(
+                self.coalesce.key(href, method, kwargs, raw),
+                lambda: self._request(href, method, argument_type, return_type, idempotent, raw, **kwargs))
+        return await self._request(href, method, argument_type, return_type, idempotent, raw, **kwargs)
+
+    async def _request(self, href, method, argument_type, return_type, idempotent, raw, **kwargs):
+        # With `raw`, the parsed JSON is returned as it is (and isn't cached)
+        # rather than models.
+        cacheable = None if raw else return_type
+        response_key = self._response_key(href, method, cacheable, kwargs)
+        if response_key is not None:
+            try:
+                return self.response_cache.get(response_key)
+            except KeyError:
+                pass
+
+        url, params, body = self.prepare(href, method, argument_type, **kwargs)
+
+        http_key, cached = self._http_cached(method, url, params, cacheable)
+
+        options = self._options(params, body, HTTPCache.conditional_headers(cached))
+        response = await self._send(href, method, url, idempotent, **options)
+
+        result = None
+        if response.status_code == 304 and cached is not None:
+            result = self.http_cache.not_modified(cached)
+        elif raw:
+            result = self._load(href, method, response.content) if response.content else None
+        elif return_type:
+            result = self._load(href, method, response.content, return_type)
+            if http_key is not None:
+                self.http_cache.store(http_key, response.headers, result)
+
+        self._remember(href, method, response_key, result, len(response.content))
+        return result
+
+    @staticmethod
+    def _options(params, body, headers):
+        options = {'headers': headers}
+        if params is not None:
+            options['params'] = params
+        if body is not None:
+            options['content'] = body
+            options['headers']['Content-Type'] = 'application/json'
+        return options
+
+    async def _send(self, href, method, url, idempotent=None, stream=False, **options):
+        attempt = 0
+        while True:
+            paused = self._paused()
+            if paused > 0:
+                await asyncio.sleep(paused)
+            start = time.perf_counter()
+            try:
+                request = self.session.build_request(method, url, **options)
+                # Sent streamed, to time the wait for the headers apart from
+                # reading the body.
+                response = await self.session.send(request, stream=True)
+                waited = time.perf_counter() - start
+                if not stream:
+                    await response.aread()
+            except httpx.TransportError:
+                if self.metrics is not None:
+                    self._record(method, href, 'error', time.perf_counter() - start)
+                delay = self._retry_delay(method, attempt, idempotent)
+                if delay is None:
+                    raise
+            else:
+                if self.metrics is not None:
+                    self._record(method, href, response.status_code, waited,
+                                 None if stream else response.num_bytes_downloaded)
+                if not response.is_error:
+                    self._note_rate_limit(response.headers)
+                    return response
+                delay = self._retry_delay(method, attempt, idempotent, response)
+                if delay is None:
+                    await response.aread()
+                    response.raise_for_status()
+                await response.aclose()
+
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def bulk(self, href, method, rows, argument_type=None, return_type=None, idempotent=None, concurrency=8,
+                   dry_run=False):
+        # As `Client.bulk`, with up to `concurrency` requests in flight as
+        # tasks. `rows` may also be an asynchronous iterable.
+        results = []
+        if not hasattr(rows, '__aiter__'):
+            rows = _aiter(rows)
+
+        if dry_run:
+            index = 0
+            async for row in rows:
+                _, failure = self._prepare_row(href, method, argument_type, index, row, dry_run=True)
+                results.append(failure or BulkResult(index, row, True, None, None))
+                index += 1
+            return BulkReport(results, dry_run=True)
+
+        pending = {}
+
+        async def send(url, params, body):
+            response = await self._send(href, method, url, idempotent, **self._options(params, body, {}))
+            return self._bulk_result(href, method, return_type, response)
+
+        def collect(done):
+            for task in done:
+                index, row = pending.pop(task)
+                try:
+                    results.append(BulkResult(index, row, True, task.result(), None))
+                except Exception as e:
+                    # Any failure is the row's alone, and doesn't stop the rest.
+                    results.append(BulkResult(index, row, False, None, e))
+
+        try:
+            index = 0
+            async for row in rows:
+                prepared, failure = self._prepare_row(href, method, argument_type, index, row)
+                if failure is not None:
+                    results.append(failure)
+                else:
+                    if len(pending) >= concurrency:
+                        done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                        collect(done)
+                    pending[asyncio.ensure_future(send(*prepared))] = index, row
+                index += 1
+            if pending:
+                collect((await asyncio.wait(pending))[0])
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+        return BulkReport(results)
+
+    async def stream(self, href, method, argument_type=None, return_type=None, idempotent=None, **kwargs):
+        # As `Client.stream`.
+        url, params, body = self.prepare(href, method, argument_type, **kwargs)
+        options = self._options(params, body, {})
+
+        construct = self.decoder.constructor(return_type) if return_type else None
+        parser = ArrayParser()
+        response = await self._send(href, method, url, idempotent, stream=True, **options)
+        try:
+            async for chunk in response.aiter_bytes(self.stream_chunk_size):
+                for item in parser.feed(chunk):
+                    yield construct(item) if construct else item
+            for item in parser.close():
+                yield construct(item) if construct else item
+        finally:
+            await response.aclose()
+
+    async def iter_pages(self, href, method, argument_type, return_type, prefetch=0, **kwargs):
+        page = self._first_page(argument_type, kwargs)
+
+        if prefetch:
+            async for items in self._prefetch_pages(href, method, argument_type, return_type, prefetch, page, **kwargs):
+                yield items
+            return
+
+        while True:
+            items = await self.request(href, method, argument_type, return_type, page=page, **kwargs)
+            if items:
+                yield items
+            if len(items) < kwargs['per_page']:
+                return
+            page += 1
+
+    async def _prefetch_pages(self, href, method, argument_type, return_type, prefetch, page, **kwargs):
+        # As `Client._prefetch_pages`, with tasks in place of threads.
+        pending = deque()
+
+        def submit():
+            nonlocal page
+            pending.append(asyncio.ensure_future(self.request(href, method, argument_type, return_type,
+                                                              page=page, **kwargs)))
+            page += 1
+
+        try:
+            for _ in range(prefetch):
+                submit()
+
+            while True:
+                items = await pending.popleft()
+                if len(items) < kwargs['per_page']:
+                    if items:
+                        yield items
+                    return
+                submit()
+                yield items
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    async def iter_items(self, href, method, argument_type, return_type, stream=False, **kwargs):
+        if stream:
+            async for item in self._stream_items(href, method, argument_type, return_type, **kwargs):
+                yield item
+            return
+        async for items in self.iter_pages(href, method, argument_type, return_type, **kwargs):
+            for item in items:
+                yield item
+
+    async def _stream_items(self, href, method, argument_type, return_type, **kwargs):
+        if kwargs.pop('prefetch', 0):
+            raise ValueError("Streamed pages can't be prefetched")
+        page = self._first_page(argument_type, kwargs)
+        while True:
+            count = 0
+            async for item in self.stream(href, method, argument_type, return_type, page=page, **kwargs):
+                count += 1
+                yield item
+            if count < kwargs['per_page']:
+                return
+            page += 1
+
+    async def iter_sharded(self, href, method, argument_type, return_type, workers=4, window='month', **kwargs):
+        # As `Client.iter_sharded`, with tasks in place of threads.
+        self._first_page(argument_type, kwargs)
+        shards = Shards(return_type, kwargs, window)
+        pending = {}
+
+        async def fetch(window):
+            arguments = shards.arguments(window)
+            items = await self.request(href, method, argument_type, return_type, page=0, **arguments)
+            if shards.dense(window, items):
+                return None
+            found = list(items)
+            if len(items) == kwargs['per_page']:
+                async for more in self.iter_pages(href, method, argument_type, return_type, page=1, **arguments):
+                    found.extend(more)
+            return found
+
+        def submit(windows):
+            for window in windows:
+                pending[asyncio.ensure_future(fetch(window))] = window
+
+        try:
+            submit(shards.take(workers))
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    window = pending.pop(task)
+                    items = task.result()
+                    if items is None:
+                        submit(shards.split(window))
+                    else:
+                        shards.finish(window, items)
+                submit(shards.take(workers - len(pending)))
+                for item in shards.ready():
+                    yield item
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+
+async def _aiter(iterable):
+    for item in iterable:
+        yield item
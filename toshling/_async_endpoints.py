@@ -0,0 +1,394 @@
+from importlib import import_module
+
+
+class _Models:
+    # Stands in for a module of models until one of them is first needed, as
+    # building them all takes a while, and then takes the module's place.
+    def __init__(self, name):
+        self._name = name
+
+    def __getattr__(self, attribute):
+        module = import_module(f'.models.{self._name}', __package__)
+        globals()[self._name] = module
+        return getattr(module, attribute)
+
+
+argument_types = _Models('argument_types')
+return_types = _Models('return_types')
+
+
+class Endpoint:
+    def __init__(self, client):
+        self.client = client
+
+class TagsSums(Endpoint):
+    async def list(self, **kwargs):
+        return await self.client.request('/tags/sums', 'GET', argument_type=argument_types.TagsSumsListArgument, return_type=return_types.TagSum, **kwargs)
+    
+    def iter_pages(self, **kwargs):
+        return self.client.iter_pages('/tags/sums', 'GET', argument_type=argument_types.TagsSumsListArgument, return_type=return_types.TagSum, **kwargs)
+    
+    def iter(self, **kwargs):
+        return self.client.iter_items('/tags/sums', 'GET', argument_type=argument_types.TagsSumsListArgument, return_type=return_types.TagSum, **kwargs)
+    
+
+class Tags(Endpoint):
+    def __init__(self, client):
+        super().__init__(client)
+        self.sums = TagsSums(client)
+    
+    async def list(self, **kwargs):
+        return await self.client.request('/tags', 'GET', argument_type=argument_types.TagsListArgument, return_type=return_types.Tag, **kwargs)
+    
+    def iter_pages(self, **kwargs):
+        return self.client.iter_pages('/tags', 'GET', argument_type=argument_types.TagsListArgument, return_type=return_types.Tag, **kwargs)
+    
+    def iter(self, **kwargs):
+        return self.client.iter_items('/tags', 'GET', argument_type=argument_types.TagsListArgument, return_type=return_types.Tag, **kwargs)
+    
+    async def create(self, **kwargs):
+        return await self.client.request('/tags', 'POST', argument_type=argument_types.TagsCreateArgument, **kwargs)
+    
+    def bulk_create(self, rows, **kwargs):
+        return self.client.bulk('/tags', 'POST', rows, argument_type=argument_types.TagsCreateArgument, **kwargs)
+    
+    async def merge(self, **kwargs):
+        return await self.client.request('/tags/merge', 'POST', argument_type=argument_types.TagsMergeArgument, **kwargs)
+    
+    async def delete(self, **kwargs):
+        return await self.client.request('/tags/{id}', 'DELETE', argument_type=argument_types.TagsDeleteArgument, **kwargs)
+    
+    def delete_many(self, rows, **kwargs):
+        return self.client.bulk('/tags/{id}', 'DELETE', rows, argument_type=argument_types.TagsDeleteArgument, **kwargs)
+    
+    async def get(self, **kwargs):
+        return await self.client.request('/tags/{id}', 'GET', argument_type=argument_types.TagsGetArgument, return_type=return_types.Tag, **kwargs)
+    
+    async def update(self, **kwargs):
+        return await self.client.request('/tags/{id}', 'PUT', argument_type=argument_types.TagsUpdateArgument, return_type=return_types.Tag, **kwargs)
+    
+    def update_many(self, rows, **kwargs):
+        return self.client.bulk('/tags/{id}', 'PUT', rows, argument_type=argument_types.TagsUpdateArgument, return_type=return_types.Tag, **kwargs)
+    
+
+class MeNotifications(Endpoint):
+    async def list(self, **kwargs):
+        return await self.client.request('/me/notifications', 'GET', argument_type=argument_types.MeNotificationsListArgument, return_type=return_types.Notification, **kwargs)
+    
+    def iter_pages(self, **kwargs):
+        return self.client.iter_pages('/me/notifications', 'GET', argument_type=argument_types.MeNotificationsListArgument, return_type=return_types.Notification, **kwargs)
+    
+    def iter(self, **kwargs):
+        return self.client.iter_items('/me/notifications', 'GET', argument_type=argument_types.MeNotificationsListArgument, return_type=return_types.Notification, **kwargs)
+    
+    async def dismiss_all(self, **kwargs):
+        return await self.client.request('/me/notifications/dismiss_all', 'POST', **kwargs)
+    
+    async def delete(self, **kwargs):
+        return await self.client.request('/me/notifications/{id}', 'DELETE', argument_type=argument_types.MeNotificationsDeleteArgument, **kwargs)
+    
+    def delete_many(self, rows, **kwargs):
+        return self.client.bulk('/me/notifications/{id}', 'DELETE', rows, argument_type=argument_types.MeNotificationsDeleteArgument, **kwargs)
+    
+    async def get(self, **kwargs):
+        return await self.client.request('/me/notifications/{id}', 'GET', argument_type=argument_types.MeNotificationsGetArgument, return_type=return_types.Notification, **kwargs)
+    
+
+class MeAdjust(Endpoint):
+    async def campaign(self, **kwargs):
+        return await self.client.request('/me/adjust/campaign', 'POST', argument_type=argument_types.MeAdjustCampaignArgument, **kwargs)
+    
+
+class Me(Endpoint):
+    def __init__(self, client):
+        super().__init__(client)
+        self.notifications = MeNotifications(client)
+        self.adjust = MeAdjust(client)
+    
+    async def get(self, **kwargs):
+        return await self.client.request('/me', 'GET', return_type=return_types.User, **kwargs)
+    
+    async def update(self, **kwargs):
+        return await self.client.request('/me', 'PUT', argument_type=argument_types.MeUpdateArgument, return_type=return_types.User, **kwargs)
+    
+    async def devices(self, **kwargs):
+        return await self.client.request('/me/devices', 'GET', **kwargs)
+    
+    async def push(self, **kwargs):
+        return await self.client.request('/me/push', 'POST', argument_type=argument_types.MePushArgument, **kwargs)
+    
+    async def revert(self, **kwargs):
+        return await self.client.request('/me/revert', 'POST', argument_type=argument_types.MeRevertArgument, **kwargs)
+    
+    async def settings(self, **kwargs):
+        return await self.client.request('/me/settings', 'GET', **kwargs)
+    
+
+class Images(Endpoint):
+    async def list(self, **kwargs):
+        return await self.client.request('/images', 'GET', argument_type=argument_types.ImagesListArgument, return_type=return_types.Image, **kwargs)
+    
+    def iter_pages(self, **kwargs):
+        return self.client.iter_pages('/images', 'GET', argument_type=argument_types.ImagesListArgument, return_type=return_types.Image, **kwargs)
+    
+    def iter(self, **kwargs):
+        return self.client.iter_items('/images', 'GET', argument_type=argument_types.ImagesListArgument, return_type=return_types.Image, **kwargs)
+    
+    async def create(self, **kwargs):
+        return await self.client.request('/images', 'POST', **kwargs)
+    
+    def bulk_create(self, rows, **kwargs):
+        return self.client.bulk('/images', 'POST', rows, **kwargs)
+    
+    async def delete(self, **kwargs):
+        return await self.client.request('/images/{id}', 'DELETE', argument_type=argument_types.ImagesDeleteArgument, **kwargs)
+    
+    def delete_many(self, rows, **kwargs):
+        return self.client.bulk('/images/{id}', 'DELETE', rows, argument_type=argument_types.ImagesDeleteArgument, **kwargs)
+    
+    async def get(self, **kwargs):
+        return await self.client.request('/images/{id}', 'GET', argument_type=argument_types.ImagesGetArgument, return_type=return_types.Image, **kwargs)
+    
+
+class Exports(Endpoint):
+    async def list(self, **kwargs):
+        return await self.client.request('/exports', 'GET', argument_type=argument_types.ExportsListArgument, return_type=return_types.Export, **kwargs)
+    
+    def iter_pages(self, **kwargs):
+        return self.client.iter_pages('/exports', 'GET', argument_type=argument_types.ExportsListArgument, return_type=return_types.Export, **kwargs)
+    
+    def iter(self, **kwargs):
+        return self.client.iter_items('/exports', 'GET', argument_type=argument_types.ExportsListArgument, return_type=return_types.Export, **kwargs)
+    
+    async def create(self, **kwargs):
+        return await self.client.request('/exports', 'POST', argument_type=argument_types.ExportsCreateArgument, **kwargs)
+    
+    def bulk_create(self, rows, **kwargs):
+        return self.client.bulk('/exports', 'POST', rows, argument_type=argument_types.ExportsCreateArgument, **kwargs)
+    
+    async def get(self, **kwargs):
+        return await self.client.request('/exports/{id}', 'GET', argument_type=argument_types.ExportsGetArgument, return_type=return_types.Export, **kwargs)
+    
+    async def update(self, **kwargs):
+        return await self.client.request('/exports/{id}', 'PUT', argument_type=argument_types.ExportsUpdateArgument, return_type=return_types.Export, **kwargs)
+    
+    def update_many(self, rows, **kwargs):
+        return self.client.bulk('/exports/{id}', 'PUT', rows, argument_type=argument_types.ExportsUpdateArgument, return_type=return_types.Export, **kwargs)
+    
+
+class EntriesSums(Endpoint):
+    async def list(self, **kwargs):
+        return await self.client.request('/entries/sums', 'GET', argument_type=argument_types.EntriesSumsListArgument, return_type=return_types.Day, **kwargs)
+    
+    def iter_pages(self, **kwargs):
+        return self.client.iter_pages('/entries/sums', 'GET', argument_type=argument_types.EntriesSumsListArgument, return_type=return_types.Day, **kwargs)
+    
+    def iter(self, **kwargs):
+        return self.client.iter_items('/entries/sums', 'GET', argument_type=argument_types.EntriesSumsListArgument, return_type=return_types.Day, **kwargs)
+    
+    def iter_sharded(self, **kwargs):
+        return self.client.iter_sharded('/entries/sums', 'GET', argument_type=argument_types.EntriesSumsListArgument, return_type=return_types.Day, **kwargs)
+    
+
+class EntriesLocations(Endpoint):
+    async def list(self, **kwargs):
+        return await self.client.request('/entries/locations', 'GET', argument_type=argument_types.EntriesLocationsListArgument, return_type=return_types.Location, **kwargs)
+    
+    def iter_pages(self, **kwargs):
+        return self.client.iter_pages('/entries/locations', 'GET', argument_type=argument_types.EntriesLocationsListArgument, return_type=return_types.Location, **kwargs)
+    
+    def iter(self, **kwargs):
+        return self.client.iter_items('/entries/locations', 'GET', argument_type=argument_types.EntriesLocationsListArgument, return_type=return_types.Location, **kwargs)
+    
+    async def get(self, **kwargs):
+        return await self.client.request('/entries/locations/{id}', 'GET', argument_type=argument_types.EntriesLocationsGetArgument, return_type=return_types.Location, **kwargs)
+    
+
+class Entries(Endpoint):
+    def __init__(self, client):
+        super().__init__(client)
+        self.sums = EntriesSums(client)
+        self.locations = EntriesLocations(client)
+    
+    async def list(self, **kwargs):
+        return await self.client.request('/entries', 'GET', argument_type=argument_types.EntriesListArgument, return_type=return_types.Entry, **kwargs)
+    
+    def iter_pages(self, **kwargs):
+        return self.client.iter_pages('/entries', 'GET', argument_type=argument_types.EntriesListArgument, return_type=return_types.Entry, **kwargs)
+    
+    def iter(self, **kwargs):
+        return self.client.iter_items('/entries', 'GET', argument_type=argument_types.EntriesListArgument, return_type=return_types.Entry, **kwargs)
+    
+    def iter_sharded(self, **kwargs):
+        return self.client.iter_sharded('/entries', 'GET', argument_type=argument_types.EntriesListArgument, return_type=return_types.Entry, **kwargs)
+    
+    async def create(self, **kwargs):
+        return await self.client.request('/entries', 'POST', argument_type=argument_types.EntriesCreateArgument, **kwargs)
+    
+    def bulk_create(self, rows, **kwargs):
+        return self.client.bulk('/entries', 'POST', rows, argument_type=argument_types.EntriesCreateArgument, **kwargs)
+    
+    async def manage(self, **kwargs):
+        return await self.client.request('/entries/manage', 'GET', **kwargs)
+    
+    async def repeats(self, **kwargs):
+        return await self.client.request('/entries/repeats', 'GET', **kwargs)
+    
+    async def split(self, **kwargs):
+        return await self.client.request('/entries/split/{id}', 'DELETE', argument_type=argument_types.EntriesSplitArgument, **kwargs)
+    
+    async def delete(self, **kwargs):
+        return await self.client.request('/entries/{id}', 'DELETE', argument_type=argument_types.EntriesDeleteArgument, **kwargs)
+    
+    def delete_many(self, rows, **kwargs):
+        return self.client.bulk('/entries/{id}', 'DELETE', rows, argument_type=argument_types.EntriesDeleteArgument, **kwargs)
+    
+    async def get(self, **kwargs):
+        return await self.client.request('/entries/{id}', 'GET', argument_type=argument_types.EntriesGetArgument, return_type=return_types.Entry, **kwargs)
+    
+    async def update(self, **kwargs):
+        return await self.client.request('/entries/{id}', 'PUT', argument_type=argument_types.EntriesUpdateArgument, return_type=return_types.Entry, **kwargs)
+    
+    def update_many(self, rows, **kwargs):
+        return self.client.bulk('/entries/{id}', 'PUT', rows, argument_type=argument_types.EntriesUpdateArgument, return_type=return_types.Entry, **kwargs)
+    
+
+class Currencies(Endpoint):
+    async def list(self, **kwargs):
+        return await self.client.request('/currencies', 'GET', argument_type=argument_types.CurrenciesListArgument, return_type=return_types.CurrencyElement, **kwargs)
+    
+
+class CategoriesSums(Endpoint):
+    async def list(self, **kwargs):
+        return await self.client.request('/categories/sums', 'GET', argument_type=argument_types.CategoriesSumsListArgument, return_type=return_types.CategorySum, **kwargs)
+    
+    def iter_pages(self, **kwargs):
+        return self.client.iter_pages('/categories/sums', 'GET', argument_type=argument_types.CategoriesSumsListArgument, return_type=return_types.CategorySum, **kwargs)
+    
+    def iter(self, **kwargs):
+        return self.client.iter_items('/categories/sums', 'GET', argument_type=argument_types.CategoriesSumsListArgument, return_type=return_types.CategorySum, **kwargs)
+    
+
+class Categories(Endpoint):
+    def __init__(self, client):
+        super().__init__(client)
+        self.sums = CategoriesSums(client)
+    
+    async def list(self, **kwargs):
+        return await self.client.request('/categories', 'GET', argument_type=argument_types.CategoriesListArgument, return_type=return_types.Category, **kwargs)
+    
+    def iter_pages(self, **kwargs):
+        return self.client.iter_pages('/categories', 'GET', argument_type=argument_types.CategoriesListArgument, return_type=return_types.Category, **kwargs)
+    
+    def iter(self, **kwargs):
+        return self.client.iter_items('/categories', 'GET', argument_type=argument_types.CategoriesListArgument, return_type=return_types.Category, **kwargs)
+    
+    async def create(self, **kwargs):
+        return await self.client.request('/categories', 'POST', argument_type=argument_types.CategoriesCreateArgument, **kwargs)
+    
+    def bulk_create(self, rows, **kwargs):
+        return self.client.bulk('/categories', 'POST', rows, argument_type=argument_types.CategoriesCreateArgument, **kwargs)
+    
+    async def merge(self, **kwargs):
+        return await self.client.request('/categories/merge', 'POST', argument_type=argument_types.CategoriesMergeArgument, **kwargs)
+    
+    async def delete(self, **kwargs):
+        return await self.client.request('/categories/{id}', 'DELETE', argument_type=argument_types.CategoriesDeleteArgument, **kwargs)
+    
+    def delete_many(self, rows, **kwargs):
+        return self.client.bulk('/categories/{id}', 'DELETE', rows, argument_type=argument_types.CategoriesDeleteArgument, **kwargs)
+    
+    async def get(self, **kwargs):
+        return await self.client.request('/categories/{id}', 'GET', argument_type=argument_types.CategoriesGetArgument, return_type=return_types.Category, **kwargs)
+    
+    async def update(self, **kwargs):
+        return await self.client.request('/categories/{id}', 'PUT', argument_type=argument_types.CategoriesUpdateArgument, return_type=return_types.Category, **kwargs)
+    
+    def update_many(self, rows, **kwargs):
+        return self.client.bulk('/categories/{id}', 'PUT', rows, argument_type=argument_types.CategoriesUpdateArgument, return_type=return_types.Category, **kwargs)
+    
+
+class Budgets(Endpoint):
+    async def list(self, **kwargs):
+        return await self.client.request('/budgets', 'GET', argument_type=argument_types.BudgetsListArgument, return_type=return_types.Budget, **kwargs)
+    
+    def iter_pages(self, **kwargs):
+        return self.client.iter_pages('/budgets', 'GET', argument_type=argument_types.BudgetsListArgument, return_type=return_types.Budget, **kwargs)
+    
+    def iter(self, **kwargs):
+        return self.client.iter_items('/budgets', 'GET', argument_type=argument_types.BudgetsListArgument, return_type=return_types.Budget, **kwargs)
+    
+    async def create(self, **kwargs):
+        return await self.client.request('/budgets', 'POST', argument_type=argument_types.BudgetsCreateArgument, **kwargs)
+    
+    def bulk_create(self, rows, **kwargs):
+        return self.client.bulk('/budgets', 'POST', rows, argument_type=argument_types.BudgetsCreateArgument, **kwargs)
+    
+    async def reorder(self, **kwargs):
+        return await self.client.request('/budgets/reorder', 'POST', argument_type=argument_types.BudgetsReorderArgument, **kwargs)
+    
+    async def delete(self, **kwargs):
+        return await self.client.request('/budgets/{id}', 'DELETE', argument_type=argument_types.BudgetsDeleteArgument, **kwargs)
+    
+    def delete_many(self, rows, **kwargs):
+        return self.client.bulk('/budgets/{id}', 'DELETE', rows, argument_type=argument_types.BudgetsDeleteArgument, **kwargs)
+    
+    async def get(self, **kwargs):
+        return await self.client.request('/budgets/{id}', 'GET', argument_type=argument_types.BudgetsGetArgument, return_type=return_types.Budget, **kwargs)
+    
+    async def update(self, **kwargs):
+        return await self.client.request('/budgets/{id}', 'PUT', argument_type=argument_types.BudgetsUpdateArgument, return_type=return_types.Budget, **kwargs)
+    
+    def update_many(self, rows, **kwargs):
+        return self.client.bulk('/budgets/{id}', 'PUT', rows, argument_type=argument_types.BudgetsUpdateArgument, return_type=return_types.Budget, **kwargs)
+    
+    async def history(self, **kwargs):
+        return await self.client.request('/budgets/{id}/history', 'GET', argument_type=argument_types.BudgetsHistoryArgument, **kwargs)
+    
+    async def move(self, **kwargs):
+        return await self.client.request('/budgets/{id}/move', 'POST', argument_type=argument_types.BudgetsMoveArgument, **kwargs)
+    
+
+class Accounts(Endpoint):
+    async def list(self, **kwargs):
+        return await self.client.request('/accounts', 'GET', argument_type=argument_types.AccountsListArgument, return_type=return_types.Account, **kwargs)
+    
+    def iter_pages(self, **kwargs):
+        return self.client.iter_pages('/accounts', 'GET', argument_type=argument_types.AccountsListArgument, return_type=return_types.Account, **kwargs)
+    
+    def iter(self, **kwargs):
+        return self.client.iter_items('/accounts', 'GET', argument_type=argument_types.AccountsListArgument, return_type=return_types.Account, **kwargs)
+    
+    async def create(self, **kwargs):
+        return await self.client.request('/accounts', 'POST', argument_type=argument_types.AccountsCreateArgument, **kwargs)
+    
+    def bulk_create(self, rows, **kwargs):
+        return self.client.bulk('/accounts', 'POST', rows, argument_type=argument_types.AccountsCreateArgument, **kwargs)
+    
+    async def merge(self, **kwargs):
+        return await self.client.request('/accounts/merge', 'POST', argument_type=argument_types.AccountsMergeArgument, **kwargs)
+    
+    async def reorder(self, **kwargs):
+        return await self.client.request('/accounts/reorder', 'POST', argument_type=argument_types.AccountsReorderArgument, **kwargs)
+    
+    async def delete(self, **kwargs):
+        return await self.client.request('/accounts/{id}', 'DELETE', argument_type=argument_types.AccountsDeleteArgument, **kwargs)
+    
+    def delete_many(self, rows, **kwargs):
+        return self.client.bulk('/accounts/{id}', 'DELETE', rows, argument_type=argument_types.AccountsDeleteArgument, **kwargs)
+    
+    async def get(self, **kwargs):
+        return await self.client.request('/accounts/{id}', 'GET', argument_type=argument_types.AccountsGetArgument, return_type=return_types.Account, **kwargs)
+    
+    async def update(self, **kwargs):
+        return await self.client.request('/accounts/{id}', 'PUT', argument_type=argument_types.AccountsUpdateArgument, return_type=return_types.Account, **kwargs)
+    
+    def update_many(self, rows, **kwargs):
+        return self.client.bulk('/accounts/{id}', 'PUT', rows, argument_type=argument_types.AccountsUpdateArgument, return_type=return_types.Account, **kwargs)
+    
+    async def force_delete(self, **kwargs):
+        return await self.client.request('/accounts/{id}/force_delete', 'POST', argument_type=argument_types.AccountsForceDeleteArgument, **kwargs)
+    
+    async def move(self, **kwargs):
+        return await self.client.request('/accounts/{id}/move', 'POST', argument_type=argument_types.AccountsMoveArgument, **kwargs)
+    
\ No newline at end of file
@@ -0,0 +1,36 @@
+from collections import namedtuple
+
+
+# The outcome of one row of a bulk operation. `result` is the decoded response
+# (or, for requests without a return type, the `Location` of the created
+# object), and `error` the exception a failed row raised.
+BulkResult = namedtuple('BulkResult', ['index', 'row', 'ok', 'result', 'error'])
+
+
+class BulkReport:
+    """The results of a bulk operation, one `BulkResult` per row, in the
+    order the rows were given.
+
+    Rows of a `dry_run` were only validated, and `ok` if they're valid.
+    """
+    def __init__(self, results, dry_run=False):
+        self.results = sorted(results, key=lambda r: r.index)
+        self.dry_run = dry_run
+
+    def __len__(self):
+        return len(self.results)
+
+    def __iter__(self):
+        return iter(self.results)
+
+    @property
+    def succeeded(self):
+        return [r for r in self.results if r.ok]
+
+    @property
+    def failed(self):
+        return [r for r in self.results if not r.ok]
+
+    def __repr__(self):
+        return (f'<BulkReport rows={len(self)} succeeded={len(self.succeeded)} failed={len(self.failed)}'
+                f'{" dry_run" if self.dry_run else ""}>')
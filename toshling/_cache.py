@@ -0,0 +1,243 @@
+import threading
+import time
+from collections import OrderedDict, namedtuple
+from concurrent.futures import Future
+
+
+Validated = namedtuple('Validated', ['etag', 'last_modified', 'result'])
+
+
+def params_key(params):
+    # Query parameters, normalised so that equivalent calls share a key.
+    return tuple(sorted((k, str(v)) for k, v in (params or {}).items()))
+
+
+class HTTPCache:
+    """Conditional request cache for GET responses.
+
+    The decoded result of a response carrying an `ETag` or `Last-Modified`
+    validator is kept (for up to `maxsize` URLs, least recently used first
+    out), and the validators are sent with the next identical request as
+    `If-None-Match`/`If-Modified-Since`. When the server answers
+    `304 Not Modified`, the cached result is returned without downloading or
+    decoding anything.
+    """
+    def __init__(self, maxsize=256):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(url, params):
+        return url, params_key(params)
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    @staticmethod
+    def conditional_headers(entry):
+        headers = {}
+        if entry is not None:
+            if entry.etag:
+                headers['If-None-Match'] = entry.etag
+            if entry.last_modified:
+                headers['If-Modified-Since'] = entry.last_modified
+        return headers
+
+    def not_modified(self, entry):
+        with self._lock:
+            self.hits += 1
+        return entry.result
+
+    def store(self, key, headers, result):
+        etag, last_modified = headers.get('ETag'), headers.get('Last-Modified')
+        with self._lock:
+            self.misses += 1
+            if not (etag or last_modified):
+                self._entries.pop(key, None)
+                return
+            self._entries[key] = Validated(etag, last_modified, result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+Cached = namedtuple('Cached', ['expires', 'size', 'result'])
+
+
+def resource(href):
+    # The collection an href belongs to, e.g. '/tags' for '/tags/{id}/merge'.
+    return '/' + href.lstrip('/').split('/', 1)[0]
+
+
+class ResponseCache:
+    """In-process cache of decoded GET results, keyed by the href and the
+    normalised arguments of the call.
+
+    Results are kept for `ttl` seconds, or as given per href in `ttls` (e.g.
+    `{'/categories/{id}': 600}`), and the least recently used are evicted
+    beyond `maxsize` results or `maxbytes` of response bodies.
+
+    Successful writes (POST, PUT and DELETE) invalidate every cached result
+    of the same resource, e.g. updating a tag invalidates `/tags`,
+    `/tags/{id}` and `/tags/sums`, along with the resources listed for it in
+    `invalidates`. By default writes to entries also invalidate the accounts,
+    budgets, categories and tags, whose balances, sums and counts depend on
+    them.
+    """
+    def __init__(self, ttl=60, ttls=None, maxsize=1024, maxbytes=32 * 1024 * 1024, invalidates=None,
+                 clock=time.monotonic):
+        self.ttl = ttl
+        self.ttls = ttls or {}
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.invalidates = {
+            '/entries': ('/accounts', '/budgets', '/categories', '/tags'),
+            **(invalidates or {})
+        }
+        self.clock = clock
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def key(href, kwargs):
+        return href, params_key(kwargs)
+
+    def get(self, key):
+        """Return the cached result for `key`, or raise `KeyError`."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.expires <= self.clock():
+                if entry is not None:
+                    self._remove(key)
+                self.misses += 1
+                raise KeyError(key)
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.result
+
+    def store(self, key, result, size=0):
+        ttl = self.ttls.get(key[0], self.ttl)
+        if ttl <= 0 or size > self.maxbytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = Cached(self.clock() + ttl, size, result)
+            self._bytes += size
+            while len(self._entries) > self.maxsize or self._bytes > self.maxbytes:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def invalidate(self, href):
+        """Drop every cached result affected by a write to `href`."""
+        affected = {resource(href), *self.invalidates.get(resource(href), ())}
+        with self._lock:
+            for key in [k for k in self._entries if resource(k[0]) in affected]:
+                self._remove(key)
+                self.invalidations += 1
+
+    def _remove(self, key):
+        self._bytes -= self._entries.pop(key).size
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    @property
+    def size(self):
+        return len(self._entries)
+
+    @property
+    def bytes(self):
+        return self._bytes
+
+
+class SingleFlight:
+    """Coalesce identical concurrent calls, so that only the first (the
+    leader) is made, and those arriving while it's in flight share its
+    result, or its exception.
+
+    Unlike a cache, nothing is kept once the leader's call completes. The
+    calls answered by another's are counted in `shared`.
+    """
+    def __init__(self):
+        self._calls = {}
+        self._tasks = {}
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.shared = 0
+
+    @staticmethod
+    def key(href, method, kwargs, raw=False):
+        return href, method, raw, params_key(kwargs)
+
+    def call(self, key, function):
+        """Return `function()`, or the result of an identical call in flight."""
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+                self.calls += 1
+            else:
+                self.shared += 1
+        if not leader:
+            return future.result()
+
+        try:
+            result = function()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+    async def acall(self, key, function):
+        """As `call`, awaiting the coroutine function `function`."""
+        # Imported here, as asyncio takes a while to import and is only
+        # needed by an `AsyncClient`.
+        import asyncio
+
+        future = self._tasks.get(key)
+        if future is not None:
+            self.shared += 1
+            return await asyncio.shield(future)
+
+        future = self._tasks[key] = asyncio.get_running_loop().create_future()
+        self.calls += 1
+        try:
+            result = await function()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Nobody else may be waiting for the exception.
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._tasks[key]
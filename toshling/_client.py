@@ -1,12 +1,26 @@
 import json
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime
+from string import Formatter
 
 import requests
+from requests.adapters import HTTPAdapter
 from statham.schema.constants import NotPassed
 from statham.schema.elements import Object
+from statham.schema.exceptions import ValidationError
 from statham.schema.validation import format_checker
 
 from . import _endpoints as endpoints
+from ._bulk import BulkReport, BulkResult
+from ._cache import HTTPCache, ResponseCache, SingleFlight
+from ._decode import Decoder, keywords
+from ._json import resolve_backend
+from ._retry import RetryPolicy
+from ._shard import Shards
+from ._stream import ArrayParser
+from .metrics import Metrics
 
 
 @format_checker.register("date")
@@ -20,66 +34,598 @@ def is_date(value: str) -> bool:
 class StathamJSONEncoder(json.JSONEncoder):
     def default(self, o):
         if isinstance(o, Object):
-            return {type(o).properties[k].source: v for k, v in o._dict.items() if not isinstance(v, NotPassed)}
+            # Additional properties (not in the schema) are kept under their own key.
+            properties = type(o).properties
+            return {properties[k].source if k in properties else k: v
+                    for k, v in o._dict.items() if not isinstance(v, NotPassed)}
         
         return json.JSONEncoder.default(self, o)
 
 
-class Client:
-    def __init__(self, api_key, api_endpoint_base='https://api2.toshl.com'):
+_hrefs = {}
+
+
+def _href_builder(href):
+    # A function formatting `href` with a dict of keyword arguments, as
+    # `href.format` would.
+    fields = list(Formatter().parse(href))
+    if all(name is None for _, name, _, _ in fields):
+        return lambda kwargs: href
+    if len(fields) == 1 or len(fields) == 2 and fields[1][1] is None:
+        prefix, name, spec, conversion = fields[0]
+        suffix = fields[1][0] if len(fields) == 2 else ''
+        if not spec and not conversion:
+            return lambda kwargs: f'{prefix}{kwargs[name]}{suffix}'
+    return lambda kwargs: href.format(**kwargs)
+
+
+def _href(href, kwargs):
+    # Format `href` with `kwargs`, by a function built once per href.
+    try:
+        build = _hrefs[href]
+    except KeyError:
+        build = _hrefs.setdefault(href, _href_builder(href))
+    return build(kwargs)
+
+
+def _received(response):
+    # The bytes of a loaded response's body as sent, before any content
+    # decoding, as counted by urllib3.
+    try:
+        return response.raw.tell()
+    except (AttributeError, OSError, ValueError):
+        return len(response.content)
+
+
+class _Namespace:
+    # An endpoint namespace of a client (e.g. `client.entries`), constructed
+    # on first access and kept on the client from then on.
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, client, owner=None):
+        if client is None:
+            return self
+        endpoint = getattr(client.endpoints, self.name.capitalize())(client)
+        client.__dict__[self.name] = endpoint
+        return endpoint
+
+
+class BaseClient:
+    """Request preparation and response decoding shared by `Client` and
+    `AsyncClient`, which only differ in how requests are sent."""
+    endpoints = endpoints
+
+    accounts = _Namespace()
+    budgets = _Namespace()
+    categories = _Namespace()
+    currencies = _Namespace()
+    entries = _Namespace()
+    exports = _Namespace()
+    images = _Namespace()
+    me = _Namespace()
+    tags = _Namespace()
+
+    # The size of the chunks streamed responses are read and parsed in.
+    stream_chunk_size = 64 * 1024
+
+    def __init__(self, api_key, api_endpoint_base, retry=True, http_cache=None,
+                 response_cache=None, decode='compiled', validate_sample=0.0, json_backend=None, coalesce=False,
+                 metrics=None, validate=True):
         self.api_key = api_key
         self.api_endpoint_base = api_endpoint_base
 
-        self.accounts = endpoints.Accounts(self)
-        self.budgets = endpoints.Budgets(self)
-        self.categories = endpoints.Categories(self)
-        self.currencies = endpoints.Currencies(self)
-        self.entries = endpoints.Entries(self)
-        self.exports = endpoints.Exports(self)
-        self.images = endpoints.Images(self)
-        self.me = endpoints.Me(self)
-        self.tags = endpoints.Tags(self)
-    
-    def request(self, href, method, argument_type=None, return_type=None, **kwargs):
-        options = {}
+        # `retry` is a `RetryPolicy`, True for the default policy, or False
+        # to never retry.
+        self.retry = RetryPolicy() if retry is True else retry or None
+
+        # Once the server rate limits a request, every request (including
+        # those made concurrently) waits until `_resume_at`, a
+        # `time.monotonic()` time, rather than only the one rejected.
+        self._resume_at = 0.0
+
+        # `http_cache` is an `HTTPCache`, True for a default sized one, or
+        # None to not make conditional requests.
+        self.http_cache = HTTPCache() if http_cache is True else http_cache
+
+        # `response_cache` is a `ResponseCache`, True for one with default
+        # TTLs and sizes, or None to not cache results in process.
+        self.response_cache = ResponseCache() if response_cache is True else response_cache
+
+        # `coalesce` is a `SingleFlight`, True for a new one, or False to
+        # make every GET even while an identical one is in flight.
+        self.coalesce = SingleFlight() if coalesce is True else coalesce or None
+
+        # `metrics` is a `toshling.metrics.Metrics`, True for a new one, or
+        # None to not record any.
+        self.metrics = Metrics() if metrics is True else metrics or None
+
+        # How models are constructed from responses. 'compiled' and
+        # 'statham' validate everything, while 'trusted' and 'compact' don't
+        # (except for a `validate_sample` fraction of items).
+        self.decoder = Decoder(decode, validate_sample)
+
+        # How bodies are encoded and responses parsed, see `resolve_backend`.
+        self.json = resolve_backend(json_backend)
+
+        # Whether arguments are validated (and defaults filled in) before
+        # being sent, rather than sent as given. May be changed at any time.
+        self.validate = validate
+        self._arguments = {}
+
+    def prepare(self, href, method, argument_type=None, **kwargs):
+        """Return the URL, query parameters and JSON body for a request."""
+        params = body = None
 
         if argument_type:
+            sources, validator = self._argument(argument_type)
+
             # Remap kwargs (which are modified to avoid Python reserved keywords) back into
             # the source keys of the argument object.
-            remap = {}
-            for k, v in kwargs.items():
-                remap[argument_type.properties[k].source] = v
+            remap = {sources[k]: v for k, v in kwargs.items()}
 
             # Construct the argument, which will validate all kwargs.
-            argument = argument_type(remap)
+            if not self.validate:
+                argument = remap
+            elif self.metrics is None:
+                argument = validator(remap)
+            else:
+                start = time.perf_counter()
+                argument = validator(remap)
+                self.metrics.observe('validate_seconds', method, href, time.perf_counter() - start)
 
             # If we GET, use the original remap, otherwise, JSON encode the argument.
             if method == 'GET':
-                options['params'] = remap
+                params = remap
             else:
-                options['data'] = json.dumps(argument, cls=StathamJSONEncoder)
-                options['headers'] = {'Content-Type': 'application/json'}
-
-        # Do the request.
-        response = requests.request(method,
-                                    self.api_endpoint_base + href.format(**kwargs),
-                                    auth=(self.api_key, ''),
-                                    **options)
-        
-        # Check if the response is OK.
-        if response.ok:
-            # Attempt to construct the return type, handling lists, and some
-            # dicts especially (Toshl decided that on some endpoints such as
-            # the currencies list that they'd actually return a dict).
-            if return_type:
-                plain = response.json()
-                if isinstance(plain, list):
-                    return [return_type(p) for p in plain]
-                elif set(plain.keys()).issubset(set(p.source for p in return_type.properties.values())):
-                    return return_type(response.json())
-                elif isinstance(plain, dict):
-                    return {k: return_type(v) for k, v in plain.items()}
-                else:
-                    return plain
+                body = self.json.dumps(argument)
+                if self.metrics is not None:
+                    self.metrics.observe('request_bytes', method, href, len(body))
+
+        return self.api_endpoint_base + _href(href, kwargs), params, body
+
+    def _argument(self, argument_type):
+        # The source key of each keyword argument of `argument_type` and its
+        # validator, looked up once per class (by `id()`, as hashing statham
+        # models is slow).
+        try:
+            return self._arguments[id(argument_type)]
+        except KeyError:
+            validator = self.decoder.validator(argument_type)
+            return self._arguments.setdefault(id(argument_type), (keywords(argument_type), validator))
+
+    def _load(self, href, method, content, return_type=None):
+        # Parse a JSON response body, and construct `return_type` models from
+        # it, unless that's None.
+        if self.metrics is None:
+            plain = self.json.loads(content)
+            return self.decode(plain, return_type) if return_type else plain
+
+        start = time.perf_counter()
+        plain = self.json.loads(content)
+        parsed = time.perf_counter()
+        self.metrics.observe('parse_seconds', method, href, parsed - start)
+        if not return_type:
+            return plain
+        result = self.decode(plain, return_type)
+        self.metrics.observe('decode_seconds', method, href, time.perf_counter() - parsed)
+        return result
+
+    def decode(self, plain, return_type=None):
+        # Attempt to construct the return type, handling lists, and some
+        # dicts especially (Toshl decided that on some endpoints such as
+        # the currencies list that they'd actually return a dict).
+        if return_type:
+            construct = self.decoder.constructor(return_type)
+            if isinstance(plain, list):
+                return [construct(p) for p in plain]
+            elif set(plain.keys()).issubset(set(p.source for p in return_type.properties.values())):
+                return construct(plain)
+            elif isinstance(plain, dict) and all(isinstance(v, dict) for v in plain.values()):
+                return {k: construct(v) for k, v in plain.items()}
+            elif isinstance(plain, dict):
+                # An object with keys the schema doesn't list (e.g. an export,
+                # whose schema lists none).
+                return construct(plain)
+            else:
+                return plain
+
+    def _response_key(self, href, method, return_type, kwargs):
+        if self.response_cache is None or method != 'GET' or not return_type:
+            return None
+        return ResponseCache.key(href, kwargs)
+
+    def _remember(self, href, method, response_key, result, size):
+        # Cache the result of a successful GET, or invalidate whatever a
+        # successful write may have changed.
+        if self.response_cache is None:
+            return
+        if method != 'GET':
+            self.response_cache.invalidate(href)
+        elif response_key is not None:
+            self.response_cache.store(response_key, result, size)
+
+    def _http_cached(self, method, url, params, return_type):
+        # Return the cache key and any cached entry for a request, if its
+        # decoded result can be cached.
+        if self.http_cache is None or method != 'GET' or not return_type:
+            return None, None
+        key = self.http_cache.key(url, params)
+        return key, self.http_cache.get(key)
+
+    def _retry_delay(self, method, attempt, idempotent, response=None):
+        # Return the seconds to wait before retrying a failed request (or one
+        # which failed to connect, if there is no response), or None.
+        if not self.retry:
+            return None
+
+        status = headers = None
+        if response is not None:
+            status, headers = response.status_code, response.headers
+
+        delay = self.retry.delay(method, attempt, status, headers, idempotent)
+        if delay is None:
+            # Only count requests which would have been retried again.
+            if attempt >= self.retry.total and self.retry.retryable(method, status, idempotent):
+                self.retry.stats.record_exhausted()
         else:
-            response.raise_for_status()
+            self.retry.stats.record(status, delay)
+            if status == 429:
+                self._pause(delay)
+        return delay
+
+    def _record(self, method, href, status, seconds, size=None):
+        # Record the status, time until the response headers arrived and
+        # bytes received of one attempt at a request.
+        metrics = self.metrics
+        metrics.count(method, href, status)
+        metrics.observe('request_seconds', method, href, seconds)
+        if size is not None:
+            metrics.observe('response_bytes', method, href, size)
+
+    def _pause(self, delay):
+        self._resume_at = max(self._resume_at, time.monotonic() + delay)
+
+    def _note_rate_limit(self, headers):
+        # A successful response may still say the rate limit is exhausted,
+        # in which case wait for it to reset before the next request (though
+        # no longer than the retry policy would).
+        if headers.get('X-RateLimit-Remaining') == '0':
+            delay = RetryPolicy.requested_delay(headers)
+            if delay:
+                self._pause(min(delay, (self.retry or RetryPolicy()).backoff_max))
+
+    def _paused(self):
+        # Return the seconds left to wait for a rate limit to reset.
+        return self._resume_at - time.monotonic()
+
+    def _prepare_row(self, href, method, argument_type, index, row, dry_run=False):
+        # Validate and encode one row of a bulk operation, returning a failed
+        # result for an invalid row rather than raising. Rows of requests to
+        # a single object may be its id alone. Dry runs exist to validate
+        # rows, so do even when the client doesn't validate arguments.
+        try:
+            kwargs = {'id': row} if isinstance(row, str) else row
+            prepared = self.prepare(href, method, argument_type, **kwargs)
+            if dry_run and argument_type and not self.validate:
+                sources, validator = self._argument(argument_type)
+                validator({sources[k]: v for k, v in kwargs.items()})
+            return prepared, None
+        except (ValidationError, KeyError, TypeError) as e:
+            return None, BulkResult(index, row, False, None, e)
+
+    def _bulk_result(self, href, method, return_type, response):
+        # Decode the response to one row of a bulk operation.
+        if return_type and response.content:
+            result = self._load(href, method, response.content, return_type)
+        else:
+            result = response.headers.get('Location')
+        self._remember(href, method, None, result, len(response.content))
+        return result
+
+    @staticmethod
+    def _first_page(argument_type, kwargs):
+        # Pages default to the largest size the schema allows, and start at
+        # `page` (or the first).
+        per_page = argument_type.properties['per_page'].element
+        kwargs['per_page'] = min(kwargs.get('per_page', per_page.maximum), per_page.maximum)
+        return kwargs.pop('page', argument_type.properties['page'].element.default)
+
+
+class Client(BaseClient):
+    def __init__(self, api_key, api_endpoint_base='https://api2.toshl.com',
+                 pool_connections=10, pool_maxsize=10, pool_block=False, retry=True, http_cache=None,
+                 response_cache=None, decode='compiled', validate_sample=0.0, json_backend=None, coalesce=False,
+                 metrics=None, transport=None, validate=True):
+        super().__init__(api_key, api_endpoint_base, retry, http_cache, response_cache, decode, validate_sample,
+                         json_backend, coalesce, metrics, validate)
+
+        # A single session is kept for the lifetime of the client, so that
+        # connections (and TLS sessions) are pooled and kept alive between
+        # calls. `pool_connections` is the number of hosts to keep pools for,
+        # `pool_maxsize` is the number of connections kept per host, and
+        # `pool_block` makes `pool_maxsize` a hard limit rather than a cap on
+        # the number of idle connections kept. `transport` is a `requests`
+        # adapter to send requests with instead (such as a
+        # `toshling.cassette.Cassette` recorder or player).
+        self.session = requests.Session()
+        self.session.auth = (api_key, '')
+        adapter = transport or HTTPAdapter(pool_connections=pool_connections,
+                                           pool_maxsize=pool_maxsize,
+                                           pool_block=pool_block)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    def close(self):
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    def request(self, href, method, argument_type=None, return_type=None, idempotent=None, raw=False,
+                **kwargs):
+        if self.coalesce is not None and method == 'GET':
+            return self.coalesce.call(
+                self.coalesce.key(href, method, kwargs, raw),
+                lambda: self._request(href, method, argument_type, return_type, idempotent, raw, **kwargs))
+        return self._request(href, method, argument_type, return_type, idempotent, raw, **kwargs)
+
+    def _request(self, href, method, argument_type, return_type, idempotent, raw, **kwargs):
+        # With `raw`, the parsed JSON is returned as it is (and isn't cached)
+        # rather than models.
+        cacheable = None if raw else return_type
+        response_key = self._response_key(href, method, cacheable, kwargs)
+        if response_key is not None:
+            try:
+                return self.response_cache.get(response_key)
+            except KeyError:
+                pass
+
+        url, params, body = self.prepare(href, method, argument_type, **kwargs)
+
+        http_key, cached = self._http_cached(method, url, params, cacheable)
+
+        options = self._options(params, body, HTTPCache.conditional_headers(cached))
+        response = self._send(href, method, url, idempotent, **options)
+
+        result = None
+        if response.status_code == 304 and cached is not None:
+            result = self.http_cache.not_modified(cached)
+        elif raw:
+            result = self._load(href, method, response.content) if response.content else None
+        elif return_type:
+            result = self._load(href, method, response.content, return_type)
+            if http_key is not None:
+                self.http_cache.store(http_key, response.headers, result)
+
+        self._remember(href, method, response_key, result, len(response.content))
+        return result
+
+    @staticmethod
+    def _options(params, body, headers):
+        options = {'headers': headers}
+        if params is not None:
+            options['params'] = params
+        if body is not None:
+            options['data'] = body
+            options['headers']['Content-Type'] = 'application/json'
+        return options
+
+    def _send(self, href, method, url, idempotent=None, **options):
+        # Do the request, retrying failures allowed by the retry policy.
+        # `idempotent` overrides whether the policy treats this request as
+        # safe to repeat.
+        attempt = 0
+        while True:
+            paused = self._paused()
+            if paused > 0:
+                time.sleep(paused)
+            start = time.perf_counter()
+            try:
+                response = self.session.request(method, url, **options)
+            except (requests.ConnectionError, requests.Timeout):
+                if self.metrics is not None:
+                    self._record(method, href, 'error', time.perf_counter() - start)
+                delay = self._retry_delay(method, attempt, idempotent)
+                if delay is None:
+                    raise
+            else:
+                if self.metrics is not None:
+                    # `elapsed` runs until the headers are parsed, before the
+                    # body is read.
+                    self._record(method, href, response.status_code, response.elapsed.total_seconds(),
+                                 None if options.get('stream') else _received(response))
+                # Check if the response is OK.
+                if response.ok:
+                    self._note_rate_limit(response.headers)
+                    return response
+                delay = self._retry_delay(method, attempt, idempotent, response)
+                if delay is None:
+                    response.raise_for_status()
+                response.close()
+
+            self.retry.sleep(delay)
+            attempt += 1
+
+    def bulk(self, href, method, rows, argument_type=None, return_type=None, idempotent=None, concurrency=8,
+             dry_run=False):
+        """Make one request per row (a dict of the keyword arguments of the
+        endpoint method, or an id) of `rows`, returning a `BulkReport` of each row's
+        success or failure rather than raising.
+
+        Rows are validated and encoded ahead of being sent, while up to
+        `concurrency` earlier rows are in flight. A rate limited request
+        pauses all of them until the limit resets. With `dry_run`, rows are
+        only validated (even if the client doesn't validate arguments).
+        """
+        results = []
+        if dry_run:
+            for index, row in enumerate(rows):
+                _, failure = self._prepare_row(href, method, argument_type, index, row, dry_run=True)
+                results.append(failure or BulkResult(index, row, True, None, None))
+            return BulkReport(results, dry_run=True)
+
+        executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix='toshling-bulk')
+        pending = {}
+
+        def send(url, params, body):
+            response = self._send(href, method, url, idempotent, **self._options(params, body, {}))
+            return self._bulk_result(href, method, return_type, response)
+
+        def collect(done):
+            for future in done:
+                index, row = pending.pop(future)
+                try:
+                    results.append(BulkResult(index, row, True, future.result(), None))
+                except Exception as e:
+                    # Any failure is the row's alone, and doesn't stop the rest.
+                    results.append(BulkResult(index, row, False, None, e))
+
+        try:
+            for index, row in enumerate(rows):
+                prepared, failure = self._prepare_row(href, method, argument_type, index, row)
+                if failure is not None:
+                    results.append(failure)
+                    continue
+                # Only validate a bounded number of rows ahead of those sent.
+                if len(pending) >= 2 * concurrency:
+                    collect(wait(pending, return_when=FIRST_COMPLETED).done)
+                pending[executor.submit(send, *prepared)] = index, row
+            collect(wait(pending).done)
+        finally:
+            executor.shutdown(cancel_futures=True)
+        return BulkReport(results)
+
+    def stream(self, href, method, argument_type=None, return_type=None, idempotent=None, **kwargs):
+        """Yield the items of a JSON array response one at a time, parsing
+        the body incrementally as it arrives, rather than loading it whole.
+
+        Streamed responses bypass the HTTP and response caches.
+        """
+        url, params, body = self.prepare(href, method, argument_type, **kwargs)
+        options = self._options(params, body, {})
+
+        construct = self.decoder.constructor(return_type) if return_type else None
+        parser = ArrayParser()
+        with self._send(href, method, url, idempotent, stream=True, **options) as response:
+            for chunk in response.iter_content(self.stream_chunk_size):
+                for item in parser.feed(chunk):
+                    yield construct(item) if construct else item
+            for item in parser.close():
+                yield construct(item) if construct else item
+
+    def iter_pages(self, href, method, argument_type, return_type, prefetch=0, **kwargs):
+        # Lazily request successive pages, stopping at the first page shorter
+        # than `per_page`.
+        page = self._first_page(argument_type, kwargs)
+
+        if prefetch:
+            yield from self._prefetch_pages(href, method, argument_type, return_type, prefetch, page, **kwargs)
+            return
+
+        while True:
+            items = self.request(href, method, argument_type, return_type, page=page, **kwargs)
+            if items:
+                yield items
+            if len(items) < kwargs['per_page']:
+                return
+            page += 1
+
+    def _prefetch_pages(self, href, method, argument_type, return_type, prefetch, page, **kwargs):
+        # Keep `prefetch` pages requested ahead of the consumer. Pages are
+        # yielded in order, and a new page is only requested as an older one
+        # is taken, so at most `prefetch` pages are held at once. Requests
+        # made past the end of the data are simply discarded.
+        executor = ThreadPoolExecutor(max_workers=prefetch, thread_name_prefix='toshling-prefetch')
+        pending = deque()
+
+        def submit():
+            nonlocal page
+            pending.append(executor.submit(self.request, href, method, argument_type, return_type,
+                                           page=page, **kwargs))
+            page += 1
+
+        try:
+            for _ in range(prefetch):
+                submit()
+
+            while True:
+                items = pending.popleft().result()
+                if len(items) < kwargs['per_page']:
+                    if items:
+                        yield items
+                    return
+                submit()
+                yield items
+        finally:
+            executor.shutdown(cancel_futures=True)
+
+    def iter_items(self, href, method, argument_type, return_type, stream=False, **kwargs):
+        if stream:
+            yield from self._stream_items(href, method, argument_type, return_type, **kwargs)
+            return
+        for items in self.iter_pages(href, method, argument_type, return_type, **kwargs):
+            yield from items
+
+    def _stream_items(self, href, method, argument_type, return_type, **kwargs):
+        # As `iter_pages`, yielding the items of each page as they're parsed.
+        if kwargs.pop('prefetch', 0):
+            raise ValueError("Streamed pages can't be prefetched")
+        page = self._first_page(argument_type, kwargs)
+        while True:
+            count = 0
+            for item in self.stream(href, method, argument_type, return_type, page=page, **kwargs):
+                count += 1
+                yield item
+            if count < kwargs['per_page']:
+                return
+            page += 1
+
+    def iter_sharded(self, href, method, argument_type, return_type, workers=4, window='month', **kwargs):
+        """Yield the items dated from `from_` to `to`, fetched in date windows
+        (calendar months, years with `window='year'`, or a number of days)
+        by up to `workers` threads at once, rather than page by page.
+
+        A window whose first page is full is split in two and each half
+        fetched in its place, down to single days, which are paged through.
+        Items are yielded in date order without duplicates, those of each
+        window once every earlier window is done.
+        """
+        self._first_page(argument_type, kwargs)
+        shards = Shards(return_type, kwargs, window)
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='toshling-shard')
+        pending = {}
+
+        def fetch(window):
+            # The window's items, or None if it's to be split.
+            arguments = shards.arguments(window)
+            items = self.request(href, method, argument_type, return_type, page=0, **arguments)
+            if shards.dense(window, items):
+                return None
+            found = list(items)
+            if len(items) == kwargs['per_page']:
+                for more in self.iter_pages(href, method, argument_type, return_type, page=1, **arguments):
+                    found.extend(more)
+            return found
+
+        def submit(windows):
+            for window in windows:
+                pending[executor.submit(fetch, window)] = window
+
+        try:
+            submit(shards.take(workers))
+            while pending:
+                for future in wait(pending, return_when=FIRST_COMPLETED).done:
+                    window = pending.pop(future)
+                    items = future.result()
+                    if items is None:
+                        submit(shards.split(window))
+                    else:
+                        shards.finish(window, items)
+                submit(shards.take(workers - len(pending)))
+                yield from shards.ready()
+        finally:
+            executor.shutdown(cancel_futures=True)
@@ -0,0 +1,242 @@
+import random
+from functools import lru_cache
+
+from statham.schema.constants import NotPassed
+from statham.schema.elements import Array, Element
+from statham.schema.elements.meta import ObjectClassDict, ObjectMeta
+from statham.schema.exceptions import ValidationError
+from statham.schema.validation import format_checker
+
+from ._json import to_plain
+
+
+# Used by the compiled decoders in `toshling.models`, see `compile_models.py`.
+
+MISSING = NotPassed()
+new = object.__new__
+# Dates and timestamps repeat a lot, and parsing them is slow.
+is_format = lru_cache(maxsize=4096)(format_checker)
+_element = Element()
+_SCALARS = (str, int, float, bool, type(None))
+
+
+def anything(value):
+    """Decode a value of an untyped element (one which accepts anything)."""
+    # Statham returns scalars (and lists of them) unchanged, but takes ~100us
+    # to do so.
+    if type(value) in _SCALARS:
+        return value
+    if type(value) is list and all(type(v) in _SCALARS for v in value):
+        return list(value)
+    return _element(value)
+
+
+class Invalid(Exception):
+    """Raised by compiled decoders when a value fails a check."""
+
+
+def additional(properties, value, sources, names):
+    # As statham does, keep keys which aren't the source of any property in
+    # `_dict` only, decoded by a permissive element.
+    for key, sub_value in value.items():
+        if key not in sources:
+            if key in names:
+                raise Invalid
+            properties[key] = anything(sub_value)
+
+
+# Caches by model are keyed by `id()`, as statham hashes models by their name
+# and properties, and compares them by value (so that `Export` from both the
+# argument and return types compare equal).
+_compiled = {}
+
+
+def compiled(model):
+    """Return a constructor of `model` using its compiled decoder.
+
+    When any check fails, the value is handed to statham instead, so that the
+    result, or `ValidationError`, is exactly that of `model(value)`.
+    """
+    try:
+        return _compiled[id(model)]
+    except KeyError:
+        pass
+
+    # Imported here, so that regenerating the models doesn't need them.
+    from .models import compiled_argument_types, compiled_return_types
+    decoders = {compiled_return_types.models.__name__: compiled_return_types.DECODERS,
+                compiled_argument_types.models.__name__: compiled_argument_types.DECODERS}
+    decode = decoders.get(model.__module__, {}).get(model)
+    if decode is None:
+        construct = model
+    else:
+        def construct(value):
+            try:
+                return decode(value)
+            except (Invalid, ValidationError):
+                return model(value)
+    return _compiled.setdefault(id(model), construct)
+
+
+def keywords(model):
+    """Return the source key of each keyword argument of an argument type,
+    e.g. `{'from_': 'from', ...}`."""
+    from .models import compiled_argument_types
+    try:
+        return compiled_argument_types.KEYWORDS[model]
+    except KeyError:
+        return {name: property_.source for name, property_ in model.properties.items()}
+
+
+class TrustedObject:
+    """Mixin making a return type wrap a raw response dict without validating
+    it. Properties are looked up (and nested objects wrapped) lazily, on first
+    access, and `validate()` returns the fully validated model.
+    """
+    def __new__(cls, value=NotPassed(), property_=None):
+        return object.__new__(cls)
+
+    def __init__(self, value=NotPassed(), property_=None):
+        self.__dict__['_raw'] = value
+
+    def __getattr__(self, name):
+        if name == '_dict':
+            # As statham keeps it, including additional properties.
+            properties = type(self).properties
+            sources = {prop.source for prop in properties.values()}
+            plain = {attr: getattr(self, attr) for attr in properties}
+            plain.update((k, v) for k, v in self._raw.items() if k not in sources)
+            return plain
+        try:
+            prop = type(self).properties[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+        value = self._raw.get(prop.source, NotPassed())
+        if isinstance(value, NotPassed):
+            value = prop.element.default
+        elif value is not None:
+            value = _wrap(prop.element, value)
+
+        self.__dict__[name] = value
+        return value
+
+    def __setattr__(self, name, value):
+        self.__dict__[name] = value
+
+    def __eq__(self, other):
+        return isinstance(other, type(self).validated_type) and self._dict == other._dict
+
+    def validate(self):
+        """Return the model validated (and constructed) by statham."""
+        return type(self).validated_type(self._raw)
+
+
+def _wrap(element, value):
+    if isinstance(element, ObjectMeta) and isinstance(value, dict):
+        return trusted_type(element)(value)
+    if isinstance(element, Array) and isinstance(element.items, ObjectMeta) and isinstance(value, list):
+        item_type = trusted_type(element.items)
+        return [item_type(v) if isinstance(v, dict) else v for v in value]
+    return value
+
+
+_trusted_types = {}
+
+
+def trusted_type(return_type):
+    """Return a subclass of `return_type` which trusts its input."""
+    try:
+        return _trusted_types[id(return_type)]
+    except KeyError:
+        trusted = ObjectMeta(return_type.__name__, (TrustedObject, return_type), ObjectClassDict())
+        trusted.validated_type = return_type
+        return _trusted_types.setdefault(id(return_type), trusted)
+
+
+def unknown(value, sources):
+    # The additional properties of a compact model.
+    return {k: v for k, v in value.items() if k not in sources}
+
+
+class CompactObject:
+    """Mixin of the compact models in `toshling.models.compact_types`, which
+    keep their properties in `__slots__` rather than a `__dict__` and `_dict`
+    each, and build nested models when they are first read.
+
+    Like trusted models, they aren't validated, and `validate()` returns the
+    fully validated model.
+    """
+    __slots__ = ()
+
+    def __new__(cls, value=NotPassed(), property_=None):
+        from .models import compact_types
+        return compact_types.DECODERS[cls.validated_type](value)
+
+    def __init__(self, value=NotPassed(), property_=None):
+        pass
+
+    @property
+    def _dict(self):
+        plain = {attr: getattr(self, attr) for attr in type(self).properties}
+        plain.update(self._additional or ())
+        return plain
+
+    def __eq__(self, other):
+        return isinstance(other, type(self).validated_type) and self._dict == other._dict
+
+    def validate(self):
+        """Return the model validated (and constructed) by statham."""
+        return type(self).validated_type(to_plain(self))
+
+
+def compact(return_type):
+    """Return a constructor of the compact variant of `return_type`."""
+    from .models import compact_types
+    return compact_types.DECODERS.get(return_type, return_type)
+
+
+class Decoder:
+    """Build return type instances from decoded JSON.
+
+    `mode` is one of:
+
+    - `'compiled'`, to validate and construct models with the decoders
+      compiled from them by `compile_models.py`, which give the same results
+      as statham in a fraction of the time.
+    - `'statham'`, to fully validate every model with statham.
+    - `'trusted'`, to wrap the raw data with lazily decoded (and unvalidated)
+      subclasses of the return types.
+    - `'compact'`, to copy the raw data into (unvalidated) subclasses of the
+      return types with `__slots__`, for large result sets.
+
+    In the unvalidated modes, a `sample` fraction of the items are also
+    validated, raising `ValidationError` if they don't conform.
+    """
+    modes = ('compiled', 'statham', 'trusted', 'compact')
+
+    def __init__(self, mode='compiled', sample=0.0):
+        if mode not in self.modes:
+            raise ValueError(f"Unknown decode mode {mode!r}, expected one of {self.modes}")
+        self.mode = mode
+        self.sample = sample
+
+    def constructor(self, return_type):
+        if self.mode == 'statham':
+            return return_type
+        if self.mode == 'compiled':
+            return compiled(return_type)
+
+        unvalidated = trusted_type(return_type) if self.mode == 'trusted' else compact(return_type)
+        if not self.sample:
+            return unvalidated
+
+        def construct(value):
+            if random.random() < self.sample:
+                return_type(value)
+            return unvalidated(value)
+        return construct
+
+    def validator(self, argument_type):
+        # Arguments are always validated, by statham in the 'statham' mode.
+        return argument_type if self.mode == 'statham' else compiled(argument_type)
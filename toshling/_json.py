@@ -0,0 +1,93 @@
+import json
+
+from statham.schema.constants import NotPassed
+from statham.schema.elements import Object
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+_SCALARS = frozenset([str, int, float, bool, type(None)])
+_MISSING = NotPassed()
+_sources = {}
+
+
+def _source_names(model_type):
+    # Attribute names to the source names of properties, by model type (by
+    # identity, as statham hashes models by all their property names).
+    try:
+        return _sources[id(model_type)][1]
+    except KeyError:
+        sources = {name: prop.source for name, prop in model_type.properties.items()}
+        return _sources.setdefault(id(model_type), (model_type, sources))[1]
+
+
+def to_plain(value):
+    """Convert statham models (nested in lists and dicts or not) to plain
+    dicts, keyed by the source names of their properties, in a single pass."""
+    if type(value) in _SCALARS:
+        return value
+    if isinstance(value, Object):
+        sources = _source_names(type(value))
+        plain = {}
+        # Additional properties (not in the schema) are kept under their own key.
+        for k, v in value._dict.items():
+            if type(v) not in _SCALARS:
+                if v is _MISSING:
+                    continue
+                v = to_plain(v)
+            plain[sources.get(k, k)] = v
+        return plain
+    if isinstance(value, (list, tuple)):
+        return [to_plain(v) for v in value]
+    if isinstance(value, dict):
+        # Such as the arguments sent unvalidated, which may hold models.
+        return {k: v if type(v) in _SCALARS else to_plain(v) for k, v in value.items()}
+    return value
+
+
+class StdlibJSON:
+    """JSON serialization with the standard library."""
+    name = 'stdlib'
+
+    @staticmethod
+    def loads(data):
+        return json.loads(data)
+
+    @staticmethod
+    def dumps(value):
+        return json.dumps(to_plain(value), separators=(',', ':')).encode()
+
+
+class OrjsonJSON:
+    """JSON serialization with orjson, which is several times faster."""
+    name = 'orjson'
+
+    @staticmethod
+    def loads(data):
+        return orjson.loads(data)
+
+    @staticmethod
+    def dumps(value):
+        return orjson.dumps(to_plain(value))
+
+
+def resolve_backend(backend=None):
+    """Resolve the JSON `backend` of a client.
+
+    `None` picks orjson when it's installed (with the `fast` extra), and the
+    standard library otherwise. `'orjson'` and `'stdlib'` pick one, and any
+    other object with `loads(bytes)` and `dumps(value) -> bytes` is used as
+    it is.
+    """
+    if backend is None:
+        return OrjsonJSON if orjson is not None else StdlibJSON
+    if backend == 'stdlib':
+        return StdlibJSON
+    if backend == 'orjson':
+        if orjson is None:
+            raise ImportError("The orjson JSON backend requires orjson, install toshling[fast]")
+        return OrjsonJSON
+    return backend
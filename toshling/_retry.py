@@ -0,0 +1,116 @@
+import random
+import threading
+import time
+from collections import Counter
+from email.utils import parsedate_to_datetime
+
+
+class RetryPolicy:
+    """Decide whether, and after how long, a failed request is retried.
+
+    Responses with a status in `statuses`, connection errors and timeouts
+    are retried up to `total` times. Waits grow exponentially from `backoff_factor`
+    seconds up to `backoff_max`, with full jitter unless `jitter` is false.
+    A `Retry-After` header, or an exhausted `X-RateLimit-Remaining` with an
+    `X-RateLimit-Reset`, takes precedence over the backoff, though it is
+    also capped at `backoff_max`.
+
+    Only requests with a method in `methods` are retried, unless the request
+    is explicitly marked as idempotent (or not) with `idempotent=`. A 429
+    means the request was rejected before being processed, so `retry_rejected`
+    allows those to be retried regardless of the method.
+
+    Retries and time spent waiting are counted in `stats`.
+    """
+    def __init__(self, total=3, backoff_factor=0.5, backoff_max=60, jitter=True,
+                 statuses=(429, 500, 502, 503, 504),
+                 methods=('GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'),
+                 retry_rejected=True):
+        self.total = total
+        self.backoff_factor = backoff_factor
+        self.backoff_max = backoff_max
+        self.jitter = jitter
+        self.statuses = frozenset(statuses)
+        self.methods = frozenset(methods)
+        self.retry_rejected = retry_rejected
+        self.stats = RetryStats()
+
+    def delay(self, method, attempt, status=None, headers=None, idempotent=None):
+        """Return the seconds to wait before retrying, or None to give up.
+
+        `status` and `headers` are those of the failed response, or None if
+        the request failed to connect.
+        """
+        if attempt >= self.total or not self.retryable(method, status, idempotent):
+            return None
+
+        requested = self.requested_delay(headers or {})
+        if requested is not None:
+            return min(self.backoff_max, requested)
+
+        backoff = min(self.backoff_max, self.backoff_factor * 2 ** attempt)
+        return random.uniform(0, backoff) if self.jitter else backoff
+
+    def retryable(self, method, status=None, idempotent=None):
+        """Whether a request failing with `status` (or None if it failed to
+        connect) would be retried, given attempts left."""
+        if status is not None and status not in self.statuses:
+            return False
+        if idempotent is None:
+            idempotent = method in self.methods
+        return idempotent or (status == 429 and self.retry_rejected)
+
+    @staticmethod
+    def requested_delay(headers):
+        """Return the delay the server asked for in `headers`, if any."""
+        retry_after = headers.get('Retry-After')
+        if retry_after is not None:
+            try:
+                return max(0.0, float(retry_after))
+            except ValueError:
+                try:
+                    return max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time())
+                except (TypeError, ValueError):
+                    pass
+
+        if headers.get('X-RateLimit-Remaining') == '0' and headers.get('X-RateLimit-Reset'):
+            try:
+                reset = float(headers['X-RateLimit-Reset'])
+            except ValueError:
+                return None
+            # The reset is either an epoch timestamp or a number of seconds.
+            return max(0.0, reset - time.time()) if reset > 1e9 else reset
+
+        return None
+
+    def sleep(self, seconds):
+        time.sleep(seconds)
+
+
+class RetryStats:
+    """Thread-safe counters of the retries made under a `RetryPolicy`."""
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.retries = 0
+        self.wait_time = 0.0
+        self.statuses = Counter()
+        self.exhausted = 0
+
+    def record(self, status, delay):
+        with self._lock:
+            self.retries += 1
+            self.wait_time += delay
+            self.statuses[status] += 1
+
+    def record_exhausted(self):
+        with self._lock:
+            self.exhausted += 1
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                'retries': self.retries,
+                'wait_time': self.wait_time,
+                'statuses': dict(self.statuses),
+                'exhausted': self.exhausted
+            }
@@ -0,0 +1,106 @@
+from collections import deque
+from datetime import date, timedelta
+from operator import attrgetter, itemgetter
+
+
+def _next_month(day):
+    return date(day.year + day.month // 12, day.month % 12 + 1, 1)
+
+
+def windows(start, end, window='month'):
+    """Split the dates from `start` to `end` (inclusive) into consecutive
+    `(start, end)` windows: calendar months or years for `'month'` or
+    `'year'`, or spans of a number of days."""
+    if window not in ('month', 'year') and not (isinstance(window, int) and window > 0):
+        raise ValueError(f"Unknown window {window!r}, expected 'month', 'year' or a number of days")
+    found = []
+    while start <= end:
+        if window == 'month':
+            following = _next_month(start)
+        elif window == 'year':
+            following = date(start.year + 1, 1, 1)
+        else:
+            following = start + timedelta(days=window)
+        found.append((start, min(end, following - timedelta(days=1))))
+        start = following
+    return found
+
+
+def halves(window):
+    start, end = window
+    middle = start + (end - start) // 2
+    return [(start, middle), (middle + timedelta(days=1), end)]
+
+
+class Shards:
+    """The date windows of a sharded fetch of a list endpoint, tracking those
+    requested and merging their items in date order.
+
+    Windows are requested in date order. A window whose first page is full
+    may be split in two in its place, and items are only released (sorted
+    by date, and without duplicates) once every earlier window is done.
+    """
+    def __init__(self, return_type, kwargs, window='month'):
+        # Sums over weeks or months can't be split at arbitrary dates.
+        range_ = kwargs.get('range', 'day')
+        if range_ == 'week':
+            raise ValueError("Weekly sums can't be sharded, as weeks don't align with date windows")
+        self.splittable = range_ == 'day'
+        if range_ == 'month' and window != 'year':
+            window = 'month'
+
+        self.kwargs = kwargs
+        self.per_page = kwargs['per_page']
+        if kwargs.get('from_') is None or kwargs.get('to') is None:
+            raise ValueError('Sharding requires both `from_` and `to` dates')
+        self.waiting = deque(windows(date.fromisoformat(str(kwargs['from_'])), date.fromisoformat(str(kwargs['to'])),
+                                     window))
+        self.order = []
+        self.done = {}
+
+        properties = return_type.properties
+        date_ = 'date' if 'date' in properties else 'day'
+        key = 'id' if 'id' in properties else date_
+        # Raw items are the parsed JSON objects, whose keys match the
+        # names of these properties.
+        getter = itemgetter if kwargs.get('raw') else attrgetter
+        self.date, self.key = getter(date_), getter(key)
+
+    def take(self, count):
+        """Return up to `count` more windows to request."""
+        taken = []
+        while self.waiting and len(taken) < count:
+            taken.append(self.waiting.popleft())
+            self.order.append(taken[-1])
+        return taken
+
+    def arguments(self, window):
+        return {**self.kwargs, 'from_': window[0].isoformat(), 'to': window[1].isoformat()}
+
+    def dense(self, window, items):
+        """Whether `window`, its first page being `items`, should be split
+        rather than paged through."""
+        return len(items) >= self.per_page and self.splittable and window[0] < window[1]
+
+    def split(self, window):
+        """Replace `window` by its halves, returning them."""
+        index = self.order.index(window)
+        self.order[index:index + 1] = split = halves(window)
+        return split
+
+    def finish(self, window, items):
+        self.done[window] = items
+
+    def ready(self):
+        """Return the items of the windows done before any still running."""
+        released = []
+        while self.order and self.order[0] in self.done:
+            # Windows don't share dates, so duplicates (of items which moved
+            # between the pages of a window) are only looked for within one.
+            seen = set()
+            for item in sorted(self.done.pop(self.order.pop(0)), key=self.date):
+                key = self.key(item)
+                if key not in seen:
+                    seen.add(key)
+                    released.append(item)
+        return released
@@ -0,0 +1,76 @@
+import codecs
+import json
+
+
+_WHITESPACE = ' \t\n\r'
+
+
+class ArrayParser:
+    """Incrementally parse the items of a JSON array, as its text arrives in
+    chunks of bytes.
+
+    Each item is parsed (with the standard library's scanner) once it and the
+    delimiter following it have arrived, so only the unparsed tail of the
+    body is ever buffered.
+    """
+    def __init__(self):
+        self._decoder = codecs.getincrementaldecoder('utf-8')()
+        self._scan = json.JSONDecoder().raw_decode
+        self._buffer = ''
+        # 'start' before the '[', 'first' before the first item (or ']'),
+        # 'item' before an item, 'delimiter' after one and 'end' after ']'.
+        self._state = 'start'
+
+    def feed(self, chunk, final=False):
+        """Return the items completed by `chunk`."""
+        buffer = self._buffer + self._decoder.decode(chunk, final)
+        length = len(buffer)
+        position = 0
+        items = []
+
+        while True:
+            while position < length and buffer[position] in _WHITESPACE:
+                position += 1
+            if position == length:
+                break
+
+            if self._state == 'start':
+                if buffer[position] != '[':
+                    raise ValueError("Expected a JSON array")
+                position += 1
+                self._state = 'first'
+            elif self._state == 'first' and buffer[position] == ']':
+                position += 1
+                self._state = 'end'
+            elif self._state in ('first', 'item'):
+                try:
+                    item, end = self._scan(buffer, position)
+                except json.JSONDecodeError:
+                    if final:
+                        raise
+                    break  # Wait for the rest of the item.
+                following = end
+                while following < length and buffer[following] in _WHITESPACE:
+                    following += 1
+                if not final and (following == length or buffer[following] not in ',]'):
+                    break  # A number may be continued by the next chunk.
+                items.append(item)
+                position = end
+                self._state = 'delimiter'
+            elif self._state == 'delimiter':
+                if buffer[position] not in ',]':
+                    raise ValueError(f"Expected ',' or ']' at {buffer[position:position + 20]!r}")
+                self._state = 'item' if buffer[position] == ',' else 'end'
+                position += 1
+            else:
+                raise ValueError("Extra data after the JSON array")
+
+        self._buffer = buffer[position:]
+        return items
+
+    def close(self):
+        """Return any last items, checking that the array was complete."""
+        items = self.feed(b'', final=True)
+        if self._state != 'end':
+            raise ValueError("Truncated JSON array")
+        return items
@@ -0,0 +1,242 @@
+"""Recording API responses to a cassette, and replaying them offline.
+
+A `Cassette` holds the responses (status, headers and body, along with how
+long each took) to the requests made through one of its transports, passed
+to a client as `transport=`:
+
+- `recorder()` (or `async_recorder()` for an `AsyncClient`) sends requests
+  as usual, recording each response;
+- `player()` (or `async_player()`) answers requests from the recordings,
+  without a network, as fast as possible or (with `latency`) taking as long
+  as they were recorded to take.
+
+Requests are matched by method, path, query and body, so the base URL and
+API key replayed with needn't be those recorded with. The API key is never
+recorded: request headers aren't kept, and it's replaced by `SCRUBBED`
+wherever it appears in a response. Cassettes are saved as JSON lines,
+compressed when the path ends in `.gz`.
+"""
+import asyncio
+import base64
+import gzip
+import io
+import json
+import threading
+import time
+from http.client import responses as reasons
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+from requests.adapters import BaseAdapter, HTTPAdapter
+from urllib3 import HTTPResponse
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None
+
+
+SCRUBBED = '<API_KEY>'
+
+# Response headers which describe the body as sent rather than as recorded
+# (which is decoded), or are of no use replayed.
+_DROPPED_HEADERS = frozenset(['connection', 'content-encoding', 'content-length', 'keep-alive', 'set-cookie',
+                              'transfer-encoding'])
+
+
+class CassetteMiss(LookupError):
+    """Raised when replaying a request which wasn't recorded."""
+
+
+def _match(method, url, body):
+    # The key requests are matched by: their method, path, sorted query and
+    # body.
+    parts = urlsplit(url)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    if isinstance(body, bytes):
+        body = body.decode('utf-8', 'replace')
+    return method, parts.path + (f'?{query}' if query else ''), body or ''
+
+
+def _api_key(authorization):
+    # The API key sent as the user of a basic `Authorization` header.
+    if not authorization or not authorization.startswith('Basic '):
+        return None
+    try:
+        return base64.b64decode(authorization[6:]).decode().partition(':')[0] or None
+    except ValueError:
+        return None
+
+
+class Cassette:
+    """Recorded interactions with the API, each a dict of the `method`,
+    `url` (path and query) and `body` of a request and the `status`,
+    `headers`, `content` and `elapsed` seconds of its response.
+
+    Replayed requests are answered by the interactions recorded for them in
+    turn, starting over once each has been replayed.
+    """
+    def __init__(self, interactions=()):
+        self.interactions = list(interactions)
+        self._lock = threading.Lock()
+        self._recorded = None
+        self._played = {}
+
+    def __len__(self):
+        return len(self.interactions)
+
+    @classmethod
+    def load(cls, path):
+        with (gzip.open if str(path).endswith('.gz') else open)(path, 'rt', encoding='utf-8') as f:
+            return cls(json.loads(line) for line in f if line.strip())
+
+    def save(self, path):
+        with (gzip.open if str(path).endswith('.gz') else open)(path, 'wt', encoding='utf-8') as f:
+            for interaction in self.interactions:
+                f.write(json.dumps(interaction, ensure_ascii=False, separators=(',', ':')) + '\n')
+
+    def record(self, method, url, body, status, headers, content, elapsed, api_key=None):
+        """Record the response to a request, replacing `api_key` wherever it
+        appears."""
+        def scrub(text):
+            return text.replace(api_key, SCRUBBED) if api_key else text
+
+        method, url, body = _match(method, url, body)
+        interaction = {
+            'method': method, 'url': scrub(url), 'body': scrub(body), 'status': status,
+            'headers': {k.lower(): scrub(v) for k, v in headers.items() if k.lower() not in _DROPPED_HEADERS},
+            'elapsed': round(elapsed, 6),
+        }
+        try:
+            interaction['content'] = scrub(content.decode('utf-8'))
+        except UnicodeDecodeError:
+            interaction['content_base64'] = base64.b64encode(content).decode()
+        with self._lock:
+            self.interactions.append(interaction)
+            self._recorded = None
+
+    def play(self, method, url, body):
+        """Return the next interaction recorded for a request, or raise
+        `CassetteMiss`."""
+        key = _match(method, url, body)
+        with self._lock:
+            if self._recorded is None:
+                self._recorded = {}
+                for interaction in self.interactions:
+                    self._recorded.setdefault(
+                        (interaction['method'], interaction['url'], interaction['body']), []).append(interaction)
+            recorded = self._recorded.get(key)
+            if not recorded:
+                raise CassetteMiss(f'{key[0]} {key[1]} was not recorded')
+            played = self._played.get(key, 0)
+            self._played[key] = played + 1
+        return recorded[played % len(recorded)]
+
+    def rewind(self):
+        """Replay every request's interactions from the first again."""
+        with self._lock:
+            self._played.clear()
+
+    def recorder(self, adapter=None):
+        """Return a `requests` adapter recording the responses of `adapter`
+        (by default a new `HTTPAdapter`)."""
+        return RecordingAdapter(self, adapter)
+
+    def player(self, latency=False):
+        """Return a `requests` adapter replaying this cassette, delaying each
+        response by `latency` times its recorded time (so True replays it
+        as recorded)."""
+        return ReplayAdapter(self, latency)
+
+    def async_recorder(self, transport=None):
+        """As `recorder`, for an `AsyncClient`, wrapping an `httpx`
+        transport."""
+        return AsyncRecordingTransport(self, transport)
+
+    def async_player(self, latency=False):
+        """As `player`, for an `AsyncClient`."""
+        return AsyncReplayTransport(self, latency)
+
+
+def _content(interaction):
+    if 'content_base64' in interaction:
+        return base64.b64decode(interaction['content_base64'])
+    return interaction['content'].encode('utf-8')
+
+
+class RecordingAdapter(BaseAdapter):
+    """Sends requests with another adapter, recording their responses to a
+    `Cassette`. Responses are read whole, even when streamed."""
+    def __init__(self, cassette, adapter=None):
+        super().__init__()
+        self.cassette = cassette
+        self.adapter = adapter or HTTPAdapter()
+
+    def send(self, request, **kwargs):
+        start = time.perf_counter()
+        response = self.adapter.send(request, **kwargs)
+        content = response.content
+        self.cassette.record(request.method, request.url, request.body, response.status_code, response.headers,
+                             content, time.perf_counter() - start, _api_key(request.headers.get('Authorization')))
+        return response
+
+    def close(self):
+        self.adapter.close()
+
+
+class ReplayAdapter(HTTPAdapter):
+    """Answers requests from a `Cassette`, without a network."""
+    def __init__(self, cassette, latency=False):
+        super().__init__()
+        self.cassette = cassette
+        self.latency = float(latency)
+
+    def send(self, request, **kwargs):
+        interaction = self.cassette.play(request.method, request.url, request.body)
+        if self.latency:
+            time.sleep(interaction['elapsed'] * self.latency)
+        status = interaction['status']
+        raw = HTTPResponse(body=io.BytesIO(_content(interaction)), headers=interaction['headers'], status=status,
+                           reason=reasons.get(status, ''), preload_content=False, decode_content=False)
+        return self.build_response(request, raw)
+
+
+_AsyncBaseTransport = httpx.AsyncBaseTransport if httpx is not None else object
+
+
+class AsyncRecordingTransport(_AsyncBaseTransport):
+    """As `RecordingAdapter`, for `httpx`."""
+    def __init__(self, cassette, transport=None):
+        if httpx is None:
+            raise ImportError("AsyncRecordingTransport requires httpx, install toshling[async]")
+        self.cassette = cassette
+        self.transport = transport or httpx.AsyncHTTPTransport()
+
+    async def handle_async_request(self, request):
+        start = time.perf_counter()
+        response = await self.transport.handle_async_request(request)
+        # Reading decodes the body, so it's passed on without its encoding.
+        content = await response.aread()
+        self.cassette.record(request.method, str(request.url), request.content, response.status_code,
+                             response.headers, content, time.perf_counter() - start,
+                             _api_key(request.headers.get('Authorization')))
+        headers = [(k, v) for k, v in response.headers.items() if k.lower() not in _DROPPED_HEADERS]
+        return httpx.Response(response.status_code, headers=headers, content=content, request=request)
+
+    async def aclose(self):
+        await self.transport.aclose()
+
+
+class AsyncReplayTransport(_AsyncBaseTransport):
+    """As `ReplayAdapter`, for `httpx`."""
+    def __init__(self, cassette, latency=False):
+        if httpx is None:
+            raise ImportError("AsyncReplayTransport requires httpx, install toshling[async]")
+        self.cassette = cassette
+        self.latency = float(latency)
+
+    async def handle_async_request(self, request):
+        interaction = self.cassette.play(request.method, str(request.url), request.content)
+        if self.latency:
+            await asyncio.sleep(interaction['elapsed'] * self.latency)
+        return httpx.Response(interaction['status'], headers=interaction['headers'], content=_content(interaction),
+                              request=request)
@@ -0,0 +1,127 @@
+"""Columnar NumPy tables of entries, for vectorized analytics.
+
+`EntryTable` builds its columns straight from the raw JSON pages of
+`entries.list`, without constructing a model per entry, and computes grouped
+sums with `numpy.bincount`. Requires numpy, which is installed with the
+`numpy` extra.
+"""
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+
+# Columns of one entry each, by name, with their dtype and how they're taken
+# from a raw entry.
+COLUMNS = {
+    'id': ('U', lambda e: e.get('id', '')),
+    'amount': ('f8', lambda e: e.get('amount', np.nan)),
+    'date': ('datetime64[D]', lambda e: e.get('date') or 'NaT'),
+    'currency': ('U', lambda e: (e.get('currency') or {}).get('code', '')),
+    'account': ('U', lambda e: e.get('account', '')),
+    'category': ('U', lambda e: e.get('category', '')),
+    'completed': ('?', lambda e: e.get('completed', False)),
+    'deleted': ('?', lambda e: e.get('deleted', False)),
+}
+
+
+def _column(entries, dtype, get):
+    if dtype in ('f8', '?'):
+        return np.fromiter(map(get, entries), dtype=dtype, count=len(entries))
+    return np.array([get(e) for e in entries], dtype=dtype)
+
+
+class EntryTable:
+    """Entries as NumPy arrays, one per column in `COLUMNS`.
+
+    Tags are dictionary encoded: `tag_ids` holds every distinct tag id, and
+    the tags of entry `i` are `tag_ids[tag_codes[tag_offsets[i]:tag_offsets[i + 1]]]`.
+    """
+    def __init__(self, columns, tag_ids, tag_offsets, tag_codes):
+        if np is None:
+            raise ImportError("EntryTable requires numpy, install toshling[numpy]")
+        for name in COLUMNS:
+            setattr(self, name, columns[name])
+        self.tag_ids = tag_ids
+        self.tag_offsets = tag_offsets
+        self.tag_codes = tag_codes
+
+    @classmethod
+    def from_pages(cls, pages):
+        """Build a table from pages (lists) of raw entries."""
+        if np is None:
+            raise ImportError("EntryTable requires numpy, install toshling[numpy]")
+        chunks = {name: [] for name in COLUMNS}
+        tag_counts, tags = [], []
+        for page in pages:
+            for name, (dtype, get) in COLUMNS.items():
+                chunks[name].append(_column(page, dtype, get))
+            page_tags = [e.get('tags') or () for e in page]
+            tag_counts.append(np.fromiter(map(len, page_tags), dtype='i8', count=len(page)))
+            tags.extend(tag for entry_tags in page_tags for tag in entry_tags)
+
+        columns = {name: np.concatenate(arrays) if arrays else np.array([], dtype=COLUMNS[name][0])
+                   for name, arrays in chunks.items()}
+        tag_ids, tag_codes = np.unique(np.array(tags, dtype='U'), return_inverse=True)
+        tag_offsets = np.zeros(len(columns['id']) + 1, dtype='i8')
+        if tag_counts:
+            np.cumsum(np.concatenate(tag_counts), out=tag_offsets[1:])
+        return cls(columns, tag_ids, tag_offsets, tag_codes.astype('i4'))
+
+    @classmethod
+    def fetch(cls, client, **kwargs):
+        """Build a table of the entries listed by `client.entries.iter_pages(**kwargs)`,
+        requesting raw pages."""
+        return cls.from_pages(client.entries.iter_pages(raw=True, **kwargs))
+
+    def __len__(self):
+        return len(self.id)
+
+    def tags(self, i):
+        """Return the tag ids of entry `i`."""
+        return self.tag_ids[self.tag_codes[self.tag_offsets[i]:self.tag_offsets[i + 1]]].tolist()
+
+    def sum_by(self, *by, period=None, where=None):
+        """Sum the amounts of entries grouped by the columns named in `by`
+        (and by `'tag'`, counting entries once per tag), and by dates
+        truncated to a NumPy datetime unit `period` such as `'Y'` or `'M'`.
+
+        `where` is an optional boolean mask of entries to include. Returns
+        a dict of sums keyed by tuples of the group values, in the order of
+        `by` with the period last.
+        """
+        rows = np.arange(len(self))
+        if 'tag' in by:
+            rows = np.repeat(rows, np.diff(self.tag_offsets))
+        if where is not None:
+            keep = np.asarray(where, dtype=bool)[rows]
+        else:
+            keep = np.ones(len(rows), dtype=bool)
+
+        keys = [self.tag_ids[self.tag_codes] if name == 'tag' else getattr(self, name)[rows] for name in by]
+        if period is not None:
+            keys.append(self.date[rows].astype(f'datetime64[{period}]'))
+
+        # Combine the codes of each key into one group number per row,
+        # renumbering the groups seen after each key so that they stay below
+        # the number of rows, however many values the keys could combine to.
+        groups = np.zeros(np.count_nonzero(keep), dtype='i8')
+        columns = []
+        for key in keys:
+            values, codes = np.unique(key[keep], return_inverse=True)
+            codes = codes.ravel()
+            groups = np.unique(groups * len(values) + codes, return_inverse=True)[1].ravel()
+            columns.append((values, codes))
+
+        totals = np.bincount(groups, weights=self.amount[rows][keep])
+        # The values of each group's keys are those of its first row.
+        first = np.unique(groups, return_index=True)[1]
+        result = {}
+        for group, row in enumerate(first):
+            result[tuple(values[codes[row]].item() for values, codes in columns)] = float(totals[group])
+        return result
+
+
+def to_columns(client, **kwargs):
+    """Return an `EntryTable` of the entries listed with `kwargs`."""
+    return EntryTable.fetch(client, **kwargs)
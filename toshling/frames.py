@@ -0,0 +1,171 @@
+"""pandas DataFrames of list and sums endpoints.
+
+Frames are built column-wise from the raw JSON pages of an endpoint, without
+constructing a model per item. Nested objects such as `DayExpenses` are
+flattened into columns named by their path (`expenses_sum`), and each column
+gets a dtype from the schema of the return type: dates and date-times become
+datetimes (date-times in UTC), enumerations and ids of other objects become
+categoricals, and integers, booleans and strings use pandas' nullable dtypes.
+Requires pandas, which is installed with the `pandas` extra.
+"""
+from statham.schema.constants import NotPassed
+from statham.schema.elements import Boolean, Integer, Number, String
+from statham.schema.elements.meta import ObjectMeta
+
+from .models import return_types
+
+try:
+    import pandas as pd
+    from pandas.api.types import union_categoricals
+except ImportError:  # pragma: no cover
+    pd = None
+
+
+# Return types of the endpoints `to_dataframe` can be given, by endpoint class
+# name (which is the same for the synchronous and asynchronous clients).
+RETURN_TYPES = {
+    'Entries': return_types.Entry,
+    'EntriesSums': return_types.Day,
+    'CategoriesSums': return_types.CategorySum,
+    'TagsSums': return_types.TagSum,
+}
+
+# String properties holding the ids (or codes) of other objects, which repeat
+# across rows and so are stored as categoricals.
+REFERENCES = frozenset(['account', 'category', 'tag', 'code', 'main', 'reference_currency', 'connection'])
+
+CHUNK_SIZE = 50000
+
+
+def _kind(name, element):
+    if isinstance(element, Number):
+        return 'float64'
+    if isinstance(element, Integer):
+        return 'Int64'
+    if isinstance(element, Boolean):
+        return 'boolean'
+    if isinstance(element, String):
+        if element.format in ('date', 'date-time'):
+            return element.format
+        if not isinstance(element.enum, NotPassed) or name in REFERENCES:
+            return 'category'
+        return 'string'
+    return 'object'
+
+
+def _fields(model, path=()):
+    # Yield `(column, source path, kind)` for each column of `model`,
+    # flattening nested objects which have properties of their own.
+    for prop in model.properties.values():
+        source = path + (prop.source,)
+        element = prop.element
+        if isinstance(element, ObjectMeta) and element.properties:
+            yield from _fields(element, source)
+        else:
+            yield '_'.join(source), source, _kind(prop.source, element)
+
+
+def _getter(path):
+    if len(path) == 1:
+        key, = path
+        return lambda item: item.get(key)
+
+    def get(item):
+        for key in path:
+            if item is None:
+                return None
+            item = item.get(key)
+        return item
+    return get
+
+
+def _series(values, kind):
+    if kind == 'date':
+        dates = pd.to_datetime(pd.Series(values, dtype=object), format='%Y-%m-%d', errors='coerce')
+        return dates.astype('datetime64[ns]')
+    if kind == 'date-time':
+        # Date-times may or may not carry a zone (e.g. a 'Z'), so all are read
+        # as UTC and kept as naive UTC times.
+        times = pd.to_datetime(pd.Series(values, dtype=object), format='ISO8601', errors='coerce', utc=True)
+        return times.dt.tz_localize(None).astype('datetime64[ns]')
+    if kind == 'category':
+        return pd.Series(pd.Categorical(values))
+    if kind == 'object':
+        series = pd.Series(dtype=object, index=range(len(values)))
+        series[:] = values
+        return series
+    return pd.Series(values, dtype=kind)
+
+
+class FrameBuilder:
+    """Accumulate pages of raw items of `return_type` column by column, and
+    build them into a DataFrame.
+
+    `columns` optionally selects (and orders) the flattened columns to keep.
+    """
+    def __init__(self, return_type, columns=None):
+        if pd is None:
+            raise ImportError("FrameBuilder requires pandas, install toshling[pandas]")
+        fields = {name: (_getter(path), kind) for name, path, kind in _fields(return_type)}
+        if columns is not None:
+            unknown = set(columns).difference(fields)
+            if unknown:
+                raise ValueError(f"Unknown columns for {return_type.__name__}: {', '.join(sorted(unknown))}")
+            fields = {name: fields[name] for name in columns}
+        self.fields = fields
+        self._values = {name: [] for name in fields}
+
+    def __len__(self):
+        return len(next(iter(self._values.values()), ()))
+
+    def add(self, items):
+        """Add a page (list) of raw items."""
+        for name, (get, _) in self.fields.items():
+            self._values[name].extend(map(get, items))
+
+    def build(self):
+        """Return a DataFrame of the items added since the last build."""
+        frame = pd.DataFrame({name: _series(self._values[name], kind)
+                              for name, (_, kind) in self.fields.items()})
+        self._values = {name: [] for name in self.fields}
+        return frame
+
+
+def _concat(frames):
+    # Concatenate chunks, taking the union of the categories of categoricals
+    # rather than falling back to objects.
+    if len(frames) == 1:
+        return frames[0]
+    columns = {}
+    for name, column in frames[0].items():
+        if isinstance(column.dtype, pd.CategoricalDtype):
+            columns[name] = pd.Series(union_categoricals([f[name] for f in frames]))
+        else:
+            columns[name] = pd.concat([f[name] for f in frames], ignore_index=True)
+    return pd.DataFrame(columns)
+
+
+def iter_dataframes(endpoint, return_type=None, columns=None, chunk_size=CHUNK_SIZE, **kwargs):
+    """Yield DataFrames of up to about `chunk_size` rows of the items listed by
+    the (synchronous) `endpoint`, such as `client.entries.sums`, with `kwargs`.
+
+    `return_type` is needed for endpoints other than those in `RETURN_TYPES`.
+    """
+    builder = FrameBuilder(return_type or RETURN_TYPES[type(endpoint).__name__], columns)
+    built = False
+    for page in endpoint.iter_pages(raw=True, **kwargs):
+        builder.add(page)
+        if len(builder) >= chunk_size:
+            yield builder.build()
+            built = True
+    if len(builder) or not built:
+        yield builder.build()
+
+
+def to_dataframe(endpoint, return_type=None, columns=None, chunk_size=CHUNK_SIZE, **kwargs):
+    """Return a DataFrame of the items listed by `endpoint` with `kwargs`.
+
+    The frame is built in chunks of `chunk_size` rows, so only one chunk of
+    items is held as Python objects at a time.
+    """
+    return _concat(list(iter_dataframes(endpoint, return_type, columns, chunk_size, **kwargs)))
@@ -0,0 +1,138 @@
+"""Per-endpoint metrics of the requests made by a client.
+
+A `Metrics` passed to a client as `metrics=` records, for each endpoint
+(method and href template, e.g. `GET /entries/{id}`), histograms of:
+
+- `request_seconds`, the time from sending a request until the headers of
+  its response arrive, leaving out reading the body (each attempt,
+  including those retried);
+- `request_bytes` and `response_bytes`, the sizes of the bodies sent and
+  received, as transferred (so compressed, if they were), and not recorded
+  for streamed responses;
+- `validate_seconds`, the time taken to validate the arguments;
+- `parse_seconds`, the time taken to parse JSON responses; and
+- `decode_seconds`, the time taken to construct models from them;
+
+and counts the responses by status (or `'error'` for requests which failed
+to connect). `snapshot()` returns them as a dict, which exporters such as
+`prometheus_text` turn into other formats.
+"""
+import threading
+from bisect import bisect_left
+
+
+# Upper bounds of the buckets of time (in seconds) and size (in bytes)
+# histograms.
+TIME_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+
+HISTOGRAMS = {
+    'request_seconds': TIME_BUCKETS,
+    'request_bytes': SIZE_BUCKETS,
+    'response_bytes': SIZE_BUCKETS,
+    'validate_seconds': TIME_BUCKETS,
+    'parse_seconds': TIME_BUCKETS,
+    'decode_seconds': TIME_BUCKETS,
+}
+
+
+class Histogram:
+    """Counts of observed values by bucket, with their count and sum."""
+    def __init__(self, buckets):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def snapshot(self):
+        # Buckets are cumulative, as in Prometheus, ending with +Inf.
+        cumulative, total = [], 0
+        for bound, count in zip(self.buckets + (float('inf'),), self.counts):
+            total += count
+            cumulative.append((bound, total))
+        return {'count': self.count, 'sum': self.sum, 'buckets': cumulative}
+
+
+class Metrics:
+    """Thread-safe histograms and status counts of requests, by endpoint.
+
+    `histograms` maps the name of each histogram to its bucket bounds, and
+    defaults to `HISTOGRAMS`.
+    """
+    def __init__(self, histograms=None):
+        self.histograms = dict(HISTOGRAMS if histograms is None else histograms)
+        self._lock = threading.Lock()
+        self._endpoints = {}
+
+    def _endpoint(self, method, href):
+        try:
+            return self._endpoints[method, href]
+        except KeyError:
+            endpoint = {'statuses': {}, **{name: Histogram(b) for name, b in self.histograms.items()}}
+            return self._endpoints.setdefault((method, href), endpoint)
+
+    def observe(self, name, method, href, value):
+        """Record `value` in the `name` histogram of an endpoint."""
+        with self._lock:
+            self._endpoint(method, href)[name].observe(value)
+
+    def count(self, method, href, status):
+        """Count a response with `status` from an endpoint."""
+        with self._lock:
+            statuses = self._endpoint(method, href)['statuses']
+            statuses[status] = statuses.get(status, 0) + 1
+
+    def snapshot(self):
+        """Return the metrics of each endpoint, keyed by `'METHOD href'`."""
+        with self._lock:
+            return {
+                f'{method} {href}': {name: dict(value) if name == 'statuses' else value.snapshot()
+                                     for name, value in endpoint.items()}
+                for (method, href), endpoint in sorted(self._endpoints.items())
+            }
+
+    def export(self, exporter=None):
+        """Return `exporter(snapshot)`, by default in the Prometheus text
+        format."""
+        return (exporter or prometheus_text)(self.snapshot())
+
+    def reset(self):
+        with self._lock:
+            self._endpoints.clear()
+
+
+def _labels(**labels):
+    return ','.join('{}="{}"'.format(k, str(v).replace('\\', '\\\\').replace('"', '\\"'))
+                    for k, v in labels.items())
+
+
+def _number(value):
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def prometheus_text(snapshot, prefix='toshling'):
+    """Format a `Metrics.snapshot()` in the Prometheus text exposition format."""
+    endpoints = [(key.split(' ', 1), metrics) for key, metrics in snapshot.items()]
+    lines = [f'# TYPE {prefix}_responses_total counter']
+    for (method, href), metrics in endpoints:
+        for status, count in sorted(metrics['statuses'].items(), key=lambda s: str(s[0])):
+            lines.append(f'{prefix}_responses_total{{{_labels(method=method, endpoint=href, status=status)}}} {count}')
+
+    names = sorted({name for _, metrics in endpoints for name in metrics if name != 'statuses'})
+    for name in names:
+        lines.append(f'# TYPE {prefix}_{name} histogram')
+        for (method, href), metrics in endpoints:
+            histogram = metrics[name]
+            labels = _labels(method=method, endpoint=href)
+            for bound, count in histogram['buckets']:
+                lines.append(f'{prefix}_{name}_bucket{{{labels},le="{_number(bound)}"}} {count}')
+            lines.append(f'{prefix}_{name}_sum{{{labels}}} {_number(histogram["sum"])}')
+            lines.append(f'{prefix}_{name}_count{{{labels}}} {histogram["count"]}')
+    return '\n'.join(lines) + '\n'
@@ -1,2 +1,10 @@
-from . import return_types
-from . import argument_types
\ No newline at end of file
+from importlib import import_module
+
+
+def __getattr__(name):
+    # Modules of models are only imported (and their models built) when first
+    # used.
+    if name in ('argument_types', 'return_types', 'compact_types', 'compiled_argument_types',
+                'compiled_return_types'):
+        return import_module(f'.{name}', __name__)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
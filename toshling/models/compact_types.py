@@ -0,0 +1,1679 @@
+"""Compact variants of the models in `return_types`.
+
+Generated by `compile_models.py`, do not edit.
+"""
+from .._decode import MISSING, CompactObject, new, unknown
+from . import return_types as models
+
+_SOURCES_0 = frozenset(['modified', 'name', 'precision', 'symbol', 'type'])
+_SOURCES_1 = frozenset(['deleted', 'filename', 'id', 'path', 'status', 'type'])
+_SOURCES_2 = frozenset(['action', 'date', 'deleted', 'id', 'modified', 'text', 'type'])
+_SOURCES_3 = frozenset(['byday', 'bymonthday', 'bysetpos', 'count', 'end', 'entries', 'frequency', 'id', 'interval', 'iteration', 'start', 'template', 'template_end', 'template_start', 'type'])
+_SOURCES_4 = frozenset(['expenses', 'incomes'])
+_SOURCES_5 = frozenset(['byday', 'bymonthday', 'bysetpos'])
+_SOURCES_6 = frozenset(['id', 'logo', 'name', 'status'])
+_SOURCES_7 = frozenset(['code', 'fixed', 'main_rate', 'rate'])
+_SOURCES_8 = frozenset([])
+_SOURCES_9 = frozenset(['amount', 'end', 'start'])
+_SOURCES_10 = frozenset(['avg', 'balance', 'billing', 'connection', 'count', 'currency', 'daily_sum_median', 'deleted', 'extra', 'goal', 'id', 'initial_balance', 'limit', 'modified', 'name', 'name_override', 'order', 'parent', 'recalculated', 'review', 'settle', 'status', 'type'])
+_SOURCES_11 = frozenset(['deleted_accounts', 'deleted_categories', 'deleted_tags', 'description', 'id'])
+_SOURCES_12 = frozenset(['byday', 'bymonthday', 'bysetpos', 'end', 'frequency', 'interval', 'iteration', 'start'])
+_SOURCES_13 = frozenset(['!accounts', '!categories', '!tags', 'accounts', 'amount', 'categories', 'currency', 'deleted', 'delta', 'extra', 'from', 'history_amount_median', 'id', 'limit', 'limit_planned', 'modified', 'name', 'order', 'parent', 'percent', 'planned', 'problem', 'recalculated', 'recurrence', 'rollover', 'rollover_amount', 'rollover_amount_planned', 'rollover_override', 'status', 'tags', 'to', 'type'])
+_SOURCES_14 = frozenset(['budgets', 'entries', 'expense_entries', 'expense_tags', 'expense_tags_used_with_category', 'income_entries', 'income_tags', 'income_tags_used_with_category', 'tags', 'tags_used_with_category'])
+_SOURCES_15 = frozenset(['counts', 'deleted', 'extra', 'id', 'modified', 'name', 'name_override', 'type'])
+_SOURCES_16 = frozenset(['count', 'sum'])
+_SOURCES_17 = frozenset(['category', 'category_name', 'category_type', 'expenses', 'incomes', 'modified'])
+_SOURCES_18 = frozenset(['filename', 'id', 'path', 'status', 'type'])
+_SOURCES_19 = frozenset(['connection', 'id', 'memo', 'payee', 'pending'])
+_SOURCES_20 = frozenset(['id', 'latitude', 'longitude', 'venue_id'])
+_SOURCES_21 = frozenset(['at', 'number', 'period'])
+_SOURCES_22 = frozenset(['completed', 'id', 'type'])
+_SOURCES_23 = frozenset(['id'])
+_SOURCES_24 = frozenset(['children', 'parent'])
+_SOURCES_25 = frozenset(['account', 'amount', 'currency', 'id'])
+_SOURCES_26 = frozenset(['account', 'amount', 'category', 'completed', 'created', 'currency', 'date', 'deleted', 'desc', 'extra', 'id', 'images', 'import', 'location', 'modified', 'readonly', 'reminders', 'repeat', 'review', 'settle', 'split', 'tags', 'transaction'])
+_SOURCES_27 = frozenset(['day', 'expenses', 'incomes', 'modified'])
+_SOURCES_28 = frozenset(['filename', 'filesize', 'path', 'valid_until'])
+_SOURCES_29 = frozenset(['created', 'data', 'filters', 'formats', 'from', 'id', 'modified', 'resources', 'seen', 'status', 'to', 'type'])
+_SOURCES_30 = frozenset(['address', 'amount', 'chain_id', 'city', 'expenses', 'id', 'incomes', 'latitude', 'longitude', 'modified', 'name', 'used', 'venue_id', 'visits'])
+_SOURCES_31 = frozenset(['budgets', 'entries', 'unsorted_entries'])
+_SOURCES_32 = frozenset(['category', 'counts', 'deleted', 'extra', 'id', 'meta_tag', 'modified', 'name', 'name_override', 'type'])
+_SOURCES_33 = frozenset(['categories', 'count', 'sum'])
+_SOURCES_34 = frozenset(['expenses', 'incomes', 'modified', 'tag'])
+_SOURCES_35 = frozenset(['code', 'fixed', 'rate', 'reference_currency'])
+_SOURCES_36 = frozenset(['custom', 'custom_exchange_rate', 'main', 'update', 'update_accounts'])
+_SOURCES_37 = frozenset(['accounts', 'bank', 'budgets', 'export', 'images', 'import', 'locations', 'passcode', 'planning', 'pro_share', 'reminders', 'repeats'])
+_SOURCES_38 = frozenset(['date_migrated', 'finished', 'revert_until'])
+_SOURCES_39 = frozenset(['end', 'name', 'start'])
+_SOURCES_40 = frozenset(['id', 'next', 'provider', 'trial'])
+_SOURCES_41 = frozenset(['end', 'start'])
+_SOURCES_42 = frozenset(['address', 'city', 'country', 'name', 'post', 'state', 'vat'])
+_SOURCES_43 = frozenset(['level', 'partner', 'payment', 'remaining_credit', 'since', 'trial', 'until', 'vat'])
+_SOURCES_44 = frozenset(['country', 'currency', 'email', 'extra', 'first_name', 'flags', 'id', 'joined', 'language', 'last_name', 'limits', 'locale', 'migration', 'modified', 'notifications', 'otp_enabled', 'pro', 'social', 'start_day', 'steps', 'timezone', 'trial_eligible'])
+
+
+class CurrencyElement(CompactObject, models.CurrencyElement):
+    __slots__ = ('modified', 'name', 'precision', 'symbol', 'type', '_additional')
+    validated_type = models.CurrencyElement
+
+
+class Image(CompactObject, models.Image):
+    __slots__ = ('deleted', 'filename', 'id', 'path', 'status', 'type', '_additional')
+    validated_type = models.Image
+
+
+class Notification(CompactObject, models.Notification):
+    __slots__ = ('action', 'date', 'deleted', 'id', 'modified', 'text', 'type', '_additional')
+    validated_type = models.Notification
+
+
+class EntryRepeat(CompactObject, models.EntryRepeat):
+    __slots__ = ('byday', 'bymonthday', 'bysetpos', 'count', 'end', 'entries', 'frequency', 'id', 'interval', 'iteration', 'start', 'template', 'template_end', 'template_start', 'type', '_additional')
+    validated_type = models.EntryRepeat
+
+
+class AccountAvg(CompactObject, models.AccountAvg):
+    __slots__ = ('expenses', 'incomes', '_additional')
+    validated_type = models.AccountAvg
+
+
+class AccountBilling(CompactObject, models.AccountBilling):
+    __slots__ = ('byday', 'bymonthday', 'bysetpos', '_additional')
+    validated_type = models.AccountBilling
+
+
+class AccountConnection(CompactObject, models.AccountConnection):
+    __slots__ = ('id', 'logo', 'name', 'status', '_additional')
+    validated_type = models.AccountConnection
+
+
+class Currency(CompactObject, models.Currency):
+    __slots__ = ('code', 'fixed', 'main_rate', 'rate', '_additional')
+    validated_type = models.Currency
+
+
+class AccountMedian(CompactObject, models.AccountMedian):
+    __slots__ = ('expenses', 'incomes', '_additional')
+    validated_type = models.AccountMedian
+
+
+class Extra(CompactObject, models.Extra):
+    __slots__ = ('_additional',)
+    validated_type = models.Extra
+
+
+class AccountGoal(CompactObject, models.AccountGoal):
+    __slots__ = ('amount', 'end', 'start', '_additional')
+    validated_type = models.AccountGoal
+
+
+class AccountSettle(CompactObject, models.AccountSettle):
+    __slots__ = ('byday', 'bymonthday', 'bysetpos', '_additional')
+    validated_type = models.AccountSettle
+
+
+class Account(CompactObject, models.Account):
+    __slots__ = ('_avg', 'balance', '_billing', '_connection', 'count', '_currency', '_daily_sum_median', 'deleted', '_extra', '_goal', 'id', 'initial_balance', 'limit', 'modified', 'name', 'name_override', 'order', 'parent', 'recalculated', 'review', '_settle', 'status', 'type', '_additional')
+    validated_type = models.Account
+
+    @property
+    def avg(self):
+        value = self._avg
+        if type(value) is dict:
+            value = self._avg = decode_AccountAvg(value)
+        return value
+
+    @avg.setter
+    def avg(self, value):
+        self._avg = value
+
+    @property
+    def billing(self):
+        value = self._billing
+        if type(value) is dict:
+            value = self._billing = decode_AccountBilling(value)
+        return value
+
+    @billing.setter
+    def billing(self, value):
+        self._billing = value
+
+    @property
+    def connection(self):
+        value = self._connection
+        if type(value) is dict:
+            value = self._connection = decode_AccountConnection(value)
+        return value
+
+    @connection.setter
+    def connection(self, value):
+        self._connection = value
+
+    @property
+    def currency(self):
+        value = self._currency
+        if type(value) is dict:
+            value = self._currency = decode_Currency(value)
+        return value
+
+    @currency.setter
+    def currency(self, value):
+        self._currency = value
+
+    @property
+    def daily_sum_median(self):
+        value = self._daily_sum_median
+        if type(value) is dict:
+            value = self._daily_sum_median = decode_AccountMedian(value)
+        return value
+
+    @daily_sum_median.setter
+    def daily_sum_median(self, value):
+        self._daily_sum_median = value
+
+    @property
+    def extra(self):
+        value = self._extra
+        if type(value) is dict:
+            value = self._extra = decode_Extra(value)
+        return value
+
+    @extra.setter
+    def extra(self, value):
+        self._extra = value
+
+    @property
+    def goal(self):
+        value = self._goal
+        if type(value) is dict:
+            value = self._goal = decode_AccountGoal(value)
+        return value
+
+    @goal.setter
+    def goal(self, value):
+        self._goal = value
+
+    @property
+    def settle(self):
+        value = self._settle
+        if type(value) is dict:
+            value = self._settle = decode_AccountSettle(value)
+        return value
+
+    @settle.setter
+    def settle(self, value):
+        self._settle = value
+
+
+class BudgetProblem(CompactObject, models.BudgetProblem):
+    __slots__ = ('deleted_accounts', 'deleted_categories', 'deleted_tags', 'description', 'id', '_additional')
+    validated_type = models.BudgetProblem
+
+
+class Recurrence(CompactObject, models.Recurrence):
+    __slots__ = ('byday', 'bymonthday', 'bysetpos', 'end', 'frequency', 'interval', 'iteration', 'start', '_additional')
+    validated_type = models.Recurrence
+
+
+class Budget(CompactObject, models.Budget):
+    __slots__ = ('exclamation_mark_accounts', 'exclamation_mark_categories', 'exclamation_mark_tags', 'accounts', 'amount', 'categories', '_currency', 'deleted', 'delta', '_extra', 'from_', 'history_amount_median', 'id', 'limit', 'limit_planned', 'modified', 'name', 'order', 'parent', 'percent', 'planned', '_problem', 'recalculated', '_recurrence', 'rollover', 'rollover_amount', 'rollover_amount_planned', 'rollover_override', 'status', 'tags', 'to', 'type', '_additional')
+    validated_type = models.Budget
+
+    @property
+    def currency(self):
+        value = self._currency
+        if type(value) is dict:
+            value = self._currency = decode_Currency(value)
+        return value
+
+    @currency.setter
+    def currency(self, value):
+        self._currency = value
+
+    @property
+    def extra(self):
+        value = self._extra
+        if type(value) is dict:
+            value = self._extra = decode_Extra(value)
+        return value
+
+    @extra.setter
+    def extra(self, value):
+        self._extra = value
+
+    @property
+    def problem(self):
+        value = self._problem
+        if type(value) is dict:
+            value = self._problem = decode_BudgetProblem(value)
+        return value
+
+    @problem.setter
+    def problem(self, value):
+        self._problem = value
+
+    @property
+    def recurrence(self):
+        value = self._recurrence
+        if type(value) is dict:
+            value = self._recurrence = decode_Recurrence(value)
+        return value
+
+    @recurrence.setter
+    def recurrence(self, value):
+        self._recurrence = value
+
+
+class CategoryCounts(CompactObject, models.CategoryCounts):
+    __slots__ = ('budgets', 'entries', 'expense_entries', 'expense_tags', 'expense_tags_used_with_category', 'income_entries', 'income_tags', 'income_tags_used_with_category', 'tags', 'tags_used_with_category', '_additional')
+    validated_type = models.CategoryCounts
+
+
+class Category(CompactObject, models.Category):
+    __slots__ = ('_counts', 'deleted', '_extra', 'id', 'modified', 'name', 'name_override', 'type', '_additional')
+    validated_type = models.Category
+
+    @property
+    def counts(self):
+        value = self._counts
+        if type(value) is dict:
+            value = self._counts = decode_CategoryCounts(value)
+        return value
+
+    @counts.setter
+    def counts(self, value):
+        self._counts = value
+
+    @property
+    def extra(self):
+        value = self._extra
+        if type(value) is dict:
+            value = self._extra = decode_Extra(value)
+        return value
+
+    @extra.setter
+    def extra(self, value):
+        self._extra = value
+
+
+class CategorySumExpenses(CompactObject, models.CategorySumExpenses):
+    __slots__ = ('count', 'sum', '_additional')
+    validated_type = models.CategorySumExpenses
+
+
+class CategorySumIncomes(CompactObject, models.CategorySumIncomes):
+    __slots__ = ('count', 'sum', '_additional')
+    validated_type = models.CategorySumIncomes
+
+
+class CategorySum(CompactObject, models.CategorySum):
+    __slots__ = ('category', 'category_name', 'category_type', '_expenses', '_incomes', 'modified', '_additional')
+    validated_type = models.CategorySum
+
+    @property
+    def expenses(self):
+        value = self._expenses
+        if type(value) is dict:
+            value = self._expenses = decode_CategorySumExpenses(value)
+        return value
+
+    @expenses.setter
+    def expenses(self, value):
+        self._expenses = value
+
+    @property
+    def incomes(self):
+        value = self._incomes
+        if type(value) is dict:
+            value = self._incomes = decode_CategorySumIncomes(value)
+        return value
+
+    @incomes.setter
+    def incomes(self, value):
+        self._incomes = value
+
+
+class EntryImage(CompactObject, models.EntryImage):
+    __slots__ = ('filename', 'id', 'path', 'status', 'type', '_additional')
+    validated_type = models.EntryImage
+
+
+class EntryImport(CompactObject, models.EntryImport):
+    __slots__ = ('connection', 'id', 'memo', 'payee', 'pending', '_additional')
+    validated_type = models.EntryImport
+
+
+class EntryLocation(CompactObject, models.EntryLocation):
+    __slots__ = ('id', 'latitude', 'longitude', 'venue_id', '_additional')
+    validated_type = models.EntryLocation
+
+
+class Reminder(CompactObject, models.Reminder):
+    __slots__ = ('at', 'number', 'period', '_additional')
+    validated_type = models.Reminder
+
+
+class EntryReview(CompactObject, models.EntryReview):
+    __slots__ = ('completed', 'id', 'type', '_additional')
+    validated_type = models.EntryReview
+
+
+class EntrySettle(CompactObject, models.EntrySettle):
+    __slots__ = ('id', '_additional')
+    validated_type = models.EntrySettle
+
+
+class EntrySplit(CompactObject, models.EntrySplit):
+    __slots__ = ('children', 'parent', '_additional')
+    validated_type = models.EntrySplit
+
+
+class EntryTransaction(CompactObject, models.EntryTransaction):
+    __slots__ = ('account', 'amount', '_currency', 'id', '_additional')
+    validated_type = models.EntryTransaction
+
+    @property
+    def currency(self):
+        value = self._currency
+        if type(value) is dict:
+            value = self._currency = decode_Currency(value)
+        return value
+
+    @currency.setter
+    def currency(self, value):
+        self._currency = value
+
+
+class Entry(CompactObject, models.Entry):
+    __slots__ = ('account', 'amount', 'category', 'completed', 'created', '_currency', 'date', 'deleted', 'desc', '_extra', 'id', '_images', '_import_', '_location', 'modified', 'readonly', '_reminders', '_repeat', '_review', '_settle', '_split', 'tags', '_transaction', '_additional')
+    validated_type = models.Entry
+
+    @property
+    def currency(self):
+        value = self._currency
+        if type(value) is dict:
+            value = self._currency = decode_Currency(value)
+        return value
+
+    @currency.setter
+    def currency(self, value):
+        self._currency = value
+
+    @property
+    def extra(self):
+        value = self._extra
+        if type(value) is dict:
+            value = self._extra = decode_Extra(value)
+        return value
+
+    @extra.setter
+    def extra(self, value):
+        self._extra = value
+
+    @property
+    def images(self):
+        value = self._images
+        if type(value) is list and any(type(item) is dict for item in value):
+            value = self._images = [decode_EntryImage(item) if type(item) is dict else item for item in value]
+        return value
+
+    @images.setter
+    def images(self, value):
+        self._images = value
+
+    @property
+    def import_(self):
+        value = self._import_
+        if type(value) is dict:
+            value = self._import_ = decode_EntryImport(value)
+        return value
+
+    @import_.setter
+    def import_(self, value):
+        self._import_ = value
+
+    @property
+    def location(self):
+        value = self._location
+        if type(value) is dict:
+            value = self._location = decode_EntryLocation(value)
+        return value
+
+    @location.setter
+    def location(self, value):
+        self._location = value
+
+    @property
+    def reminders(self):
+        value = self._reminders
+        if type(value) is list and any(type(item) is dict for item in value):
+            value = self._reminders = [decode_Reminder(item) if type(item) is dict else item for item in value]
+        return value
+
+    @reminders.setter
+    def reminders(self, value):
+        self._reminders = value
+
+    @property
+    def repeat(self):
+        value = self._repeat
+        if type(value) is dict:
+            value = self._repeat = decode_EntryRepeat(value)
+        return value
+
+    @repeat.setter
+    def repeat(self, value):
+        self._repeat = value
+
+    @property
+    def review(self):
+        value = self._review
+        if type(value) is dict:
+            value = self._review = decode_EntryReview(value)
+        return value
+
+    @review.setter
+    def review(self, value):
+        self._review = value
+
+    @property
+    def settle(self):
+        value = self._settle
+        if type(value) is dict:
+            value = self._settle = decode_EntrySettle(value)
+        return value
+
+    @settle.setter
+    def settle(self, value):
+        self._settle = value
+
+    @property
+    def split(self):
+        value = self._split
+        if type(value) is dict:
+            value = self._split = decode_EntrySplit(value)
+        return value
+
+    @split.setter
+    def split(self, value):
+        self._split = value
+
+    @property
+    def transaction(self):
+        value = self._transaction
+        if type(value) is dict:
+            value = self._transaction = decode_EntryTransaction(value)
+        return value
+
+    @transaction.setter
+    def transaction(self, value):
+        self._transaction = value
+
+
+class DayExpenses(CompactObject, models.DayExpenses):
+    __slots__ = ('count', 'sum', '_additional')
+    validated_type = models.DayExpenses
+
+
+class DayIncomes(CompactObject, models.DayIncomes):
+    __slots__ = ('count', 'sum', '_additional')
+    validated_type = models.DayIncomes
+
+
+class Day(CompactObject, models.Day):
+    __slots__ = ('day', '_expenses', '_incomes', 'modified', '_additional')
+    validated_type = models.Day
+
+    @property
+    def expenses(self):
+        value = self._expenses
+        if type(value) is dict:
+            value = self._expenses = decode_DayExpenses(value)
+        return value
+
+    @expenses.setter
+    def expenses(self, value):
+        self._expenses = value
+
+    @property
+    def incomes(self):
+        value = self._incomes
+        if type(value) is dict:
+            value = self._incomes = decode_DayIncomes(value)
+        return value
+
+    @incomes.setter
+    def incomes(self, value):
+        self._incomes = value
+
+
+class ExportData(CompactObject, models.ExportData):
+    __slots__ = ('filename', 'filesize', 'path', 'valid_until', '_additional')
+    validated_type = models.ExportData
+
+
+class Export(CompactObject, models.Export):
+    __slots__ = ('_additional',)
+    validated_type = models.Export
+
+
+class Export_1(CompactObject, models.Export_1):
+    __slots__ = ('created', '_data', '_filters', '_formats', 'from_', 'id', 'modified', '_resources', 'seen', 'status', 'to', 'type', '_additional')
+    validated_type = models.Export_1
+
+    @property
+    def data(self):
+        value = self._data
+        if type(value) is dict:
+            value = self._data = decode_ExportData(value)
+        return value
+
+    @data.setter
+    def data(self, value):
+        self._data = value
+
+    @property
+    def filters(self):
+        value = self._filters
+        if type(value) is dict:
+            value = self._filters = decode_Export(value)
+        return value
+
+    @filters.setter
+    def filters(self, value):
+        self._filters = value
+
+    @property
+    def formats(self):
+        value = self._formats
+        if type(value) is dict:
+            value = self._formats = decode_Export(value)
+        return value
+
+    @formats.setter
+    def formats(self, value):
+        self._formats = value
+
+    @property
+    def resources(self):
+        value = self._resources
+        if type(value) is dict:
+            value = self._resources = decode_Export(value)
+        return value
+
+    @resources.setter
+    def resources(self, value):
+        self._resources = value
+
+
+class Expenses(CompactObject, models.Expenses):
+    __slots__ = ('count', 'sum', '_additional')
+    validated_type = models.Expenses
+
+
+class Incomes(CompactObject, models.Incomes):
+    __slots__ = ('count', 'sum', '_additional')
+    validated_type = models.Incomes
+
+
+class Location(CompactObject, models.Location):
+    __slots__ = ('address', 'amount', 'chain_id', 'city', '_expenses', 'id', '_incomes', 'latitude', 'longitude', 'modified', 'name', 'used', 'venue_id', 'visits', '_additional')
+    validated_type = models.Location
+
+    @property
+    def expenses(self):
+        value = self._expenses
+        if type(value) is dict:
+            value = self._expenses = decode_Expenses(value)
+        return value
+
+    @expenses.setter
+    def expenses(self, value):
+        self._expenses = value
+
+    @property
+    def incomes(self):
+        value = self._incomes
+        if type(value) is dict:
+            value = self._incomes = decode_Incomes(value)
+        return value
+
+    @incomes.setter
+    def incomes(self, value):
+        self._incomes = value
+
+
+class TagCounts(CompactObject, models.TagCounts):
+    __slots__ = ('budgets', 'entries', 'unsorted_entries', '_additional')
+    validated_type = models.TagCounts
+
+
+class Tag(CompactObject, models.Tag):
+    __slots__ = ('category', '_counts', 'deleted', '_extra', 'id', 'meta_tag', 'modified', 'name', 'name_override', 'type', '_additional')
+    validated_type = models.Tag
+
+    @property
+    def counts(self):
+        value = self._counts
+        if type(value) is dict:
+            value = self._counts = decode_TagCounts(value)
+        return value
+
+    @counts.setter
+    def counts(self, value):
+        self._counts = value
+
+    @property
+    def extra(self):
+        value = self._extra
+        if type(value) is dict:
+            value = self._extra = decode_Extra(value)
+        return value
+
+    @extra.setter
+    def extra(self, value):
+        self._extra = value
+
+
+class TagSumExpenses(CompactObject, models.TagSumExpenses):
+    __slots__ = ('categories', 'count', 'sum', '_additional')
+    validated_type = models.TagSumExpenses
+
+
+class TagSumIncomes(CompactObject, models.TagSumIncomes):
+    __slots__ = ('categories', 'count', 'sum', '_additional')
+    validated_type = models.TagSumIncomes
+
+
+class TagSum(CompactObject, models.TagSum):
+    __slots__ = ('_expenses', '_incomes', 'modified', 'tag', '_additional')
+    validated_type = models.TagSum
+
+    @property
+    def expenses(self):
+        value = self._expenses
+        if type(value) is dict:
+            value = self._expenses = decode_TagSumExpenses(value)
+        return value
+
+    @expenses.setter
+    def expenses(self, value):
+        self._expenses = value
+
+    @property
+    def incomes(self):
+        value = self._incomes
+        if type(value) is dict:
+            value = self._incomes = decode_TagSumIncomes(value)
+        return value
+
+    @incomes.setter
+    def incomes(self, value):
+        self._incomes = value
+
+
+class CustomCurrency(CompactObject, models.CustomCurrency):
+    __slots__ = ('code', 'fixed', 'rate', 'reference_currency', '_additional')
+    validated_type = models.CustomCurrency
+
+
+class UserCurrency(CompactObject, models.UserCurrency):
+    __slots__ = ('_custom', 'custom_exchange_rate', 'main', 'update', 'update_accounts', '_additional')
+    validated_type = models.UserCurrency
+
+    @property
+    def custom(self):
+        value = self._custom
+        if type(value) is dict:
+            value = self._custom = decode_CustomCurrency(value)
+        return value
+
+    @custom.setter
+    def custom(self, value):
+        self._custom = value
+
+
+class UserLimits(CompactObject, models.UserLimits):
+    __slots__ = ('accounts', 'bank', 'budgets', 'export', 'images', 'import_', 'locations', 'passcode', 'planning', 'pro_share', 'reminders', 'repeats', '_additional')
+    validated_type = models.UserLimits
+
+
+class UserMigration(CompactObject, models.UserMigration):
+    __slots__ = ('date_migrated', 'finished', 'revert_until', '_additional')
+    validated_type = models.UserMigration
+
+
+class UserPartner(CompactObject, models.UserPartner):
+    __slots__ = ('end', 'name', 'start', '_additional')
+    validated_type = models.UserPartner
+
+
+class UserProPayment(CompactObject, models.UserProPayment):
+    __slots__ = ('id', 'next', 'provider', 'trial', '_additional')
+    validated_type = models.UserProPayment
+
+
+class UserProTrial(CompactObject, models.UserProTrial):
+    __slots__ = ('end', 'start', '_additional')
+    validated_type = models.UserProTrial
+
+
+class UserProVAT(CompactObject, models.UserProVAT):
+    __slots__ = ('address', 'city', 'country', 'name', 'post', 'state', 'vat', '_additional')
+    validated_type = models.UserProVAT
+
+
+class UserPro(CompactObject, models.UserPro):
+    __slots__ = ('level', '_partner', '_payment', 'remaining_credit', 'since', '_trial', 'until', '_vat', '_additional')
+    validated_type = models.UserPro
+
+    @property
+    def partner(self):
+        value = self._partner
+        if type(value) is list and any(type(item) is dict for item in value):
+            value = self._partner = [decode_UserPartner(item) if type(item) is dict else item for item in value]
+        return value
+
+    @partner.setter
+    def partner(self, value):
+        self._partner = value
+
+    @property
+    def payment(self):
+        value = self._payment
+        if type(value) is dict:
+            value = self._payment = decode_UserProPayment(value)
+        return value
+
+    @payment.setter
+    def payment(self, value):
+        self._payment = value
+
+    @property
+    def trial(self):
+        value = self._trial
+        if type(value) is dict:
+            value = self._trial = decode_UserProTrial(value)
+        return value
+
+    @trial.setter
+    def trial(self, value):
+        self._trial = value
+
+    @property
+    def vat(self):
+        value = self._vat
+        if type(value) is dict:
+            value = self._vat = decode_UserProVAT(value)
+        return value
+
+    @vat.setter
+    def vat(self, value):
+        self._vat = value
+
+
+class User(CompactObject, models.User):
+    __slots__ = ('country', '_currency', 'email', '_extra', 'first_name', 'flags', 'id', 'joined', 'language', 'last_name', '_limits', 'locale', '_migration', 'modified', 'notifications', 'otp_enabled', '_pro', 'social', 'start_day', 'steps', 'timezone', 'trial_eligible', '_additional')
+    validated_type = models.User
+
+    @property
+    def currency(self):
+        value = self._currency
+        if type(value) is dict:
+            value = self._currency = decode_UserCurrency(value)
+        return value
+
+    @currency.setter
+    def currency(self, value):
+        self._currency = value
+
+    @property
+    def extra(self):
+        value = self._extra
+        if type(value) is dict:
+            value = self._extra = decode_Extra(value)
+        return value
+
+    @extra.setter
+    def extra(self, value):
+        self._extra = value
+
+    @property
+    def limits(self):
+        value = self._limits
+        if type(value) is dict:
+            value = self._limits = decode_UserLimits(value)
+        return value
+
+    @limits.setter
+    def limits(self, value):
+        self._limits = value
+
+    @property
+    def migration(self):
+        value = self._migration
+        if type(value) is dict:
+            value = self._migration = decode_UserMigration(value)
+        return value
+
+    @migration.setter
+    def migration(self, value):
+        self._migration = value
+
+    @property
+    def pro(self):
+        value = self._pro
+        if type(value) is dict:
+            value = self._pro = decode_UserPro(value)
+        return value
+
+    @pro.setter
+    def pro(self, value):
+        self._pro = value
+
+
+def decode_CurrencyElement(value):
+    model = new(CurrencyElement)
+    get = value.get
+    model.modified = get('modified', MISSING)
+    model.name = get('name', MISSING)
+    model.precision = get('precision', MISSING)
+    model.symbol = get('symbol', MISSING)
+    model.type = get('type', MISSING)
+    model._additional = None if _SOURCES_0.issuperset(value) else unknown(value, _SOURCES_0)
+    return model
+
+
+def decode_Image(value):
+    model = new(Image)
+    get = value.get
+    model.deleted = get('deleted', MISSING)
+    model.filename = get('filename', MISSING)
+    model.id = get('id', MISSING)
+    model.path = get('path', MISSING)
+    model.status = get('status', MISSING)
+    model.type = get('type', MISSING)
+    model._additional = None if _SOURCES_1.issuperset(value) else unknown(value, _SOURCES_1)
+    return model
+
+
+def decode_Notification(value):
+    model = new(Notification)
+    get = value.get
+    model.action = get('action', MISSING)
+    model.date = get('date', MISSING)
+    model.deleted = get('deleted', MISSING)
+    model.id = get('id', MISSING)
+    model.modified = get('modified', MISSING)
+    model.text = get('text', MISSING)
+    model.type = get('type', MISSING)
+    model._additional = None if _SOURCES_2.issuperset(value) else unknown(value, _SOURCES_2)
+    return model
+
+
+def decode_EntryRepeat(value):
+    model = new(EntryRepeat)
+    get = value.get
+    model.byday = get('byday', MISSING)
+    model.bymonthday = get('bymonthday', MISSING)
+    model.bysetpos = get('bysetpos', MISSING)
+    model.count = get('count', MISSING)
+    model.end = get('end', MISSING)
+    model.entries = get('entries', MISSING)
+    model.frequency = get('frequency', MISSING)
+    model.id = get('id', MISSING)
+    model.interval = get('interval', MISSING)
+    model.iteration = get('iteration', MISSING)
+    model.start = get('start', MISSING)
+    model.template = get('template', MISSING)
+    model.template_end = get('template_end', MISSING)
+    model.template_start = get('template_start', MISSING)
+    model.type = get('type', MISSING)
+    model._additional = None if _SOURCES_3.issuperset(value) else unknown(value, _SOURCES_3)
+    return model
+
+
+def decode_AccountAvg(value):
+    model = new(AccountAvg)
+    get = value.get
+    value_ = get('expenses', 0.0)
+    model.expenses = float(value_) if type(value_) is int else value_
+    value_ = get('incomes', 0.0)
+    model.incomes = float(value_) if type(value_) is int else value_
+    model._additional = None if _SOURCES_4.issuperset(value) else unknown(value, _SOURCES_4)
+    return model
+
+
+def decode_AccountBilling(value):
+    model = new(AccountBilling)
+    get = value.get
+    model.byday = get('byday', MISSING)
+    model.bymonthday = get('bymonthday', MISSING)
+    model.bysetpos = get('bysetpos', MISSING)
+    model._additional = None if _SOURCES_5.issuperset(value) else unknown(value, _SOURCES_5)
+    return model
+
+
+def decode_AccountConnection(value):
+    model = new(AccountConnection)
+    get = value.get
+    model.id = get('id', MISSING)
+    model.logo = get('logo', MISSING)
+    model.name = get('name', MISSING)
+    model.status = get('status', MISSING)
+    model._additional = None if _SOURCES_6.issuperset(value) else unknown(value, _SOURCES_6)
+    return model
+
+
+def decode_Currency(value):
+    model = new(Currency)
+    get = value.get
+    model.code = get('code', MISSING)
+    model.fixed = get('fixed', 'false')
+    value_ = get('main_rate', MISSING)
+    model.main_rate = float(value_) if type(value_) is int else value_
+    value_ = get('rate', MISSING)
+    model.rate = float(value_) if type(value_) is int else value_
+    model._additional = None if _SOURCES_7.issuperset(value) else unknown(value, _SOURCES_7)
+    return model
+
+
+def decode_AccountMedian(value):
+    model = new(AccountMedian)
+    get = value.get
+    value_ = get('expenses', 0.0)
+    model.expenses = float(value_) if type(value_) is int else value_
+    value_ = get('incomes', 0.0)
+    model.incomes = float(value_) if type(value_) is int else value_
+    model._additional = None if _SOURCES_4.issuperset(value) else unknown(value, _SOURCES_4)
+    return model
+
+
+def decode_Extra(value):
+    model = new(Extra)
+    model._additional = None if _SOURCES_8.issuperset(value) else unknown(value, _SOURCES_8)
+    return model
+
+
+def decode_AccountGoal(value):
+    model = new(AccountGoal)
+    get = value.get
+    value_ = get('amount', MISSING)
+    model.amount = float(value_) if type(value_) is int else value_
+    model.end = get('end', MISSING)
+    model.start = get('start', MISSING)
+    model._additional = None if _SOURCES_9.issuperset(value) else unknown(value, _SOURCES_9)
+    return model
+
+
+def decode_AccountSettle(value):
+    model = new(AccountSettle)
+    get = value.get
+    model.byday = get('byday', MISSING)
+    model.bymonthday = get('bymonthday', MISSING)
+    model.bysetpos = get('bysetpos', MISSING)
+    model._additional = None if _SOURCES_5.issuperset(value) else unknown(value, _SOURCES_5)
+    return model
+
+
+def decode_Account(value):
+    model = new(Account)
+    get = value.get
+    model._avg = get('avg', MISSING)
+    value_ = get('balance', MISSING)
+    model.balance = float(value_) if type(value_) is int else value_
+    model._billing = get('billing', MISSING)
+    model._connection = get('connection', MISSING)
+    model.count = get('count', MISSING)
+    model._currency = get('currency', MISSING)
+    model._daily_sum_median = get('daily_sum_median', MISSING)
+    model.deleted = get('deleted', MISSING)
+    model._extra = get('extra', MISSING)
+    model._goal = get('goal', MISSING)
+    model.id = get('id', MISSING)
+    value_ = get('initial_balance', 0.0)
+    model.initial_balance = float(value_) if type(value_) is int else value_
+    value_ = get('limit', None)
+    model.limit = float(value_) if type(value_) is int else value_
+    model.modified = get('modified', MISSING)
+    model.name = get('name', MISSING)
+    model.name_override = get('name_override', False)
+    model.order = get('order', MISSING)
+    model.parent = get('parent', MISSING)
+    model.recalculated = get('recalculated', MISSING)
+    model.review = get('review', MISSING)
+    model._settle = get('settle', MISSING)
+    model.status = get('status', MISSING)
+    model.type = get('type', MISSING)
+    model._additional = None if _SOURCES_10.issuperset(value) else unknown(value, _SOURCES_10)
+    return model
+
+
+def decode_BudgetProblem(value):
+    model = new(BudgetProblem)
+    get = value.get
+    model.deleted_accounts = get('deleted_accounts', MISSING)
+    model.deleted_categories = get('deleted_categories', MISSING)
+    model.deleted_tags = get('deleted_tags', MISSING)
+    model.description = get('description', MISSING)
+    model.id = get('id', MISSING)
+    model._additional = None if _SOURCES_11.issuperset(value) else unknown(value, _SOURCES_11)
+    return model
+
+
+def decode_Recurrence(value):
+    model = new(Recurrence)
+    get = value.get
+    model.byday = get('byday', MISSING)
+    model.bymonthday = get('bymonthday', MISSING)
+    model.bysetpos = get('bysetpos', MISSING)
+    model.end = get('end', MISSING)
+    model.frequency = get('frequency', MISSING)
+    model.interval = get('interval', MISSING)
+    model.iteration = get('iteration', MISSING)
+    model.start = get('start', MISSING)
+    model._additional = None if _SOURCES_12.issuperset(value) else unknown(value, _SOURCES_12)
+    return model
+
+
+def decode_Budget(value):
+    model = new(Budget)
+    get = value.get
+    model.exclamation_mark_accounts = get('!accounts', MISSING)
+    model.exclamation_mark_categories = get('!categories', MISSING)
+    model.exclamation_mark_tags = get('!tags', MISSING)
+    model.accounts = get('accounts', MISSING)
+    value_ = get('amount', MISSING)
+    model.amount = float(value_) if type(value_) is int else value_
+    model.categories = get('categories', MISSING)
+    model._currency = get('currency', MISSING)
+    model.deleted = get('deleted', MISSING)
+    value_ = get('delta', MISSING)
+    model.delta = float(value_) if type(value_) is int else value_
+    model._extra = get('extra', MISSING)
+    model.from_ = get('from', MISSING)
+    value_ = get('history_amount_median', MISSING)
+    model.history_amount_median = float(value_) if type(value_) is int else value_
+    model.id = get('id', MISSING)
+    value_ = get('limit', MISSING)
+    model.limit = float(value_) if type(value_) is int else value_
+    value_ = get('limit_planned', MISSING)
+    model.limit_planned = float(value_) if type(value_) is int else value_
+    model.modified = get('modified', MISSING)
+    model.name = get('name', MISSING)
+    model.order = get('order', MISSING)
+    model.parent = get('parent', MISSING)
+    value_ = get('percent', MISSING)
+    model.percent = float(value_) if type(value_) is int else value_
+    value_ = get('planned', MISSING)
+    model.planned = float(value_) if type(value_) is int else value_
+    model._problem = get('problem', MISSING)
+    model.recalculated = get('recalculated', MISSING)
+    model._recurrence = get('recurrence', MISSING)
+    model.rollover = get('rollover', False)
+    value_ = get('rollover_amount', 0.0)
+    model.rollover_amount = float(value_) if type(value_) is int else value_
+    value_ = get('rollover_amount_planned', 0.0)
+    model.rollover_amount_planned = float(value_) if type(value_) is int else value_
+    model.rollover_override = get('rollover_override', False)
+    model.status = get('status', MISSING)
+    model.tags = get('tags', MISSING)
+    model.to = get('to', MISSING)
+    model.type = get('type', MISSING)
+    model._additional = None if _SOURCES_13.issuperset(value) else unknown(value, _SOURCES_13)
+    return model
+
+
+def decode_CategoryCounts(value):
+    model = new(CategoryCounts)
+    get = value.get
+    model.budgets = get('budgets', MISSING)
+    model.entries = get('entries', MISSING)
+    model.expense_entries = get('expense_entries', MISSING)
+    model.expense_tags = get('expense_tags', MISSING)
+    model.expense_tags_used_with_category = get('expense_tags_used_with_category', MISSING)
+    model.income_entries = get('income_entries', MISSING)
+    model.income_tags = get('income_tags', MISSING)
+    model.income_tags_used_with_category = get('income_tags_used_with_category', MISSING)
+    model.tags = get('tags', MISSING)
+    model.tags_used_with_category = get('tags_used_with_category', MISSING)
+    model._additional = None if _SOURCES_14.issuperset(value) else unknown(value, _SOURCES_14)
+    return model
+
+
+def decode_Category(value):
+    model = new(Category)
+    get = value.get
+    model._counts = get('counts', MISSING)
+    model.deleted = get('deleted', MISSING)
+    model._extra = get('extra', MISSING)
+    model.id = get('id', MISSING)
+    model.modified = get('modified', MISSING)
+    model.name = get('name', MISSING)
+    model.name_override = get('name_override', False)
+    model.type = get('type', MISSING)
+    model._additional = None if _SOURCES_15.issuperset(value) else unknown(value, _SOURCES_15)
+    return model
+
+
+def decode_CategorySumExpenses(value):
+    model = new(CategorySumExpenses)
+    get = value.get
+    model.count = get('count', MISSING)
+    value_ = get('sum', MISSING)
+    model.sum = float(value_) if type(value_) is int else value_
+    model._additional = None if _SOURCES_16.issuperset(value) else unknown(value, _SOURCES_16)
+    return model
+
+
+def decode_CategorySumIncomes(value):
+    model = new(CategorySumIncomes)
+    get = value.get
+    model.count = get('count', MISSING)
+    value_ = get('sum', MISSING)
+    model.sum = float(value_) if type(value_) is int else value_
+    model._additional = None if _SOURCES_16.issuperset(value) else unknown(value, _SOURCES_16)
+    return model
+
+
+def decode_CategorySum(value):
+    model = new(CategorySum)
+    get = value.get
+    model.category = get('category', MISSING)
+    model.category_name = get('category_name', MISSING)
+    model.category_type = get('category_type', MISSING)
+    model._expenses = get('expenses', MISSING)
+    model._incomes = get('incomes', MISSING)
+    model.modified = get('modified', MISSING)
+    model._additional = None if _SOURCES_17.issuperset(value) else unknown(value, _SOURCES_17)
+    return model
+
+
+def decode_EntryImage(value):
+    model = new(EntryImage)
+    get = value.get
+    model.filename = get('filename', MISSING)
+    model.id = get('id', MISSING)
+    model.path = get('path', MISSING)
+    model.status = get('status', MISSING)
+    model.type = get('type', MISSING)
+    model._additional = None if _SOURCES_18.issuperset(value) else unknown(value, _SOURCES_18)
+    return model
+
+
+def decode_EntryImport(value):
+    model = new(EntryImport)
+    get = value.get
+    model.connection = get('connection', MISSING)
+    model.id = get('id', MISSING)
+    model.memo = get('memo', MISSING)
+    model.payee = get('payee', MISSING)
+    model.pending = get('pending', MISSING)
+    model._additional = None if _SOURCES_19.issuperset(value) else unknown(value, _SOURCES_19)
+    return model
+
+
+def decode_EntryLocation(value):
+    model = new(EntryLocation)
+    get = value.get
+    model.id = get('id', MISSING)
+    value_ = get('latitude', MISSING)
+    model.latitude = float(value_) if type(value_) is int else value_
+    value_ = get('longitude', MISSING)
+    model.longitude = float(value_) if type(value_) is int else value_
+    model.venue_id = get('venue_id', MISSING)
+    model._additional = None if _SOURCES_20.issuperset(value) else unknown(value, _SOURCES_20)
+    return model
+
+
+def decode_Reminder(value):
+    model = new(Reminder)
+    get = value.get
+    model.at = get('at', MISSING)
+    model.number = get('number', MISSING)
+    model.period = get('period', MISSING)
+    model._additional = None if _SOURCES_21.issuperset(value) else unknown(value, _SOURCES_21)
+    return model
+
+
+def decode_EntryReview(value):
+    model = new(EntryReview)
+    get = value.get
+    model.completed = get('completed', MISSING)
+    model.id = get('id', MISSING)
+    model.type = get('type', MISSING)
+    model._additional = None if _SOURCES_22.issuperset(value) else unknown(value, _SOURCES_22)
+    return model
+
+
+def decode_EntrySettle(value):
+    model = new(EntrySettle)
+    get = value.get
+    model.id = get('id', MISSING)
+    model._additional = None if _SOURCES_23.issuperset(value) else unknown(value, _SOURCES_23)
+    return model
+
+
+def decode_EntrySplit(value):
+    model = new(EntrySplit)
+    get = value.get
+    model.children = get('children', MISSING)
+    model.parent = get('parent', MISSING)
+    model._additional = None if _SOURCES_24.issuperset(value) else unknown(value, _SOURCES_24)
+    return model
+
+
+def decode_EntryTransaction(value):
+    model = new(EntryTransaction)
+    get = value.get
+    model.account = get('account', MISSING)
+    value_ = get('amount', MISSING)
+    model.amount = float(value_) if type(value_) is int else value_
+    model._currency = get('currency', MISSING)
+    model.id = get('id', MISSING)
+    model._additional = None if _SOURCES_25.issuperset(value) else unknown(value, _SOURCES_25)
+    return model
+
+
+def decode_Entry(value):
+    model = new(Entry)
+    get = value.get
+    model.account = get('account', MISSING)
+    value_ = get('amount', MISSING)
+    model.amount = float(value_) if type(value_) is int else value_
+    model.category = get('category', MISSING)
+    model.completed = get('completed', False)
+    model.created = get('created', MISSING)
+    model._currency = get('currency', MISSING)
+    model.date = get('date', MISSING)
+    model.deleted = get('deleted', MISSING)
+    model.desc = get('desc', MISSING)
+    model._extra = get('extra', MISSING)
+    model.id = get('id', MISSING)
+    model._images = get('images', MISSING)
+    model._import_ = get('import', MISSING)
+    model._location = get('location', MISSING)
+    model.modified = get('modified', MISSING)
+    model.readonly = get('readonly', MISSING)
+    model._reminders = get('reminders', MISSING)
+    model._repeat = get('repeat', MISSING)
+    model._review = get('review', MISSING)
+    model._settle = get('settle', MISSING)
+    model._split = get('split', MISSING)
+    model.tags = get('tags', MISSING)
+    model._transaction = get('transaction', MISSING)
+    model._additional = None if _SOURCES_26.issuperset(value) else unknown(value, _SOURCES_26)
+    return model
+
+
+def decode_DayExpenses(value):
+    model = new(DayExpenses)
+    get = value.get
+    model.count = get('count', MISSING)
+    value_ = get('sum', MISSING)
+    model.sum = float(value_) if type(value_) is int else value_
+    model._additional = None if _SOURCES_16.issuperset(value) else unknown(value, _SOURCES_16)
+    return model
+
+
+def decode_DayIncomes(value):
+    model = new(DayIncomes)
+    get = value.get
+    model.count = get('count', MISSING)
+    value_ = get('sum', MISSING)
+    model.sum = float(value_) if type(value_) is int else value_
+    model._additional = None if _SOURCES_16.issuperset(value) else unknown(value, _SOURCES_16)
+    return model
+
+
+def decode_Day(value):
+    model = new(Day)
+    get = value.get
+    model.day = get('day', MISSING)
+    model._expenses = get('expenses', MISSING)
+    model._incomes = get('incomes', MISSING)
+    model.modified = get('modified', MISSING)
+    model._additional = None if _SOURCES_27.issuperset(value) else unknown(value, _SOURCES_27)
+    return model
+
+
+def decode_ExportData(value):
+    model = new(ExportData)
+    get = value.get
+    model.filename = get('filename', MISSING)
+    value_ = get('filesize', MISSING)
+    model.filesize = float(value_) if type(value_) is int else value_
+    model.path = get('path', MISSING)
+    model.valid_until = get('valid_until', MISSING)
+    model._additional = None if _SOURCES_28.issuperset(value) else unknown(value, _SOURCES_28)
+    return model
+
+
+def decode_Export(value):
+    model = new(Export)
+    model._additional = None if _SOURCES_8.issuperset(value) else unknown(value, _SOURCES_8)
+    return model
+
+
+def decode_Export_1(value):
+    model = new(Export_1)
+    get = value.get
+    model.created = get('created', MISSING)
+    model._data = get('data', MISSING)
+    model._filters = get('filters', MISSING)
+    model._formats = get('formats', MISSING)
+    model.from_ = get('from', MISSING)
+    model.id = get('id', MISSING)
+    model.modified = get('modified', MISSING)
+    model._resources = get('resources', MISSING)
+    model.seen = get('seen', MISSING)
+    model.status = get('status', MISSING)
+    model.to = get('to', MISSING)
+    model.type = get('type', MISSING)
+    model._additional = None if _SOURCES_29.issuperset(value) else unknown(value, _SOURCES_29)
+    return model
+
+
+def decode_Expenses(value):
+    model = new(Expenses)
+    get = value.get
+    model.count = get('count', MISSING)
+    value_ = get('sum', MISSING)
+    model.sum = float(value_) if type(value_) is int else value_
+    model._additional = None if _SOURCES_16.issuperset(value) else unknown(value, _SOURCES_16)
+    return model
+
+
+def decode_Incomes(value):
+    model = new(Incomes)
+    get = value.get
+    model.count = get('count', MISSING)
+    value_ = get('sum', MISSING)
+    model.sum = float(value_) if type(value_) is int else value_
+    model._additional = None if _SOURCES_16.issuperset(value) else unknown(value, _SOURCES_16)
+    return model
+
+
+def decode_Location(value):
+    model = new(Location)
+    get = value.get
+    model.address = get('address', MISSING)
+    value_ = get('amount', MISSING)
+    model.amount = float(value_) if type(value_) is int else value_
+    model.chain_id = get('chain_id', MISSING)
+    model.city = get('city', MISSING)
+    model._expenses = get('expenses', MISSING)
+    model.id = get('id', MISSING)
+    model._incomes = get('incomes', MISSING)
+    value_ = get('latitude', MISSING)
+    model.latitude = float(value_) if type(value_) is int else value_
+    value_ = get('longitude', MISSING)
+    model.longitude = float(value_) if type(value_) is int else value_
+    model.modified = get('modified', MISSING)
+    model.name = get('name', MISSING)
+    model.used = get('used', MISSING)
+    model.venue_id = get('venue_id', MISSING)
+    model.visits = get('visits', MISSING)
+    model._additional = None if _SOURCES_30.issuperset(value) else unknown(value, _SOURCES_30)
+    return model
+
+
+def decode_TagCounts(value):
+    model = new(TagCounts)
+    get = value.get
+    model.budgets = get('budgets', MISSING)
+    model.entries = get('entries', MISSING)
+    model.unsorted_entries = get('unsorted_entries', MISSING)
+    model._additional = None if _SOURCES_31.issuperset(value) else unknown(value, _SOURCES_31)
+    return model
+
+
+def decode_Tag(value):
+    model = new(Tag)
+    get = value.get
+    model.category = get('category', MISSING)
+    model._counts = get('counts', MISSING)
+    model.deleted = get('deleted', MISSING)
+    model._extra = get('extra', MISSING)
+    model.id = get('id', MISSING)
+    model.meta_tag = get('meta_tag', MISSING)
+    model.modified = get('modified', MISSING)
+    model.name = get('name', MISSING)
+    model.name_override = get('name_override', False)
+    model.type = get('type', MISSING)
+    model._additional = None if _SOURCES_32.issuperset(value) else unknown(value, _SOURCES_32)
+    return model
+
+
+def decode_TagSumExpenses(value):
+    model = new(TagSumExpenses)
+    get = value.get
+    model.categories = get('categories', MISSING)
+    model.count = get('count', MISSING)
+    value_ = get('sum', MISSING)
+    model.sum = float(value_) if type(value_) is int else value_
+    model._additional = None if _SOURCES_33.issuperset(value) else unknown(value, _SOURCES_33)
+    return model
+
+
+def decode_TagSumIncomes(value):
+    model = new(TagSumIncomes)
+    get = value.get
+    model.categories = get('categories', MISSING)
+    model.count = get('count', MISSING)
+    value_ = get('sum', MISSING)
+    model.sum = float(value_) if type(value_) is int else value_
+    model._additional = None if _SOURCES_33.issuperset(value) else unknown(value, _SOURCES_33)
+    return model
+
+
+def decode_TagSum(value):
+    model = new(TagSum)
+    get = value.get
+    model._expenses = get('expenses', MISSING)
+    model._incomes = get('incomes', MISSING)
+    model.modified = get('modified', MISSING)
+    model.tag = get('tag', MISSING)
+    model._additional = None if _SOURCES_34.issuperset(value) else unknown(value, _SOURCES_34)
+    return model
+
+
+def decode_CustomCurrency(value):
+    model = new(CustomCurrency)
+    get = value.get
+    model.code = get('code', MISSING)
+    model.fixed = get('fixed', 'false')
+    value_ = get('rate', MISSING)
+    model.rate = float(value_) if type(value_) is int else value_
+    model.reference_currency = get('reference_currency', MISSING)
+    model._additional = None if _SOURCES_35.issuperset(value) else unknown(value, _SOURCES_35)
+    return model
+
+
+def decode_UserCurrency(value):
+    model = new(UserCurrency)
+    get = value.get
+    model._custom = get('custom', MISSING)
+    value_ = get('custom_exchange_rate', MISSING)
+    model.custom_exchange_rate = float(value_) if type(value_) is int else value_
+    model.main = get('main', MISSING)
+    model.update = get('update', MISSING)
+    model.update_accounts = get('update_accounts', MISSING)
+    model._additional = None if _SOURCES_36.issuperset(value) else unknown(value, _SOURCES_36)
+    return model
+
+
+def decode_UserLimits(value):
+    model = new(UserLimits)
+    get = value.get
+    model.accounts = get('accounts', MISSING)
+    model.bank = get('bank', MISSING)
+    model.budgets = get('budgets', MISSING)
+    model.export = get('export', MISSING)
+    model.images = get('images', MISSING)
+    model.import_ = get('import', MISSING)
+    model.locations = get('locations', MISSING)
+    model.passcode = get('passcode', MISSING)
+    model.planning = get('planning', MISSING)
+    model.pro_share = get('pro_share', MISSING)
+    model.reminders = get('reminders', MISSING)
+    model.repeats = get('repeats', MISSING)
+    model._additional = None if _SOURCES_37.issuperset(value) else unknown(value, _SOURCES_37)
+    return model
+
+
+def decode_UserMigration(value):
+    model = new(UserMigration)
+    get = value.get
+    model.date_migrated = get('date_migrated', MISSING)
+    model.finished = get('finished', MISSING)
+    model.revert_until = get('revert_until', MISSING)
+    model._additional = None if _SOURCES_38.issuperset(value) else unknown(value, _SOURCES_38)
+    return model
+
+
+def decode_UserPartner(value):
+    model = new(UserPartner)
+    get = value.get
+    model.end = get('end', MISSING)
+    model.name = get('name', MISSING)
+    model.start = get('start', MISSING)
+    model._additional = None if _SOURCES_39.issuperset(value) else unknown(value, _SOURCES_39)
+    return model
+
+
+def decode_UserProPayment(value):
+    model = new(UserProPayment)
+    get = value.get
+    model.id = get('id', MISSING)
+    model.next = get('next', MISSING)
+    model.provider = get('provider', MISSING)
+    model.trial = get('trial', 'false')
+    model._additional = None if _SOURCES_40.issuperset(value) else unknown(value, _SOURCES_40)
+    return model
+
+
+def decode_UserProTrial(value):
+    model = new(UserProTrial)
+    get = value.get
+    model.end = get('end', MISSING)
+    model.start = get('start', MISSING)
+    model._additional = None if _SOURCES_41.issuperset(value) else unknown(value, _SOURCES_41)
+    return model
+
+
+def decode_UserProVAT(value):
+    model = new(UserProVAT)
+    get = value.get
+    model.address = get('address', MISSING)
+    model.city = get('city', MISSING)
+    model.country = get('country', MISSING)
+    model.name = get('name', MISSING)
+    model.post = get('post', MISSING)
+    model.state = get('state', MISSING)
+    model.vat = get('vat', MISSING)
+    model._additional = None if _SOURCES_42.issuperset(value) else unknown(value, _SOURCES_42)
+    return model
+
+
+def decode_UserPro(value):
+    model = new(UserPro)
+    get = value.get
+    model.level = get('level', MISSING)
+    model._partner = get('partner', MISSING)
+    model._payment = get('payment', MISSING)
+    value_ = get('remaining_credit', MISSING)
+    model.remaining_credit = float(value_) if type(value_) is int else value_
+    model.since = get('since', MISSING)
+    model._trial = get('trial', MISSING)
+    model.until = get('until', MISSING)
+    model._vat = get('vat', MISSING)
+    model._additional = None if _SOURCES_43.issuperset(value) else unknown(value, _SOURCES_43)
+    return model
+
+
+def decode_User(value):
+    model = new(User)
+    get = value.get
+    model.country = get('country', MISSING)
+    model._currency = get('currency', MISSING)
+    model.email = get('email', MISSING)
+    model._extra = get('extra', MISSING)
+    model.first_name = get('first_name', MISSING)
+    model.flags = get('flags', MISSING)
+    model.id = get('id', MISSING)
+    model.joined = get('joined', MISSING)
+    model.language = get('language', MISSING)
+    model.last_name = get('last_name', MISSING)
+    model._limits = get('limits', MISSING)
+    model.locale = get('locale', MISSING)
+    model._migration = get('migration', MISSING)
+    model.modified = get('modified', MISSING)
+    model.notifications = get('notifications', MISSING)
+    model.otp_enabled = get('otp_enabled', MISSING)
+    model._pro = get('pro', MISSING)
+    model.social = get('social', MISSING)
+    model.start_day = get('start_day', 1)
+    model.steps = get('steps', MISSING)
+    model.timezone = get('timezone', MISSING)
+    model.trial_eligible = get('trial_eligible', False)
+    model._additional = None if _SOURCES_44.issuperset(value) else unknown(value, _SOURCES_44)
+    return model
+
+
+DECODERS = {
+    models.CurrencyElement: decode_CurrencyElement,
+    models.Image: decode_Image,
+    models.Notification: decode_Notification,
+    models.EntryRepeat: decode_EntryRepeat,
+    models.AccountAvg: decode_AccountAvg,
+    models.AccountBilling: decode_AccountBilling,
+    models.AccountConnection: decode_AccountConnection,
+    models.Currency: decode_Currency,
+    models.AccountMedian: decode_AccountMedian,
+    models.Extra: decode_Extra,
+    models.AccountGoal: decode_AccountGoal,
+    models.AccountSettle: decode_AccountSettle,
+    models.Account: decode_Account,
+    models.BudgetProblem: decode_BudgetProblem,
+    models.Recurrence: decode_Recurrence,
+    models.Budget: decode_Budget,
+    models.CategoryCounts: decode_CategoryCounts,
+    models.Category: decode_Category,
+    models.CategorySumExpenses: decode_CategorySumExpenses,
+    models.CategorySumIncomes: decode_CategorySumIncomes,
+    models.CategorySum: decode_CategorySum,
+    models.EntryImage: decode_EntryImage,
+    models.EntryImport: decode_EntryImport,
+    models.EntryLocation: decode_EntryLocation,
+    models.Reminder: decode_Reminder,
+    models.EntryReview: decode_EntryReview,
+    models.EntrySettle: decode_EntrySettle,
+    models.EntrySplit: decode_EntrySplit,
+    models.EntryTransaction: decode_EntryTransaction,
+    models.Entry: decode_Entry,
+    models.DayExpenses: decode_DayExpenses,
+    models.DayIncomes: decode_DayIncomes,
+    models.Day: decode_Day,
+    models.ExportData: decode_ExportData,
+    models.Export: decode_Export,
+    models.Export_1: decode_Export_1,
+    models.Expenses: decode_Expenses,
+    models.Incomes: decode_Incomes,
+    models.Location: decode_Location,
+    models.TagCounts: decode_TagCounts,
+    models.Tag: decode_Tag,
+    models.TagSumExpenses: decode_TagSumExpenses,
+    models.TagSumIncomes: decode_TagSumIncomes,
+    models.TagSum: decode_TagSum,
+    models.CustomCurrency: decode_CustomCurrency,
+    models.UserCurrency: decode_UserCurrency,
+    models.UserLimits: decode_UserLimits,
+    models.UserMigration: decode_UserMigration,
+    models.UserPartner: decode_UserPartner,
+    models.UserProPayment: decode_UserProPayment,
+    models.UserProTrial: decode_UserProTrial,
+    models.UserProVAT: decode_UserProVAT,
+    models.UserPro: decode_UserPro,
+    models.User: decode_User,
+}
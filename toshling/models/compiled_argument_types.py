@@ -0,0 +1,3816 @@
+"""Specialised decoders for the models in `argument_types`.
+
+Generated by `compile_models.py`, do not edit.
+"""
+import re
+
+from .._decode import MISSING, Invalid, additional, anything, is_format, new
+from . import argument_types as models
+
+_SOURCES_0 = frozenset(['ids', 'include_deleted', 'page', 'per_page', 'since', 'status'])
+_ENUM_1 = frozenset(['active', 'archived', 'inactive'])
+_SOURCES_2 = frozenset(['account', 'accounts', 'currency', 'sync', 'title'])
+_SOURCES_3 = frozenset(['order'])
+_SOURCES_4 = frozenset(['id'])
+_SOURCES_5 = frozenset(['position'])
+_SOURCES_6 = frozenset(['accounts', 'categories', 'expand', 'from', 'has_problem', 'include_deleted', 'one_iteration_only', 'page', 'parent', 'per_page', 'search', 'since', 'tags', 'to'])
+_NAMES_7 = frozenset(['accounts', 'categories', 'expand', 'from_', 'has_problem', 'include_deleted', 'one_iteration_only', 'page', 'parent', 'per_page', 'search', 'since', 'tags', 'to'])
+_SOURCES_8 = frozenset(['from', 'id', 'page', 'per_page', 'to'])
+_NAMES_9 = frozenset(['from_', 'id', 'page', 'per_page', 'to'])
+_SOURCES_10 = frozenset(['ids', 'include_deleted', 'page', 'per_page', 'search', 'since', 'type'])
+_ENUM_11 = frozenset(['expense', 'income'])
+_SOURCES_12 = frozenset(['categories', 'category'])
+_SOURCES_13 = frozenset(['!categories', '!locations', '!tags', 'accounts', 'categories', 'currency', 'from', 'locations', 'page', 'per_page', 'required_tags', 'search', 'since', 'tags', 'to', 'type'])
+_PATTERN_14 = re.compile('[A-Z_]{2,10}')
+_NAMES_15 = frozenset(['accounts', 'categories', 'currency', 'from_', 'locations', 'not_categories', 'not_locations', 'not_tags', 'page', 'per_page', 'required_tags', 'search', 'since', 'tags', 'to', 'type'])
+_SOURCES_16 = frozenset(['currencies', 'since', 'types'])
+_ENUM_17 = frozenset(['commodity', 'crypto', 'deprecated', 'fiat'])
+_SOURCES_18 = frozenset(['!categories', '!locations', '!tags', 'accounts', 'categories', 'expand', 'from', 'include_deleted', 'locations', 'page', 'parent', 'per_page', 'repeat', 'search', 'since', 'tags', 'to', 'type'])
+_ENUM_19 = frozenset(['expense', 'income', 'transaction'])
+_NAMES_20 = frozenset(['accounts', 'categories', 'expand', 'from_', 'include_deleted', 'locations', 'not_categories', 'not_locations', 'not_tags', 'page', 'parent', 'per_page', 'repeat', 'search', 'since', 'tags', 'to', 'type'])
+_SOURCES_21 = frozenset(['!categories', '!tags', 'accounts', 'categories', 'from', 'include_unused', 'latitude', 'longitude', 'near', 'page', 'per_page', 'radius', 'search', 'since', 'tags', 'to', 'type'])
+_NAMES_22 = frozenset(['accounts', 'categories', 'from_', 'include_unused', 'latitude', 'longitude', 'near', 'not_categories', 'not_tags', 'page', 'per_page', 'radius', 'search', 'since', 'tags', 'to', 'type'])
+_SOURCES_23 = frozenset(['!categories', '!locations', '!tags', 'accounts', 'categories', 'currency', 'from', 'locations', 'page', 'per_page', 'range', 'search', 'since', 'tags', 'to', 'type'])
+_ENUM_24 = frozenset(['day', 'month', 'week'])
+_NAMES_25 = frozenset(['accounts', 'categories', 'currency', 'from_', 'locations', 'not_categories', 'not_locations', 'not_tags', 'page', 'per_page', 'range', 'search', 'since', 'tags', 'to', 'type'])
+_SOURCES_26 = frozenset(['page', 'per_page', 'status', 'type'])
+_ENUM_27 = frozenset(['error', 'generated', 'generating', 'sending', 'sent'])
+_ENUM_28 = frozenset(['attachments', 'export', 'user_data'])
+_SOURCES_29 = frozenset(['modified', 'seen'])
+_SOURCES_30 = frozenset(['include_deleted', 'page', 'per_page', 'since', 'status'])
+_ENUM_31 = frozenset(['deleting', 'error', 'new', 'uploaded'])
+_SOURCES_32 = frozenset(['adgroup', 'campaign', 'creative', 'network'])
+_SOURCES_33 = frozenset(['include_deleted', 'page', 'per_page', 'since'])
+_SOURCES_34 = frozenset(['token', 'type'])
+_ENUM_35 = frozenset(['apple', 'apple_fcm', 'google', 'windows'])
+_SOURCES_36 = frozenset(['password'])
+_SOURCES_37 = frozenset(['categories', 'ids', 'include_deleted', 'page', 'per_page', 'search', 'since', 'type', 'used_with_categories', 'used_with_tags', 'used_with_tags_min'])
+_SOURCES_38 = frozenset(['account', 'category', 'tag', 'tags'])
+_SOURCES_39 = frozenset(['!categories', '!locations', '!tags', 'accounts', 'categories', 'currency', 'from', 'locations', 'page', 'per_page', 'search', 'since', 'tags', 'to', 'type'])
+_NAMES_40 = frozenset(['accounts', 'categories', 'currency', 'from_', 'locations', 'not_categories', 'not_locations', 'not_tags', 'page', 'per_page', 'search', 'since', 'tags', 'to', 'type'])
+_SOURCES_41 = frozenset(['code', 'fixed', 'main_rate', 'rate'])
+_SOURCES_42 = frozenset([])
+_SOURCES_43 = frozenset(['!accounts', '!categories', '!tags', 'accounts', 'categories', 'currency', 'delta', 'extra', 'frequency', 'id', 'limit', 'modified', 'name', 'percent', 'period', 'rollover', 'rollover_amount', 'rollover_override', 'start', 'tags', 'type'])
+_ENUM_44 = frozenset(['delta', 'percent', 'regular'])
+_PROPERTY_45 = models.BudgetsUpdateArgument.properties['start']
+_PROPERTY_46 = models.BudgetsUpdateArgument.properties['period']
+_PROPERTY_47 = models.BudgetsUpdateArgument.properties['frequency']
+_NAMES_48 = frozenset(['accounts', 'categories', 'currency', 'delta', 'extra', 'frequency', 'id', 'limit', 'modified', 'name', 'not_accounts', 'not_categories', 'not_tags', 'percent', 'period', 'rollover', 'rollover_amount', 'rollover_override', 'start', 'tags', 'type'])
+_SOURCES_49 = frozenset(['extra', 'name', 'type'])
+_SOURCES_50 = frozenset(['extra', 'id', 'modified', 'name', 'name_override', 'type'])
+_SOURCES_51 = frozenset(['category', 'extra', 'name', 'type'])
+_SOURCES_52 = frozenset(['category', 'extra', 'id', 'modified', 'name', 'name_override', 'type'])
+_SOURCES_53 = frozenset(['amount', 'end', 'start'])
+_SOURCES_54 = frozenset(['currency', 'extra', 'goal', 'initial_balance', 'name', 'parent', 'type'])
+_ENUM_55 = frozenset(['brokerage', 'credit_card', 'custom', 'depository', 'loan', 'mortgage', 'other'])
+_SOURCES_56 = frozenset(['currency', 'extra', 'goal', 'id', 'initial_balance', 'modified', 'name', 'name_override', 'parent', 'type'])
+_SOURCES_57 = frozenset(['byday', 'bymonthday', 'bysetpos', 'end', 'frequency', 'interval', 'start'])
+_ENUM_58 = frozenset(['daily', 'monthly', 'one-time', 'weekly', 'yearly'])
+_SOURCES_59 = frozenset(['!accounts', '!categories', '!tags', 'accounts', 'categories', 'currency', 'delta', 'extra', 'frequency', 'limit', 'name', 'percent', 'period', 'recurrence', 'rollover', 'rollover_amount', 'rollover_override', 'start', 'tags', 'type'])
+_PROPERTY_60 = models.BudgetsCreateArgument.properties['start']
+_PROPERTY_61 = models.BudgetsCreateArgument.properties['period']
+_PROPERTY_62 = models.BudgetsCreateArgument.properties['frequency']
+_NAMES_63 = frozenset(['accounts', 'categories', 'currency', 'delta', 'extra', 'frequency', 'limit', 'name', 'not_accounts', 'not_categories', 'not_tags', 'percent', 'period', 'recurrence', 'rollover', 'rollover_amount', 'rollover_override', 'start', 'tags', 'type'])
+_SOURCES_64 = frozenset(['id', 'latitude', 'longitude', 'venue_id'])
+_SOURCES_65 = frozenset(['at', 'number', 'period'])
+_ENUM_66 = frozenset(['day', 'month', 'week', 'year'])
+_SOURCES_67 = frozenset(['byday', 'bymonthday', 'bysetpos', 'count', 'end', 'frequency', 'id', 'interval', 'iteration', 'start'])
+_ENUM_68 = frozenset(['daily', 'monthly', 'weekly', 'yearly'])
+_SOURCES_69 = frozenset(['parent'])
+_SOURCES_70 = frozenset(['account', 'currency', 'id'])
+_SOURCES_71 = frozenset(['account', 'amount', 'category', 'completed', 'currency', 'date', 'desc', 'extra', 'images', 'location', 'reminders', 'repeat', 'split', 'tags', 'transaction'])
+_SOURCES_72 = frozenset(['account', 'amount', 'category', 'completed', 'currency', 'date', 'desc', 'extra', 'id', 'images', 'location', 'modified', 'reminders', 'repeat', 'tags', 'transaction'])
+_SOURCES_73 = frozenset(['filters', 'formats', 'from', 'resources', 'seen', 'to', 'type'])
+_NAMES_74 = frozenset(['filters', 'formats', 'from_', 'resources', 'seen', 'to', 'type'])
+_SOURCES_75 = frozenset(['code', 'fixed', 'rate', 'reference_currency'])
+_SOURCES_76 = frozenset(['custom', 'custom_exchange_rate', 'main', 'update', 'update_accounts'])
+_ENUM_77 = frozenset(['custom', 'historical', 'sign'])
+_SOURCES_78 = frozenset(['finished'])
+_SOURCES_79 = frozenset(['country', 'currency', 'extra', 'first_name', 'id', 'last_name', 'locale', 'migration', 'modified', 'start_day', 'timezone'])
+_PATTERN_80 = re.compile('[A-Z]{2}')
+
+
+def decode_AccountsListArgument(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('ids', MISSING)
+    if value_ is MISSING:
+        _ids = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _ids = value_
+    value_ = get('include_deleted', MISSING)
+    if value_ is MISSING:
+        _include_deleted = False
+    else:
+        if type(value_) is not bool:
+            raise Invalid
+        _include_deleted = value_
+    value_ = get('page', MISSING)
+    if value_ is MISSING:
+        _page = 0
+    else:
+        if type(value_) is not int or value_ < 0:
+            raise Invalid
+        _page = value_
+    value_ = get('per_page', MISSING)
+    if value_ is MISSING:
+        _per_page = 200
+    else:
+        if type(value_) is not int or value_ < 10 or value_ > 500:
+            raise Invalid
+        _per_page = value_
+    value_ = get('since', MISSING)
+    if value_ is MISSING:
+        _since = MISSING
+    else:
+        if type(value_) is not str or not is_format('date-time', value_):
+            raise Invalid
+        _since = value_
+    value_ = get('status', MISSING)
+    if value_ is MISSING:
+        _status = MISSING
+    else:
+        if type(value_) is not str or value_ not in _ENUM_1:
+            raise Invalid
+        _status = value_
+    properties = {'ids': _ids, 'include_deleted': _include_deleted, 'page': _page, 'per_page': _per_page, 'since': _since, 'status': _status}
+    model = new(models.AccountsListArgument)
+    model._dict = properties
+    model.ids = _ids
+    model.include_deleted = _include_deleted
+    model.page = _page
+    model.per_page = _per_page
+    model.since = _since
+    model.status = _status
+    if not _SOURCES_0.issuperset(value):
+        additional(properties, value, _SOURCES_0, _SOURCES_0)
+    return model
+
+
+def decode_AccountsMergeArgument(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('account', MISSING)
+    if value_ is MISSING:
+        _account = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _account = value_
+    value_ = get('accounts', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not list:
+            raise Invalid
+        _accounts = [anything(item) for item in value_]
+    value_ = get('currency', MISSING)
+    if value_ is MISSING:
+        _currency = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _currency = value_
+    value_ = get('sync', MISSING)
+    if value_ is MISSING:
+        _sync = MISSING
+    else:
+        if type(value_) is not list:
+            raise Invalid
+        _sync = [anything(item) for item in value_]
+    value_ = get('title', MISSING)
+    if value_ is MISSING:
+        _title = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _title = value_
+    properties = {'account': _account, 'accounts': _accounts, 'currency': _currency, 'sync': _sync, 'title': _title}
+    model = new(models.AccountsMergeArgument)
+    model._dict = properties
+    model.account = _account
+    model.accounts = _accounts
+    model.currency = _currency
+    model.sync = _sync
+    model.title = _title
+    if not _SOURCES_2.issuperset(value):
+        additional(properties, value, _SOURCES_2, _SOURCES_2)
+    return model
+
+
+def decode_AccountsReorderArgument(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('order', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not list:
+            raise Invalid
+        _order = [anything(item) for item in value_]
+    properties = {'order': _order}
+    model = new(models.AccountsReorderArgument)
+    model._dict = properties
+    model.order = _order
+    if not _SOURCES_3.issuperset(value):
+        additional(properties, value, _SOURCES_3, _SOURCES_3)
+    return model
+
+
+def decode_AccountsDeleteArgument(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('id', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _id = value_
+    properties = {'id': _id}
+    model = new(models.AccountsDeleteArgument)
+    model._dict = properties
+    model.id = _id
+    if not _SOURCES_4.issuperset(value):
+        additional(properties, value, _SOURCES_4, _SOURCES_4)
+    return model
+
+
+def decode_AccountsGetArgument(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('id', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _id = value_
+    properties = {'id': _id}
+    model = new(models.AccountsGetArgument)
+    model._dict = properties
+    model.id = _id
+    if not _SOURCES_4.issuperset(value):
+        additional(properties, value, _SOURCES_4, _SOURCES_4)
+    return model
+
+
+def decode_AccountsForceDeleteArgument(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('id', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _id = value_
+    properties = {'id': _id}
+    model = new(models.AccountsForceDeleteArgument)
+    model._dict = properties
+    model.id = _id
+    if not _SOURCES_4.issuperset(value):
+        additional(properties, value, _SOURCES_4, _SOURCES_4)
+    return model
+
+
+def decode_AccountsMoveArgument(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('position', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not int or value_ < 0:
+            raise Invalid
+        _position = value_
+    properties = {'position': _position}
+    model = new(models.AccountsMoveArgument)
+    model._dict = properties
+    model.position = _position
+    if not _SOURCES_5.issuperset(value):
+        additional(properties, value, _SOURCES_5, _SOURCES_5)
+    return model
+
+
+def decode_BudgetsListArgument(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('accounts', MISSING)
+    if value_ is MISSING:
+        _accounts = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _accounts = value_
+    value_ = get('categories', MISSING)
+    if value_ is MISSING:
+        _categories = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _categories = value_
+    value_ = get('expand', MISSING)
+    if value_ is MISSING:
+        _expand = False
+    else:
+        if type(value_) is not bool:
+            raise Invalid
+        _expand = value_
+    value_ = get('from', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str or not is_format('date', value_):
+            raise Invalid
+        _from_ = value_
+    value_ = get('has_problem', MISSING)
+    if value_ is MISSING:
+        _has_problem = MISSING
+    else:
+        if type(value_) is not bool:
+            raise Invalid
+        _has_problem = value_
+    value_ = get('include_deleted', MISSING)
+    if value_ is MISSING:
+        _include_deleted = False
+    else:
+        if type(value_) is not bool:
+            raise Invalid
+        _include_deleted = value_
+    value_ = get('one_iteration_only', MISSING)
+    if value_ is MISSING:
+        _one_iteration_only = False
+    else:
+        if type(value_) is not bool:
+            raise Invalid
+        _one_iteration_only = value_
+    value_ = get('page', MISSING)
+    if value_ is MISSING:
+        _page = 0
+    else:
+        if type(value_) is not int or value_ < 0:
+            raise Invalid
+        _page = value_
+    value_ = get('parent', MISSING)
+    if value_ is MISSING:
+        _parent = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _parent = value_
+    value_ = get('per_page', MISSING)
+    if value_ is MISSING:
+        _per_page = 200
+    else:
+        if type(value_) is not int or value_ < 10 or value_ > 500:
+            raise Invalid
+        _per_page = value_
+    value_ = get('search', MISSING)
+    if value_ is MISSING:
+        _search = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _search = value_
+    value_ = get('since', MISSING)
+    if value_ is MISSING:
+        _since = MISSING
+    else:
+        if type(value_) is not str or not is_format('date-time', value_):
+            raise Invalid
+        _since = value_
+    value_ = get('tags', MISSING)
+    if value_ is MISSING:
+        _tags = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _tags = value_
+    value_ = get('to', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str or not is_format('date', value_):
+            raise Invalid
+        _to = value_
+    properties = {'accounts': _accounts, 'categories': _categories, 'expand': _expand, 'from_': _from_, 'has_problem': _has_problem, 'include_deleted': _include_deleted, 'one_iteration_only': _one_iteration_only, 'page': _page, 'parent': _parent, 'per_page': _per_page, 'search': _search, 'since': _since, 'tags': _tags, 'to': _to}
+    model = new(models.BudgetsListArgument)
+    model._dict = properties
+    model.accounts = _accounts
+    model.categories = _categories
+    model.expand = _expand
+    model.from_ = _from_
+    model.has_problem = _has_problem
+    model.include_deleted = _include_deleted
+    model.one_iteration_only = _one_iteration_only
+    model.page = _page
+    model.parent = _parent
+    model.per_page = _per_page
+    model.search = _search
+    model.since = _since
+    model.tags = _tags
+    model.to = _to
+    if not _SOURCES_6.issuperset(value):
+        additional(properties, value, _SOURCES_6, _NAMES_7)
+    return model
+
+
+def decode_BudgetsReorderArgument(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('order', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not list:
+            raise Invalid
+        _order = [anything(item) for item in value_]
+    properties = {'order': _order}
+    model = new(models.BudgetsReorderArgument)
+    model._dict = properties
+    model.order = _order
+    if not _SOURCES_3.issuperset(value):
+        additional(properties, value, _SOURCES_3, _SOURCES_3)
+    return model
+
+
+def decode_BudgetsDeleteArgument(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('id', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _id = value_
+    properties = {'id': _id}
+    model = new(models.BudgetsDeleteArgument)
+    model._dict = properties
+    model.id = _id
+    if not _SOURCES_4.issuperset(value):
+        additional(properties, value, _SOURCES_4, _SOURCES_4)
+    return model
+
+
+def decode_BudgetsGetArgument(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('id', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _id = value_
+    properties = {'id': _id}
+    model = new(models.BudgetsGetArgument)
+    model._dict = properties
+    model.id = _id
+    if not _SOURCES_4.issuperset(value):
+        additional(properties, value, _SOURCES_4, _SOURCES_4)
+    return model
+
+
+def decode_BudgetsHistoryArgument(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('from', MISSING)
+    if value_ is MISSING:
+        _from_ = MISSING
+    else:
+        if type(value_) is not str or not is_format('date', value_):
+            raise Invalid
+        _from_ = value_
+    value_ = get('id', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _id = value_
+    value_ = get('page', MISSING)
+    if value_ is MISSING:
+        _page = 0
+    else:
+        if type(value_) is not int or value_ < 0:
+            raise Invalid
+        _page = value_
+    value_ = get('per_page', MISSING)
+    if value_ is MISSING:
+        _per_page = 200
+    else:
+        if type(value_) is not int or value_ < 10 or value_ > 500:
+            raise Invalid
+        _per_page = value_
+    value_ = get('to', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str or not is_format('date', value_):
+            raise Invalid
+        _to = value_
+    properties = {'from_': _from_, 'id': _id, 'page': _page, 'per_page': _per_page, 'to': _to}
+    model = new(models.BudgetsHistoryArgument)
+    model._dict = properties
+    model.from_ = _from_
+    model.id = _id
+    model.page = _page
+    model.per_page = _per_page
+    model.to = _to
+    if not _SOURCES_8.issuperset(value):
+        additional(properties, value, _SOURCES_8, _NAMES_9)
+    return model
+
+
+def decode_BudgetsMoveArgument(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('position', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not int or value_ < 0:
+            raise Invalid
+        _position = value_
+    properties = {'position': _position}
+    model = new(models.BudgetsMoveArgument)
+    model._dict = properties
+    model.position = _position
+    if not _SOURCES_5.issuperset(value):
+        additional(properties, value, _SOURCES_5, _SOURCES_5)
+    return model
+
+
+def decode_CategoriesListArgument(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('ids', MISSING)
+    if value_ is MISSING:
+        _ids = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _ids = value_
+    value_ = get('include_deleted', MISSING)
+    if value_ is MISSING:
+        _include_deleted = False
+    else:
+        if type(value_) is not bool:
+            raise Invalid
+        _include_deleted = value_
+    value_ = get('page', MISSING)
+    if value_ is MISSING:
+        _page = 0
+    else:
+        if type(value_) is not int or value_ < 0:
+            raise Invalid
+        _page = value_
+    value_ = get('per_page', MISSING)
+    if value_ is MISSING:
+        _per_page = 200
+    else:
+        if type(value_) is not int or value_ < 10 or value_ > 500:
+            raise Invalid
+        _per_page = value_
+    value_ = get('search', MISSING)
+    if value_ is MISSING:
+        _search = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _search = value_
+    value_ = get('since', MISSING)
+    if value_ is MISSING:
+        _since = MISSING
+    else:
+        if type(value_) is not str or not is_format('date-time', value_):
+            raise Invalid
+        _since = value_
+    value_ = get('type', MISSING)
+    if value_ is MISSING:
+        _type = MISSING
+    else:
+        if type(value_) is not str or value_ not in _ENUM_11:
+            raise Invalid
+        _type = value_
+    properties = {'ids': _ids, 'include_deleted': _include_deleted, 'page': _page, 'per_page': _per_page, 'search': _search, 'since': _since, 'type': _type}
+    model = new(models.CategoriesListArgument)
+    model._dict = properties
+    model.ids = _ids
+    model.include_deleted = _include_deleted
+    model.page = _page
+    model.per_page = _per_page
+    model.search = _search
+    model.since = _since
+    model.type = _type
+    if not _SOURCES_10.issuperset(value):
+        additional(properties, value, _SOURCES_10, _SOURCES_10)
+    return model
+
+
+def decode_CategoriesMergeArgument(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('categories', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not list:
+            raise Invalid
+        _categories = [anything(item) for item in value_]
+    value_ = get('category', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _category = value_
+    properties = {'categories': _categories, 'category': _category}
+    model = new(models.CategoriesMergeArgument)
+    model._dict = properties
+    model.categories = _categories
+    model.category = _category
+    if not _SOURCES_12.issuperset(value):
+        additional(properties, value, _SOURCES_12, _SOURCES_12)
+    return model
+
+
+def decode_CategoriesSumsListArgument(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('accounts', MISSING)
+    if value_ is MISSING:
+        _accounts = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _accounts = value_
+    value_ = get('categories', MISSING)
+    if value_ is MISSING:
+        _categories = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _categories = value_
+    value_ = get('currency', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str or not _PATTERN_14.search(value_):
+            raise Invalid
+        _currency = value_
+    value_ = get('from', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str or not is_format('date', value_):
+            raise Invalid
+        _from_ = value_
+    value_ = get('locations', MISSING)
+    if value_ is MISSING:
+        _locations = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _locations = value_
+    value_ = get('page', MISSING)
+    if value_ is MISSING:
+        _page = 0
+    else:
+        if type(value_) is not int or value_ < 0:
+            raise Invalid
+        _page = value_
+    value_ = get('per_page', MISSING)
+    if value_ is MISSING:
+        _per_page = 200
+    else:
+        if type(value_) is not int or value_ < 10 or value_ > 500:
+            raise Invalid
+        _per_page = value_
+    value_ = get('required_tags', MISSING)
+    if value_ is MISSING:
+        _required_tags = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _required_tags = value_
+    value_ = get('search', MISSING)
+    if value_ is MISSING:
+        _search = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _search = value_
+    value_ = get('since', MISSING)
+    if value_ is MISSING:
+        _since = MISSING
+    else:
+        if type(value_) is not str or not is_format('date-time', value_):
+            raise Invalid
+        _since = value_
+    value_ = get('tags', MISSING)
+    if value_ is MISSING:
+        _tags = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _tags = value_
+    value_ = get('to', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str or not is_format('date', value_):
+            raise Invalid
+        _to = value_
+    value_ = get('type', MISSING)
+    if value_ is MISSING:
+        _type = MISSING
+    else:
+        if type(value_) is not str or value_ not in _ENUM_11:
+            raise Invalid
+        _type = value_
+    value_ = get('!categories', MISSING)
+    if value_ is MISSING:
+        _not_categories = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _not_categories = value_
+    value_ = get('!locations', MISSING)
+    if value_ is MISSING:
+        _not_locations = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _not_locations = value_
+    value_ = get('!tags', MISSING)
+    if value_ is MISSING:
+        _not_tags = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _not_tags = value_
+    properties = {'accounts': _accounts, 'categories': _categories, 'currency': _currency, 'from_': _from_, 'locations': _locations, 'page': _page, 'per_page': _per_page, 'required_tags': _required_tags, 'search': _search, 'since': _since, 'tags': _tags, 'to': _to, 'type': _type, 'not_categories': _not_categories, 'not_locations': _not_locations, 'not_tags': _not_tags}
+    model = new(models.CategoriesSumsListArgument)
+    model._dict = properties
+    model.accounts = _accounts
+    model.categories = _categories
+    model.currency = _currency
+    model.from_ = _from_
+    model.locations = _locations
+    model.page = _page
+    model.per_page = _per_page
+    model.required_tags = _required_tags
+    model.search = _search
+    model.since = _since
+    model.tags = _tags
+    model.to = _to
+    model.type = _type
+    model.not_categories = _not_categories
+    model.not_locations = _not_locations
+    model.not_tags = _not_tags
+    if not _SOURCES_13.issuperset(value):
+        additional(properties, value, _SOURCES_13, _NAMES_15)
+    return model
+
+
+def decode_CategoriesDeleteArgument(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('id', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _id = value_
+    properties = {'id': _id}
+    model = new(models.CategoriesDeleteArgument)
+    model._dict = properties
+    model.id = _id
+    if not _SOURCES_4.issuperset(value):
+        additional(properties, value, _SOURCES_4, _SOURCES_4)
+    return model
+
+
+def decode_CategoriesGetArgument(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('id', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _id = value_
+    properties = {'id': _id}
+    model = new(models.CategoriesGetArgument)
+    model._dict = properties
+    model.id = _id
+    if not _SOURCES_4.issuperset(value):
+        additional(properties, value, _SOURCES_4, _SOURCES_4)
+    return model
+
+
+def decode_CurrenciesListArgument(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('currencies', MISSING)
+    if value_ is MISSING:
+        _currencies = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _currencies = value_
+    value_ = get('since', MISSING)
+    if value_ is MISSING:
+        _since = MISSING
+    else:
+        if type(value_) is not str or not is_format('date-time', value_):
+            raise Invalid
+        _since = value_
+    value_ = get('types', MISSING)
+    if value_ is MISSING:
+        _types = MISSING
+    else:
+        if type(value_) is not str or value_ not in _ENUM_17:
+            raise Invalid
+        _types = value_
+    properties = {'currencies': _currencies, 'since': _since, 'types': _types}
+    model = new(models.CurrenciesListArgument)
+    model._dict = properties
+    model.currencies = _currencies
+    model.since = _since
+    model.types = _types
+    if not _SOURCES_16.issuperset(value):
+        additional(properties, value, _SOURCES_16, _SOURCES_16)
+    return model
+
+
+def decode_EntriesListArgument(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('accounts', MISSING)
+    if value_ is MISSING:
+        _accounts = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _accounts = value_
+    value_ = get('categories', MISSING)
+    if value_ is MISSING:
+        _categories = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _categories = value_
+    value_ = get('expand', MISSING)
+    if value_ is MISSING:
+        _expand = False
+    else:
+        if type(value_) is not bool:
+            raise Invalid
+        _expand = value_
+    value_ = get('from', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str or not is_format('date', value_):
+            raise Invalid
+        _from_ = value_
+    value_ = get('include_deleted', MISSING)
+    if value_ is MISSING:
+        _include_deleted = False
+    else:
+        if type(value_) is not bool:
+            raise Invalid
+        _include_deleted = value_
+    value_ = get('locations', MISSING)
+    if value_ is MISSING:
+        _locations = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _locations = value_
+    value_ = get('page', MISSING)
+    if value_ is MISSING:
+        _page = 0
+    else:
+        if type(value_) is not int or value_ < 0:
+            raise Invalid
+        _page = value_
+    value_ = get('parent', MISSING)
+    if value_ is MISSING:
+        _parent = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _parent = value_
+    value_ = get('per_page', MISSING)
+    if value_ is MISSING:
+        _per_page = 200
+    else:
+        if type(value_) is not int or value_ < 10 or value_ > 500:
+            raise Invalid
+        _per_page = value_
+    value_ = get('repeat', MISSING)
+    if value_ is MISSING:
+        _repeat = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _repeat = value_
+    value_ = get('search', MISSING)
+    if value_ is MISSING:
+        _search = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _search = value_
+    value_ = get('since', MISSING)
+    if value_ is MISSING:
+        _since = MISSING
+    else:
+        if type(value_) is not str or not is_format('date-time', value_):
+            raise Invalid
+        _since = value_
+    value_ = get('tags', MISSING)
+    if value_ is MISSING:
+        _tags = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _tags = value_
+    value_ = get('to', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str or not is_format('date', value_):
+            raise Invalid
+        _to = value_
+    value_ = get('type', MISSING)
+    if value_ is MISSING:
+        _type = MISSING
+    else:
+        if type(value_) is not str or value_ not in _ENUM_19:
+            raise Invalid
+        _type = value_
+    value_ = get('!categories', MISSING)
+    if value_ is MISSING:
+        _not_categories = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _not_categories = value_
+    value_ = get('!locations', MISSING)
+    if value_ is MISSING:
+        _not_locations = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _not_locations = value_
+    value_ = get('!tags', MISSING)
+    if value_ is MISSING:
+        _not_tags = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _not_tags = value_
+    properties = {'accounts': _accounts, 'categories': _categories, 'expand': _expand, 'from_': _from_, 'include_deleted': _include_deleted, 'locations': _locations, 'page': _page, 'parent': _parent, 'per_page': _per_page, 'repeat': _repeat, 'search': _search, 'since': _since, 'tags': _tags, 'to': _to, 'type': _type, 'not_categories': _not_categories, 'not_locations': _not_locations, 'not_tags': _not_tags}
+    model = new(models.EntriesListArgument)
+    model._dict = properties
+    model.accounts = _accounts
+    model.categories = _categories
+    model.expand = _expand
+    model.from_ = _from_
+    model.include_deleted = _include_deleted
+    model.locations = _locations
+    model.page = _page
+    model.parent = _parent
+    model.per_page = _per_page
+    model.repeat = _repeat
+    model.search = _search
+    model.since = _since
+    model.tags = _tags
+    model.to = _to
+    model.type = _type
+    model.not_categories = _not_categories
+    model.not_locations = _not_locations
+    model.not_tags = _not_tags
+    if not _SOURCES_18.issuperset(value):
+        additional(properties, value, _SOURCES_18, _NAMES_20)
+    return model
+
+
+def decode_EntriesLocationsListArgument(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('accounts', MISSING)
+    if value_ is MISSING:
+        _accounts = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _accounts = value_
+    value_ = get('categories', MISSING)
+    if value_ is MISSING:
+        _categories = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _categories = value_
+    value_ = get('from', MISSING)
+    if value_ is MISSING:
+        _from_ = MISSING
+    else:
+        if type(value_) is not str or not is_format('date', value_):
+            raise Invalid
+        _from_ = value_
+    value_ = get('include_unused', MISSING)
+    if value_ is MISSING:
+        _include_unused = False
+    else:
+        if type(value_) is not bool:
+            raise Invalid
+        _include_unused = value_
+    value_ = get('latitude', MISSING)
+    if value_ is MISSING:
+        _latitude = MISSING
+    else:
+        if type(value_) is not float and type(value_) is not int:
+            raise Invalid
+        _latitude = float(value_)
+    value_ = get('longitude', MISSING)
+    if value_ is MISSING:
+        _longitude = MISSING
+    else:
+        if type(value_) is not float and type(value_) is not int:
+            raise Invalid
+        _longitude = float(value_)
+    value_ = get('near', MISSING)
+    if value_ is MISSING:
+        _near = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _near = value_
+    value_ = get('page', MISSING)
+    if value_ is MISSING:
+        _page = 0
+    else:
+        if type(value_) is not int or value_ < 0:
+            raise Invalid
+        _page = value_
+    value_ = get('per_page', MISSING)
+    if value_ is MISSING:
+        _per_page = 200
+    else:
+        if type(value_) is not int or value_ < 10 or value_ > 500:
+            raise Invalid
+        _per_page = value_
+    value_ = get('radius', MISSING)
+    if value_ is MISSING:
+        _radius = MISSING
+    else:
+        if type(value_) is not float and type(value_) is not int:
+            raise Invalid
+        _radius = float(value_)
+    value_ = get('search', MISSING)
+    if value_ is MISSING:
+        _search = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _search = value_
+    value_ = get('since', MISSING)
+    if value_ is MISSING:
+        _since = MISSING
+    else:
+        if type(value_) is not str or not is_format('date-time', value_):
+            raise Invalid
+        _since = value_
+    value_ = get('tags', MISSING)
+    if value_ is MISSING:
+        _tags = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _tags = value_
+    value_ = get('to', MISSING)
+    if value_ is MISSING:
+        _to = MISSING
+    else:
+        if type(value_) is not str or not is_format('date', value_):
+            raise Invalid
+        _to = value_
+    value_ = get('type', MISSING)
+    if value_ is MISSING:
+        _type = MISSING
+    else:
+        if type(value_) is not str or value_ not in _ENUM_11:
+            raise Invalid
+        _type = value_
+    value_ = get('!categories', MISSING)
+    if value_ is MISSING:
+        _not_categories = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _not_categories = value_
+    value_ = get('!tags', MISSING)
+    if value_ is MISSING:
+        _not_tags = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _not_tags = value_
+    properties = {'accounts': _accounts, 'categories': _categories, 'from_': _from_, 'include_unused': _include_unused, 'latitude': _latitude, 'longitude': _longitude, 'near': _near, 'page': _page, 'per_page': _per_page, 'radius': _radius, 'search': _search, 'since': _since, 'tags': _tags, 'to': _to, 'type': _type, 'not_categories': _not_categories, 'not_tags': _not_tags}
+    model = new(models.EntriesLocationsListArgument)
+    model._dict = properties
+    model.accounts = _accounts
+    model.categories = _categories
+    model.from_ = _from_
+    model.include_unused = _include_unused
+    model.latitude = _latitude
+    model.longitude = _longitude
+    model.near = _near
+    model.page = _page
+    model.per_page = _per_page
+    model.radius = _radius
+    model.search = _search
+    model.since = _since
+    model.tags = _tags
+    model.to = _to
+    model.type = _type
+    model.not_categories = _not_categories
+    model.not_tags = _not_tags
+    if not _SOURCES_21.issuperset(value):
+        additional(properties, value, _SOURCES_21, _NAMES_22)
+    return model
+
+
+def decode_EntriesLocationsGetArgument(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('id', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _id = value_
+    properties = {'id': _id}
+    model = new(models.EntriesLocationsGetArgument)
+    model._dict = properties
+    model.id = _id
+    if not _SOURCES_4.issuperset(value):
+        additional(properties, value, _SOURCES_4, _SOURCES_4)
+    return model
+
+
+def decode_EntriesSplitArgument(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('id', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _id = value_
+    properties = {'id': _id}
+    model = new(models.EntriesSplitArgument)
+    model._dict = properties
+    model.id = _id
+    if not _SOURCES_4.issuperset(value):
+        additional(properties, value, _SOURCES_4, _SOURCES_4)
+    return model
+
+
+def decode_EntriesSumsListArgument(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('accounts', MISSING)
+    if value_ is MISSING:
+        _accounts = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _accounts = value_
+    value_ = get('categories', MISSING)
+    if value_ is MISSING:
+        _categories = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _categories = value_
+    value_ = get('currency', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str or not _PATTERN_14.search(value_):
+            raise Invalid
+        _currency = value_
+    value_ = get('from', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str or not is_format('date', value_):
+            raise Invalid
+        _from_ = value_
+    value_ = get('locations', MISSING)
+    if value_ is MISSING:
+        _locations = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _locations = value_
+    value_ = get('page', MISSING)
+    if value_ is MISSING:
+        _page = 0
+    else:
+        if type(value_) is not int or value_ < 0:
+            raise Invalid
+        _page = value_
+    value_ = get('per_page', MISSING)
+    if value_ is MISSING:
+        _per_page = 200
+    else:
+        if type(value_) is not int or value_ < 10 or value_ > 500:
+            raise Invalid
+        _per_page = value_
+    value_ = get('range', MISSING)
+    if value_ is MISSING:
+        _range = 'day'
+    else:
+        if type(value_) is not str or value_ not in _ENUM_24:
+            raise Invalid
+        _range = value_
+    value_ = get('search', MISSING)
+    if value_ is MISSING:
+        _search = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _search = value_
+    value_ = get('since', MISSING)
+    if value_ is MISSING:
+        _since = MISSING
+    else:
+        if type(value_) is not str or not is_format('date-time', value_):
+            raise Invalid
+        _since = value_
+    value_ = get('tags', MISSING)
+    if value_ is MISSING:
+        _tags = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _tags = value_
+    value_ = get('to', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str or not is_format('date', value_):
+            raise Invalid
+        _to = value_
+    value_ = get('type', MISSING)
+    if value_ is MISSING:
+        _type = MISSING
+    else:
+        if type(value_) is not str or value_ not in _ENUM_11:
+            raise Invalid
+        _type = value_
+    value_ = get('!categories', MISSING)
+    if value_ is MISSING:
+        _not_categories = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _not_categories = value_
+    value_ = get('!locations', MISSING)
+    if value_ is MISSING:
+        _not_locations = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _not_locations = value_
+    value_ = get('!tags', MISSING)
+    if value_ is MISSING:
+        _not_tags = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _not_tags = value_
+    properties = {'accounts': _accounts, 'categories': _categories, 'currency': _currency, 'from_': _from_, 'locations': _locations, 'page': _page, 'per_page': _per_page, 'range': _range, 'search': _search, 'since': _since, 'tags': _tags, 'to': _to, 'type': _type, 'not_categories': _not_categories, 'not_locations': _not_locations, 'not_tags': _not_tags}
+    model = new(models.EntriesSumsListArgument)
+    model._dict = properties
+    model.accounts = _accounts
+    model.categories = _categories
+    model.currency = _currency
+    model.from_ = _from_
+    model.locations = _locations
+    model.page = _page
+    model.per_page = _per_page
+    model.range = _range
+    model.search = _search
+    model.since = _since
+    model.tags = _tags
+    model.to = _to
+    model.type = _type
+    model.not_categories = _not_categories
+    model.not_locations = _not_locations
+    model.not_tags = _not_tags
+    if not _SOURCES_23.issuperset(value):
+        additional(properties, value, _SOURCES_23, _NAMES_25)
+    return model
+
+
+def decode_EntriesDeleteArgument(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('id', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _id = value_
+    properties = {'id': _id}
+    model = new(models.EntriesDeleteArgument)
+    model._dict = properties
+    model.id = _id
+    if not _SOURCES_4.issuperset(value):
+        additional(properties, value, _SOURCES_4, _SOURCES_4)
+    return model
+
+
+def decode_EntriesGetArgument(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('id', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _id = value_
+    properties = {'id': _id}
+    model = new(models.EntriesGetArgument)
+    model._dict = properties
+    model.id = _id
+    if not _SOURCES_4.issuperset(value):
+        additional(properties, value, _SOURCES_4, _SOURCES_4)
+    return model
+
+
+def decode_ExportsListArgument(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('page', MISSING)
+    if value_ is MISSING:
+        _page = 0
+    else:
+        if type(value_) is not int or value_ < 0:
+            raise Invalid
+        _page = value_
+    value_ = get('per_page', MISSING)
+    if value_ is MISSING:
+        _per_page = 200
+    else:
+        if type(value_) is not int or value_ < 10 or value_ > 500:
+            raise Invalid
+        _per_page = value_
+    value_ = get('status', MISSING)
+    if value_ is MISSING:
+        _status = MISSING
+    else:
+        if type(value_) is not str or value_ not in _ENUM_27:
+            raise Invalid
+        _status = value_
+    value_ = get('type', MISSING)
+    if value_ is MISSING:
+        _type = MISSING
+    else:
+        if type(value_) is not str or value_ not in _ENUM_28:
+            raise Invalid
+        _type = value_
+    properties = {'page': _page, 'per_page': _per_page, 'status': _status, 'type': _type}
+    model = new(models.ExportsListArgument)
+    model._dict = properties
+    model.page = _page
+    model.per_page = _per_page
+    model.status = _status
+    model.type = _type
+    if not _SOURCES_26.issuperset(value):
+        additional(properties, value, _SOURCES_26, _SOURCES_26)
+    return model
+
+
+def decode_ExportsGetArgument(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('id', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _id = value_
+    properties = {'id': _id}
+    model = new(models.ExportsGetArgument)
+    model._dict = properties
+    model.id = _id
+    if not _SOURCES_4.issuperset(value):
+        additional(properties, value, _SOURCES_4, _SOURCES_4)
+    return model
+
+
+def decode_ExportsUpdateArgument(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('modified', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _modified = value_
+    value_ = get('seen', MISSING)
+    if value_ is MISSING:
+        _seen = MISSING
+    else:
+        if type(value_) is not bool:
+            raise Invalid
+        _seen = value_
+    properties = {'modified': _modified, 'seen': _seen}
+    model = new(models.ExportsUpdateArgument)
+    model._dict = properties
+    model.modified = _modified
+    model.seen = _seen
+    if not _SOURCES_29.issuperset(value):
+        additional(properties, value, _SOURCES_29, _SOURCES_29)
+    return model
+
+
+def decode_ImagesListArgument(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('include_deleted', MISSING)
+    if value_ is MISSING:
+        _include_deleted = False
+    else:
+        if type(value_) is not bool:
+            raise Invalid
+        _include_deleted = value_
+    value_ = get('page', MISSING)
+    if value_ is MISSING:
+        _page = 0
+    else:
+        if type(value_) is not int or value_ < 0:
+            raise Invalid
+        _page = value_
+    value_ = get('per_page', MISSING)
+    if value_ is MISSING:
+        _per_page = 200
+    else:
+        if type(value_) is not int or value_ < 10 or value_ > 500:
+            raise Invalid
+        _per_page = value_
+    value_ = get('since', MISSING)
+    if value_ is MISSING:
+        _since = MISSING
+    else:
+        if type(value_) is not str or not is_format('date-time', value_):
+            raise Invalid
+        _since = value_
+    value_ = get('status', MISSING)
+    if value_ is MISSING:
+        _status = MISSING
+    else:
+        if type(value_) is not str or value_ not in _ENUM_31:
+            raise Invalid
+        _status = value_
+    properties = {'include_deleted': _include_deleted, 'page': _page, 'per_page': _per_page, 'since': _since, 'status': _status}
+    model = new(models.ImagesListArgument)
+    model._dict = properties
+    model.include_deleted = _include_deleted
+    model.page = _page
+    model.per_page = _per_page
+    model.since = _since
+    model.status = _status
+    if not _SOURCES_30.issuperset(value):
+        additional(properties, value, _SOURCES_30, _SOURCES_30)
+    return model
+
+
+def decode_ImagesDeleteArgument(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('id', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _id = value_
+    properties = {'id': _id}
+    model = new(models.ImagesDeleteArgument)
+    model._dict = properties
+    model.id = _id
+    if not _SOURCES_4.issuperset(value):
+        additional(properties, value, _SOURCES_4, _SOURCES_4)
+    return model
+
+
+def decode_ImagesGetArgument(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('id', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _id = value_
+    properties = {'id': _id}
+    model = new(models.ImagesGetArgument)
+    model._dict = properties
+    model.id = _id
+    if not _SOURCES_4.issuperset(value):
+        additional(properties, value, _SOURCES_4, _SOURCES_4)
+    return model
+
+
+def decode_MeAdjustCampaignArgument(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('adgroup', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _adgroup = value_
+    value_ = get('campaign', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _campaign = value_
+    value_ = get('creative', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _creative = value_
+    value_ = get('network', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _network = value_
+    properties = {'adgroup': _adgroup, 'campaign': _campaign, 'creative': _creative, 'network': _network}
+    model = new(models.MeAdjustCampaignArgument)
+    model._dict = properties
+    model.adgroup = _adgroup
+    model.campaign = _campaign
+    model.creative = _creative
+    model.network = _network
+    if not _SOURCES_32.issuperset(value):
+        additional(properties, value, _SOURCES_32, _SOURCES_32)
+    return model
+
+
+def decode_MeNotificationsListArgument(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('include_deleted', MISSING)
+    if value_ is MISSING:
+        _include_deleted = False
+    else:
+        if type(value_) is not bool:
+            raise Invalid
+        _include_deleted = value_
+    value_ = get('page', MISSING)
+    if value_ is MISSING:
+        _page = 0
+    else:
+        if type(value_) is not int or value_ < 0:
+            raise Invalid
+        _page = value_
+    value_ = get('per_page', MISSING)
+    if value_ is MISSING:
+        _per_page = 200
+    else:
+        if type(value_) is not int or value_ < 10 or value_ > 500:
+            raise Invalid
+        _per_page = value_
+    value_ = get('since', MISSING)
+    if value_ is MISSING:
+        _since = MISSING
+    else:
+        if type(value_) is not str or not is_format('date-time', value_):
+            raise Invalid
+        _since = value_
+    properties = {'include_deleted': _include_deleted, 'page': _page, 'per_page': _per_page, 'since': _since}
+    model = new(models.MeNotificationsListArgument)
+    model._dict = properties
+    model.include_deleted = _include_deleted
+    model.page = _page
+    model.per_page = _per_page
+    model.since = _since
+    if not _SOURCES_33.issuperset(value):
+        additional(properties, value, _SOURCES_33, _SOURCES_33)
+    return model
+
+
+def decode_MeNotificationsDeleteArgument(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('id', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _id = value_
+    properties = {'id': _id}
+    model = new(models.MeNotificationsDeleteArgument)
+    model._dict = properties
+    model.id = _id
+    if not _SOURCES_4.issuperset(value):
+        additional(properties, value, _SOURCES_4, _SOURCES_4)
+    return model
+
+
+def decode_MeNotificationsGetArgument(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('id', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _id = value_
+    properties = {'id': _id}
+    model = new(models.MeNotificationsGetArgument)
+    model._dict = properties
+    model.id = _id
+    if not _SOURCES_4.issuperset(value):
+        additional(properties, value, _SOURCES_4, _SOURCES_4)
+    return model
+
+
+def decode_MePushArgument(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('token', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _token = value_
+    value_ = get('type', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str or value_ not in _ENUM_35:
+            raise Invalid
+        _type = value_
+    properties = {'token': _token, 'type': _type}
+    model = new(models.MePushArgument)
+    model._dict = properties
+    model.token = _token
+    model.type = _type
+    if not _SOURCES_34.issuperset(value):
+        additional(properties, value, _SOURCES_34, _SOURCES_34)
+    return model
+
+
+def decode_MeRevertArgument(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('password', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _password = value_
+    properties = {'password': _password}
+    model = new(models.MeRevertArgument)
+    model._dict = properties
+    model.password = _password
+    if not _SOURCES_36.issuperset(value):
+        additional(properties, value, _SOURCES_36, _SOURCES_36)
+    return model
+
+
+def decode_TagsListArgument(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('categories', MISSING)
+    if value_ is MISSING:
+        _categories = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _categories = value_
+    value_ = get('ids', MISSING)
+    if value_ is MISSING:
+        _ids = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _ids = value_
+    value_ = get('include_deleted', MISSING)
+    if value_ is MISSING:
+        _include_deleted = False
+    else:
+        if type(value_) is not bool:
+            raise Invalid
+        _include_deleted = value_
+    value_ = get('page', MISSING)
+    if value_ is MISSING:
+        _page = 0
+    else:
+        if type(value_) is not int or value_ < 0:
+            raise Invalid
+        _page = value_
+    value_ = get('per_page', MISSING)
+    if value_ is MISSING:
+        _per_page = 50
+    else:
+        if type(value_) is not int or value_ < 10 or value_ > 500:
+            raise Invalid
+        _per_page = value_
+    value_ = get('search', MISSING)
+    if value_ is MISSING:
+        _search = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _search = value_
+    value_ = get('since', MISSING)
+    if value_ is MISSING:
+        _since = MISSING
+    else:
+        if type(value_) is not str or not is_format('date-time', value_):
+            raise Invalid
+        _since = value_
+    value_ = get('type', MISSING)
+    if value_ is MISSING:
+        _type = MISSING
+    else:
+        if type(value_) is not str or value_ not in _ENUM_11:
+            raise Invalid
+        _type = value_
+    value_ = get('used_with_categories', MISSING)
+    if value_ is MISSING:
+        _used_with_categories = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _used_with_categories = value_
+    value_ = get('used_with_tags', MISSING)
+    if value_ is MISSING:
+        _used_with_tags = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _used_with_tags = value_
+    value_ = get('used_with_tags_min', MISSING)
+    if value_ is MISSING:
+        _used_with_tags_min = 1
+    else:
+        if type(value_) is not int or value_ < 1:
+            raise Invalid
+        _used_with_tags_min = value_
+    properties = {'categories': _categories, 'ids': _ids, 'include_deleted': _include_deleted, 'page': _page, 'per_page': _per_page, 'search': _search, 'since': _since, 'type': _type, 'used_with_categories': _used_with_categories, 'used_with_tags': _used_with_tags, 'used_with_tags_min': _used_with_tags_min}
+    model = new(models.TagsListArgument)
+    model._dict = properties
+    model.categories = _categories
+    model.ids = _ids
+    model.include_deleted = _include_deleted
+    model.page = _page
+    model.per_page = _per_page
+    model.search = _search
+    model.since = _since
+    model.type = _type
+    model.used_with_categories = _used_with_categories
+    model.used_with_tags = _used_with_tags
+    model.used_with_tags_min = _used_with_tags_min
+    if not _SOURCES_37.issuperset(value):
+        additional(properties, value, _SOURCES_37, _SOURCES_37)
+    return model
+
+
+def decode_TagsMergeArgument(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('account', MISSING)
+    if value_ is MISSING:
+        _account = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _account = value_
+    value_ = get('category', MISSING)
+    if value_ is MISSING:
+        _category = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _category = value_
+    value_ = get('tag', MISSING)
+    if value_ is MISSING:
+        _tag = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _tag = value_
+    value_ = get('tags', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not list:
+            raise Invalid
+        _tags = [anything(item) for item in value_]
+    properties = {'account': _account, 'category': _category, 'tag': _tag, 'tags': _tags}
+    model = new(models.TagsMergeArgument)
+    model._dict = properties
+    model.account = _account
+    model.category = _category
+    model.tag = _tag
+    model.tags = _tags
+    if not _SOURCES_38.issuperset(value):
+        additional(properties, value, _SOURCES_38, _SOURCES_38)
+    return model
+
+
+def decode_TagsSumsListArgument(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('accounts', MISSING)
+    if value_ is MISSING:
+        _accounts = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _accounts = value_
+    value_ = get('categories', MISSING)
+    if value_ is MISSING:
+        _categories = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _categories = value_
+    value_ = get('currency', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str or not _PATTERN_14.search(value_):
+            raise Invalid
+        _currency = value_
+    value_ = get('from', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str or not is_format('date', value_):
+            raise Invalid
+        _from_ = value_
+    value_ = get('locations', MISSING)
+    if value_ is MISSING:
+        _locations = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _locations = value_
+    value_ = get('page', MISSING)
+    if value_ is MISSING:
+        _page = 0
+    else:
+        if type(value_) is not int or value_ < 0:
+            raise Invalid
+        _page = value_
+    value_ = get('per_page', MISSING)
+    if value_ is MISSING:
+        _per_page = 200
+    else:
+        if type(value_) is not int or value_ < 10 or value_ > 500:
+            raise Invalid
+        _per_page = value_
+    value_ = get('search', MISSING)
+    if value_ is MISSING:
+        _search = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _search = value_
+    value_ = get('since', MISSING)
+    if value_ is MISSING:
+        _since = MISSING
+    else:
+        if type(value_) is not str or not is_format('date-time', value_):
+            raise Invalid
+        _since = value_
+    value_ = get('tags', MISSING)
+    if value_ is MISSING:
+        _tags = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _tags = value_
+    value_ = get('to', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str or not is_format('date', value_):
+            raise Invalid
+        _to = value_
+    value_ = get('type', MISSING)
+    if value_ is MISSING:
+        _type = MISSING
+    else:
+        if type(value_) is not str or value_ not in _ENUM_11:
+            raise Invalid
+        _type = value_
+    value_ = get('!categories', MISSING)
+    if value_ is MISSING:
+        _not_categories = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _not_categories = value_
+    value_ = get('!locations', MISSING)
+    if value_ is MISSING:
+        _not_locations = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _not_locations = value_
+    value_ = get('!tags', MISSING)
+    if value_ is MISSING:
+        _not_tags = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _not_tags = value_
+    properties = {'accounts': _accounts, 'categories': _categories, 'currency': _currency, 'from_': _from_, 'locations': _locations, 'page': _page, 'per_page': _per_page, 'search': _search, 'since': _since, 'tags': _tags, 'to': _to, 'type': _type, 'not_categories': _not_categories, 'not_locations': _not_locations, 'not_tags': _not_tags}
+    model = new(models.TagsSumsListArgument)
+    model._dict = properties
+    model.accounts = _accounts
+    model.categories = _categories
+    model.currency = _currency
+    model.from_ = _from_
+    model.locations = _locations
+    model.page = _page
+    model.per_page = _per_page
+    model.search = _search
+    model.since = _since
+    model.tags = _tags
+    model.to = _to
+    model.type = _type
+    model.not_categories = _not_categories
+    model.not_locations = _not_locations
+    model.not_tags = _not_tags
+    if not _SOURCES_39.issuperset(value):
+        additional(properties, value, _SOURCES_39, _NAMES_40)
+    return model
+
+
+def decode_TagsDeleteArgument(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('id', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _id = value_
+    properties = {'id': _id}
+    model = new(models.TagsDeleteArgument)
+    model._dict = properties
+    model.id = _id
+    if not _SOURCES_4.issuperset(value):
+        additional(properties, value, _SOURCES_4, _SOURCES_4)
+    return model
+
+
+def decode_TagsGetArgument(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('id', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _id = value_
+    properties = {'id': _id}
+    model = new(models.TagsGetArgument)
+    model._dict = properties
+    model.id = _id
+    if not _SOURCES_4.issuperset(value):
+        additional(properties, value, _SOURCES_4, _SOURCES_4)
+    return model
+
+
+def decode_Currency(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('code', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str or not _PATTERN_14.search(value_):
+            raise Invalid
+        _code = value_
+    value_ = get('fixed', MISSING)
+    if value_ is MISSING:
+        _fixed = 'false'
+    else:
+        if type(value_) is not bool:
+            raise Invalid
+        _fixed = value_
+    value_ = get('main_rate', MISSING)
+    if value_ is MISSING:
+        _main_rate = MISSING
+    else:
+        if type(value_) is not float and type(value_) is not int:
+            raise Invalid
+        _main_rate = float(value_)
+    value_ = get('rate', MISSING)
+    if value_ is MISSING:
+        _rate = MISSING
+    else:
+        if type(value_) is not float and type(value_) is not int or value_ <= 0:
+            raise Invalid
+        _rate = float(value_)
+    properties = {'code': _code, 'fixed': _fixed, 'main_rate': _main_rate, 'rate': _rate}
+    model = new(models.Currency)
+    model._dict = properties
+    model.code = _code
+    model.fixed = _fixed
+    model.main_rate = _main_rate
+    model.rate = _rate
+    if not _SOURCES_41.issuperset(value):
+        additional(properties, value, _SOURCES_41, _SOURCES_41)
+    return model
+
+
+def decode_Extra(value):
+    if type(value) is not dict:
+        raise Invalid
+    properties = {}
+    model = new(models.Extra)
+    model._dict = properties
+    if not _SOURCES_42.issuperset(value):
+        additional(properties, value, _SOURCES_42, _SOURCES_42)
+    return model
+
+
+def decode_BudgetsUpdateArgument(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('accounts', MISSING)
+    if value_ is MISSING:
+        _accounts = MISSING
+    else:
+        if type(value_) is not list:
+            raise Invalid
+        _accounts = [anything(item) for item in value_]
+    value_ = get('categories', MISSING)
+    if value_ is MISSING:
+        _categories = MISSING
+    else:
+        if type(value_) is not list:
+            raise Invalid
+        _categories = [anything(item) for item in value_]
+    value_ = get('currency', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        _currency = decode_Currency(value_)
+    value_ = get('delta', MISSING)
+    if value_ is MISSING:
+        _delta = MISSING
+    else:
+        if type(value_) is not float and type(value_) is not int:
+            raise Invalid
+        _delta = float(value_)
+    value_ = get('extra', MISSING)
+    if value_ is MISSING:
+        _extra = MISSING
+    else:
+        _extra = decode_Extra(value_)
+    value_ = get('id', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _id = value_
+    value_ = get('limit', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not float and type(value_) is not int or value_ <= -1000000000000000 or value_ >= 1000000000000000:
+            raise Invalid
+        _limit = float(value_)
+    value_ = get('modified', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _modified = value_
+    value_ = get('name', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str or len(value_) > 255:
+            raise Invalid
+        _name = value_
+    value_ = get('percent', MISSING)
+    if value_ is MISSING:
+        _percent = MISSING
+    else:
+        if type(value_) is not float and type(value_) is not int or value_ <= 0:
+            raise Invalid
+        _percent = float(value_)
+    value_ = get('rollover', MISSING)
+    if value_ is MISSING:
+        _rollover = False
+    else:
+        if type(value_) is not bool:
+            raise Invalid
+        _rollover = value_
+    value_ = get('rollover_amount', MISSING)
+    if value_ is MISSING:
+        _rollover_amount = 0.0
+    else:
+        if type(value_) is not float and type(value_) is not int or value_ <= -1000000000000000 or value_ >= 1000000000000000:
+            raise Invalid
+        _rollover_amount = float(value_)
+    value_ = get('rollover_override', MISSING)
+    if value_ is MISSING:
+        _rollover_override = False
+    else:
+        if type(value_) is not bool:
+            raise Invalid
+        _rollover_override = value_
+    value_ = get('tags', MISSING)
+    if value_ is MISSING:
+        _tags = MISSING
+    else:
+        if type(value_) is not list:
+            raise Invalid
+        _tags = [anything(item) for item in value_]
+    value_ = get('type', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str or value_ not in _ENUM_44:
+            raise Invalid
+        _type = value_
+    value_ = get('start', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        _start = _PROPERTY_45(value_)
+    value_ = get('period', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        _period = _PROPERTY_46(value_)
+    value_ = get('frequency', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        _frequency = _PROPERTY_47(value_)
+    value_ = get('!accounts', MISSING)
+    if value_ is MISSING:
+        _not_accounts = MISSING
+    else:
+        if type(value_) is not list:
+            raise Invalid
+        _not_accounts = [anything(item) for item in value_]
+    value_ = get('!categories', MISSING)
+    if value_ is MISSING:
+        _not_categories = MISSING
+    else:
+        if type(value_) is not list:
+            raise Invalid
+        _not_categories = [anything(item) for item in value_]
+    value_ = get('!tags', MISSING)
+    if value_ is MISSING:
+        _not_tags = MISSING
+    else:
+        if type(value_) is not list:
+            raise Invalid
+        _not_tags = [anything(item) for item in value_]
+    properties = {'accounts': _accounts, 'categories': _categories, 'currency': _currency, 'delta': _delta, 'extra': _extra, 'id': _id, 'limit': _limit, 'modified': _modified, 'name': _name, 'percent': _percent, 'rollover': _rollover, 'rollover_amount': _rollover_amount, 'rollover_override': _rollover_override, 'tags': _tags, 'type': _type, 'start': _start, 'period': _period, 'frequency': _frequency, 'not_accounts': _not_accounts, 'not_categories': _not_categories, 'not_tags': _not_tags}
+    model = new(models.BudgetsUpdateArgument)
+    model._dict = properties
+    model.accounts = _accounts
+    model.categories = _categories
+    model.currency = _currency
+    model.delta = _delta
+    model.extra = _extra
+    model.id = _id
+    model.limit = _limit
+    model.modified = _modified
+    model.name = _name
+    model.percent = _percent
+    model.rollover = _rollover
+    model.rollover_amount = _rollover_amount
+    model.rollover_override = _rollover_override
+    model.tags = _tags
+    model.type = _type
+    model.start = _start
+    model.period = _period
+    model.frequency = _frequency
+    model.not_accounts = _not_accounts
+    model.not_categories = _not_categories
+    model.not_tags = _not_tags
+    if not _SOURCES_43.issuperset(value):
+        additional(properties, value, _SOURCES_43, _NAMES_48)
+    return model
+
+
+def decode_CategoriesCreateArgument(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('extra', MISSING)
+    if value_ is MISSING:
+        _extra = MISSING
+    else:
+        _extra = decode_Extra(value_)
+    value_ = get('name', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str or len(value_) < 1 or len(value_) > 255:
+            raise Invalid
+        _name = value_
+    value_ = get('type', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str or value_ not in _ENUM_11:
+            raise Invalid
+        _type = value_
+    properties = {'extra': _extra, 'name': _name, 'type': _type}
+    model = new(models.CategoriesCreateArgument)
+    model._dict = properties
+    model.extra = _extra
+    model.name = _name
+    model.type = _type
+    if not _SOURCES_49.issuperset(value):
+        additional(properties, value, _SOURCES_49, _SOURCES_49)
+    return model
+
+
+def decode_CategoriesUpdateArgument(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('extra', MISSING)
+    if value_ is MISSING:
+        _extra = MISSING
+    else:
+        _extra = decode_Extra(value_)
+    value_ = get('id', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _id = value_
+    value_ = get('modified', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _modified = value_
+    value_ = get('name', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str or len(value_) < 1 or len(value_) > 255:
+            raise Invalid
+        _name = value_
+    value_ = get('name_override', MISSING)
+    if value_ is MISSING:
+        _name_override = False
+    else:
+        if type(value_) is not bool:
+            raise Invalid
+        _name_override = value_
+    value_ = get('type', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str or value_ not in _ENUM_11:
+            raise Invalid
+        _type = value_
+    properties = {'extra': _extra, 'id': _id, 'modified': _modified, 'name': _name, 'name_override': _name_override, 'type': _type}
+    model = new(models.CategoriesUpdateArgument)
+    model._dict = properties
+    model.extra = _extra
+    model.id = _id
+    model.modified = _modified
+    model.name = _name
+    model.name_override = _name_override
+    model.type = _type
+    if not _SOURCES_50.issuperset(value):
+        additional(properties, value, _SOURCES_50, _SOURCES_50)
+    return model
+
+
+def decode_TagsCreateArgument(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('category', MISSING)
+    if value_ is MISSING:
+        _category = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _category = value_
+    value_ = get('extra', MISSING)
+    if value_ is MISSING:
+        _extra = MISSING
+    else:
+        _extra = decode_Extra(value_)
+    value_ = get('name', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str or len(value_) < 1 or len(value_) > 255:
+            raise Invalid
+        _name = value_
+    value_ = get('type', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str or value_ not in _ENUM_11:
+            raise Invalid
+        _type = value_
+    properties = {'category': _category, 'extra': _extra, 'name': _name, 'type': _type}
+    model = new(models.TagsCreateArgument)
+    model._dict = properties
+    model.category = _category
+    model.extra = _extra
+    model.name = _name
+    model.type = _type
+    if not _SOURCES_51.issuperset(value):
+        additional(properties, value, _SOURCES_51, _SOURCES_51)
+    return model
+
+
+def decode_TagsUpdateArgument(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('category', MISSING)
+    if value_ is MISSING:
+        _category = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _category = value_
+    value_ = get('extra', MISSING)
+    if value_ is MISSING:
+        _extra = MISSING
+    else:
+        _extra = decode_Extra(value_)
+    value_ = get('id', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _id = value_
+    value_ = get('modified', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _modified = value_
+    value_ = get('name', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str or len(value_) < 1 or len(value_) > 255:
+            raise Invalid
+        _name = value_
+    value_ = get('name_override', MISSING)
+    if value_ is MISSING:
+        _name_override = False
+    else:
+        if type(value_) is not bool:
+            raise Invalid
+        _name_override = value_
+    value_ = get('type', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str or value_ not in _ENUM_11:
+            raise Invalid
+        _type = value_
+    properties = {'category': _category, 'extra': _extra, 'id': _id, 'modified': _modified, 'name': _name, 'name_override': _name_override, 'type': _type}
+    model = new(models.TagsUpdateArgument)
+    model._dict = properties
+    model.category = _category
+    model.extra = _extra
+    model.id = _id
+    model.modified = _modified
+    model.name = _name
+    model.name_override = _name_override
+    model.type = _type
+    if not _SOURCES_52.issuperset(value):
+        additional(properties, value, _SOURCES_52, _SOURCES_52)
+    return model
+
+
+def decode_SavingsGoal(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('amount', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not float and type(value_) is not int or value_ <= 0 or value_ >= 1000000000000000:
+            raise Invalid
+        _amount = float(value_)
+    value_ = get('end', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str or not is_format('date', value_):
+            raise Invalid
+        _end = value_
+    value_ = get('start', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str or not is_format('date', value_):
+            raise Invalid
+        _start = value_
+    properties = {'amount': _amount, 'end': _end, 'start': _start}
+    model = new(models.SavingsGoal)
+    model._dict = properties
+    model.amount = _amount
+    model.end = _end
+    model.start = _start
+    if not _SOURCES_53.issuperset(value):
+        additional(properties, value, _SOURCES_53, _SOURCES_53)
+    return model
+
+
+def decode_AccountsCreateArgument(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('currency', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        _currency = decode_Currency(value_)
+    value_ = get('extra', MISSING)
+    if value_ is MISSING:
+        _extra = MISSING
+    else:
+        _extra = decode_Extra(value_)
+    value_ = get('goal', MISSING)
+    if value_ is MISSING:
+        _goal = MISSING
+    else:
+        _goal = decode_SavingsGoal(value_)
+    value_ = get('initial_balance', MISSING)
+    if value_ is MISSING:
+        _initial_balance = 0.0
+    else:
+        if type(value_) is not float and type(value_) is not int or value_ <= -1000000000000000 or value_ >= 1000000000000000:
+            raise Invalid
+        _initial_balance = float(value_)
+    value_ = get('name', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str or len(value_) > 255:
+            raise Invalid
+        _name = value_
+    value_ = get('parent', MISSING)
+    if value_ is MISSING:
+        _parent = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _parent = value_
+    value_ = get('type', MISSING)
+    if value_ is MISSING:
+        _type = MISSING
+    else:
+        if type(value_) is not str or value_ not in _ENUM_55:
+            raise Invalid
+        _type = value_
+    properties = {'currency': _currency, 'extra': _extra, 'goal': _goal, 'initial_balance': _initial_balance, 'name': _name, 'parent': _parent, 'type': _type}
+    model = new(models.AccountsCreateArgument)
+    model._dict = properties
+    model.currency = _currency
+    model.extra = _extra
+    model.goal = _goal
+    model.initial_balance = _initial_balance
+    model.name = _name
+    model.parent = _parent
+    model.type = _type
+    if not _SOURCES_54.issuperset(value):
+        additional(properties, value, _SOURCES_54, _SOURCES_54)
+    return model
+
+
+def decode_AccountsUpdateArgument(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('currency', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        _currency = decode_Currency(value_)
+    value_ = get('extra', MISSING)
+    if value_ is MISSING:
+        _extra = MISSING
+    else:
+        _extra = decode_Extra(value_)
+    value_ = get('goal', MISSING)
+    if value_ is MISSING:
+        _goal = MISSING
+    else:
+        _goal = decode_SavingsGoal(value_)
+    value_ = get('id', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _id = value_
+    value_ = get('initial_balance', MISSING)
+    if value_ is MISSING:
+        _initial_balance = 0.0
+    else:
+        if type(value_) is not float and type(value_) is not int or value_ <= -1000000000000000 or value_ >= 1000000000000000:
+            raise Invalid
+        _initial_balance = float(value_)
+    value_ = get('modified', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _modified = value_
+    value_ = get('name', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str or len(value_) > 255:
+            raise Invalid
+        _name = value_
+    value_ = get('name_override', MISSING)
+    if value_ is MISSING:
+        _name_override = False
+    else:
+        if type(value_) is not bool:
+            raise Invalid
+        _name_override = value_
+    value_ = get('parent', MISSING)
+    if value_ is MISSING:
+        _parent = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _parent = value_
+    value_ = get('type', MISSING)
+    if value_ is MISSING:
+        _type = MISSING
+    else:
+        if type(value_) is not str or value_ not in _ENUM_55:
+            raise Invalid
+        _type = value_
+    properties = {'currency': _currency, 'extra': _extra, 'goal': _goal, 'id': _id, 'initial_balance': _initial_balance, 'modified': _modified, 'name': _name, 'name_override': _name_override, 'parent': _parent, 'type': _type}
+    model = new(models.AccountsUpdateArgument)
+    model._dict = properties
+    model.currency = _currency
+    model.extra = _extra
+    model.goal = _goal
+    model.id = _id
+    model.initial_balance = _initial_balance
+    model.modified = _modified
+    model.name = _name
+    model.name_override = _name_override
+    model.parent = _parent
+    model.type = _type
+    if not _SOURCES_56.issuperset(value):
+        additional(properties, value, _SOURCES_56, _SOURCES_56)
+    return model
+
+
+def decode_Recurrence(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('byday', MISSING)
+    if value_ is MISSING:
+        _byday = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _byday = value_
+    value_ = get('bymonthday', MISSING)
+    if value_ is MISSING:
+        _bymonthday = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _bymonthday = value_
+    value_ = get('bysetpos', MISSING)
+    if value_ is MISSING:
+        _bysetpos = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _bysetpos = value_
+    value_ = get('end', MISSING)
+    if value_ is MISSING:
+        _end = MISSING
+    else:
+        if type(value_) is not str or not is_format('date', value_):
+            raise Invalid
+        _end = value_
+    value_ = get('frequency', MISSING)
+    if value_ is MISSING:
+        _frequency = MISSING
+    else:
+        if type(value_) is not str or value_ not in _ENUM_58:
+            raise Invalid
+        _frequency = value_
+    value_ = get('interval', MISSING)
+    if value_ is MISSING:
+        _interval = MISSING
+    else:
+        if type(value_) is not int or value_ < 1 or value_ > 127:
+            raise Invalid
+        _interval = value_
+    value_ = get('start', MISSING)
+    if value_ is MISSING:
+        _start = MISSING
+    else:
+        if type(value_) is not str or not is_format('date', value_):
+            raise Invalid
+        _start = value_
+    properties = {'byday': _byday, 'bymonthday': _bymonthday, 'bysetpos': _bysetpos, 'end': _end, 'frequency': _frequency, 'interval': _interval, 'start': _start}
+    model = new(models.Recurrence)
+    model._dict = properties
+    model.byday = _byday
+    model.bymonthday = _bymonthday
+    model.bysetpos = _bysetpos
+    model.end = _end
+    model.frequency = _frequency
+    model.interval = _interval
+    model.start = _start
+    if not _SOURCES_57.issuperset(value):
+        additional(properties, value, _SOURCES_57, _SOURCES_57)
+    return model
+
+
+def decode_BudgetsCreateArgument(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('accounts', MISSING)
+    if value_ is MISSING:
+        _accounts = MISSING
+    else:
+        if type(value_) is not list:
+            raise Invalid
+        _accounts = [anything(item) for item in value_]
+    value_ = get('categories', MISSING)
+    if value_ is MISSING:
+        _categories = MISSING
+    else:
+        if type(value_) is not list:
+            raise Invalid
+        _categories = [anything(item) for item in value_]
+    value_ = get('currency', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        _currency = decode_Currency(value_)
+    value_ = get('delta', MISSING)
+    if value_ is MISSING:
+        _delta = MISSING
+    else:
+        if type(value_) is not float and type(value_) is not int:
+            raise Invalid
+        _delta = float(value_)
+    value_ = get('extra', MISSING)
+    if value_ is MISSING:
+        _extra = MISSING
+    else:
+        _extra = decode_Extra(value_)
+    value_ = get('limit', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not float and type(value_) is not int or value_ <= -1000000000000000 or value_ >= 1000000000000000:
+            raise Invalid
+        _limit = float(value_)
+    value_ = get('name', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str or len(value_) > 255:
+            raise Invalid
+        _name = value_
+    value_ = get('percent', MISSING)
+    if value_ is MISSING:
+        _percent = MISSING
+    else:
+        if type(value_) is not float and type(value_) is not int or value_ <= 0:
+            raise Invalid
+        _percent = float(value_)
+    value_ = get('recurrence', MISSING)
+    if value_ is MISSING:
+        _recurrence = MISSING
+    else:
+        _recurrence = decode_Recurrence(value_)
+    value_ = get('rollover', MISSING)
+    if value_ is MISSING:
+        _rollover = False
+    else:
+        if type(value_) is not bool:
+            raise Invalid
+        _rollover = value_
+    value_ = get('rollover_amount', MISSING)
+    if value_ is MISSING:
+        _rollover_amount = 0.0
+    else:
+        if type(value_) is not float and type(value_) is not int or value_ <= -1000000000000000 or value_ >= 1000000000000000:
+            raise Invalid
+        _rollover_amount = float(value_)
+    value_ = get('rollover_override', MISSING)
+    if value_ is MISSING:
+        _rollover_override = False
+    else:
+        if type(value_) is not bool:
+            raise Invalid
+        _rollover_override = value_
+    value_ = get('tags', MISSING)
+    if value_ is MISSING:
+        _tags = MISSING
+    else:
+        if type(value_) is not list:
+            raise Invalid
+        _tags = [anything(item) for item in value_]
+    value_ = get('type', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str or value_ not in _ENUM_44:
+            raise Invalid
+        _type = value_
+    value_ = get('start', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        _start = _PROPERTY_60(value_)
+    value_ = get('period', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        _period = _PROPERTY_61(value_)
+    value_ = get('frequency', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        _frequency = _PROPERTY_62(value_)
+    value_ = get('!accounts', MISSING)
+    if value_ is MISSING:
+        _not_accounts = MISSING
+    else:
+        if type(value_) is not list:
+            raise Invalid
+        _not_accounts = [anything(item) for item in value_]
+    value_ = get('!categories', MISSING)
+    if value_ is MISSING:
+        _not_categories = MISSING
+    else:
+        if type(value_) is not list:
+            raise Invalid
+        _not_categories = [anything(item) for item in value_]
+    value_ = get('!tags', MISSING)
+    if value_ is MISSING:
+        _not_tags = MISSING
+    else:
+        if type(value_) is not list:
+            raise Invalid
+        _not_tags = [anything(item) for item in value_]
+    properties = {'accounts': _accounts, 'categories': _categories, 'currency': _currency, 'delta': _delta, 'extra': _extra, 'limit': _limit, 'name': _name, 'percent': _percent, 'recurrence': _recurrence, 'rollover': _rollover, 'rollover_amount': _rollover_amount, 'rollover_override': _rollover_override, 'tags': _tags, 'type': _type, 'start': _start, 'period': _period, 'frequency': _frequency, 'not_accounts': _not_accounts, 'not_categories': _not_categories, 'not_tags': _not_tags}
+    model = new(models.BudgetsCreateArgument)
+    model._dict = properties
+    model.accounts = _accounts
+    model.categories = _categories
+    model.currency = _currency
+    model.delta = _delta
+    model.extra = _extra
+    model.limit = _limit
+    model.name = _name
+    model.percent = _percent
+    model.recurrence = _recurrence
+    model.rollover = _rollover
+    model.rollover_amount = _rollover_amount
+    model.rollover_override = _rollover_override
+    model.tags = _tags
+    model.type = _type
+    model.start = _start
+    model.period = _period
+    model.frequency = _frequency
+    model.not_accounts = _not_accounts
+    model.not_categories = _not_categories
+    model.not_tags = _not_tags
+    if not _SOURCES_59.issuperset(value):
+        additional(properties, value, _SOURCES_59, _NAMES_63)
+    return model
+
+
+def decode_EntryImage(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('id', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _id = value_
+    properties = {'id': _id}
+    model = new(models.EntryImage)
+    model._dict = properties
+    model.id = _id
+    if not _SOURCES_4.issuperset(value):
+        additional(properties, value, _SOURCES_4, _SOURCES_4)
+    return model
+
+
+def decode_EntryLocation(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('id', MISSING)
+    if value_ is MISSING:
+        _id = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _id = value_
+    value_ = get('latitude', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not float and type(value_) is not int:
+            raise Invalid
+        _latitude = float(value_)
+    value_ = get('longitude', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not float and type(value_) is not int:
+            raise Invalid
+        _longitude = float(value_)
+    value_ = get('venue_id', MISSING)
+    if value_ is MISSING:
+        _venue_id = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _venue_id = value_
+    properties = {'id': _id, 'latitude': _latitude, 'longitude': _longitude, 'venue_id': _venue_id}
+    model = new(models.EntryLocation)
+    model._dict = properties
+    model.id = _id
+    model.latitude = _latitude
+    model.longitude = _longitude
+    model.venue_id = _venue_id
+    if not _SOURCES_64.issuperset(value):
+        additional(properties, value, _SOURCES_64, _SOURCES_64)
+    return model
+
+
+def decode_Reminder(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('at', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str or not is_format('time', value_):
+            raise Invalid
+        _at = value_
+    value_ = get('number', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not int or value_ < 0 or value_ > 255:
+            raise Invalid
+        _number = value_
+    value_ = get('period', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str or value_ not in _ENUM_66:
+            raise Invalid
+        _period = value_
+    properties = {'at': _at, 'number': _number, 'period': _period}
+    model = new(models.Reminder)
+    model._dict = properties
+    model.at = _at
+    model.number = _number
+    model.period = _period
+    if not _SOURCES_65.issuperset(value):
+        additional(properties, value, _SOURCES_65, _SOURCES_65)
+    return model
+
+
+def decode_EntryRepeat(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('byday', MISSING)
+    if value_ is MISSING:
+        _byday = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _byday = value_
+    value_ = get('bymonthday', MISSING)
+    if value_ is MISSING:
+        _bymonthday = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _bymonthday = value_
+    value_ = get('bysetpos', MISSING)
+    if value_ is MISSING:
+        _bysetpos = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _bysetpos = value_
+    value_ = get('count', MISSING)
+    if value_ is MISSING:
+        _count = MISSING
+    else:
+        if type(value_) is not int or value_ < 1:
+            raise Invalid
+        _count = value_
+    value_ = get('end', MISSING)
+    if value_ is MISSING:
+        _end = MISSING
+    else:
+        if type(value_) is not str or not is_format('date', value_):
+            raise Invalid
+        _end = value_
+    value_ = get('frequency', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str or value_ not in _ENUM_68:
+            raise Invalid
+        _frequency = value_
+    value_ = get('id', MISSING)
+    if value_ is MISSING:
+        _id = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _id = value_
+    value_ = get('interval', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not int or value_ < 1 or value_ > 127:
+            raise Invalid
+        _interval = value_
+    value_ = get('iteration', MISSING)
+    if value_ is MISSING:
+        _iteration = MISSING
+    else:
+        if type(value_) is not float and type(value_) is not int or value_ < 0:
+            raise Invalid
+        _iteration = float(value_)
+    value_ = get('start', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str or not is_format('date', value_):
+            raise Invalid
+        _start = value_
+    properties = {'byday': _byday, 'bymonthday': _bymonthday, 'bysetpos': _bysetpos, 'count': _count, 'end': _end, 'frequency': _frequency, 'id': _id, 'interval': _interval, 'iteration': _iteration, 'start': _start}
+    model = new(models.EntryRepeat)
+    model._dict = properties
+    model.byday = _byday
+    model.bymonthday = _bymonthday
+    model.bysetpos = _bysetpos
+    model.count = _count
+    model.end = _end
+    model.frequency = _frequency
+    model.id = _id
+    model.interval = _interval
+    model.iteration = _iteration
+    model.start = _start
+    if not _SOURCES_67.issuperset(value):
+        additional(properties, value, _SOURCES_67, _SOURCES_67)
+    return model
+
+
+def decode_EntrySplit(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('parent', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _parent = value_
+    properties = {'parent': _parent}
+    model = new(models.EntrySplit)
+    model._dict = properties
+    model.parent = _parent
+    if not _SOURCES_69.issuperset(value):
+        additional(properties, value, _SOURCES_69, _SOURCES_69)
+    return model
+
+
+def decode_EntryTransaction(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('account', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _account = value_
+    value_ = get('currency', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        _currency = decode_Currency(value_)
+    value_ = get('id', MISSING)
+    if value_ is MISSING:
+        _id = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _id = value_
+    properties = {'account': _account, 'currency': _currency, 'id': _id}
+    model = new(models.EntryTransaction)
+    model._dict = properties
+    model.account = _account
+    model.currency = _currency
+    model.id = _id
+    if not _SOURCES_70.issuperset(value):
+        additional(properties, value, _SOURCES_70, _SOURCES_70)
+    return model
+
+
+def decode_EntriesCreateArgument(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('account', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _account = value_
+    value_ = get('amount', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not float and type(value_) is not int or value_ <= -1000000000000000 or value_ >= 1000000000000000:
+            raise Invalid
+        _amount = float(value_)
+    value_ = get('category', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _category = value_
+    value_ = get('completed', MISSING)
+    if value_ is MISSING:
+        _completed = False
+    else:
+        if type(value_) is not bool:
+            raise Invalid
+        _completed = value_
+    value_ = get('currency', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        _currency = decode_Currency(value_)
+    value_ = get('date', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str or not is_format('date', value_):
+            raise Invalid
+        _date = value_
+    value_ = get('desc', MISSING)
+    if value_ is MISSING:
+        _desc = MISSING
+    else:
+        if type(value_) is not str or len(value_) > 255:
+            raise Invalid
+        _desc = value_
+    value_ = get('extra', MISSING)
+    if value_ is MISSING:
+        _extra = MISSING
+    else:
+        _extra = decode_Extra(value_)
+    value_ = get('images', MISSING)
+    if value_ is MISSING:
+        _images = MISSING
+    else:
+        if type(value_) is not list or len(value_) > 4:
+            raise Invalid
+        _images = [decode_EntryImage(item) for item in value_]
+    value_ = get('location', MISSING)
+    if value_ is MISSING:
+        _location = MISSING
+    else:
+        _location = decode_EntryLocation(value_)
+    value_ = get('reminders', MISSING)
+    if value_ is MISSING:
+        _reminders = MISSING
+    else:
+        if type(value_) is not list or len(value_) > 5:
+            raise Invalid
+        _reminders = [decode_Reminder(item) for item in value_]
+    value_ = get('repeat', MISSING)
+    if value_ is MISSING:
+        _repeat = MISSING
+    else:
+        _repeat = decode_EntryRepeat(value_)
+    value_ = get('split', MISSING)
+    if value_ is MISSING:
+        _split = MISSING
+    else:
+        _split = decode_EntrySplit(value_)
+    value_ = get('tags', MISSING)
+    if value_ is MISSING:
+        _tags = MISSING
+    else:
+        if type(value_) is not list:
+            raise Invalid
+        _tags = [anything(item) for item in value_]
+    value_ = get('transaction', MISSING)
+    if value_ is MISSING:
+        _transaction = MISSING
+    else:
+        _transaction = decode_EntryTransaction(value_)
+    properties = {'account': _account, 'amount': _amount, 'category': _category, 'completed': _completed, 'currency': _currency, 'date': _date, 'desc': _desc, 'extra': _extra, 'images': _images, 'location': _location, 'reminders': _reminders, 'repeat': _repeat, 'split': _split, 'tags': _tags, 'transaction': _transaction}
+    model = new(models.EntriesCreateArgument)
+    model._dict = properties
+    model.account = _account
+    model.amount = _amount
+    model.category = _category
+    model.completed = _completed
+    model.currency = _currency
+    model.date = _date
+    model.desc = _desc
+    model.extra = _extra
+    model.images = _images
+    model.location = _location
+    model.reminders = _reminders
+    model.repeat = _repeat
+    model.split = _split
+    model.tags = _tags
+    model.transaction = _transaction
+    if not _SOURCES_71.issuperset(value):
+        additional(properties, value, _SOURCES_71, _SOURCES_71)
+    return model
+
+
+def decode_EntriesUpdateArgument(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('account', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _account = value_
+    value_ = get('amount', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not float and type(value_) is not int or value_ <= -1000000000000000 or value_ >= 1000000000000000:
+            raise Invalid
+        _amount = float(value_)
+    value_ = get('category', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _category = value_
+    value_ = get('completed', MISSING)
+    if value_ is MISSING:
+        _completed = False
+    else:
+        if type(value_) is not bool:
+            raise Invalid
+        _completed = value_
+    value_ = get('currency', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        _currency = decode_Currency(value_)
+    value_ = get('date', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str or not is_format('date', value_):
+            raise Invalid
+        _date = value_
+    value_ = get('desc', MISSING)
+    if value_ is MISSING:
+        _desc = MISSING
+    else:
+        if type(value_) is not str or len(value_) > 255:
+            raise Invalid
+        _desc = value_
+    value_ = get('extra', MISSING)
+    if value_ is MISSING:
+        _extra = MISSING
+    else:
+        _extra = decode_Extra(value_)
+    value_ = get('id', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _id = value_
+    value_ = get('images', MISSING)
+    if value_ is MISSING:
+        _images = MISSING
+    else:
+        if type(value_) is not list or len(value_) > 4:
+            raise Invalid
+        _images = [decode_EntryImage(item) for item in value_]
+    value_ = get('location', MISSING)
+    if value_ is MISSING:
+        _location = MISSING
+    else:
+        _location = decode_EntryLocation(value_)
+    value_ = get('modified', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _modified = value_
+    value_ = get('reminders', MISSING)
+    if value_ is MISSING:
+        _reminders = MISSING
+    else:
+        if type(value_) is not list or len(value_) > 5:
+            raise Invalid
+        _reminders = [decode_Reminder(item) for item in value_]
+    value_ = get('repeat', MISSING)
+    if value_ is MISSING:
+        _repeat = MISSING
+    else:
+        _repeat = decode_EntryRepeat(value_)
+    value_ = get('tags', MISSING)
+    if value_ is MISSING:
+        _tags = MISSING
+    else:
+        if type(value_) is not list:
+            raise Invalid
+        _tags = [anything(item) for item in value_]
+    value_ = get('transaction', MISSING)
+    if value_ is MISSING:
+        _transaction = MISSING
+    else:
+        _transaction = decode_EntryTransaction(value_)
+    properties = {'account': _account, 'amount': _amount, 'category': _category, 'completed': _completed, 'currency': _currency, 'date': _date, 'desc': _desc, 'extra': _extra, 'id': _id, 'images': _images, 'location': _location, 'modified': _modified, 'reminders': _reminders, 'repeat': _repeat, 'tags': _tags, 'transaction': _transaction}
+    model = new(models.EntriesUpdateArgument)
+    model._dict = properties
+    model.account = _account
+    model.amount = _amount
+    model.category = _category
+    model.completed = _completed
+    model.currency = _currency
+    model.date = _date
+    model.desc = _desc
+    model.extra = _extra
+    model.id = _id
+    model.images = _images
+    model.location = _location
+    model.modified = _modified
+    model.reminders = _reminders
+    model.repeat = _repeat
+    model.tags = _tags
+    model.transaction = _transaction
+    if not _SOURCES_72.issuperset(value):
+        additional(properties, value, _SOURCES_72, _SOURCES_72)
+    return model
+
+
+def decode_Export(value):
+    if type(value) is not dict:
+        raise Invalid
+    properties = {}
+    model = new(models.Export)
+    model._dict = properties
+    if not _SOURCES_42.issuperset(value):
+        additional(properties, value, _SOURCES_42, _SOURCES_42)
+    return model
+
+
+def decode_ExportsCreateArgument(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('filters', MISSING)
+    if value_ is MISSING:
+        _filters = MISSING
+    else:
+        _filters = decode_Export(value_)
+    value_ = get('formats', MISSING)
+    if value_ is MISSING:
+        _formats = MISSING
+    else:
+        _formats = decode_Export(value_)
+    value_ = get('from', MISSING)
+    if value_ is MISSING:
+        _from_ = MISSING
+    else:
+        if type(value_) is not str or not is_format('date', value_):
+            raise Invalid
+        _from_ = value_
+    value_ = get('resources', MISSING)
+    if value_ is MISSING:
+        _resources = MISSING
+    else:
+        _resources = decode_Export(value_)
+    value_ = get('seen', MISSING)
+    if value_ is MISSING:
+        _seen = MISSING
+    else:
+        if type(value_) is not bool:
+            raise Invalid
+        _seen = value_
+    value_ = get('to', MISSING)
+    if value_ is MISSING:
+        _to = MISSING
+    else:
+        if type(value_) is not str or not is_format('date', value_):
+            raise Invalid
+        _to = value_
+    value_ = get('type', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str or value_ not in _ENUM_28:
+            raise Invalid
+        _type = value_
+    properties = {'filters': _filters, 'formats': _formats, 'from_': _from_, 'resources': _resources, 'seen': _seen, 'to': _to, 'type': _type}
+    model = new(models.ExportsCreateArgument)
+    model._dict = properties
+    model.filters = _filters
+    model.formats = _formats
+    model.from_ = _from_
+    model.resources = _resources
+    model.seen = _seen
+    model.to = _to
+    model.type = _type
+    if not _SOURCES_73.issuperset(value):
+        additional(properties, value, _SOURCES_73, _NAMES_74)
+    return model
+
+
+def decode_CustomCurrency(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('code', MISSING)
+    if value_ is MISSING:
+        _code = MISSING
+    else:
+        if type(value_) is not str or not _PATTERN_14.search(value_):
+            raise Invalid
+        _code = value_
+    value_ = get('fixed', MISSING)
+    if value_ is MISSING:
+        _fixed = 'false'
+    else:
+        if type(value_) is not bool:
+            raise Invalid
+        _fixed = value_
+    value_ = get('rate', MISSING)
+    if value_ is MISSING:
+        _rate = MISSING
+    else:
+        if type(value_) is not float and type(value_) is not int or value_ < 0:
+            raise Invalid
+        _rate = float(value_)
+    value_ = get('reference_currency', MISSING)
+    if value_ is MISSING:
+        _reference_currency = MISSING
+    else:
+        if type(value_) is not str or not _PATTERN_14.search(value_):
+            raise Invalid
+        _reference_currency = value_
+    properties = {'code': _code, 'fixed': _fixed, 'rate': _rate, 'reference_currency': _reference_currency}
+    model = new(models.CustomCurrency)
+    model._dict = properties
+    model.code = _code
+    model.fixed = _fixed
+    model.rate = _rate
+    model.reference_currency = _reference_currency
+    if not _SOURCES_75.issuperset(value):
+        additional(properties, value, _SOURCES_75, _SOURCES_75)
+    return model
+
+
+def decode_CurrencySettings(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('custom', MISSING)
+    if value_ is MISSING:
+        _custom = MISSING
+    else:
+        _custom = decode_CustomCurrency(value_)
+    value_ = get('custom_exchange_rate', MISSING)
+    if value_ is MISSING:
+        _custom_exchange_rate = MISSING
+    else:
+        if type(value_) is not float and type(value_) is not int or value_ < 0:
+            raise Invalid
+        _custom_exchange_rate = float(value_)
+    value_ = get('main', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str or not _PATTERN_14.search(value_):
+            raise Invalid
+        _main = value_
+    value_ = get('update', MISSING)
+    if value_ is MISSING:
+        _update = MISSING
+    else:
+        if type(value_) is not str or value_ not in _ENUM_77:
+            raise Invalid
+        _update = value_
+    value_ = get('update_accounts', MISSING)
+    if value_ is MISSING:
+        _update_accounts = MISSING
+    else:
+        if type(value_) is not bool:
+            raise Invalid
+        _update_accounts = value_
+    properties = {'custom': _custom, 'custom_exchange_rate': _custom_exchange_rate, 'main': _main, 'update': _update, 'update_accounts': _update_accounts}
+    model = new(models.CurrencySettings)
+    model._dict = properties
+    model.custom = _custom
+    model.custom_exchange_rate = _custom_exchange_rate
+    model.main = _main
+    model.update = _update
+    model.update_accounts = _update_accounts
+    if not _SOURCES_76.issuperset(value):
+        additional(properties, value, _SOURCES_76, _SOURCES_76)
+    return model
+
+
+def decode_UserMigrationDetails(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('finished', MISSING)
+    if value_ is MISSING:
+        _finished = MISSING
+    else:
+        if type(value_) is not bool:
+            raise Invalid
+        _finished = value_
+    properties = {'finished': _finished}
+    model = new(models.UserMigrationDetails)
+    model._dict = properties
+    model.finished = _finished
+    if not _SOURCES_78.issuperset(value):
+        additional(properties, value, _SOURCES_78, _SOURCES_78)
+    return model
+
+
+def decode_MeUpdateArgument(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('country', MISSING)
+    if value_ is MISSING:
+        _country = MISSING
+    else:
+        if type(value_) is not str or not _PATTERN_80.search(value_):
+            raise Invalid
+        _country = value_
+    value_ = get('currency', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        _currency = decode_CurrencySettings(value_)
+    value_ = get('extra', MISSING)
+    if value_ is MISSING:
+        _extra = MISSING
+    else:
+        _extra = decode_Extra(value_)
+    value_ = get('first_name', MISSING)
+    if value_ is MISSING:
+        _first_name = MISSING
+    else:
+        if type(value_) is not str or len(value_) > 150:
+            raise Invalid
+        _first_name = value_
+    value_ = get('id', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _id = value_
+    value_ = get('last_name', MISSING)
+    if value_ is MISSING:
+        _last_name = MISSING
+    else:
+        if type(value_) is not str or len(value_) > 150:
+            raise Invalid
+        _last_name = value_
+    value_ = get('locale', MISSING)
+    if value_ is MISSING:
+        _locale = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _locale = value_
+    value_ = get('migration', MISSING)
+    if value_ is MISSING:
+        _migration = MISSING
+    else:
+        _migration = decode_UserMigrationDetails(value_)
+    value_ = get('modified', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _modified = value_
+    value_ = get('start_day', MISSING)
+    if value_ is MISSING:
+        _start_day = 1
+    else:
+        if type(value_) is not int or value_ < 1 or value_ > 31:
+            raise Invalid
+        _start_day = value_
+    value_ = get('timezone', MISSING)
+    if value_ is MISSING:
+        _timezone = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _timezone = value_
+    properties = {'country': _country, 'currency': _currency, 'extra': _extra, 'first_name': _first_name, 'id': _id, 'last_name': _last_name, 'locale': _locale, 'migration': _migration, 'modified': _modified, 'start_day': _start_day, 'timezone': _timezone}
+    model = new(models.MeUpdateArgument)
+    model._dict = properties
+    model.country = _country
+    model.currency = _currency
+    model.extra = _extra
+    model.first_name = _first_name
+    model.id = _id
+    model.last_name = _last_name
+    model.locale = _locale
+    model.migration = _migration
+    model.modified = _modified
+    model.start_day = _start_day
+    model.timezone = _timezone
+    if not _SOURCES_79.issuperset(value):
+        additional(properties, value, _SOURCES_79, _SOURCES_79)
+    return model
+
+
+DECODERS = {
+    models.AccountsListArgument: decode_AccountsListArgument,
+    models.AccountsMergeArgument: decode_AccountsMergeArgument,
+    models.AccountsReorderArgument: decode_AccountsReorderArgument,
+    models.AccountsDeleteArgument: decode_AccountsDeleteArgument,
+    models.AccountsGetArgument: decode_AccountsGetArgument,
+    models.AccountsForceDeleteArgument: decode_AccountsForceDeleteArgument,
+    models.AccountsMoveArgument: decode_AccountsMoveArgument,
+    models.BudgetsListArgument: decode_BudgetsListArgument,
+    models.BudgetsReorderArgument: decode_BudgetsReorderArgument,
+    models.BudgetsDeleteArgument: decode_BudgetsDeleteArgument,
+    models.BudgetsGetArgument: decode_BudgetsGetArgument,
+    models.BudgetsHistoryArgument: decode_BudgetsHistoryArgument,
+    models.BudgetsMoveArgument: decode_BudgetsMoveArgument,
+    models.CategoriesListArgument: decode_CategoriesListArgument,
+    models.CategoriesMergeArgument: decode_CategoriesMergeArgument,
+    models.CategoriesSumsListArgument: decode_CategoriesSumsListArgument,
+    models.CategoriesDeleteArgument: decode_CategoriesDeleteArgument,
+    models.CategoriesGetArgument: decode_CategoriesGetArgument,
+    models.CurrenciesListArgument: decode_CurrenciesListArgument,
+    models.EntriesListArgument: decode_EntriesListArgument,
+    models.EntriesLocationsListArgument: decode_EntriesLocationsListArgument,
+    models.EntriesLocationsGetArgument: decode_EntriesLocationsGetArgument,
+    models.EntriesSplitArgument: decode_EntriesSplitArgument,
+    models.EntriesSumsListArgument: decode_EntriesSumsListArgument,
+    models.EntriesDeleteArgument: decode_EntriesDeleteArgument,
+    models.EntriesGetArgument: decode_EntriesGetArgument,
+    models.ExportsListArgument: decode_ExportsListArgument,
+    models.ExportsGetArgument: decode_ExportsGetArgument,
+    models.ExportsUpdateArgument: decode_ExportsUpdateArgument,
+    models.ImagesListArgument: decode_ImagesListArgument,
+    models.ImagesDeleteArgument: decode_ImagesDeleteArgument,
+    models.ImagesGetArgument: decode_ImagesGetArgument,
+    models.MeAdjustCampaignArgument: decode_MeAdjustCampaignArgument,
+    models.MeNotificationsListArgument: decode_MeNotificationsListArgument,
+    models.MeNotificationsDeleteArgument: decode_MeNotificationsDeleteArgument,
+    models.MeNotificationsGetArgument: decode_MeNotificationsGetArgument,
+    models.MePushArgument: decode_MePushArgument,
+    models.MeRevertArgument: decode_MeRevertArgument,
+    models.TagsListArgument: decode_TagsListArgument,
+    models.TagsMergeArgument: decode_TagsMergeArgument,
+    models.TagsSumsListArgument: decode_TagsSumsListArgument,
+    models.TagsDeleteArgument: decode_TagsDeleteArgument,
+    models.TagsGetArgument: decode_TagsGetArgument,
+    models.Currency: decode_Currency,
+    models.Extra: decode_Extra,
+    models.BudgetsUpdateArgument: decode_BudgetsUpdateArgument,
+    models.CategoriesCreateArgument: decode_CategoriesCreateArgument,
+    models.CategoriesUpdateArgument: decode_CategoriesUpdateArgument,
+    models.TagsCreateArgument: decode_TagsCreateArgument,
+    models.TagsUpdateArgument: decode_TagsUpdateArgument,
+    models.SavingsGoal: decode_SavingsGoal,
+    models.AccountsCreateArgument: decode_AccountsCreateArgument,
+    models.AccountsUpdateArgument: decode_AccountsUpdateArgument,
+    models.Recurrence: decode_Recurrence,
+    models.BudgetsCreateArgument: decode_BudgetsCreateArgument,
+    models.EntryImage: decode_EntryImage,
+    models.EntryLocation: decode_EntryLocation,
+    models.Reminder: decode_Reminder,
+    models.EntryRepeat: decode_EntryRepeat,
+    models.EntrySplit: decode_EntrySplit,
+    models.EntryTransaction: decode_EntryTransaction,
+    models.EntriesCreateArgument: decode_EntriesCreateArgument,
+    models.EntriesUpdateArgument: decode_EntriesUpdateArgument,
+    models.Export: decode_Export,
+    models.ExportsCreateArgument: decode_ExportsCreateArgument,
+    models.CustomCurrency: decode_CustomCurrency,
+    models.CurrencySettings: decode_CurrencySettings,
+    models.UserMigrationDetails: decode_UserMigrationDetails,
+    models.MeUpdateArgument: decode_MeUpdateArgument,
+}
+
+# The source key of each keyword argument of the endpoint methods.
+KEYWORDS = {
+    models.AccountsListArgument: {'ids': 'ids', 'include_deleted': 'include_deleted', 'page': 'page', 'per_page': 'per_page', 'since': 'since', 'status': 'status'},
+    models.AccountsMergeArgument: {'account': 'account', 'accounts': 'accounts', 'currency': 'currency', 'sync': 'sync', 'title': 'title'},
+    models.AccountsReorderArgument: {'order': 'order'},
+    models.AccountsDeleteArgument: {'id': 'id'},
+    models.AccountsGetArgument: {'id': 'id'},
+    models.AccountsForceDeleteArgument: {'id': 'id'},
+    models.AccountsMoveArgument: {'position': 'position'},
+    models.BudgetsListArgument: {'accounts': 'accounts', 'categories': 'categories', 'expand': 'expand', 'from_': 'from', 'has_problem': 'has_problem', 'include_deleted': 'include_deleted', 'one_iteration_only': 'one_iteration_only', 'page': 'page', 'parent': 'parent', 'per_page': 'per_page', 'search': 'search', 'since': 'since', 'tags': 'tags', 'to': 'to'},
+    models.BudgetsReorderArgument: {'order': 'order'},
+    models.BudgetsDeleteArgument: {'id': 'id'},
+    models.BudgetsGetArgument: {'id': 'id'},
+    models.BudgetsHistoryArgument: {'from_': 'from', 'id': 'id', 'page': 'page', 'per_page': 'per_page', 'to': 'to'},
+    models.BudgetsMoveArgument: {'position': 'position'},
+    models.CategoriesListArgument: {'ids': 'ids', 'include_deleted': 'include_deleted', 'page': 'page', 'per_page': 'per_page', 'search': 'search', 'since': 'since', 'type': 'type'},
+    models.CategoriesMergeArgument: {'categories': 'categories', 'category': 'category'},
+    models.CategoriesSumsListArgument: {'accounts': 'accounts', 'categories': 'categories', 'currency': 'currency', 'from_': 'from', 'locations': 'locations', 'page': 'page', 'per_page': 'per_page', 'required_tags': 'required_tags', 'search': 'search', 'since': 'since', 'tags': 'tags', 'to': 'to', 'type': 'type', 'not_categories': '!categories', 'not_locations': '!locations', 'not_tags': '!tags'},
+    models.CategoriesDeleteArgument: {'id': 'id'},
+    models.CategoriesGetArgument: {'id': 'id'},
+    models.CurrenciesListArgument: {'currencies': 'currencies', 'since': 'since', 'types': 'types'},
+    models.EntriesListArgument: {'accounts': 'accounts', 'categories': 'categories', 'expand': 'expand', 'from_': 'from', 'include_deleted': 'include_deleted', 'locations': 'locations', 'page': 'page', 'parent': 'parent', 'per_page': 'per_page', 'repeat': 'repeat', 'search': 'search', 'since': 'since', 'tags': 'tags', 'to': 'to', 'type': 'type', 'not_categories': '!categories', 'not_locations': '!locations', 'not_tags': '!tags'},
+    models.EntriesLocationsListArgument: {'accounts': 'accounts', 'categories': 'categories', 'from_': 'from', 'include_unused': 'include_unused', 'latitude': 'latitude', 'longitude': 'longitude', 'near': 'near', 'page': 'page', 'per_page': 'per_page', 'radius': 'radius', 'search': 'search', 'since': 'since', 'tags': 'tags', 'to': 'to', 'type': 'type', 'not_categories': '!categories', 'not_tags': '!tags'},
+    models.EntriesLocationsGetArgument: {'id': 'id'},
+    models.EntriesSplitArgument: {'id': 'id'},
+    models.EntriesSumsListArgument: {'accounts': 'accounts', 'categories': 'categories', 'currency': 'currency', 'from_': 'from', 'locations': 'locations', 'page': 'page', 'per_page': 'per_page', 'range': 'range', 'search': 'search', 'since': 'since', 'tags': 'tags', 'to': 'to', 'type': 'type', 'not_categories': '!categories', 'not_locations': '!locations', 'not_tags': '!tags'},
+    models.EntriesDeleteArgument: {'id': 'id'},
+    models.EntriesGetArgument: {'id': 'id'},
+    models.ExportsListArgument: {'page': 'page', 'per_page': 'per_page', 'status': 'status', 'type': 'type'},
+    models.ExportsGetArgument: {'id': 'id'},
+    models.ExportsUpdateArgument: {'modified': 'modified', 'seen': 'seen'},
+    models.ImagesListArgument: {'include_deleted': 'include_deleted', 'page': 'page', 'per_page': 'per_page', 'since': 'since', 'status': 'status'},
+    models.ImagesDeleteArgument: {'id': 'id'},
+    models.ImagesGetArgument: {'id': 'id'},
+    models.MeAdjustCampaignArgument: {'adgroup': 'adgroup', 'campaign': 'campaign', 'creative': 'creative', 'network': 'network'},
+    models.MeNotificationsListArgument: {'include_deleted': 'include_deleted', 'page': 'page', 'per_page': 'per_page', 'since': 'since'},
+    models.MeNotificationsDeleteArgument: {'id': 'id'},
+    models.MeNotificationsGetArgument: {'id': 'id'},
+    models.MePushArgument: {'token': 'token', 'type': 'type'},
+    models.MeRevertArgument: {'password': 'password'},
+    models.TagsListArgument: {'categories': 'categories', 'ids': 'ids', 'include_deleted': 'include_deleted', 'page': 'page', 'per_page': 'per_page', 'search': 'search', 'since': 'since', 'type': 'type', 'used_with_categories': 'used_with_categories', 'used_with_tags': 'used_with_tags', 'used_with_tags_min': 'used_with_tags_min'},
+    models.TagsMergeArgument: {'account': 'account', 'category': 'category', 'tag': 'tag', 'tags': 'tags'},
+    models.TagsSumsListArgument: {'accounts': 'accounts', 'categories': 'categories', 'currency': 'currency', 'from_': 'from', 'locations': 'locations', 'page': 'page', 'per_page': 'per_page', 'search': 'search', 'since': 'since', 'tags': 'tags', 'to': 'to', 'type': 'type', 'not_categories': '!categories', 'not_locations': '!locations', 'not_tags': '!tags'},
+    models.TagsDeleteArgument: {'id': 'id'},
+    models.TagsGetArgument: {'id': 'id'},
+    models.BudgetsUpdateArgument: {'accounts': 'accounts', 'categories': 'categories', 'currency': 'currency', 'delta': 'delta', 'extra': 'extra', 'id': 'id', 'limit': 'limit', 'modified': 'modified', 'name': 'name', 'percent': 'percent', 'rollover': 'rollover', 'rollover_amount': 'rollover_amount', 'rollover_override': 'rollover_override', 'tags': 'tags', 'type': 'type', 'start': 'start', 'period': 'period', 'frequency': 'frequency', 'not_accounts': '!accounts', 'not_categories': '!categories', 'not_tags': '!tags'},
+    models.CategoriesCreateArgument: {'extra': 'extra', 'name': 'name', 'type': 'type'},
+    models.CategoriesUpdateArgument: {'extra': 'extra', 'id': 'id', 'modified': 'modified', 'name': 'name', 'name_override': 'name_override', 'type': 'type'},
+    models.TagsCreateArgument: {'category': 'category', 'extra': 'extra', 'name': 'name', 'type': 'type'},
+    models.TagsUpdateArgument: {'category': 'category', 'extra': 'extra', 'id': 'id', 'modified': 'modified', 'name': 'name', 'name_override': 'name_override', 'type': 'type'},
+    models.AccountsCreateArgument: {'currency': 'currency', 'extra': 'extra', 'goal': 'goal', 'initial_balance': 'initial_balance', 'name': 'name', 'parent': 'parent', 'type': 'type'},
+    models.AccountsUpdateArgument: {'currency': 'currency', 'extra': 'extra', 'goal': 'goal', 'id': 'id', 'initial_balance': 'initial_balance', 'modified': 'modified', 'name': 'name', 'name_override': 'name_override', 'parent': 'parent', 'type': 'type'},
+    models.BudgetsCreateArgument: {'accounts': 'accounts', 'categories': 'categories', 'currency': 'currency', 'delta': 'delta', 'extra': 'extra', 'limit': 'limit', 'name': 'name', 'percent': 'percent', 'recurrence': 'recurrence', 'rollover': 'rollover', 'rollover_amount': 'rollover_amount', 'rollover_override': 'rollover_override', 'tags': 'tags', 'type': 'type', 'start': 'start', 'period': 'period', 'frequency': 'frequency', 'not_accounts': '!accounts', 'not_categories': '!categories', 'not_tags': '!tags'},
+    models.EntriesCreateArgument: {'account': 'account', 'amount': 'amount', 'category': 'category', 'completed': 'completed', 'currency': 'currency', 'date': 'date', 'desc': 'desc', 'extra': 'extra', 'images': 'images', 'location': 'location', 'reminders': 'reminders', 'repeat': 'repeat', 'split': 'split', 'tags': 'tags', 'transaction': 'transaction'},
+    models.EntriesUpdateArgument: {'account': 'account', 'amount': 'amount', 'category': 'category', 'completed': 'completed', 'currency': 'currency', 'date': 'date', 'desc': 'desc', 'extra': 'extra', 'id': 'id', 'images': 'images', 'location': 'location', 'modified': 'modified', 'reminders': 'reminders', 'repeat': 'repeat', 'tags': 'tags', 'transaction': 'transaction'},
+    models.ExportsCreateArgument: {'filters': 'filters', 'formats': 'formats', 'from_': 'from', 'resources': 'resources', 'seen': 'seen', 'to': 'to', 'type': 'type'},
+    models.MeUpdateArgument: {'country': 'country', 'currency': 'currency', 'extra': 'extra', 'first_name': 'first_name', 'id': 'id', 'last_name': 'last_name', 'locale': 'locale', 'migration': 'migration', 'modified': 'modified', 'start_day': 'start_day', 'timezone': 'timezone'},
+}
@@ -0,0 +1,3425 @@
+"""Specialised decoders for the models in `return_types`.
+
+Generated by `compile_models.py`, do not edit.
+"""
+import re
+
+from .._decode import MISSING, Invalid, additional, anything, is_format, new
+from . import return_types as models
+
+_SOURCES_0 = frozenset(['modified', 'name', 'precision', 'symbol', 'type'])
+_ENUM_1 = frozenset(['commodity', 'crypto', 'deprecated', 'fiat'])
+_SOURCES_2 = frozenset(['deleted', 'filename', 'id', 'path', 'status', 'type'])
+_ENUM_3 = frozenset(['deleting', 'error', 'new', 'uploaded'])
+_SOURCES_4 = frozenset(['action', 'date', 'deleted', 'id', 'modified', 'text', 'type'])
+_ENUM_5 = frozenset(['account', 'add_budget', 'add_entry', 'balance', 'budget', 'connection', 'connections', 'entry', 'export', 'news', 'upgrade'])
+_SOURCES_6 = frozenset(['byday', 'bymonthday', 'bysetpos', 'count', 'end', 'entries', 'frequency', 'id', 'interval', 'iteration', 'start', 'template', 'template_end', 'template_start', 'type'])
+_ENUM_7 = frozenset(['daily', 'monthly', 'weekly', 'yearly'])
+_ENUM_8 = frozenset(['automatic', 'confirm', 'confirmed'])
+_SOURCES_9 = frozenset(['expenses', 'incomes'])
+_SOURCES_10 = frozenset(['byday', 'bymonthday', 'bysetpos'])
+_SOURCES_11 = frozenset(['id', 'logo', 'name', 'status'])
+_ENUM_12 = frozenset(['connected', 'disconnected', 'error', 'inactive'])
+_SOURCES_13 = frozenset(['code', 'fixed', 'main_rate', 'rate'])
+_PATTERN_14 = re.compile('[A-Z_]{2,10}')
+_SOURCES_15 = frozenset([])
+_SOURCES_16 = frozenset(['amount', 'end', 'start'])
+_SOURCES_17 = frozenset(['avg', 'balance', 'billing', 'connection', 'count', 'currency', 'daily_sum_median', 'deleted', 'extra', 'goal', 'id', 'initial_balance', 'limit', 'modified', 'name', 'name_override', 'order', 'parent', 'recalculated', 'review', 'settle', 'status', 'type'])
+_ENUM_18 = frozenset(['active', 'archived', 'inactive'])
+_ENUM_19 = frozenset(['brokerage', 'credit_card', 'custom', 'depository', 'investment', 'loan', 'mortgage', 'other', 'savings'])
+_SOURCES_20 = frozenset(['deleted_accounts', 'deleted_categories', 'deleted_tags', 'description', 'id'])
+_SOURCES_21 = frozenset(['byday', 'bymonthday', 'bysetpos', 'end', 'frequency', 'interval', 'iteration', 'start'])
+_ENUM_22 = frozenset(['daily', 'monthly', 'one-time', 'weekly', 'yearly'])
+_SOURCES_23 = frozenset(['!accounts', '!categories', '!tags', 'accounts', 'amount', 'categories', 'currency', 'deleted', 'delta', 'extra', 'from', 'history_amount_median', 'id', 'limit', 'limit_planned', 'modified', 'name', 'order', 'parent', 'percent', 'planned', 'problem', 'recalculated', 'recurrence', 'rollover', 'rollover_amount', 'rollover_amount_planned', 'rollover_override', 'status', 'tags', 'to', 'type'])
+_ENUM_24 = frozenset(['delta', 'percent', 'regular'])
+_NAMES_25 = frozenset(['accounts', 'amount', 'categories', 'currency', 'deleted', 'delta', 'exclamation_mark_accounts', 'exclamation_mark_categories', 'exclamation_mark_tags', 'extra', 'from_', 'history_amount_median', 'id', 'limit', 'limit_planned', 'modified', 'name', 'order', 'parent', 'percent', 'planned', 'problem', 'recalculated', 'recurrence', 'rollover', 'rollover_amount', 'rollover_amount_planned', 'rollover_override', 'status', 'tags', 'to', 'type'])
+_SOURCES_26 = frozenset(['budgets', 'entries', 'expense_entries', 'expense_tags', 'expense_tags_used_with_category', 'income_entries', 'income_tags', 'income_tags_used_with_category', 'tags', 'tags_used_with_category'])
+_SOURCES_27 = frozenset(['counts', 'deleted', 'extra', 'id', 'modified', 'name', 'name_override', 'type'])
+_ENUM_28 = frozenset(['expense', 'income', 'system'])
+_SOURCES_29 = frozenset(['count', 'sum'])
+_SOURCES_30 = frozenset(['category', 'category_name', 'category_type', 'expenses', 'incomes', 'modified'])
+_SOURCES_31 = frozenset(['filename', 'id', 'path', 'status', 'type'])
+_SOURCES_32 = frozenset(['connection', 'id', 'memo', 'payee', 'pending'])
+_SOURCES_33 = frozenset(['id', 'latitude', 'longitude', 'venue_id'])
+_SOURCES_34 = frozenset(['at', 'number', 'period'])
+_ENUM_35 = frozenset(['day', 'month', 'week', 'year'])
+_SOURCES_36 = frozenset(['completed', 'id', 'type'])
+_ENUM_37 = frozenset(['expense', 'income', 'repeat', 'transfer'])
+_SOURCES_38 = frozenset(['id'])
+_SOURCES_39 = frozenset(['children', 'parent'])
+_SOURCES_40 = frozenset(['account', 'amount', 'currency', 'id'])
+_SOURCES_41 = frozenset(['account', 'amount', 'category', 'completed', 'created', 'currency', 'date', 'deleted', 'desc', 'extra', 'id', 'images', 'import', 'location', 'modified', 'readonly', 'reminders', 'repeat', 'review', 'settle', 'split', 'tags', 'transaction'])
+_NAMES_42 = frozenset(['account', 'amount', 'category', 'completed', 'created', 'currency', 'date', 'deleted', 'desc', 'extra', 'id', 'images', 'import_', 'location', 'modified', 'readonly', 'reminders', 'repeat', 'review', 'settle', 'split', 'tags', 'transaction'])
+_SOURCES_43 = frozenset(['day', 'expenses', 'incomes', 'modified'])
+_SOURCES_44 = frozenset(['filename', 'filesize', 'path', 'valid_until'])
+_SOURCES_45 = frozenset(['created', 'data', 'filters', 'formats', 'from', 'id', 'modified', 'resources', 'seen', 'status', 'to', 'type'])
+_ENUM_46 = frozenset(['error', 'generated', 'generating', 'sending', 'sent'])
+_ENUM_47 = frozenset(['attachments', 'export', 'user_data'])
+_NAMES_48 = frozenset(['created', 'data', 'filters', 'formats', 'from_', 'id', 'modified', 'resources', 'seen', 'status', 'to', 'type'])
+_SOURCES_49 = frozenset(['address', 'amount', 'chain_id', 'city', 'expenses', 'id', 'incomes', 'latitude', 'longitude', 'modified', 'name', 'used', 'venue_id', 'visits'])
+_SOURCES_50 = frozenset(['budgets', 'entries', 'unsorted_entries'])
+_SOURCES_51 = frozenset(['category', 'counts', 'deleted', 'extra', 'id', 'meta_tag', 'modified', 'name', 'name_override', 'type'])
+_ENUM_52 = frozenset(['expense', 'income'])
+_SOURCES_53 = frozenset(['categories', 'count', 'sum'])
+_SOURCES_54 = frozenset(['expenses', 'incomes', 'modified', 'tag'])
+_SOURCES_55 = frozenset(['code', 'fixed', 'rate', 'reference_currency'])
+_SOURCES_56 = frozenset(['custom', 'custom_exchange_rate', 'main', 'update', 'update_accounts'])
+_ENUM_57 = frozenset(['custom', 'historical', 'sign'])
+_SOURCES_58 = frozenset(['accounts', 'bank', 'budgets', 'export', 'images', 'import', 'locations', 'passcode', 'planning', 'pro_share', 'reminders', 'repeats'])
+_NAMES_59 = frozenset(['accounts', 'bank', 'budgets', 'export', 'images', 'import_', 'locations', 'passcode', 'planning', 'pro_share', 'reminders', 'repeats'])
+_SOURCES_60 = frozenset(['date_migrated', 'finished', 'revert_until'])
+_SOURCES_61 = frozenset(['end', 'name', 'start'])
+_SOURCES_62 = frozenset(['id', 'next', 'provider', 'trial'])
+_ENUM_63 = frozenset(['adyen', 'amazon', 'apple', 'bitpay', 'g2s', 'google', 'microsoft', 'paypal', 'unknown'])
+_SOURCES_64 = frozenset(['end', 'start'])
+_SOURCES_65 = frozenset(['address', 'city', 'country', 'name', 'post', 'state', 'vat'])
+_SOURCES_66 = frozenset(['level', 'partner', 'payment', 'remaining_credit', 'since', 'trial', 'until', 'vat'])
+_ENUM_67 = frozenset(['medici', 'pro'])
+_SOURCES_68 = frozenset(['country', 'currency', 'email', 'extra', 'first_name', 'flags', 'id', 'joined', 'language', 'last_name', 'limits', 'locale', 'migration', 'modified', 'notifications', 'otp_enabled', 'pro', 'social', 'start_day', 'steps', 'timezone', 'trial_eligible'])
+_PATTERN_69 = re.compile('[A-Z]{2}')
+_ENUM_70 = frozenset(['apple', 'etalio', 'evernote', 'facebook', 'flickr', 'foursquare', 'google', 'toshl', 'twitter'])
+_ENUM_71 = frozenset(['budget', 'budget_category', 'expense', 'income'])
+
+
+def decode_CurrencyElement(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('modified', MISSING)
+    if value_ is MISSING:
+        _modified = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _modified = value_
+    value_ = get('name', MISSING)
+    if value_ is MISSING:
+        _name = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _name = value_
+    value_ = get('precision', MISSING)
+    if value_ is MISSING:
+        _precision = MISSING
+    else:
+        if type(value_) is not int or value_ < 0 or value_ > 9:
+            raise Invalid
+        _precision = value_
+    value_ = get('symbol', MISSING)
+    if value_ is MISSING:
+        _symbol = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _symbol = value_
+    value_ = get('type', MISSING)
+    if value_ is MISSING:
+        _type = MISSING
+    else:
+        if type(value_) is not str or value_ not in _ENUM_1:
+            raise Invalid
+        _type = value_
+    properties = {'modified': _modified, 'name': _name, 'precision': _precision, 'symbol': _symbol, 'type': _type}
+    model = new(models.CurrencyElement)
+    model._dict = properties
+    model.modified = _modified
+    model.name = _name
+    model.precision = _precision
+    model.symbol = _symbol
+    model.type = _type
+    if not _SOURCES_0.issuperset(value):
+        additional(properties, value, _SOURCES_0, _SOURCES_0)
+    return model
+
+
+def decode_Image(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('deleted', MISSING)
+    if value_ is MISSING:
+        _deleted = MISSING
+    else:
+        if type(value_) is not bool:
+            raise Invalid
+        _deleted = value_
+    value_ = get('filename', MISSING)
+    if value_ is MISSING:
+        _filename = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _filename = value_
+    value_ = get('id', MISSING)
+    if value_ is MISSING:
+        _id = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _id = value_
+    value_ = get('path', MISSING)
+    if value_ is MISSING:
+        _path = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _path = value_
+    value_ = get('status', MISSING)
+    if value_ is MISSING:
+        _status = MISSING
+    else:
+        if type(value_) is not str or value_ not in _ENUM_3:
+            raise Invalid
+        _status = value_
+    value_ = get('type', MISSING)
+    if value_ is MISSING:
+        _type = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _type = value_
+    properties = {'deleted': _deleted, 'filename': _filename, 'id': _id, 'path': _path, 'status': _status, 'type': _type}
+    model = new(models.Image)
+    model._dict = properties
+    model.deleted = _deleted
+    model.filename = _filename
+    model.id = _id
+    model.path = _path
+    model.status = _status
+    model.type = _type
+    if not _SOURCES_2.issuperset(value):
+        additional(properties, value, _SOURCES_2, _SOURCES_2)
+    return model
+
+
+def decode_Notification(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('action', MISSING)
+    if value_ is MISSING:
+        _action = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _action = value_
+    value_ = get('date', MISSING)
+    if value_ is MISSING:
+        _date = MISSING
+    else:
+        if type(value_) is not str or not is_format('date-time', value_):
+            raise Invalid
+        _date = value_
+    value_ = get('deleted', MISSING)
+    if value_ is MISSING:
+        _deleted = MISSING
+    else:
+        if type(value_) is not bool:
+            raise Invalid
+        _deleted = value_
+    value_ = get('id', MISSING)
+    if value_ is MISSING:
+        _id = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _id = value_
+    value_ = get('modified', MISSING)
+    if value_ is MISSING:
+        _modified = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _modified = value_
+    value_ = get('text', MISSING)
+    if value_ is MISSING:
+        _text = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _text = value_
+    value_ = get('type', MISSING)
+    if value_ is MISSING:
+        _type = MISSING
+    else:
+        if type(value_) is not str or value_ not in _ENUM_5:
+            raise Invalid
+        _type = value_
+    properties = {'action': _action, 'date': _date, 'deleted': _deleted, 'id': _id, 'modified': _modified, 'text': _text, 'type': _type}
+    model = new(models.Notification)
+    model._dict = properties
+    model.action = _action
+    model.date = _date
+    model.deleted = _deleted
+    model.id = _id
+    model.modified = _modified
+    model.text = _text
+    model.type = _type
+    if not _SOURCES_4.issuperset(value):
+        additional(properties, value, _SOURCES_4, _SOURCES_4)
+    return model
+
+
+def decode_EntryRepeat(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('byday', MISSING)
+    if value_ is MISSING:
+        _byday = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _byday = value_
+    value_ = get('bymonthday', MISSING)
+    if value_ is MISSING:
+        _bymonthday = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _bymonthday = value_
+    value_ = get('bysetpos', MISSING)
+    if value_ is MISSING:
+        _bysetpos = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _bysetpos = value_
+    value_ = get('count', MISSING)
+    if value_ is MISSING:
+        _count = MISSING
+    else:
+        if type(value_) is not int or value_ < 1:
+            raise Invalid
+        _count = value_
+    value_ = get('end', MISSING)
+    if value_ is MISSING:
+        _end = MISSING
+    else:
+        if type(value_) is not str or not is_format('date', value_):
+            raise Invalid
+        _end = value_
+    value_ = get('entries', MISSING)
+    if value_ is MISSING:
+        _entries = MISSING
+    else:
+        if type(value_) is not list:
+            raise Invalid
+        for item in value_:
+            if type(item) is not str:
+                raise Invalid
+        _entries = list(value_)
+    value_ = get('frequency', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str or value_ not in _ENUM_7:
+            raise Invalid
+        _frequency = value_
+    value_ = get('id', MISSING)
+    if value_ is MISSING:
+        _id = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _id = value_
+    value_ = get('interval', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not int or value_ < 1 or value_ > 255:
+            raise Invalid
+        _interval = value_
+    value_ = get('iteration', MISSING)
+    if value_ is MISSING:
+        _iteration = MISSING
+    else:
+        if type(value_) is not int or value_ < 0:
+            raise Invalid
+        _iteration = value_
+    value_ = get('start', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str or not is_format('date', value_):
+            raise Invalid
+        _start = value_
+    value_ = get('template', MISSING)
+    if value_ is MISSING:
+        _template = MISSING
+    else:
+        if type(value_) is not bool:
+            raise Invalid
+        _template = value_
+    value_ = get('template_end', MISSING)
+    if value_ is MISSING:
+        _template_end = MISSING
+    else:
+        if type(value_) is not str or not is_format('date', value_):
+            raise Invalid
+        _template_end = value_
+    value_ = get('template_start', MISSING)
+    if value_ is MISSING:
+        _template_start = MISSING
+    else:
+        if type(value_) is not str or not is_format('date', value_):
+            raise Invalid
+        _template_start = value_
+    value_ = get('type', MISSING)
+    if value_ is MISSING:
+        _type = MISSING
+    else:
+        if type(value_) is not str or value_ not in _ENUM_8:
+            raise Invalid
+        _type = value_
+    properties = {'byday': _byday, 'bymonthday': _bymonthday, 'bysetpos': _bysetpos, 'count': _count, 'end': _end, 'entries': _entries, 'frequency': _frequency, 'id': _id, 'interval': _interval, 'iteration': _iteration, 'start': _start, 'template': _template, 'template_end': _template_end, 'template_start': _template_start, 'type': _type}
+    model = new(models.EntryRepeat)
+    model._dict = properties
+    model.byday = _byday
+    model.bymonthday = _bymonthday
+    model.bysetpos = _bysetpos
+    model.count = _count
+    model.end = _end
+    model.entries = _entries
+    model.frequency = _frequency
+    model.id = _id
+    model.interval = _interval
+    model.iteration = _iteration
+    model.start = _start
+    model.template = _template
+    model.template_end = _template_end
+    model.template_start = _template_start
+    model.type = _type
+    if not _SOURCES_6.issuperset(value):
+        additional(properties, value, _SOURCES_6, _SOURCES_6)
+    return model
+
+
+def decode_AccountAvg(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('expenses', MISSING)
+    if value_ is MISSING:
+        _expenses = 0.0
+    else:
+        if type(value_) is not float and type(value_) is not int or value_ < 0 or value_ >= 1000000000000000:
+            raise Invalid
+        _expenses = float(value_)
+    value_ = get('incomes', MISSING)
+    if value_ is MISSING:
+        _incomes = 0.0
+    else:
+        if type(value_) is not float and type(value_) is not int or value_ < 0 or value_ >= 1000000000000000:
+            raise Invalid
+        _incomes = float(value_)
+    properties = {'expenses': _expenses, 'incomes': _incomes}
+    model = new(models.AccountAvg)
+    model._dict = properties
+    model.expenses = _expenses
+    model.incomes = _incomes
+    if not _SOURCES_9.issuperset(value):
+        additional(properties, value, _SOURCES_9, _SOURCES_9)
+    return model
+
+
+def decode_AccountBilling(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('byday', MISSING)
+    if value_ is MISSING:
+        _byday = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _byday = value_
+    value_ = get('bymonthday', MISSING)
+    if value_ is MISSING:
+        _bymonthday = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _bymonthday = value_
+    value_ = get('bysetpos', MISSING)
+    if value_ is MISSING:
+        _bysetpos = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _bysetpos = value_
+    properties = {'byday': _byday, 'bymonthday': _bymonthday, 'bysetpos': _bysetpos}
+    model = new(models.AccountBilling)
+    model._dict = properties
+    model.byday = _byday
+    model.bymonthday = _bymonthday
+    model.bysetpos = _bysetpos
+    if not _SOURCES_10.issuperset(value):
+        additional(properties, value, _SOURCES_10, _SOURCES_10)
+    return model
+
+
+def decode_AccountConnection(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('id', MISSING)
+    if value_ is MISSING:
+        _id = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _id = value_
+    value_ = get('logo', MISSING)
+    if value_ is MISSING:
+        _logo = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _logo = value_
+    value_ = get('name', MISSING)
+    if value_ is MISSING:
+        _name = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _name = value_
+    value_ = get('status', MISSING)
+    if value_ is MISSING:
+        _status = MISSING
+    else:
+        if type(value_) is not str or value_ not in _ENUM_12:
+            raise Invalid
+        _status = value_
+    properties = {'id': _id, 'logo': _logo, 'name': _name, 'status': _status}
+    model = new(models.AccountConnection)
+    model._dict = properties
+    model.id = _id
+    model.logo = _logo
+    model.name = _name
+    model.status = _status
+    if not _SOURCES_11.issuperset(value):
+        additional(properties, value, _SOURCES_11, _SOURCES_11)
+    return model
+
+
+def decode_Currency(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('code', MISSING)
+    if value_ is MISSING:
+        _code = MISSING
+    else:
+        if type(value_) is not str or not _PATTERN_14.search(value_):
+            raise Invalid
+        _code = value_
+    value_ = get('fixed', MISSING)
+    if value_ is MISSING:
+        _fixed = 'false'
+    else:
+        if type(value_) is not bool:
+            raise Invalid
+        _fixed = value_
+    value_ = get('main_rate', MISSING)
+    if value_ is MISSING:
+        _main_rate = MISSING
+    else:
+        if type(value_) is not float and type(value_) is not int:
+            raise Invalid
+        _main_rate = float(value_)
+    value_ = get('rate', MISSING)
+    if value_ is MISSING:
+        _rate = MISSING
+    else:
+        if type(value_) is not float and type(value_) is not int or value_ <= 0:
+            raise Invalid
+        _rate = float(value_)
+    properties = {'code': _code, 'fixed': _fixed, 'main_rate': _main_rate, 'rate': _rate}
+    model = new(models.Currency)
+    model._dict = properties
+    model.code = _code
+    model.fixed = _fixed
+    model.main_rate = _main_rate
+    model.rate = _rate
+    if not _SOURCES_13.issuperset(value):
+        additional(properties, value, _SOURCES_13, _SOURCES_13)
+    return model
+
+
+def decode_AccountMedian(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('expenses', MISSING)
+    if value_ is MISSING:
+        _expenses = 0.0
+    else:
+        if type(value_) is not float and type(value_) is not int or value_ < 0 or value_ >= 1000000000000000:
+            raise Invalid
+        _expenses = float(value_)
+    value_ = get('incomes', MISSING)
+    if value_ is MISSING:
+        _incomes = 0.0
+    else:
+        if type(value_) is not float and type(value_) is not int or value_ < 0 or value_ >= 1000000000000000:
+            raise Invalid
+        _incomes = float(value_)
+    properties = {'expenses': _expenses, 'incomes': _incomes}
+    model = new(models.AccountMedian)
+    model._dict = properties
+    model.expenses = _expenses
+    model.incomes = _incomes
+    if not _SOURCES_9.issuperset(value):
+        additional(properties, value, _SOURCES_9, _SOURCES_9)
+    return model
+
+
+def decode_Extra(value):
+    if type(value) is not dict:
+        raise Invalid
+    properties = {}
+    model = new(models.Extra)
+    model._dict = properties
+    if not _SOURCES_15.issuperset(value):
+        additional(properties, value, _SOURCES_15, _SOURCES_15)
+    return model
+
+
+def decode_AccountGoal(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('amount', MISSING)
+    if value_ is MISSING:
+        _amount = MISSING
+    else:
+        if type(value_) is not float and type(value_) is not int or value_ <= 0 or value_ >= 1000000000000000:
+            raise Invalid
+        _amount = float(value_)
+    value_ = get('end', MISSING)
+    if value_ is MISSING:
+        _end = MISSING
+    else:
+        if type(value_) is not str or not is_format('date', value_):
+            raise Invalid
+        _end = value_
+    value_ = get('start', MISSING)
+    if value_ is MISSING:
+        _start = MISSING
+    else:
+        if type(value_) is not str or not is_format('date', value_):
+            raise Invalid
+        _start = value_
+    properties = {'amount': _amount, 'end': _end, 'start': _start}
+    model = new(models.AccountGoal)
+    model._dict = properties
+    model.amount = _amount
+    model.end = _end
+    model.start = _start
+    if not _SOURCES_16.issuperset(value):
+        additional(properties, value, _SOURCES_16, _SOURCES_16)
+    return model
+
+
+def decode_AccountSettle(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('byday', MISSING)
+    if value_ is MISSING:
+        _byday = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _byday = value_
+    value_ = get('bymonthday', MISSING)
+    if value_ is MISSING:
+        _bymonthday = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _bymonthday = value_
+    value_ = get('bysetpos', MISSING)
+    if value_ is MISSING:
+        _bysetpos = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _bysetpos = value_
+    properties = {'byday': _byday, 'bymonthday': _bymonthday, 'bysetpos': _bysetpos}
+    model = new(models.AccountSettle)
+    model._dict = properties
+    model.byday = _byday
+    model.bymonthday = _bymonthday
+    model.bysetpos = _bysetpos
+    if not _SOURCES_10.issuperset(value):
+        additional(properties, value, _SOURCES_10, _SOURCES_10)
+    return model
+
+
+def decode_Account(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('avg', MISSING)
+    if value_ is MISSING:
+        _avg = MISSING
+    else:
+        _avg = decode_AccountAvg(value_)
+    value_ = get('balance', MISSING)
+    if value_ is MISSING:
+        _balance = MISSING
+    else:
+        if type(value_) is not float and type(value_) is not int or value_ <= -1000000000000000 or value_ >= 1000000000000000:
+            raise Invalid
+        _balance = float(value_)
+    value_ = get('billing', MISSING)
+    if value_ is MISSING:
+        _billing = MISSING
+    else:
+        _billing = decode_AccountBilling(value_)
+    value_ = get('connection', MISSING)
+    if value_ is MISSING:
+        _connection = MISSING
+    else:
+        _connection = decode_AccountConnection(value_)
+    value_ = get('count', MISSING)
+    if value_ is MISSING:
+        _count = MISSING
+    else:
+        if type(value_) is not int:
+            raise Invalid
+        _count = value_
+    value_ = get('currency', MISSING)
+    if value_ is MISSING:
+        _currency = MISSING
+    else:
+        _currency = decode_Currency(value_)
+    value_ = get('daily_sum_median', MISSING)
+    if value_ is MISSING:
+        _daily_sum_median = MISSING
+    else:
+        _daily_sum_median = decode_AccountMedian(value_)
+    value_ = get('deleted', MISSING)
+    if value_ is MISSING:
+        _deleted = MISSING
+    else:
+        if type(value_) is not bool:
+            raise Invalid
+        _deleted = value_
+    value_ = get('extra', MISSING)
+    if value_ is MISSING:
+        _extra = MISSING
+    else:
+        _extra = decode_Extra(value_)
+    value_ = get('goal', MISSING)
+    if value_ is MISSING:
+        _goal = MISSING
+    else:
+        _goal = decode_AccountGoal(value_)
+    value_ = get('id', MISSING)
+    if value_ is MISSING:
+        _id = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _id = value_
+    value_ = get('initial_balance', MISSING)
+    if value_ is MISSING:
+        _initial_balance = 0.0
+    else:
+        if type(value_) is not float and type(value_) is not int or value_ <= -1000000000000000 or value_ >= 1000000000000000:
+            raise Invalid
+        _initial_balance = float(value_)
+    value_ = get('limit', MISSING)
+    if value_ is MISSING:
+        _limit = None
+    else:
+        if type(value_) is not float and type(value_) is not int or value_ <= -1000000000000000 or value_ >= 1000000000000000:
+            raise Invalid
+        _limit = float(value_)
+    value_ = get('modified', MISSING)
+    if value_ is MISSING:
+        _modified = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _modified = value_
+    value_ = get('name', MISSING)
+    if value_ is MISSING:
+        _name = MISSING
+    else:
+        if type(value_) is not str or len(value_) > 100:
+            raise Invalid
+        _name = value_
+    value_ = get('name_override', MISSING)
+    if value_ is MISSING:
+        _name_override = False
+    else:
+        if type(value_) is not bool:
+            raise Invalid
+        _name_override = value_
+    value_ = get('order', MISSING)
+    if value_ is MISSING:
+        _order = MISSING
+    else:
+        if type(value_) is not int or value_ < 0 or value_ > 255:
+            raise Invalid
+        _order = value_
+    value_ = get('parent', MISSING)
+    if value_ is MISSING:
+        _parent = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _parent = value_
+    value_ = get('recalculated', MISSING)
+    if value_ is MISSING:
+        _recalculated = MISSING
+    else:
+        if type(value_) is not bool:
+            raise Invalid
+        _recalculated = value_
+    value_ = get('review', MISSING)
+    if value_ is MISSING:
+        _review = MISSING
+    else:
+        if type(value_) is not int:
+            raise Invalid
+        _review = value_
+    value_ = get('settle', MISSING)
+    if value_ is MISSING:
+        _settle = MISSING
+    else:
+        _settle = decode_AccountSettle(value_)
+    value_ = get('status', MISSING)
+    if value_ is MISSING:
+        _status = MISSING
+    else:
+        if type(value_) is not str or value_ not in _ENUM_18:
+            raise Invalid
+        _status = value_
+    value_ = get('type', MISSING)
+    if value_ is MISSING:
+        _type = MISSING
+    else:
+        if type(value_) is not str or value_ not in _ENUM_19:
+            raise Invalid
+        _type = value_
+    properties = {'avg': _avg, 'balance': _balance, 'billing': _billing, 'connection': _connection, 'count': _count, 'currency': _currency, 'daily_sum_median': _daily_sum_median, 'deleted': _deleted, 'extra': _extra, 'goal': _goal, 'id': _id, 'initial_balance': _initial_balance, 'limit': _limit, 'modified': _modified, 'name': _name, 'name_override': _name_override, 'order': _order, 'parent': _parent, 'recalculated': _recalculated, 'review': _review, 'settle': _settle, 'status': _status, 'type': _type}
+    model = new(models.Account)
+    model._dict = properties
+    model.avg = _avg
+    model.balance = _balance
+    model.billing = _billing
+    model.connection = _connection
+    model.count = _count
+    model.currency = _currency
+    model.daily_sum_median = _daily_sum_median
+    model.deleted = _deleted
+    model.extra = _extra
+    model.goal = _goal
+    model.id = _id
+    model.initial_balance = _initial_balance
+    model.limit = _limit
+    model.modified = _modified
+    model.name = _name
+    model.name_override = _name_override
+    model.order = _order
+    model.parent = _parent
+    model.recalculated = _recalculated
+    model.review = _review
+    model.settle = _settle
+    model.status = _status
+    model.type = _type
+    if not _SOURCES_17.issuperset(value):
+        additional(properties, value, _SOURCES_17, _SOURCES_17)
+    return model
+
+
+def decode_BudgetProblem(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('deleted_accounts', MISSING)
+    if value_ is MISSING:
+        _deleted_accounts = MISSING
+    else:
+        if type(value_) is not list:
+            raise Invalid
+        for item in value_:
+            if type(item) is not str:
+                raise Invalid
+        _deleted_accounts = list(value_)
+    value_ = get('deleted_categories', MISSING)
+    if value_ is MISSING:
+        _deleted_categories = MISSING
+    else:
+        if type(value_) is not list:
+            raise Invalid
+        for item in value_:
+            if type(item) is not str:
+                raise Invalid
+        _deleted_categories = list(value_)
+    value_ = get('deleted_tags', MISSING)
+    if value_ is MISSING:
+        _deleted_tags = MISSING
+    else:
+        if type(value_) is not list:
+            raise Invalid
+        for item in value_:
+            if type(item) is not str:
+                raise Invalid
+        _deleted_tags = list(value_)
+    value_ = get('description', MISSING)
+    if value_ is MISSING:
+        _description = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _description = value_
+    value_ = get('id', MISSING)
+    if value_ is MISSING:
+        _id = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _id = value_
+    properties = {'deleted_accounts': _deleted_accounts, 'deleted_categories': _deleted_categories, 'deleted_tags': _deleted_tags, 'description': _description, 'id': _id}
+    model = new(models.BudgetProblem)
+    model._dict = properties
+    model.deleted_accounts = _deleted_accounts
+    model.deleted_categories = _deleted_categories
+    model.deleted_tags = _deleted_tags
+    model.description = _description
+    model.id = _id
+    if not _SOURCES_20.issuperset(value):
+        additional(properties, value, _SOURCES_20, _SOURCES_20)
+    return model
+
+
+def decode_Recurrence(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('byday', MISSING)
+    if value_ is MISSING:
+        _byday = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _byday = value_
+    value_ = get('bymonthday', MISSING)
+    if value_ is MISSING:
+        _bymonthday = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _bymonthday = value_
+    value_ = get('bysetpos', MISSING)
+    if value_ is MISSING:
+        _bysetpos = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _bysetpos = value_
+    value_ = get('end', MISSING)
+    if value_ is MISSING:
+        _end = MISSING
+    else:
+        if type(value_) is not str or not is_format('date', value_):
+            raise Invalid
+        _end = value_
+    value_ = get('frequency', MISSING)
+    if value_ is MISSING:
+        _frequency = MISSING
+    else:
+        if type(value_) is not str or value_ not in _ENUM_22:
+            raise Invalid
+        _frequency = value_
+    value_ = get('interval', MISSING)
+    if value_ is MISSING:
+        _interval = MISSING
+    else:
+        if type(value_) is not int or value_ < 1 or value_ > 127:
+            raise Invalid
+        _interval = value_
+    value_ = get('iteration', MISSING)
+    if value_ is MISSING:
+        _iteration = MISSING
+    else:
+        if type(value_) is not int or value_ < 0:
+            raise Invalid
+        _iteration = value_
+    value_ = get('start', MISSING)
+    if value_ is MISSING:
+        _start = MISSING
+    else:
+        if type(value_) is not str or not is_format('date', value_):
+            raise Invalid
+        _start = value_
+    properties = {'byday': _byday, 'bymonthday': _bymonthday, 'bysetpos': _bysetpos, 'end': _end, 'frequency': _frequency, 'interval': _interval, 'iteration': _iteration, 'start': _start}
+    model = new(models.Recurrence)
+    model._dict = properties
+    model.byday = _byday
+    model.bymonthday = _bymonthday
+    model.bysetpos = _bysetpos
+    model.end = _end
+    model.frequency = _frequency
+    model.interval = _interval
+    model.iteration = _iteration
+    model.start = _start
+    if not _SOURCES_21.issuperset(value):
+        additional(properties, value, _SOURCES_21, _SOURCES_21)
+    return model
+
+
+def decode_Budget(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('!accounts', MISSING)
+    if value_ is MISSING:
+        _exclamation_mark_accounts = MISSING
+    else:
+        if type(value_) is not list:
+            raise Invalid
+        for item in value_:
+            if type(item) is not str:
+                raise Invalid
+        _exclamation_mark_accounts = list(value_)
+    value_ = get('!categories', MISSING)
+    if value_ is MISSING:
+        _exclamation_mark_categories = MISSING
+    else:
+        if type(value_) is not list:
+            raise Invalid
+        for item in value_:
+            if type(item) is not str:
+                raise Invalid
+        _exclamation_mark_categories = list(value_)
+    value_ = get('!tags', MISSING)
+    if value_ is MISSING:
+        _exclamation_mark_tags = MISSING
+    else:
+        if type(value_) is not list:
+            raise Invalid
+        for item in value_:
+            if type(item) is not str:
+                raise Invalid
+        _exclamation_mark_tags = list(value_)
+    value_ = get('accounts', MISSING)
+    if value_ is MISSING:
+        _accounts = MISSING
+    else:
+        if type(value_) is not list:
+            raise Invalid
+        for item in value_:
+            if type(item) is not str:
+                raise Invalid
+        _accounts = list(value_)
+    value_ = get('amount', MISSING)
+    if value_ is MISSING:
+        _amount = MISSING
+    else:
+        if type(value_) is not float and type(value_) is not int or value_ < 0 or value_ >= 1000000000000000:
+            raise Invalid
+        _amount = float(value_)
+    value_ = get('categories', MISSING)
+    if value_ is MISSING:
+        _categories = MISSING
+    else:
+        if type(value_) is not list:
+            raise Invalid
+        for item in value_:
+            if type(item) is not str:
+                raise Invalid
+        _categories = list(value_)
+    value_ = get('currency', MISSING)
+    if value_ is MISSING:
+        _currency = MISSING
+    else:
+        _currency = decode_Currency(value_)
+    value_ = get('deleted', MISSING)
+    if value_ is MISSING:
+        _deleted = MISSING
+    else:
+        if type(value_) is not bool:
+            raise Invalid
+        _deleted = value_
+    value_ = get('delta', MISSING)
+    if value_ is MISSING:
+        _delta = MISSING
+    else:
+        if type(value_) is not float and type(value_) is not int:
+            raise Invalid
+        _delta = float(value_)
+    value_ = get('extra', MISSING)
+    if value_ is MISSING:
+        _extra = MISSING
+    else:
+        _extra = decode_Extra(value_)
+    value_ = get('from', MISSING)
+    if value_ is MISSING:
+        _from_ = MISSING
+    else:
+        if type(value_) is not str or not is_format('date', value_):
+            raise Invalid
+        _from_ = value_
+    value_ = get('history_amount_median', MISSING)
+    if value_ is MISSING:
+        _history_amount_median = MISSING
+    else:
+        if type(value_) is not float and type(value_) is not int or value_ < 0 or value_ >= 1000000000000000:
+            raise Invalid
+        _history_amount_median = float(value_)
+    value_ = get('id', MISSING)
+    if value_ is MISSING:
+        _id = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _id = value_
+    value_ = get('limit', MISSING)
+    if value_ is MISSING:
+        _limit = MISSING
+    else:
+        if type(value_) is not float and type(value_) is not int or value_ <= -1000000000000000 or value_ >= 1000000000000000:
+            raise Invalid
+        _limit = float(value_)
+    value_ = get('limit_planned', MISSING)
+    if value_ is MISSING:
+        _limit_planned = MISSING
+    else:
+        if type(value_) is not float and type(value_) is not int or value_ <= -1000000000000000 or value_ >= 1000000000000000:
+            raise Invalid
+        _limit_planned = float(value_)
+    value_ = get('modified', MISSING)
+    if value_ is MISSING:
+        _modified = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _modified = value_
+    value_ = get('name', MISSING)
+    if value_ is MISSING:
+        _name = MISSING
+    else:
+        if type(value_) is not str or len(value_) > 300:
+            raise Invalid
+        _name = value_
+    value_ = get('order', MISSING)
+    if value_ is MISSING:
+        _order = MISSING
+    else:
+        if type(value_) is not int or value_ < 0 or value_ > 255:
+            raise Invalid
+        _order = value_
+    value_ = get('parent', MISSING)
+    if value_ is MISSING:
+        _parent = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _parent = value_
+    value_ = get('percent', MISSING)
+    if value_ is MISSING:
+        _percent = MISSING
+    else:
+        if type(value_) is not float and type(value_) is not int or value_ <= 0:
+            raise Invalid
+        _percent = float(value_)
+    value_ = get('planned', MISSING)
+    if value_ is MISSING:
+        _planned = MISSING
+    else:
+        if type(value_) is not float and type(value_) is not int or value_ < 0 or value_ >= 1000000000000000:
+            raise Invalid
+        _planned = float(value_)
+    value_ = get('problem', MISSING)
+    if value_ is MISSING:
+        _problem = MISSING
+    else:
+        _problem = decode_BudgetProblem(value_)
+    value_ = get('recalculated', MISSING)
+    if value_ is MISSING:
+        _recalculated = MISSING
+    else:
+        if type(value_) is not bool:
+            raise Invalid
+        _recalculated = value_
+    value_ = get('recurrence', MISSING)
+    if value_ is MISSING:
+        _recurrence = MISSING
+    else:
+        _recurrence = decode_Recurrence(value_)
+    value_ = get('rollover', MISSING)
+    if value_ is MISSING:
+        _rollover = False
+    else:
+        if type(value_) is not bool:
+            raise Invalid
+        _rollover = value_
+    value_ = get('rollover_amount', MISSING)
+    if value_ is MISSING:
+        _rollover_amount = 0.0
+    else:
+        if type(value_) is not float and type(value_) is not int or value_ <= -1000000000000000 or value_ >= 1000000000000000:
+            raise Invalid
+        _rollover_amount = float(value_)
+    value_ = get('rollover_amount_planned', MISSING)
+    if value_ is MISSING:
+        _rollover_amount_planned = 0.0
+    else:
+        if type(value_) is not float and type(value_) is not int or value_ <= -1000000000000000 or value_ >= 1000000000000000:
+            raise Invalid
+        _rollover_amount_planned = float(value_)
+    value_ = get('rollover_override', MISSING)
+    if value_ is MISSING:
+        _rollover_override = False
+    else:
+        if type(value_) is not bool:
+            raise Invalid
+        _rollover_override = value_
+    value_ = get('status', MISSING)
+    if value_ is MISSING:
+        _status = MISSING
+    else:
+        if type(value_) is not str or value_ not in _ENUM_18:
+            raise Invalid
+        _status = value_
+    value_ = get('tags', MISSING)
+    if value_ is MISSING:
+        _tags = MISSING
+    else:
+        if type(value_) is not list:
+            raise Invalid
+        for item in value_:
+            if type(item) is not str:
+                raise Invalid
+        _tags = list(value_)
+    value_ = get('to', MISSING)
+    if value_ is MISSING:
+        _to = MISSING
+    else:
+        if type(value_) is not str or not is_format('date', value_):
+            raise Invalid
+        _to = value_
+    value_ = get('type', MISSING)
+    if value_ is MISSING:
+        _type = MISSING
+    else:
+        if type(value_) is not str or value_ not in _ENUM_24:
+            raise Invalid
+        _type = value_
+    properties = {'exclamation_mark_accounts': _exclamation_mark_accounts, 'exclamation_mark_categories': _exclamation_mark_categories, 'exclamation_mark_tags': _exclamation_mark_tags, 'accounts': _accounts, 'amount': _amount, 'categories': _categories, 'currency': _currency, 'deleted': _deleted, 'delta': _delta, 'extra': _extra, 'from_': _from_, 'history_amount_median': _history_amount_median, 'id': _id, 'limit': _limit, 'limit_planned': _limit_planned, 'modified': _modified, 'name': _name, 'order': _order, 'parent': _parent, 'percent': _percent, 'planned': _planned, 'problem': _problem, 'recalculated': _recalculated, 'recurrence': _recurrence, 'rollover': _rollover, 'rollover_amount': _rollover_amount, 'rollover_amount_planned': _rollover_amount_planned, 'rollover_override': _rollover_override, 'status': _status, 'tags': _tags, 'to': _to, 'type': _type}
+    model = new(models.Budget)
+    model._dict = properties
+    model.exclamation_mark_accounts = _exclamation_mark_accounts
+    model.exclamation_mark_categories = _exclamation_mark_categories
+    model.exclamation_mark_tags = _exclamation_mark_tags
+    model.accounts = _accounts
+    model.amount = _amount
+    model.categories = _categories
+    model.currency = _currency
+    model.deleted = _deleted
+    model.delta = _delta
+    model.extra = _extra
+    model.from_ = _from_
+    model.history_amount_median = _history_amount_median
+    model.id = _id
+    model.limit = _limit
+    model.limit_planned = _limit_planned
+    model.modified = _modified
+    model.name = _name
+    model.order = _order
+    model.parent = _parent
+    model.percent = _percent
+    model.planned = _planned
+    model.problem = _problem
+    model.recalculated = _recalculated
+    model.recurrence = _recurrence
+    model.rollover = _rollover
+    model.rollover_amount = _rollover_amount
+    model.rollover_amount_planned = _rollover_amount_planned
+    model.rollover_override = _rollover_override
+    model.status = _status
+    model.tags = _tags
+    model.to = _to
+    model.type = _type
+    if not _SOURCES_23.issuperset(value):
+        additional(properties, value, _SOURCES_23, _NAMES_25)
+    return model
+
+
+def decode_CategoryCounts(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('budgets', MISSING)
+    if value_ is MISSING:
+        _budgets = MISSING
+    else:
+        if type(value_) is not int:
+            raise Invalid
+        _budgets = value_
+    value_ = get('entries', MISSING)
+    if value_ is MISSING:
+        _entries = MISSING
+    else:
+        if type(value_) is not int:
+            raise Invalid
+        _entries = value_
+    value_ = get('expense_entries', MISSING)
+    if value_ is MISSING:
+        _expense_entries = MISSING
+    else:
+        if type(value_) is not int:
+            raise Invalid
+        _expense_entries = value_
+    value_ = get('expense_tags', MISSING)
+    if value_ is MISSING:
+        _expense_tags = MISSING
+    else:
+        if type(value_) is not int:
+            raise Invalid
+        _expense_tags = value_
+    value_ = get('expense_tags_used_with_category', MISSING)
+    if value_ is MISSING:
+        _expense_tags_used_with_category = MISSING
+    else:
+        if type(value_) is not int:
+            raise Invalid
+        _expense_tags_used_with_category = value_
+    value_ = get('income_entries', MISSING)
+    if value_ is MISSING:
+        _income_entries = MISSING
+    else:
+        if type(value_) is not int:
+            raise Invalid
+        _income_entries = value_
+    value_ = get('income_tags', MISSING)
+    if value_ is MISSING:
+        _income_tags = MISSING
+    else:
+        if type(value_) is not int:
+            raise Invalid
+        _income_tags = value_
+    value_ = get('income_tags_used_with_category', MISSING)
+    if value_ is MISSING:
+        _income_tags_used_with_category = MISSING
+    else:
+        if type(value_) is not int:
+            raise Invalid
+        _income_tags_used_with_category = value_
+    value_ = get('tags', MISSING)
+    if value_ is MISSING:
+        _tags = MISSING
+    else:
+        if type(value_) is not int:
+            raise Invalid
+        _tags = value_
+    value_ = get('tags_used_with_category', MISSING)
+    if value_ is MISSING:
+        _tags_used_with_category = MISSING
+    else:
+        if type(value_) is not int:
+            raise Invalid
+        _tags_used_with_category = value_
+    properties = {'budgets': _budgets, 'entries': _entries, 'expense_entries': _expense_entries, 'expense_tags': _expense_tags, 'expense_tags_used_with_category': _expense_tags_used_with_category, 'income_entries': _income_entries, 'income_tags': _income_tags, 'income_tags_used_with_category': _income_tags_used_with_category, 'tags': _tags, 'tags_used_with_category': _tags_used_with_category}
+    model = new(models.CategoryCounts)
+    model._dict = properties
+    model.budgets = _budgets
+    model.entries = _entries
+    model.expense_entries = _expense_entries
+    model.expense_tags = _expense_tags
+    model.expense_tags_used_with_category = _expense_tags_used_with_category
+    model.income_entries = _income_entries
+    model.income_tags = _income_tags
+    model.income_tags_used_with_category = _income_tags_used_with_category
+    model.tags = _tags
+    model.tags_used_with_category = _tags_used_with_category
+    if not _SOURCES_26.issuperset(value):
+        additional(properties, value, _SOURCES_26, _SOURCES_26)
+    return model
+
+
+def decode_Category(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('counts', MISSING)
+    if value_ is MISSING:
+        _counts = MISSING
+    else:
+        _counts = decode_CategoryCounts(value_)
+    value_ = get('deleted', MISSING)
+    if value_ is MISSING:
+        _deleted = MISSING
+    else:
+        if type(value_) is not bool:
+            raise Invalid
+        _deleted = value_
+    value_ = get('extra', MISSING)
+    if value_ is MISSING:
+        _extra = MISSING
+    else:
+        _extra = decode_Extra(value_)
+    value_ = get('id', MISSING)
+    if value_ is MISSING:
+        _id = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _id = value_
+    value_ = get('modified', MISSING)
+    if value_ is MISSING:
+        _modified = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _modified = value_
+    value_ = get('name', MISSING)
+    if value_ is MISSING:
+        _name = MISSING
+    else:
+        if type(value_) is not str or len(value_) < 1 or len(value_) > 100:
+            raise Invalid
+        _name = value_
+    value_ = get('name_override', MISSING)
+    if value_ is MISSING:
+        _name_override = False
+    else:
+        if type(value_) is not bool:
+            raise Invalid
+        _name_override = value_
+    value_ = get('type', MISSING)
+    if value_ is MISSING:
+        _type = MISSING
+    else:
+        if type(value_) is not str or value_ not in _ENUM_28:
+            raise Invalid
+        _type = value_
+    properties = {'counts': _counts, 'deleted': _deleted, 'extra': _extra, 'id': _id, 'modified': _modified, 'name': _name, 'name_override': _name_override, 'type': _type}
+    model = new(models.Category)
+    model._dict = properties
+    model.counts = _counts
+    model.deleted = _deleted
+    model.extra = _extra
+    model.id = _id
+    model.modified = _modified
+    model.name = _name
+    model.name_override = _name_override
+    model.type = _type
+    if not _SOURCES_27.issuperset(value):
+        additional(properties, value, _SOURCES_27, _SOURCES_27)
+    return model
+
+
+def decode_CategorySumExpenses(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('count', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not int or value_ < 0:
+            raise Invalid
+        _count = value_
+    value_ = get('sum', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not float and type(value_) is not int or value_ < 0 or value_ >= 1000000000000000:
+            raise Invalid
+        _sum = float(value_)
+    properties = {'count': _count, 'sum': _sum}
+    model = new(models.CategorySumExpenses)
+    model._dict = properties
+    model.count = _count
+    model.sum = _sum
+    if not _SOURCES_29.issuperset(value):
+        additional(properties, value, _SOURCES_29, _SOURCES_29)
+    return model
+
+
+def decode_CategorySumIncomes(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('count', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not int or value_ < 0:
+            raise Invalid
+        _count = value_
+    value_ = get('sum', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not float and type(value_) is not int or value_ < 0 or value_ >= 1000000000000000:
+            raise Invalid
+        _sum = float(value_)
+    properties = {'count': _count, 'sum': _sum}
+    model = new(models.CategorySumIncomes)
+    model._dict = properties
+    model.count = _count
+    model.sum = _sum
+    if not _SOURCES_29.issuperset(value):
+        additional(properties, value, _SOURCES_29, _SOURCES_29)
+    return model
+
+
+def decode_CategorySum(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('category', MISSING)
+    if value_ is MISSING:
+        _category = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _category = value_
+    value_ = get('category_name', MISSING)
+    if value_ is MISSING:
+        _category_name = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _category_name = value_
+    value_ = get('category_type', MISSING)
+    if value_ is MISSING:
+        _category_type = MISSING
+    else:
+        if type(value_) is not str or value_ not in _ENUM_28:
+            raise Invalid
+        _category_type = value_
+    value_ = get('expenses', MISSING)
+    if value_ is MISSING:
+        _expenses = MISSING
+    else:
+        _expenses = decode_CategorySumExpenses(value_)
+    value_ = get('incomes', MISSING)
+    if value_ is MISSING:
+        _incomes = MISSING
+    else:
+        _incomes = decode_CategorySumIncomes(value_)
+    value_ = get('modified', MISSING)
+    if value_ is MISSING:
+        _modified = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _modified = value_
+    properties = {'category': _category, 'category_name': _category_name, 'category_type': _category_type, 'expenses': _expenses, 'incomes': _incomes, 'modified': _modified}
+    model = new(models.CategorySum)
+    model._dict = properties
+    model.category = _category
+    model.category_name = _category_name
+    model.category_type = _category_type
+    model.expenses = _expenses
+    model.incomes = _incomes
+    model.modified = _modified
+    if not _SOURCES_30.issuperset(value):
+        additional(properties, value, _SOURCES_30, _SOURCES_30)
+    return model
+
+
+def decode_EntryImage(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('filename', MISSING)
+    if value_ is MISSING:
+        _filename = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _filename = value_
+    value_ = get('id', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _id = value_
+    value_ = get('path', MISSING)
+    if value_ is MISSING:
+        _path = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _path = value_
+    value_ = get('status', MISSING)
+    if value_ is MISSING:
+        _status = MISSING
+    else:
+        if type(value_) is not str or value_ not in _ENUM_3:
+            raise Invalid
+        _status = value_
+    value_ = get('type', MISSING)
+    if value_ is MISSING:
+        _type = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _type = value_
+    properties = {'filename': _filename, 'id': _id, 'path': _path, 'status': _status, 'type': _type}
+    model = new(models.EntryImage)
+    model._dict = properties
+    model.filename = _filename
+    model.id = _id
+    model.path = _path
+    model.status = _status
+    model.type = _type
+    if not _SOURCES_31.issuperset(value):
+        additional(properties, value, _SOURCES_31, _SOURCES_31)
+    return model
+
+
+def decode_EntryImport(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('connection', MISSING)
+    if value_ is MISSING:
+        _connection = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _connection = value_
+    value_ = get('id', MISSING)
+    if value_ is MISSING:
+        _id = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _id = value_
+    value_ = get('memo', MISSING)
+    if value_ is MISSING:
+        _memo = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _memo = value_
+    value_ = get('payee', MISSING)
+    if value_ is MISSING:
+        _payee = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _payee = value_
+    value_ = get('pending', MISSING)
+    if value_ is MISSING:
+        _pending = MISSING
+    else:
+        if type(value_) is not bool:
+            raise Invalid
+        _pending = value_
+    properties = {'connection': _connection, 'id': _id, 'memo': _memo, 'payee': _payee, 'pending': _pending}
+    model = new(models.EntryImport)
+    model._dict = properties
+    model.connection = _connection
+    model.id = _id
+    model.memo = _memo
+    model.payee = _payee
+    model.pending = _pending
+    if not _SOURCES_32.issuperset(value):
+        additional(properties, value, _SOURCES_32, _SOURCES_32)
+    return model
+
+
+def decode_EntryLocation(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('id', MISSING)
+    if value_ is MISSING:
+        _id = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _id = value_
+    value_ = get('latitude', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not float and type(value_) is not int:
+            raise Invalid
+        _latitude = float(value_)
+    value_ = get('longitude', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not float and type(value_) is not int:
+            raise Invalid
+        _longitude = float(value_)
+    value_ = get('venue_id', MISSING)
+    if value_ is MISSING:
+        _venue_id = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _venue_id = value_
+    properties = {'id': _id, 'latitude': _latitude, 'longitude': _longitude, 'venue_id': _venue_id}
+    model = new(models.EntryLocation)
+    model._dict = properties
+    model.id = _id
+    model.latitude = _latitude
+    model.longitude = _longitude
+    model.venue_id = _venue_id
+    if not _SOURCES_33.issuperset(value):
+        additional(properties, value, _SOURCES_33, _SOURCES_33)
+    return model
+
+
+def decode_Reminder(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('at', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str or not is_format('time', value_):
+            raise Invalid
+        _at = value_
+    value_ = get('number', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not int or value_ < 0 or value_ > 255:
+            raise Invalid
+        _number = value_
+    value_ = get('period', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str or value_ not in _ENUM_35:
+            raise Invalid
+        _period = value_
+    properties = {'at': _at, 'number': _number, 'period': _period}
+    model = new(models.Reminder)
+    model._dict = properties
+    model.at = _at
+    model.number = _number
+    model.period = _period
+    if not _SOURCES_34.issuperset(value):
+        additional(properties, value, _SOURCES_34, _SOURCES_34)
+    return model
+
+
+def decode_EntryReview(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('completed', MISSING)
+    if value_ is MISSING:
+        _completed = MISSING
+    else:
+        if type(value_) is not bool:
+            raise Invalid
+        _completed = value_
+    value_ = get('id', MISSING)
+    if value_ is MISSING:
+        _id = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _id = value_
+    value_ = get('type', MISSING)
+    if value_ is MISSING:
+        _type = MISSING
+    else:
+        if type(value_) is not str or value_ not in _ENUM_37:
+            raise Invalid
+        _type = value_
+    properties = {'completed': _completed, 'id': _id, 'type': _type}
+    model = new(models.EntryReview)
+    model._dict = properties
+    model.completed = _completed
+    model.id = _id
+    model.type = _type
+    if not _SOURCES_36.issuperset(value):
+        additional(properties, value, _SOURCES_36, _SOURCES_36)
+    return model
+
+
+def decode_EntrySettle(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('id', MISSING)
+    if value_ is MISSING:
+        _id = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _id = value_
+    properties = {'id': _id}
+    model = new(models.EntrySettle)
+    model._dict = properties
+    model.id = _id
+    if not _SOURCES_38.issuperset(value):
+        additional(properties, value, _SOURCES_38, _SOURCES_38)
+    return model
+
+
+def decode_EntrySplit(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('children', MISSING)
+    if value_ is MISSING:
+        _children = MISSING
+    else:
+        if type(value_) is not list:
+            raise Invalid
+        for item in value_:
+            if type(item) is not str:
+                raise Invalid
+        _children = list(value_)
+    value_ = get('parent', MISSING)
+    if value_ is MISSING:
+        _parent = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _parent = value_
+    properties = {'children': _children, 'parent': _parent}
+    model = new(models.EntrySplit)
+    model._dict = properties
+    model.children = _children
+    model.parent = _parent
+    if not _SOURCES_39.issuperset(value):
+        additional(properties, value, _SOURCES_39, _SOURCES_39)
+    return model
+
+
+def decode_EntryTransaction(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('account', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _account = value_
+    value_ = get('amount', MISSING)
+    if value_ is MISSING:
+        _amount = MISSING
+    else:
+        if type(value_) is not float and type(value_) is not int or value_ <= -1000000000000000 or value_ >= 1000000000000000:
+            raise Invalid
+        _amount = float(value_)
+    value_ = get('currency', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        _currency = decode_Currency(value_)
+    value_ = get('id', MISSING)
+    if value_ is MISSING:
+        _id = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _id = value_
+    properties = {'account': _account, 'amount': _amount, 'currency': _currency, 'id': _id}
+    model = new(models.EntryTransaction)
+    model._dict = properties
+    model.account = _account
+    model.amount = _amount
+    model.currency = _currency
+    model.id = _id
+    if not _SOURCES_40.issuperset(value):
+        additional(properties, value, _SOURCES_40, _SOURCES_40)
+    return model
+
+
+def decode_Entry(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('account', MISSING)
+    if value_ is MISSING:
+        _account = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _account = value_
+    value_ = get('amount', MISSING)
+    if value_ is MISSING:
+        _amount = MISSING
+    else:
+        if type(value_) is not float and type(value_) is not int or value_ <= -1000000000000000 or value_ >= 1000000000000000:
+            raise Invalid
+        _amount = float(value_)
+    value_ = get('category', MISSING)
+    if value_ is MISSING:
+        _category = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _category = value_
+    value_ = get('completed', MISSING)
+    if value_ is MISSING:
+        _completed = False
+    else:
+        if type(value_) is not bool:
+            raise Invalid
+        _completed = value_
+    value_ = get('created', MISSING)
+    if value_ is MISSING:
+        _created = MISSING
+    else:
+        if type(value_) is not str or not is_format('date-time', value_):
+            raise Invalid
+        _created = value_
+    value_ = get('currency', MISSING)
+    if value_ is MISSING:
+        _currency = MISSING
+    else:
+        _currency = decode_Currency(value_)
+    value_ = get('date', MISSING)
+    if value_ is MISSING:
+        _date = MISSING
+    else:
+        if type(value_) is not str or not is_format('date', value_):
+            raise Invalid
+        _date = value_
+    value_ = get('deleted', MISSING)
+    if value_ is MISSING:
+        _deleted = MISSING
+    else:
+        if type(value_) is not bool:
+            raise Invalid
+        _deleted = value_
+    value_ = get('desc', MISSING)
+    if value_ is MISSING:
+        _desc = MISSING
+    else:
+        if type(value_) is not str or len(value_) > 3072:
+            raise Invalid
+        _desc = value_
+    value_ = get('extra', MISSING)
+    if value_ is MISSING:
+        _extra = MISSING
+    else:
+        _extra = decode_Extra(value_)
+    value_ = get('id', MISSING)
+    if value_ is MISSING:
+        _id = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _id = value_
+    value_ = get('images', MISSING)
+    if value_ is MISSING:
+        _images = MISSING
+    else:
+        if type(value_) is not list or len(value_) > 4:
+            raise Invalid
+        _images = [decode_EntryImage(item) for item in value_]
+    value_ = get('import', MISSING)
+    if value_ is MISSING:
+        _import_ = MISSING
+    else:
+        _import_ = decode_EntryImport(value_)
+    value_ = get('location', MISSING)
+    if value_ is MISSING:
+        _location = MISSING
+    else:
+        _location = decode_EntryLocation(value_)
+    value_ = get('modified', MISSING)
+    if value_ is MISSING:
+        _modified = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _modified = value_
+    value_ = get('readonly', MISSING)
+    if value_ is MISSING:
+        _readonly = MISSING
+    else:
+        if type(value_) is not list:
+            raise Invalid
+        for item in value_:
+            if type(item) is not str:
+                raise Invalid
+        _readonly = list(value_)
+    value_ = get('reminders', MISSING)
+    if value_ is MISSING:
+        _reminders = MISSING
+    else:
+        if type(value_) is not list or len(value_) > 5:
+            raise Invalid
+        _reminders = [decode_Reminder(item) for item in value_]
+    value_ = get('repeat', MISSING)
+    if value_ is MISSING:
+        _repeat = MISSING
+    else:
+        _repeat = decode_EntryRepeat(value_)
+    value_ = get('review', MISSING)
+    if value_ is MISSING:
+        _review = MISSING
+    else:
+        _review = decode_EntryReview(value_)
+    value_ = get('settle', MISSING)
+    if value_ is MISSING:
+        _settle = MISSING
+    else:
+        _settle = decode_EntrySettle(value_)
+    value_ = get('split', MISSING)
+    if value_ is MISSING:
+        _split = MISSING
+    else:
+        _split = decode_EntrySplit(value_)
+    value_ = get('tags', MISSING)
+    if value_ is MISSING:
+        _tags = MISSING
+    else:
+        if type(value_) is not list:
+            raise Invalid
+        for item in value_:
+            if type(item) is not str:
+                raise Invalid
+        _tags = list(value_)
+    value_ = get('transaction', MISSING)
+    if value_ is MISSING:
+        _transaction = MISSING
+    else:
+        _transaction = decode_EntryTransaction(value_)
+    properties = {'account': _account, 'amount': _amount, 'category': _category, 'completed': _completed, 'created': _created, 'currency': _currency, 'date': _date, 'deleted': _deleted, 'desc': _desc, 'extra': _extra, 'id': _id, 'images': _images, 'import_': _import_, 'location': _location, 'modified': _modified, 'readonly': _readonly, 'reminders': _reminders, 'repeat': _repeat, 'review': _review, 'settle': _settle, 'split': _split, 'tags': _tags, 'transaction': _transaction}
+    model = new(models.Entry)
+    model._dict = properties
+    model.account = _account
+    model.amount = _amount
+    model.category = _category
+    model.completed = _completed
+    model.created = _created
+    model.currency = _currency
+    model.date = _date
+    model.deleted = _deleted
+    model.desc = _desc
+    model.extra = _extra
+    model.id = _id
+    model.images = _images
+    model.import_ = _import_
+    model.location = _location
+    model.modified = _modified
+    model.readonly = _readonly
+    model.reminders = _reminders
+    model.repeat = _repeat
+    model.review = _review
+    model.settle = _settle
+    model.split = _split
+    model.tags = _tags
+    model.transaction = _transaction
+    if not _SOURCES_41.issuperset(value):
+        additional(properties, value, _SOURCES_41, _NAMES_42)
+    return model
+
+
+def decode_DayExpenses(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('count', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not int or value_ < 0:
+            raise Invalid
+        _count = value_
+    value_ = get('sum', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not float and type(value_) is not int or value_ < 0 or value_ >= 1000000000000000:
+            raise Invalid
+        _sum = float(value_)
+    properties = {'count': _count, 'sum': _sum}
+    model = new(models.DayExpenses)
+    model._dict = properties
+    model.count = _count
+    model.sum = _sum
+    if not _SOURCES_29.issuperset(value):
+        additional(properties, value, _SOURCES_29, _SOURCES_29)
+    return model
+
+
+def decode_DayIncomes(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('count', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not int or value_ < 0:
+            raise Invalid
+        _count = value_
+    value_ = get('sum', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not float and type(value_) is not int or value_ < 0 or value_ >= 1000000000000000:
+            raise Invalid
+        _sum = float(value_)
+    properties = {'count': _count, 'sum': _sum}
+    model = new(models.DayIncomes)
+    model._dict = properties
+    model.count = _count
+    model.sum = _sum
+    if not _SOURCES_29.issuperset(value):
+        additional(properties, value, _SOURCES_29, _SOURCES_29)
+    return model
+
+
+def decode_Day(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('day', MISSING)
+    if value_ is MISSING:
+        _day = MISSING
+    else:
+        if type(value_) is not str or not is_format('date', value_):
+            raise Invalid
+        _day = value_
+    value_ = get('expenses', MISSING)
+    if value_ is MISSING:
+        _expenses = MISSING
+    else:
+        _expenses = decode_DayExpenses(value_)
+    value_ = get('incomes', MISSING)
+    if value_ is MISSING:
+        _incomes = MISSING
+    else:
+        _incomes = decode_DayIncomes(value_)
+    value_ = get('modified', MISSING)
+    if value_ is MISSING:
+        _modified = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _modified = value_
+    properties = {'day': _day, 'expenses': _expenses, 'incomes': _incomes, 'modified': _modified}
+    model = new(models.Day)
+    model._dict = properties
+    model.day = _day
+    model.expenses = _expenses
+    model.incomes = _incomes
+    model.modified = _modified
+    if not _SOURCES_43.issuperset(value):
+        additional(properties, value, _SOURCES_43, _SOURCES_43)
+    return model
+
+
+def decode_ExportData(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('filename', MISSING)
+    if value_ is MISSING:
+        _filename = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _filename = value_
+    value_ = get('filesize', MISSING)
+    if value_ is MISSING:
+        _filesize = MISSING
+    else:
+        if type(value_) is not float and type(value_) is not int:
+            raise Invalid
+        _filesize = float(value_)
+    value_ = get('path', MISSING)
+    if value_ is MISSING:
+        _path = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _path = value_
+    value_ = get('valid_until', MISSING)
+    if value_ is MISSING:
+        _valid_until = MISSING
+    else:
+        if type(value_) is not str or not is_format('date-time', value_):
+            raise Invalid
+        _valid_until = value_
+    properties = {'filename': _filename, 'filesize': _filesize, 'path': _path, 'valid_until': _valid_until}
+    model = new(models.ExportData)
+    model._dict = properties
+    model.filename = _filename
+    model.filesize = _filesize
+    model.path = _path
+    model.valid_until = _valid_until
+    if not _SOURCES_44.issuperset(value):
+        additional(properties, value, _SOURCES_44, _SOURCES_44)
+    return model
+
+
+def decode_Export(value):
+    if type(value) is not dict:
+        raise Invalid
+    properties = {}
+    model = new(models.Export)
+    model._dict = properties
+    if not _SOURCES_15.issuperset(value):
+        additional(properties, value, _SOURCES_15, _SOURCES_15)
+    return model
+
+
+def decode_Export_1(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('created', MISSING)
+    if value_ is MISSING:
+        _created = MISSING
+    else:
+        if type(value_) is not str or not is_format('date-time', value_):
+            raise Invalid
+        _created = value_
+    value_ = get('data', MISSING)
+    if value_ is MISSING:
+        _data = MISSING
+    else:
+        _data = decode_ExportData(value_)
+    value_ = get('filters', MISSING)
+    if value_ is MISSING:
+        _filters = MISSING
+    else:
+        _filters = decode_Export(value_)
+    value_ = get('formats', MISSING)
+    if value_ is MISSING:
+        _formats = MISSING
+    else:
+        _formats = decode_Export(value_)
+    value_ = get('from', MISSING)
+    if value_ is MISSING:
+        _from_ = MISSING
+    else:
+        if type(value_) is not str or not is_format('date', value_):
+            raise Invalid
+        _from_ = value_
+    value_ = get('id', MISSING)
+    if value_ is MISSING:
+        _id = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _id = value_
+    value_ = get('modified', MISSING)
+    if value_ is MISSING:
+        _modified = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _modified = value_
+    value_ = get('resources', MISSING)
+    if value_ is MISSING:
+        _resources = MISSING
+    else:
+        _resources = decode_Export(value_)
+    value_ = get('seen', MISSING)
+    if value_ is MISSING:
+        _seen = MISSING
+    else:
+        if type(value_) is not bool:
+            raise Invalid
+        _seen = value_
+    value_ = get('status', MISSING)
+    if value_ is MISSING:
+        _status = MISSING
+    else:
+        if type(value_) is not str or value_ not in _ENUM_46:
+            raise Invalid
+        _status = value_
+    value_ = get('to', MISSING)
+    if value_ is MISSING:
+        _to = MISSING
+    else:
+        if type(value_) is not str or not is_format('date', value_):
+            raise Invalid
+        _to = value_
+    value_ = get('type', MISSING)
+    if value_ is MISSING:
+        _type = MISSING
+    else:
+        if type(value_) is not str or value_ not in _ENUM_47:
+            raise Invalid
+        _type = value_
+    properties = {'created': _created, 'data': _data, 'filters': _filters, 'formats': _formats, 'from_': _from_, 'id': _id, 'modified': _modified, 'resources': _resources, 'seen': _seen, 'status': _status, 'to': _to, 'type': _type}
+    model = new(models.Export_1)
+    model._dict = properties
+    model.created = _created
+    model.data = _data
+    model.filters = _filters
+    model.formats = _formats
+    model.from_ = _from_
+    model.id = _id
+    model.modified = _modified
+    model.resources = _resources
+    model.seen = _seen
+    model.status = _status
+    model.to = _to
+    model.type = _type
+    if not _SOURCES_45.issuperset(value):
+        additional(properties, value, _SOURCES_45, _NAMES_48)
+    return model
+
+
+def decode_Expenses(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('count', MISSING)
+    if value_ is MISSING:
+        _count = MISSING
+    else:
+        if type(value_) is not int or value_ < 0:
+            raise Invalid
+        _count = value_
+    value_ = get('sum', MISSING)
+    if value_ is MISSING:
+        _sum = MISSING
+    else:
+        if type(value_) is not float and type(value_) is not int or value_ < 0 or value_ >= 1000000000000000:
+            raise Invalid
+        _sum = float(value_)
+    properties = {'count': _count, 'sum': _sum}
+    model = new(models.Expenses)
+    model._dict = properties
+    model.count = _count
+    model.sum = _sum
+    if not _SOURCES_29.issuperset(value):
+        additional(properties, value, _SOURCES_29, _SOURCES_29)
+    return model
+
+
+def decode_Incomes(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('count', MISSING)
+    if value_ is MISSING:
+        _count = MISSING
+    else:
+        if type(value_) is not int or value_ < 0:
+            raise Invalid
+        _count = value_
+    value_ = get('sum', MISSING)
+    if value_ is MISSING:
+        _sum = MISSING
+    else:
+        if type(value_) is not float and type(value_) is not int or value_ < 0 or value_ >= 1000000000000000:
+            raise Invalid
+        _sum = float(value_)
+    properties = {'count': _count, 'sum': _sum}
+    model = new(models.Incomes)
+    model._dict = properties
+    model.count = _count
+    model.sum = _sum
+    if not _SOURCES_29.issuperset(value):
+        additional(properties, value, _SOURCES_29, _SOURCES_29)
+    return model
+
+
+def decode_Location(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('address', MISSING)
+    if value_ is MISSING:
+        _address = MISSING
+    else:
+        if type(value_) is not str or len(value_) > 255:
+            raise Invalid
+        _address = value_
+    value_ = get('amount', MISSING)
+    if value_ is MISSING:
+        _amount = MISSING
+    else:
+        if type(value_) is not float and type(value_) is not int or value_ < 0 or value_ >= 1000000000000000:
+            raise Invalid
+        _amount = float(value_)
+    value_ = get('chain_id', MISSING)
+    if value_ is MISSING:
+        _chain_id = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _chain_id = value_
+    value_ = get('city', MISSING)
+    if value_ is MISSING:
+        _city = MISSING
+    else:
+        if type(value_) is not str or len(value_) > 100:
+            raise Invalid
+        _city = value_
+    value_ = get('expenses', MISSING)
+    if value_ is MISSING:
+        _expenses = MISSING
+    else:
+        _expenses = decode_Expenses(value_)
+    value_ = get('id', MISSING)
+    if value_ is MISSING:
+        _id = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _id = value_
+    value_ = get('incomes', MISSING)
+    if value_ is MISSING:
+        _incomes = MISSING
+    else:
+        _incomes = decode_Incomes(value_)
+    value_ = get('latitude', MISSING)
+    if value_ is MISSING:
+        _latitude = MISSING
+    else:
+        if type(value_) is not float and type(value_) is not int:
+            raise Invalid
+        _latitude = float(value_)
+    value_ = get('longitude', MISSING)
+    if value_ is MISSING:
+        _longitude = MISSING
+    else:
+        if type(value_) is not float and type(value_) is not int:
+            raise Invalid
+        _longitude = float(value_)
+    value_ = get('modified', MISSING)
+    if value_ is MISSING:
+        _modified = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _modified = value_
+    value_ = get('name', MISSING)
+    if value_ is MISSING:
+        _name = MISSING
+    else:
+        if type(value_) is not str or len(value_) > 255:
+            raise Invalid
+        _name = value_
+    value_ = get('used', MISSING)
+    if value_ is MISSING:
+        _used = MISSING
+    else:
+        if type(value_) is not bool:
+            raise Invalid
+        _used = value_
+    value_ = get('venue_id', MISSING)
+    if value_ is MISSING:
+        _venue_id = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _venue_id = value_
+    value_ = get('visits', MISSING)
+    if value_ is MISSING:
+        _visits = MISSING
+    else:
+        if type(value_) is not int or value_ < 0:
+            raise Invalid
+        _visits = value_
+    properties = {'address': _address, 'amount': _amount, 'chain_id': _chain_id, 'city': _city, 'expenses': _expenses, 'id': _id, 'incomes': _incomes, 'latitude': _latitude, 'longitude': _longitude, 'modified': _modified, 'name': _name, 'used': _used, 'venue_id': _venue_id, 'visits': _visits}
+    model = new(models.Location)
+    model._dict = properties
+    model.address = _address
+    model.amount = _amount
+    model.chain_id = _chain_id
+    model.city = _city
+    model.expenses = _expenses
+    model.id = _id
+    model.incomes = _incomes
+    model.latitude = _latitude
+    model.longitude = _longitude
+    model.modified = _modified
+    model.name = _name
+    model.used = _used
+    model.venue_id = _venue_id
+    model.visits = _visits
+    if not _SOURCES_49.issuperset(value):
+        additional(properties, value, _SOURCES_49, _SOURCES_49)
+    return model
+
+
+def decode_TagCounts(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('budgets', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not int:
+            raise Invalid
+        _budgets = value_
+    value_ = get('entries', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not int:
+            raise Invalid
+        _entries = value_
+    value_ = get('unsorted_entries', MISSING)
+    if value_ is MISSING:
+        _unsorted_entries = MISSING
+    else:
+        if type(value_) is not int:
+            raise Invalid
+        _unsorted_entries = value_
+    properties = {'budgets': _budgets, 'entries': _entries, 'unsorted_entries': _unsorted_entries}
+    model = new(models.TagCounts)
+    model._dict = properties
+    model.budgets = _budgets
+    model.entries = _entries
+    model.unsorted_entries = _unsorted_entries
+    if not _SOURCES_50.issuperset(value):
+        additional(properties, value, _SOURCES_50, _SOURCES_50)
+    return model
+
+
+def decode_Tag(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('category', MISSING)
+    if value_ is MISSING:
+        _category = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _category = value_
+    value_ = get('counts', MISSING)
+    if value_ is MISSING:
+        _counts = MISSING
+    else:
+        _counts = decode_TagCounts(value_)
+    value_ = get('deleted', MISSING)
+    if value_ is MISSING:
+        _deleted = MISSING
+    else:
+        if type(value_) is not bool:
+            raise Invalid
+        _deleted = value_
+    value_ = get('extra', MISSING)
+    if value_ is MISSING:
+        _extra = MISSING
+    else:
+        _extra = decode_Extra(value_)
+    value_ = get('id', MISSING)
+    if value_ is MISSING:
+        _id = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _id = value_
+    value_ = get('meta_tag', MISSING)
+    if value_ is MISSING:
+        _meta_tag = MISSING
+    else:
+        if type(value_) is not bool:
+            raise Invalid
+        _meta_tag = value_
+    value_ = get('modified', MISSING)
+    if value_ is MISSING:
+        _modified = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _modified = value_
+    value_ = get('name', MISSING)
+    if value_ is MISSING:
+        _name = MISSING
+    else:
+        if type(value_) is not str or len(value_) < 1 or len(value_) > 100:
+            raise Invalid
+        _name = value_
+    value_ = get('name_override', MISSING)
+    if value_ is MISSING:
+        _name_override = False
+    else:
+        if type(value_) is not bool:
+            raise Invalid
+        _name_override = value_
+    value_ = get('type', MISSING)
+    if value_ is MISSING:
+        _type = MISSING
+    else:
+        if type(value_) is not str or value_ not in _ENUM_52:
+            raise Invalid
+        _type = value_
+    properties = {'category': _category, 'counts': _counts, 'deleted': _deleted, 'extra': _extra, 'id': _id, 'meta_tag': _meta_tag, 'modified': _modified, 'name': _name, 'name_override': _name_override, 'type': _type}
+    model = new(models.Tag)
+    model._dict = properties
+    model.category = _category
+    model.counts = _counts
+    model.deleted = _deleted
+    model.extra = _extra
+    model.id = _id
+    model.meta_tag = _meta_tag
+    model.modified = _modified
+    model.name = _name
+    model.name_override = _name_override
+    model.type = _type
+    if not _SOURCES_51.issuperset(value):
+        additional(properties, value, _SOURCES_51, _SOURCES_51)
+    return model
+
+
+def decode_TagSumExpenses(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('categories', MISSING)
+    if value_ is MISSING:
+        _categories = MISSING
+    else:
+        if type(value_) is not list:
+            raise Invalid
+        for item in value_:
+            if type(item) is not str:
+                raise Invalid
+        _categories = list(value_)
+    value_ = get('count', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not int or value_ < 0:
+            raise Invalid
+        _count = value_
+    value_ = get('sum', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not float and type(value_) is not int or value_ < 0 or value_ >= 1000000000000000:
+            raise Invalid
+        _sum = float(value_)
+    properties = {'categories': _categories, 'count': _count, 'sum': _sum}
+    model = new(models.TagSumExpenses)
+    model._dict = properties
+    model.categories = _categories
+    model.count = _count
+    model.sum = _sum
+    if not _SOURCES_53.issuperset(value):
+        additional(properties, value, _SOURCES_53, _SOURCES_53)
+    return model
+
+
+def decode_TagSumIncomes(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('categories', MISSING)
+    if value_ is MISSING:
+        _categories = MISSING
+    else:
+        if type(value_) is not list:
+            raise Invalid
+        for item in value_:
+            if type(item) is not str:
+                raise Invalid
+        _categories = list(value_)
+    value_ = get('count', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not int or value_ < 0:
+            raise Invalid
+        _count = value_
+    value_ = get('sum', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not float and type(value_) is not int or value_ < 0 or value_ >= 1000000000000000:
+            raise Invalid
+        _sum = float(value_)
+    properties = {'categories': _categories, 'count': _count, 'sum': _sum}
+    model = new(models.TagSumIncomes)
+    model._dict = properties
+    model.categories = _categories
+    model.count = _count
+    model.sum = _sum
+    if not _SOURCES_53.issuperset(value):
+        additional(properties, value, _SOURCES_53, _SOURCES_53)
+    return model
+
+
+def decode_TagSum(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('expenses', MISSING)
+    if value_ is MISSING:
+        _expenses = MISSING
+    else:
+        _expenses = decode_TagSumExpenses(value_)
+    value_ = get('incomes', MISSING)
+    if value_ is MISSING:
+        _incomes = MISSING
+    else:
+        _incomes = decode_TagSumIncomes(value_)
+    value_ = get('modified', MISSING)
+    if value_ is MISSING:
+        _modified = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _modified = value_
+    value_ = get('tag', MISSING)
+    if value_ is MISSING:
+        _tag = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _tag = value_
+    properties = {'expenses': _expenses, 'incomes': _incomes, 'modified': _modified, 'tag': _tag}
+    model = new(models.TagSum)
+    model._dict = properties
+    model.expenses = _expenses
+    model.incomes = _incomes
+    model.modified = _modified
+    model.tag = _tag
+    if not _SOURCES_54.issuperset(value):
+        additional(properties, value, _SOURCES_54, _SOURCES_54)
+    return model
+
+
+def decode_CustomCurrency(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('code', MISSING)
+    if value_ is MISSING:
+        _code = MISSING
+    else:
+        if type(value_) is not str or not _PATTERN_14.search(value_):
+            raise Invalid
+        _code = value_
+    value_ = get('fixed', MISSING)
+    if value_ is MISSING:
+        _fixed = 'false'
+    else:
+        if type(value_) is not bool:
+            raise Invalid
+        _fixed = value_
+    value_ = get('rate', MISSING)
+    if value_ is MISSING:
+        _rate = MISSING
+    else:
+        if type(value_) is not float and type(value_) is not int or value_ < 0:
+            raise Invalid
+        _rate = float(value_)
+    value_ = get('reference_currency', MISSING)
+    if value_ is MISSING:
+        _reference_currency = MISSING
+    else:
+        if type(value_) is not str or not _PATTERN_14.search(value_):
+            raise Invalid
+        _reference_currency = value_
+    properties = {'code': _code, 'fixed': _fixed, 'rate': _rate, 'reference_currency': _reference_currency}
+    model = new(models.CustomCurrency)
+    model._dict = properties
+    model.code = _code
+    model.fixed = _fixed
+    model.rate = _rate
+    model.reference_currency = _reference_currency
+    if not _SOURCES_55.issuperset(value):
+        additional(properties, value, _SOURCES_55, _SOURCES_55)
+    return model
+
+
+def decode_UserCurrency(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('custom', MISSING)
+    if value_ is MISSING:
+        _custom = MISSING
+    else:
+        _custom = decode_CustomCurrency(value_)
+    value_ = get('custom_exchange_rate', MISSING)
+    if value_ is MISSING:
+        _custom_exchange_rate = MISSING
+    else:
+        if type(value_) is not float and type(value_) is not int or value_ < 0:
+            raise Invalid
+        _custom_exchange_rate = float(value_)
+    value_ = get('main', MISSING)
+    if value_ is MISSING:
+        _main = MISSING
+    else:
+        if type(value_) is not str or not _PATTERN_14.search(value_):
+            raise Invalid
+        _main = value_
+    value_ = get('update', MISSING)
+    if value_ is MISSING:
+        _update = MISSING
+    else:
+        if type(value_) is not str or value_ not in _ENUM_57:
+            raise Invalid
+        _update = value_
+    value_ = get('update_accounts', MISSING)
+    if value_ is MISSING:
+        _update_accounts = MISSING
+    else:
+        if type(value_) is not bool:
+            raise Invalid
+        _update_accounts = value_
+    properties = {'custom': _custom, 'custom_exchange_rate': _custom_exchange_rate, 'main': _main, 'update': _update, 'update_accounts': _update_accounts}
+    model = new(models.UserCurrency)
+    model._dict = properties
+    model.custom = _custom
+    model.custom_exchange_rate = _custom_exchange_rate
+    model.main = _main
+    model.update = _update
+    model.update_accounts = _update_accounts
+    if not _SOURCES_56.issuperset(value):
+        additional(properties, value, _SOURCES_56, _SOURCES_56)
+    return model
+
+
+def decode_UserLimits(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('accounts', MISSING)
+    if value_ is MISSING:
+        _accounts = MISSING
+    else:
+        if type(value_) is not bool:
+            raise Invalid
+        _accounts = value_
+    value_ = get('bank', MISSING)
+    if value_ is MISSING:
+        _bank = MISSING
+    else:
+        if type(value_) is not bool:
+            raise Invalid
+        _bank = value_
+    value_ = get('budgets', MISSING)
+    if value_ is MISSING:
+        _budgets = MISSING
+    else:
+        if type(value_) is not bool:
+            raise Invalid
+        _budgets = value_
+    value_ = get('export', MISSING)
+    if value_ is MISSING:
+        _export = MISSING
+    else:
+        if type(value_) is not bool:
+            raise Invalid
+        _export = value_
+    value_ = get('images', MISSING)
+    if value_ is MISSING:
+        _images = MISSING
+    else:
+        if type(value_) is not bool:
+            raise Invalid
+        _images = value_
+    value_ = get('import', MISSING)
+    if value_ is MISSING:
+        _import_ = MISSING
+    else:
+        if type(value_) is not bool:
+            raise Invalid
+        _import_ = value_
+    value_ = get('locations', MISSING)
+    if value_ is MISSING:
+        _locations = MISSING
+    else:
+        if type(value_) is not bool:
+            raise Invalid
+        _locations = value_
+    value_ = get('passcode', MISSING)
+    if value_ is MISSING:
+        _passcode = MISSING
+    else:
+        if type(value_) is not bool:
+            raise Invalid
+        _passcode = value_
+    value_ = get('planning', MISSING)
+    if value_ is MISSING:
+        _planning = MISSING
+    else:
+        if type(value_) is not bool:
+            raise Invalid
+        _planning = value_
+    value_ = get('pro_share', MISSING)
+    if value_ is MISSING:
+        _pro_share = MISSING
+    else:
+        if type(value_) is not bool:
+            raise Invalid
+        _pro_share = value_
+    value_ = get('reminders', MISSING)
+    if value_ is MISSING:
+        _reminders = MISSING
+    else:
+        if type(value_) is not bool:
+            raise Invalid
+        _reminders = value_
+    value_ = get('repeats', MISSING)
+    if value_ is MISSING:
+        _repeats = MISSING
+    else:
+        if type(value_) is not bool:
+            raise Invalid
+        _repeats = value_
+    properties = {'accounts': _accounts, 'bank': _bank, 'budgets': _budgets, 'export': _export, 'images': _images, 'import_': _import_, 'locations': _locations, 'passcode': _passcode, 'planning': _planning, 'pro_share': _pro_share, 'reminders': _reminders, 'repeats': _repeats}
+    model = new(models.UserLimits)
+    model._dict = properties
+    model.accounts = _accounts
+    model.bank = _bank
+    model.budgets = _budgets
+    model.export = _export
+    model.images = _images
+    model.import_ = _import_
+    model.locations = _locations
+    model.passcode = _passcode
+    model.planning = _planning
+    model.pro_share = _pro_share
+    model.reminders = _reminders
+    model.repeats = _repeats
+    if not _SOURCES_58.issuperset(value):
+        additional(properties, value, _SOURCES_58, _NAMES_59)
+    return model
+
+
+def decode_UserMigration(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('date_migrated', MISSING)
+    if value_ is MISSING:
+        _date_migrated = MISSING
+    else:
+        if type(value_) is not str or not is_format('date-time', value_):
+            raise Invalid
+        _date_migrated = value_
+    value_ = get('finished', MISSING)
+    if value_ is MISSING:
+        _finished = MISSING
+    else:
+        if type(value_) is not bool:
+            raise Invalid
+        _finished = value_
+    value_ = get('revert_until', MISSING)
+    if value_ is MISSING:
+        _revert_until = MISSING
+    else:
+        if type(value_) is not str or not is_format('date-time', value_):
+            raise Invalid
+        _revert_until = value_
+    properties = {'date_migrated': _date_migrated, 'finished': _finished, 'revert_until': _revert_until}
+    model = new(models.UserMigration)
+    model._dict = properties
+    model.date_migrated = _date_migrated
+    model.finished = _finished
+    model.revert_until = _revert_until
+    if not _SOURCES_60.issuperset(value):
+        additional(properties, value, _SOURCES_60, _SOURCES_60)
+    return model
+
+
+def decode_UserPartner(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('end', MISSING)
+    if value_ is MISSING:
+        _end = MISSING
+    else:
+        if type(value_) is not str or not is_format('date-time', value_):
+            raise Invalid
+        _end = value_
+    value_ = get('name', MISSING)
+    if value_ is MISSING:
+        _name = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _name = value_
+    value_ = get('start', MISSING)
+    if value_ is MISSING:
+        _start = MISSING
+    else:
+        if type(value_) is not str or not is_format('date-time', value_):
+            raise Invalid
+        _start = value_
+    properties = {'end': _end, 'name': _name, 'start': _start}
+    model = new(models.UserPartner)
+    model._dict = properties
+    model.end = _end
+    model.name = _name
+    model.start = _start
+    if not _SOURCES_61.issuperset(value):
+        additional(properties, value, _SOURCES_61, _SOURCES_61)
+    return model
+
+
+def decode_UserProPayment(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('id', MISSING)
+    if value_ is MISSING:
+        _id = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _id = value_
+    value_ = get('next', MISSING)
+    if value_ is MISSING:
+        _next = MISSING
+    else:
+        if type(value_) is not str or not is_format('date-time', value_):
+            raise Invalid
+        _next = value_
+    value_ = get('provider', MISSING)
+    if value_ is MISSING:
+        _provider = MISSING
+    else:
+        if type(value_) is not str or value_ not in _ENUM_63:
+            raise Invalid
+        _provider = value_
+    value_ = get('trial', MISSING)
+    if value_ is MISSING:
+        _trial = 'false'
+    else:
+        if type(value_) is not bool:
+            raise Invalid
+        _trial = value_
+    properties = {'id': _id, 'next': _next, 'provider': _provider, 'trial': _trial}
+    model = new(models.UserProPayment)
+    model._dict = properties
+    model.id = _id
+    model.next = _next
+    model.provider = _provider
+    model.trial = _trial
+    if not _SOURCES_62.issuperset(value):
+        additional(properties, value, _SOURCES_62, _SOURCES_62)
+    return model
+
+
+def decode_UserProTrial(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('end', MISSING)
+    if value_ is MISSING:
+        _end = MISSING
+    else:
+        if type(value_) is not str or not is_format('date-time', value_):
+            raise Invalid
+        _end = value_
+    value_ = get('start', MISSING)
+    if value_ is MISSING:
+        _start = MISSING
+    else:
+        if type(value_) is not str or not is_format('date-time', value_):
+            raise Invalid
+        _start = value_
+    properties = {'end': _end, 'start': _start}
+    model = new(models.UserProTrial)
+    model._dict = properties
+    model.end = _end
+    model.start = _start
+    if not _SOURCES_64.issuperset(value):
+        additional(properties, value, _SOURCES_64, _SOURCES_64)
+    return model
+
+
+def decode_UserProVAT(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('address', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _address = value_
+    value_ = get('city', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _city = value_
+    value_ = get('country', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _country = value_
+    value_ = get('name', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _name = value_
+    value_ = get('post', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _post = value_
+    value_ = get('state', MISSING)
+    if value_ is MISSING:
+        _state = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _state = value_
+    value_ = get('vat', MISSING)
+    if value_ is MISSING:
+        raise Invalid
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _vat = value_
+    properties = {'address': _address, 'city': _city, 'country': _country, 'name': _name, 'post': _post, 'state': _state, 'vat': _vat}
+    model = new(models.UserProVAT)
+    model._dict = properties
+    model.address = _address
+    model.city = _city
+    model.country = _country
+    model.name = _name
+    model.post = _post
+    model.state = _state
+    model.vat = _vat
+    if not _SOURCES_65.issuperset(value):
+        additional(properties, value, _SOURCES_65, _SOURCES_65)
+    return model
+
+
+def decode_UserPro(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('level', MISSING)
+    if value_ is MISSING:
+        _level = MISSING
+    else:
+        if type(value_) is not str or value_ not in _ENUM_67:
+            raise Invalid
+        _level = value_
+    value_ = get('partner', MISSING)
+    if value_ is MISSING:
+        _partner = MISSING
+    else:
+        if type(value_) is not list:
+            raise Invalid
+        _partner = [decode_UserPartner(item) for item in value_]
+    value_ = get('payment', MISSING)
+    if value_ is MISSING:
+        _payment = MISSING
+    else:
+        _payment = decode_UserProPayment(value_)
+    value_ = get('remaining_credit', MISSING)
+    if value_ is MISSING:
+        _remaining_credit = MISSING
+    else:
+        if type(value_) is not float and type(value_) is not int or value_ < 0 or value_ > 1000:
+            raise Invalid
+        _remaining_credit = float(value_)
+    value_ = get('since', MISSING)
+    if value_ is MISSING:
+        _since = MISSING
+    else:
+        if type(value_) is not str or not is_format('date-time', value_):
+            raise Invalid
+        _since = value_
+    value_ = get('trial', MISSING)
+    if value_ is MISSING:
+        _trial = MISSING
+    else:
+        _trial = decode_UserProTrial(value_)
+    value_ = get('until', MISSING)
+    if value_ is MISSING:
+        _until = MISSING
+    else:
+        if type(value_) is not str or not is_format('date-time', value_):
+            raise Invalid
+        _until = value_
+    value_ = get('vat', MISSING)
+    if value_ is MISSING:
+        _vat = MISSING
+    else:
+        _vat = decode_UserProVAT(value_)
+    properties = {'level': _level, 'partner': _partner, 'payment': _payment, 'remaining_credit': _remaining_credit, 'since': _since, 'trial': _trial, 'until': _until, 'vat': _vat}
+    model = new(models.UserPro)
+    model._dict = properties
+    model.level = _level
+    model.partner = _partner
+    model.payment = _payment
+    model.remaining_credit = _remaining_credit
+    model.since = _since
+    model.trial = _trial
+    model.until = _until
+    model.vat = _vat
+    if not _SOURCES_66.issuperset(value):
+        additional(properties, value, _SOURCES_66, _SOURCES_66)
+    return model
+
+
+def decode_User(value):
+    if type(value) is not dict:
+        raise Invalid
+    get = value.get
+    value_ = get('country', MISSING)
+    if value_ is MISSING:
+        _country = MISSING
+    else:
+        if type(value_) is not str or not _PATTERN_69.search(value_):
+            raise Invalid
+        _country = value_
+    value_ = get('currency', MISSING)
+    if value_ is MISSING:
+        _currency = MISSING
+    else:
+        _currency = decode_UserCurrency(value_)
+    value_ = get('email', MISSING)
+    if value_ is MISSING:
+        _email = MISSING
+    else:
+        if type(value_) is not str or len(value_) > 254 or not is_format('email', value_):
+            raise Invalid
+        _email = value_
+    value_ = get('extra', MISSING)
+    if value_ is MISSING:
+        _extra = MISSING
+    else:
+        _extra = decode_Extra(value_)
+    value_ = get('first_name', MISSING)
+    if value_ is MISSING:
+        _first_name = MISSING
+    else:
+        if type(value_) is not str or len(value_) > 100:
+            raise Invalid
+        _first_name = value_
+    value_ = get('flags', MISSING)
+    if value_ is MISSING:
+        _flags = MISSING
+    else:
+        if type(value_) is not list:
+            raise Invalid
+        for item in value_:
+            if type(item) is not str:
+                raise Invalid
+        _flags = list(value_)
+    value_ = get('id', MISSING)
+    if value_ is MISSING:
+        _id = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _id = value_
+    value_ = get('joined', MISSING)
+    if value_ is MISSING:
+        _joined = MISSING
+    else:
+        if type(value_) is not str or not is_format('date-time', value_):
+            raise Invalid
+        _joined = value_
+    value_ = get('language', MISSING)
+    if value_ is MISSING:
+        _language = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _language = value_
+    value_ = get('last_name', MISSING)
+    if value_ is MISSING:
+        _last_name = MISSING
+    else:
+        if type(value_) is not str or len(value_) > 100:
+            raise Invalid
+        _last_name = value_
+    value_ = get('limits', MISSING)
+    if value_ is MISSING:
+        _limits = MISSING
+    else:
+        _limits = decode_UserLimits(value_)
+    value_ = get('locale', MISSING)
+    if value_ is MISSING:
+        _locale = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _locale = value_
+    value_ = get('migration', MISSING)
+    if value_ is MISSING:
+        _migration = MISSING
+    else:
+        _migration = decode_UserMigration(value_)
+    value_ = get('modified', MISSING)
+    if value_ is MISSING:
+        _modified = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _modified = value_
+    value_ = get('notifications', MISSING)
+    if value_ is MISSING:
+        _notifications = MISSING
+    else:
+        if type(value_) is not int:
+            raise Invalid
+        _notifications = value_
+    value_ = get('otp_enabled', MISSING)
+    if value_ is MISSING:
+        _otp_enabled = MISSING
+    else:
+        if type(value_) is not bool:
+            raise Invalid
+        _otp_enabled = value_
+    value_ = get('pro', MISSING)
+    if value_ is MISSING:
+        _pro = MISSING
+    else:
+        _pro = decode_UserPro(value_)
+    value_ = get('social', MISSING)
+    if value_ is MISSING:
+        _social = MISSING
+    else:
+        if type(value_) is not list:
+            raise Invalid
+        for item in value_:
+            if type(item) is not str or item not in _ENUM_70:
+                raise Invalid
+        _social = list(value_)
+    value_ = get('start_day', MISSING)
+    if value_ is MISSING:
+        _start_day = 1
+    else:
+        if type(value_) is not int or value_ < 1 or value_ > 31:
+            raise Invalid
+        _start_day = value_
+    value_ = get('steps', MISSING)
+    if value_ is MISSING:
+        _steps = MISSING
+    else:
+        if type(value_) is not list:
+            raise Invalid
+        for item in value_:
+            if type(item) is not str or item not in _ENUM_71:
+                raise Invalid
+        _steps = list(value_)
+    value_ = get('timezone', MISSING)
+    if value_ is MISSING:
+        _timezone = MISSING
+    else:
+        if type(value_) is not str:
+            raise Invalid
+        _timezone = value_
+    value_ = get('trial_eligible', MISSING)
+    if value_ is MISSING:
+        _trial_eligible = False
+    else:
+        if type(value_) is not bool:
+            raise Invalid
+        _trial_eligible = value_
+    properties = {'country': _country, 'currency': _currency, 'email': _email, 'extra': _extra, 'first_name': _first_name, 'flags': _flags, 'id': _id, 'joined': _joined, 'language': _language, 'last_name': _last_name, 'limits': _limits, 'locale': _locale, 'migration': _migration, 'modified': _modified, 'notifications': _notifications, 'otp_enabled': _otp_enabled, 'pro': _pro, 'social': _social, 'start_day': _start_day, 'steps': _steps, 'timezone': _timezone, 'trial_eligible': _trial_eligible}
+    model = new(models.User)
+    model._dict = properties
+    model.country = _country
+    model.currency = _currency
+    model.email = _email
+    model.extra = _extra
+    model.first_name = _first_name
+    model.flags = _flags
+    model.id = _id
+    model.joined = _joined
+    model.language = _language
+    model.last_name = _last_name
+    model.limits = _limits
+    model.locale = _locale
+    model.migration = _migration
+    model.modified = _modified
+    model.notifications = _notifications
+    model.otp_enabled = _otp_enabled
+    model.pro = _pro
+    model.social = _social
+    model.start_day = _start_day
+    model.steps = _steps
+    model.timezone = _timezone
+    model.trial_eligible = _trial_eligible
+    if not _SOURCES_68.issuperset(value):
+        additional(properties, value, _SOURCES_68, _SOURCES_68)
+    return model
+
+
+DECODERS = {
+    models.CurrencyElement: decode_CurrencyElement,
+    models.Image: decode_Image,
+    models.Notification: decode_Notification,
+    models.EntryRepeat: decode_EntryRepeat,
+    models.AccountAvg: decode_AccountAvg,
+    models.AccountBilling: decode_AccountBilling,
+    models.AccountConnection: decode_AccountConnection,
+    models.Currency: decode_Currency,
+    models.AccountMedian: decode_AccountMedian,
+    models.Extra: decode_Extra,
+    models.AccountGoal: decode_AccountGoal,
+    models.AccountSettle: decode_AccountSettle,
+    models.Account: decode_Account,
+    models.BudgetProblem: decode_BudgetProblem,
+    models.Recurrence: decode_Recurrence,
+    models.Budget: decode_Budget,
+    models.CategoryCounts: decode_CategoryCounts,
+    models.Category: decode_Category,
+    models.CategorySumExpenses: decode_CategorySumExpenses,
+    models.CategorySumIncomes: decode_CategorySumIncomes,
+    models.CategorySum: decode_CategorySum,
+    models.EntryImage: decode_EntryImage,
+    models.EntryImport: decode_EntryImport,
+    models.EntryLocation: decode_EntryLocation,
+    models.Reminder: decode_Reminder,
+    models.EntryReview: decode_EntryReview,
+    models.EntrySettle: decode_EntrySettle,
+    models.EntrySplit: decode_EntrySplit,
+    models.EntryTransaction: decode_EntryTransaction,
+    models.Entry: decode_Entry,
+    models.DayExpenses: decode_DayExpenses,
+    models.DayIncomes: decode_DayIncomes,
+    models.Day: decode_Day,
+    models.ExportData: decode_ExportData,
+    models.Export: decode_Export,
+    models.Export_1: decode_Export_1,
+    models.Expenses: decode_Expenses,
+    models.Incomes: decode_Incomes,
+    models.Location: decode_Location,
+    models.TagCounts: decode_TagCounts,
+    models.Tag: decode_Tag,
+    models.TagSumExpenses: decode_TagSumExpenses,
+    models.TagSumIncomes: decode_TagSumIncomes,
+    models.TagSum: decode_TagSum,
+    models.CustomCurrency: decode_CustomCurrency,
+    models.UserCurrency: decode_UserCurrency,
+    models.UserLimits: decode_UserLimits,
+    models.UserMigration: decode_UserMigration,
+    models.UserPartner: decode_UserPartner,
+    models.UserProPayment: decode_UserProPayment,
+    models.UserProTrial: decode_UserProTrial,
+    models.UserProVAT: decode_UserProVAT,
+    models.UserPro: decode_UserPro,
+    models.User: decode_User,
+}
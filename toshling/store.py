@@ -0,0 +1,172 @@
+"""A local SQLite mirror of entries, accounts, categories and tags.
+
+Each model is kept whole as JSON alongside the columns it is most often
+queried by, which are indexed, and the tags of entries are normalised into
+their own table. Queries return the same `return_types` models as the API.
+
+`SQLiteStore` can be used as the store of a `toshling.sync.SyncEngine`.
+"""
+import json
+import sqlite3
+from collections import namedtuple
+
+from statham.schema.elements import Object
+
+from ._client import StathamJSONEncoder
+from .models import return_types
+
+
+Column = namedtuple('Column', ['name', 'type', 'get'])
+
+
+class _StoreEncoder(StathamJSONEncoder):
+    # Defaults which don't validate (such as `Account.limit`) are filled in
+    # as None, which would fail validation when decoded again.
+    def default(self, o):
+        plain = super().default(o)
+        if isinstance(o, Object):
+            return {k: v for k, v in plain.items() if v is not None}
+        return plain
+
+
+def _attr(name):
+    def get(model):
+        value = getattr(model, name, None)
+        return value if isinstance(value, (str, int, float)) else None
+    return get
+
+
+def _currency(model):
+    return getattr(model.currency, 'code', None) if model.currency else None
+
+
+TABLES = {
+    'entries': (return_types.Entry, [
+        Column('date', 'TEXT', _attr('date')),
+        Column('account', 'TEXT', _attr('account')),
+        Column('category', 'TEXT', _attr('category')),
+        Column('amount', 'REAL', _attr('amount')),
+        Column('currency', 'TEXT', _currency),
+        Column('completed', 'INTEGER', _attr('completed')),
+        Column('modified', 'TEXT', _attr('modified')),
+    ]),
+    'accounts': (return_types.Account, [
+        Column('name', 'TEXT', _attr('name')),
+        Column('status', 'TEXT', _attr('status')),
+        Column('currency', 'TEXT', _currency),
+        Column('modified', 'TEXT', _attr('modified')),
+    ]),
+    'categories': (return_types.Category, [
+        Column('name', 'TEXT', _attr('name')),
+        Column('type', 'TEXT', _attr('type')),
+        Column('modified', 'TEXT', _attr('modified')),
+    ]),
+    'tags': (return_types.Tag, [
+        Column('name', 'TEXT', _attr('name')),
+        Column('type', 'TEXT', _attr('type')),
+        Column('category', 'TEXT', _attr('category')),
+        Column('modified', 'TEXT', _attr('modified')),
+    ]),
+}
+
+INDEXES = {
+    'entries': ['date', 'account', 'category'],
+    'accounts': [],
+    'categories': ['type'],
+    'tags': ['category'],
+}
+
+
+class SQLiteStore:
+    """Mirror Toshl models into the SQLite database at `path`."""
+    def __init__(self, path=':memory:'):
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.create()
+
+    def create(self):
+        with self.connection:
+            for table, (_, columns) in TABLES.items():
+                definitions = ''.join(f', {c.name} {c.type}' for c in columns)
+                self.connection.execute(f'CREATE TABLE IF NOT EXISTS {table} (id TEXT PRIMARY KEY{definitions}, data TEXT NOT NULL)')
+                for column in INDEXES[table]:
+                    self.connection.execute(f'CREATE INDEX IF NOT EXISTS {table}_{column} ON {table} ({column})')
+            self.connection.execute('CREATE TABLE IF NOT EXISTS entry_tags (entry TEXT NOT NULL, tag TEXT NOT NULL, '
+                                    'PRIMARY KEY (entry, tag)) WITHOUT ROWID')
+            self.connection.execute('CREATE INDEX IF NOT EXISTS entry_tags_tag ON entry_tags (tag, entry)')
+            # Marks were once kept by resource alone, which a sync with other
+            # filters would wrongly reuse, so such marks are dropped.
+            if 'filters' not in {row[1] for row in self.connection.execute('PRAGMA table_info(marks)')}:
+                self.connection.execute('DROP TABLE IF EXISTS marks')
+            self.connection.execute('CREATE TABLE IF NOT EXISTS marks (resource TEXT NOT NULL, filters TEXT NOT NULL, '
+                                    'mark TEXT, PRIMARY KEY (resource, filters)) WITHOUT ROWID')
+
+    def close(self):
+        self.connection.close()
+
+    # The store interface used by `toshling.sync.SyncEngine`.
+
+    def get_mark(self, resource, filters=''):
+        row = self.connection.execute('SELECT mark FROM marks WHERE resource = ? AND filters = ?',
+                                      (resource, filters)).fetchone()
+        return row[0] if row else None
+
+    def set_mark(self, resource, mark, filters=''):
+        with self.connection:
+            self.connection.execute('INSERT OR REPLACE INTO marks VALUES (?, ?, ?)', (resource, filters, mark))
+
+    def upsert(self, resource, models):
+        """Insert or replace `models` of `resource` in a single transaction."""
+        _, columns = TABLES[resource]
+        rows = [(m.id, *(c.get(m) for c in columns), json.dumps(m, cls=_StoreEncoder)) for m in models]
+        placeholders = ', '.join('?' * (len(columns) + 2))
+
+        with self.connection:
+            self.connection.executemany(f'INSERT OR REPLACE INTO {resource} VALUES ({placeholders})', rows)
+            if resource == 'entries':
+                self.connection.executemany('DELETE FROM entry_tags WHERE entry = ?', [(m.id,) for m in models])
+                self.connection.executemany('INSERT OR IGNORE INTO entry_tags VALUES (?, ?)',
+                                            [(m.id, tag) for m in models for tag in (m.tags or [])])
+
+    def delete(self, resource, ids):
+        ids = [(id_,) for id_ in ids]
+        with self.connection:
+            self.connection.executemany(f'DELETE FROM {resource} WHERE id = ?', ids)
+            if resource == 'entries':
+                self.connection.executemany('DELETE FROM entry_tags WHERE entry = ?', ids)
+
+    def all(self, resource):
+        return self.query(resource)
+
+    # Query helpers.
+
+    def query(self, resource, where='', params=(), order='id'):
+        """Return models of `resource` matching an SQL `where` clause."""
+        model, _ = TABLES[resource]
+        sql = f'SELECT data FROM {resource} {where} ORDER BY {order}'
+        return [model(json.loads(data)) for data, in self.connection.execute(sql, params)]
+
+    def get(self, resource, id):
+        models = self.query(resource, 'WHERE id = ?', (id,))
+        return models[0] if models else None
+
+    def entries(self, from_=None, to=None, account=None, category=None, tag=None):
+        """Return entries, in date order, filtered by an inclusive date range,
+        account, category and tag."""
+        clauses, params = [], []
+        for clause, value in (('date >= ?', from_), ('date <= ?', to), ('account = ?', account),
+                              ('category = ?', category),
+                              ('id IN (SELECT entry FROM entry_tags WHERE tag = ?)', tag)):
+            if value is not None:
+                clauses.append(clause)
+                params.append(value)
+        where = 'WHERE ' + ' AND '.join(clauses) if clauses else ''
+        return self.query('entries', where, params, order='date, id')
+
+    def accounts(self):
+        return self.query('accounts')
+
+    def categories(self):
+        return self.query('categories')
+
+    def tags(self):
+        return self.query('tags')